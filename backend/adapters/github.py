@@ -4,10 +4,12 @@ Implements GitProvider protocol for GitHub API
 """
 
 from typing import Optional
+import asyncio
 import base64
 from github import Github
-from backend.facades.git_provider import GitProvider
+from backend.facades.git_provider import GitProvider, TreeEntry
 from backend.config import get_settings
+from backend.instrumentation import record_size, timed
 
 
 class GitHubAdapter(GitProvider):
@@ -16,8 +18,9 @@ class GitHubAdapter(GitProvider):
     def __init__(self, api_token: Optional[str] = None):
         settings = get_settings()
         self.api_token = api_token or settings.github_api_token
-        self.client = Github(self.api_token)
+        self.client = Github(self.api_token, base_url=settings.github_api_url)
 
+    @timed("github")
     async def get_file(self, repo: str, path: str, branch: str) -> str:
         """Fetch file content from GitHub repository"""
         repository = self.client.get_repo(repo)
@@ -27,8 +30,10 @@ class GitHubAdapter(GitProvider):
             raise ValueError(f"Path {path} is a directory, not a file")
 
         # Decode base64 content
+        record_size("github", "received", file_content.size)
         return base64.b64decode(file_content.content).decode("utf-8")
 
+    @timed("github")
     async def commit_file(
         self,
         repo: str,
@@ -50,6 +55,8 @@ class GitHubAdapter(GitProvider):
         except Exception:
             sha = None
 
+        record_size("github", "sent", len(content.encode("utf-8")))
+
         # Create author input
         from github.InputGitAuthor import InputGitAuthor
 
@@ -78,6 +85,7 @@ class GitHubAdapter(GitProvider):
 
         return result["commit"].sha
 
+    @timed("github")
     async def create_branch(
         self, repo: str, branch_name: str, from_branch: str
     ) -> None:
@@ -90,3 +98,28 @@ class GitHubAdapter(GitProvider):
 
         # Create new branch
         repository.create_git_ref(ref=f"refs/heads/{branch_name}", sha=source_sha)
+
+    @timed("github")
+    async def list_tree(self, repo: str, branch: str) -> list[TreeEntry]:
+        """List every file on a branch with one recursive tree request"""
+
+        def fetch() -> list[TreeEntry]:
+            tree = self.client.get_repo(repo).get_git_tree(branch, recursive=True)
+            return [
+                TreeEntry(path=item.path, sha=item.sha) for item in tree.tree if item.type == "blob"
+            ]
+
+        # PyGithub is synchronous; run it off the event loop so callers can
+        # fetch many blobs concurrently
+        return await asyncio.to_thread(fetch)
+
+    @timed("github")
+    async def get_blob(self, repo: str, sha: str) -> str:
+        """Fetch file content by blob SHA"""
+
+        def fetch() -> str:
+            blob = self.client.get_repo(repo).get_git_blob(sha)
+            record_size("github", "received", blob.size)
+            return base64.b64decode(blob.content).decode("utf-8")
+
+        return await asyncio.to_thread(fetch)
@@ -4,35 +4,238 @@ Implements IssueTrackerProvider protocol for Linear API
 """
 
 from typing import Optional
-from linear import LinearClient
 from backend.facades.issue_tracker import IssueTrackerProvider, Issue, User, Comment
 from backend.config import get_settings
+from backend.services.linear_scheduler import LinearScheduler, Priority, get_linear_scheduler
+
+# Identifier (e.g. "ENG-123") -> issue UUID, shared by every adapter instance.
+# Identifiers are stable for the lifetime of an issue, so entries never expire.
+_issue_uuids: dict[str, str] = {}
+
+# Issue UUID -> team ID, kept current by Issue webhooks when issues move
+_issue_teams: dict[str, str] = {}
+
+# Team ID -> workflow state name -> state ID. Each team has its own states,
+# often with the same names, so a name only resolves within the issue's team.
+_workflow_state_ids: dict[str, dict[str, str]] = {}
+
+
+def remember_issue_id(identifier: str, uuid: str) -> None:
+    """
+    Record an identifier -> UUID mapping seen in any Linear response
+
+    Args:
+        identifier: Human-readable issue identifier (e.g., "ENG-123")
+        uuid: Linear issue UUID
+    """
+    if identifier and uuid:
+        _issue_uuids[identifier] = uuid
+
+
+def remember_issue_team(uuid: str, team_id: str) -> None:
+    """
+    Record which team an issue belongs to
+
+    Args:
+        uuid: Linear issue UUID
+        team_id: Team ID
+    """
+    if uuid and team_id:
+        _issue_teams[uuid] = team_id
+
+
+def forget_workflow_states() -> None:
+    """Drop cached workflow state IDs so they are reloaded on next use"""
+    _workflow_state_ids.clear()
+
+
+class LinearAPIError(Exception):
+    """Linear GraphQL request returned errors"""
+
+
+def _comment_from_node(issue_id: str, node: dict) -> Comment:
+    """Build Comment from a Linear comment node"""
+    return Comment(
+        id=node["id"],
+        issue_id=issue_id,
+        author_id=node["user"]["id"] if node.get("user") else "",
+        content=node["body"],
+        created_at=node["createdAt"],
+    )
 
 
 class LinearAdapter(IssueTrackerProvider):
     """Linear API adapter implementing IssueTrackerProvider protocol"""
 
-    def __init__(self, api_token: Optional[str] = None):
+    def __init__(
+        self,
+        api_token: Optional[str] = None,
+        *,
+        priority: Priority = Priority.INTERACTIVE,
+        scheduler: Optional[LinearScheduler] = None,
+    ):
         settings = get_settings()
         self.api_token = api_token or settings.linear_api_token
-        self.client = LinearClient(self.api_token)
+        self.priority = priority
+        self.scheduler = scheduler or get_linear_scheduler()
+
+    async def _execute(
+        self,
+        query: str,
+        variables: Optional[dict] = None,
+        *,
+        allow_partial: bool = False,
+    ) -> dict:
+        """
+        Execute a GraphQL document against Linear
+
+        Args:
+            query: GraphQL query or mutation
+            variables: Optional GraphQL variables
+            allow_partial: Return whatever data resolved even if some fields errored
+
+        Returns:
+            dict: The "data" member of the response
+
+        Raises:
+            LinearAPIError: If the response contains GraphQL errors and allow_partial is False
+        """
+        response = await self.scheduler.post(
+            self.api_token,
+            {"query": query, "variables": variables or {}},
+            priority=self.priority,
+        )
+
+        result = response.json() or {}
+        if result.get("errors") and not allow_partial:
+            raise LinearAPIError(result["errors"][0].get("message", "Linear API error"))
+
+        return result.get("data") or {}
+
+    async def _resolve_issue_id(self, issue_id: str) -> str:
+        """
+        Resolve an issue identifier to its UUID, using the shared cache
+
+        Args:
+            issue_id: Issue identifier or UUID
+
+        Returns:
+            str: Linear issue UUID
+        """
+        if issue_id in _issue_uuids:
+            return _issue_uuids[issue_id]
+
+        data = await self._execute(
+            """
+            query IssueId($id: String!) {
+                issue(id: $id) {
+                    id
+                    identifier
+                    team {
+                        id
+                    }
+                }
+            }
+            """,
+            {"id": issue_id},
+        )
+        issue = data.get("issue") or {}
+        remember_issue_id(issue.get("identifier", ""), issue.get("id", ""))
+        remember_issue_team(issue.get("id", ""), (issue.get("team") or {}).get("id", ""))
+        return issue.get("id") or issue_id
+
+    async def _resolve_state_id(self, issue_uuid: str, status: str) -> Optional[str]:
+        """
+        Resolve a workflow state name within the issue's team, loading each team's states once
+
+        Args:
+            issue_uuid: Linear issue UUID
+            status: Workflow state name (e.g., "Approved")
+
+        Returns:
+            State ID, or None if the issue's team has no state with that name
+        """
+        if issue_uuid not in _issue_teams:
+            # UUIDs cached from other responses don't say which team the issue is in
+            await self._resolve_issue_id(issue_uuid)
+        team_id = _issue_teams.get(issue_uuid)
+        if not team_id:
+            return None
+
+        if team_id not in _workflow_state_ids:
+            data = await self._execute(
+                """
+                query TeamStates($teamId: ID!) {
+                    workflowStates(first: 250, filter: { team: { id: { eq: $teamId } } }) {
+                        nodes {
+                            id
+                            name
+                        }
+                    }
+                }
+                """,
+                {"teamId": team_id},
+            )
+            _workflow_state_ids[team_id] = {
+                state["name"]: state["id"]
+                for state in data.get("workflowStates", {}).get("nodes", [])
+            }
+
+        return _workflow_state_ids[team_id].get(status)
+
+    async def _build_update_input(
+        self,
+        issue_uuid: str,
+        *,
+        status: Optional[str],
+        assignee_id: Optional[str],
+    ) -> dict:
+        """Build IssueUpdateInput from optional status name and assignee"""
+        update_input = {}
+
+        if status is not None:
+            state_id = await self._resolve_state_id(issue_uuid, status)
+            if state_id:
+                update_input["stateId"] = state_id
+
+        if assignee_id is not None:
+            update_input["assigneeId"] = assignee_id
+
+        return update_input
 
     async def get_issue(self, issue_id: str) -> Issue:
         """Fetch issue metadata from Linear"""
-        issue = await self.client.issue(issue_id)
-
-        # Extract custom field for feature file path
-        custom_fields = {}
-        for field in issue.custom_fields or []:
-            custom_fields[field.name] = field.value
+        data = await self._execute(
+            """
+            query Issue($id: String!) {
+                issue(id: $id) {
+                    id
+                    identifier
+                    title
+                    state {
+                        name
+                    }
+                    assignee {
+                        id
+                    }
+                    project {
+                        id
+                    }
+                }
+            }
+            """,
+            {"id": issue_id},
+        )
+        issue = data["issue"]
+        remember_issue_id(issue["identifier"], issue["id"])
 
         return Issue(
-            id=issue.identifier,
-            title=issue.title,
-            status=issue.state.name,
-            assignee_id=issue.assignee.id if issue.assignee else None,
-            project_id=issue.project.id if issue.project else "",
-            custom_fields=custom_fields,
+            id=issue["identifier"],
+            title=issue["title"],
+            status=issue["state"]["name"],
+            assignee_id=issue["assignee"]["id"] if issue.get("assignee") else None,
+            project_id=issue["project"]["id"] if issue.get("project") else "",
+            custom_fields={},
         )
 
     async def update_issue(
@@ -42,43 +245,143 @@ class LinearAdapter(IssueTrackerProvider):
         status: Optional[str] = None,
         assignee_id: Optional[str] = None,
     ) -> None:
-        """Update issue fields in Linear"""
-        issue = await self.client.issue(issue_id)
+        """Update issue fields in Linear with a single issueUpdate mutation"""
+        issue_uuid = await self._resolve_issue_id(issue_id)
+        update_input = await self._build_update_input(
+            issue_uuid, status=status, assignee_id=assignee_id
+        )
 
-        update_params = {}
+        if not update_input:
+            return
 
-        if status is not None:
-            # Find workflow state by name
-            states = await self.client.workflow_states()
-            matching_state = next((s for s in states if s.name == status), None)
-            if matching_state:
-                update_params["state_id"] = matching_state.id
+        data = await self._execute(
+            """
+            mutation IssueUpdate($id: String!, $input: IssueUpdateInput!) {
+                issueUpdate(id: $id, input: $input) {
+                    success
+                }
+            }
+            """,
+            {"id": issue_uuid, "input": update_input},
+        )
+        if not data.get("issueUpdate", {}).get("success"):
+            raise LinearAPIError(f"issueUpdate failed for {issue_id}")
 
-        if assignee_id is not None:
-            update_params["assignee_id"] = assignee_id
+    async def add_comment(self, issue_id: str, content: str) -> Comment:
+        """Add comment to Linear issue with a single commentCreate mutation"""
+        data = await self._execute(
+            """
+            mutation CommentCreate($input: CommentCreateInput!) {
+                commentCreate(input: $input) {
+                    success
+                    comment {
+                        id
+                        body
+                        createdAt
+                        user {
+                            id
+                        }
+                    }
+                }
+            }
+            """,
+            {"input": {"issueId": await self._resolve_issue_id(issue_id), "body": content}},
+        )
 
-        if update_params:
-            await issue.update(**update_params)
+        return _comment_from_node(issue_id, data["commentCreate"]["comment"])
 
-    async def add_comment(self, issue_id: str, content: str) -> Comment:
-        """Add comment to Linear issue"""
-        issue = await self.client.issue(issue_id)
-        comment = await issue.create_comment(body=content)
-
-        return Comment(
-            id=comment.id,
-            issue_id=issue_id,
-            author_id=comment.user.id,
-            content=comment.body,
-            created_at=comment.created_at.isoformat(),
+    async def update_issue_with_comment(
+        self,
+        issue_id: str,
+        content: str,
+        *,
+        status: Optional[str] = None,
+        assignee_id: Optional[str] = None,
+    ) -> tuple[bool, Comment]:
+        """
+        Update issue fields and add a comment in one combined GraphQL mutation
+
+        Args:
+            issue_id: Issue identifier or UUID
+            content: Comment body
+            status: Optional workflow state name
+            assignee_id: Optional assignee user ID
+
+        Returns:
+            tuple[bool, Comment]: Whether the update succeeded, and the created comment
+
+        Raises:
+            LinearAPIError: If status names no workflow state of the issue's team;
+                nothing is sent, so the comment never announces a move that didn't happen
+        """
+        issue_uuid = await self._resolve_issue_id(issue_id)
+        update_input = await self._build_update_input(
+            issue_uuid, status=status, assignee_id=assignee_id
+        )
+        if status is not None and "stateId" not in update_input:
+            raise LinearAPIError(f"No workflow state {status!r} in the team of {issue_id}")
+
+        # Root mutation fields execute serially, so the update lands before the
+        # comment; a failed update still leaves the comment in place.
+        data = await self._execute(
+            """
+            mutation UpdateWithComment(
+                $id: String!
+                $input: IssueUpdateInput!
+                $comment: CommentCreateInput!
+            ) {
+                issueUpdate(id: $id, input: $input) {
+                    success
+                }
+                commentCreate(input: $comment) {
+                    success
+                    comment {
+                        id
+                        body
+                        createdAt
+                        user {
+                            id
+                        }
+                    }
+                }
+            }
+            """,
+            {
+                "id": issue_uuid,
+                "input": update_input,
+                "comment": {"issueId": issue_uuid, "body": content},
+            },
+            allow_partial=True,
         )
 
+        comment_result = data.get("commentCreate") or {}
+        if not comment_result.get("comment"):
+            raise LinearAPIError(f"commentCreate failed for {issue_id}")
+
+        issue_updated = bool((data.get("issueUpdate") or {}).get("success"))
+        return issue_updated, _comment_from_node(issue_id, comment_result["comment"])
+
     async def get_users(self, team_id: str) -> list[User]:
         """Get team members from Linear for delegation"""
-        team = await self.client.team(team_id)
-        members = await team.members()
+        data = await self._execute(
+            """
+            query TeamMembers($id: String!) {
+                team(id: $id) {
+                    members(first: 250) {
+                        nodes {
+                            id
+                            name
+                            email
+                        }
+                    }
+                }
+            }
+            """,
+            {"id": team_id},
+        )
+        members = data.get("team", {}).get("members", {}).get("nodes", [])
 
         return [
-            User(id=member.id, email=member.email, name=member.name)
+            User(id=member["id"], email=member["email"], name=member["name"])
             for member in members
         ]
@@ -3,33 +3,50 @@ Gherkin Taster FastAPI Application
 Stateless web application for business approval of AI-generated Gherkin specifications
 """
 
+import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 
 from backend.config import get_settings
+from backend.instrumentation import render_metrics
 from backend.middleware.auth_middleware import setup_auth_middleware
-from backend.routes import features, approval, navigation, auth
+from backend.middleware.instrumentation_middleware import setup_instrumentation_middleware
+from backend.services.analysis_executor import get_analysis_executor
+from backend.services.linear_scheduler import get_linear_scheduler
+from backend.services.sessions import SESSION_COOKIE, load_session
+from backend.structured_logging import configure_logging, shutdown_logging
+from backend.templating import precompile_templates
+from backend.routes import features, approval, navigation, auth, webhooks
 
 # Initialize settings
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan events"""
     # Startup
-    print(f"🚀 Gherkin Taster starting in {settings.environment} mode")
-    print(f"📍 Linear org: {settings.linear_org}")
-    print(f"📍 GitHub org: {settings.github_org}")
+    configure_logging(settings)
+    logger.info("Gherkin Taster starting in %s mode", settings.environment)
+    logger.info("Linear org: %s, GitHub org: %s", settings.linear_org, settings.github_org)
+
+    # Compile templates before the first request, not during it
+    logger.info("Precompiled %d templates", precompile_templates())
+
+    # Spawn analysis workers now so the first large spec doesn't pay for it
+    await get_analysis_executor().start()
 
     yield
 
     # Shutdown
-    print("👋 Gherkin Taster shutting down")
+    logger.info("Gherkin Taster shutting down")
+    get_analysis_executor().shutdown()
+    shutdown_logging()
 
 
 # Create FastAPI app
@@ -42,17 +59,16 @@ app = FastAPI(
 
 # Setup middleware
 setup_auth_middleware(app)
+setup_instrumentation_middleware(app)
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
-# Setup templates
-templates = Jinja2Templates(directory="app/templates")
-
 # Register routes
 app.include_router(auth.router, prefix="/auth", tags=["auth"])
 app.include_router(features.router, prefix="/features", tags=["features"])
 app.include_router(approval.router, prefix="/approval", tags=["approval"])
+app.include_router(webhooks.router, prefix="/webhooks", tags=["webhooks"])
 app.include_router(navigation.router, prefix="", tags=["navigation"])
 
 
@@ -62,11 +78,22 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy"}
 
 
+@app.get("/metrics")
+async def metrics() -> PlainTextResponse:
+    """Prometheus metrics endpoint"""
+    return PlainTextResponse(
+        get_linear_scheduler().render_metrics()
+        + get_analysis_executor().render_metrics()
+        + render_metrics()
+    )
+
+
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root redirect to login or features"""
-    from fastapi.responses import RedirectResponse
-    # TODO: Check if user has session cookie, redirect to /features if yes
+    session_id = request.cookies.get(SESSION_COOKIE)
+    if session_id and await load_session(session_id):
+        return RedirectResponse(url="/features")
     return RedirectResponse(url="/auth/login")
 
 
@@ -22,11 +22,19 @@ class Settings(BaseSettings):
     linear_team: str = "demo"
     linear_oauth_client_id: str = ""
     linear_oauth_client_secret: str = ""
+    linear_webhook_secret: str = ""
+    linear_api_url: str = "https://api.linear.app/graphql"
+    linear_oauth_url: str = "https://linear.app/oauth/authorize"
+    linear_oauth_token_url: str = "https://api.linear.app/oauth/token"
 
     # GitHub Configuration
     github_api_token: str = ""
     github_org: str = "demo"
     github_repo: str = "demo-repo"
+    github_base_branch: str = "main"
+    github_features_dir: str = "features"
+    git_author_email: str = "gherkin-taster@buckler.ai"
+    github_api_url: str = "https://api.github.com"
 
     # LLM Configuration (optional)
     llm_api_key: str | None = None
@@ -35,18 +43,41 @@ class Settings(BaseSettings):
 
     # Gemini Configuration
     gemini_api_key: str = ""
+    gemini_api_url: str = "https://generativelanguage.googleapis.com"
+    gemini_model: str = "gemini-2.5-flash"
 
     # Redis Configuration
     redis_url: str = "redis://localhost:6379/0"
 
     # Application Configuration
     log_level: str = "INFO"
+    log_debug_sample_rate: float = 0.1  # Share of DEBUG events kept
     environment: str = "development"
+    template_cache_dir: str = ""  # Jinja bytecode cache, defaults to a temp dir
 
     # Session Configuration
     session_ttl: int = 86400  # 24 hours
+    session_teams_ttl: int = 300  # 5 minutes before a session's visible teams are re-fetched
+    token_revalidation_interval: int = 900  # 15 minutes between token re-validations
     edit_lock_ttl: int = 1800  # 30 minutes
 
+    # Cache Configuration
+    team_directory_ttl: int = 3600  # 1 hour
+    issue_cache_ttl: int = 604800  # 7 days, kept fresh by Linear webhooks
+
+    # Gherkin Analysis Configuration
+    analysis_workers: int = 2  # Worker processes for large specs
+    analysis_inline_max_bytes: int = 16384  # Smaller specs are analysed in-process
+
+    # Feature Index Configuration
+    feature_index_ttl: int = 300  # Seconds before the repo's feature files are re-listed
+    feature_index_concurrency: int = 8  # Blob fetches in flight while indexing
+    step_similarity_path: str = ""  # Persisted step vectors (base path); empty keeps them in memory
+
+    # Issue Search Configuration
+    issue_search_sync_interval: int = 300  # Seconds between incremental syncs of the search index
+    issue_search_path: str = ""  # Persisted search index (JSON file); empty keeps it in memory
+
     # Email Configuration (optional)
     email_smtp_host: str | None = None
     email_smtp_port: int = 587
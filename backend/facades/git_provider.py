@@ -4,6 +4,14 @@ Defines interface for Git hosting providers (GitHub, GitLab, Bitbucket)
 """
 
 from typing import Protocol
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TreeEntry:
+    """File in a branch's tree"""
+    path: str
+    sha: str  # Blob SHA: changes exactly when the file content changes
 
 
 class GitProvider(Protocol):
@@ -30,3 +38,11 @@ class GitProvider(Protocol):
     async def create_branch(self, repo: str, branch_name: str, from_branch: str) -> None:
         """Create new branch from existing branch"""
         ...
+
+    async def list_tree(self, repo: str, branch: str) -> list[TreeEntry]:
+        """List every file on a branch in one call"""
+        ...
+
+    async def get_blob(self, repo: str, sha: str) -> str:
+        """Fetch file content by blob SHA"""
+        ...
@@ -57,6 +57,17 @@ class IssueTrackerProvider(Protocol):
         """Add comment to issue"""
         ...
 
+    async def update_issue_with_comment(
+        self,
+        issue_id: str,
+        content: str,
+        *,
+        status: Optional[str] = None,
+        assignee_id: Optional[str] = None,
+    ) -> tuple[bool, Comment]:
+        """Update issue fields and add comment in one round trip, return (updated, comment)"""
+        ...
+
     async def get_users(self, team_id: str) -> list[User]:
         """Get team members for delegation"""
         ...
@@ -0,0 +1,350 @@
+"""
+Spec Compiler
+Pure functions compiling AI spec YAML to .feature text and back, with source line maps
+"""
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator, Optional
+import yaml
+from gherkin.errors import CompositeParserException, ParserException
+from gherkin.parser import Parser
+from yaml.nodes import MappingNode, Node, ScalarNode, SequenceNode
+from backend.instrumentation import timed
+from backend.gherkin.spec_yaml import SpecLoader, spec_hash
+
+# Spec step groups in Gherkin order
+STEP_GROUPS = (("given", "Given"), ("when", "When"), ("then", "Then"))
+
+# gherkin-official keywordType -> spec step group
+_KEYWORD_TYPE_GROUPS = {"Context": "given", "Action": "when", "Outcome": "then"}
+
+
+@dataclass(frozen=True)
+class CompiledText:
+    """
+    Output of the spec compiler
+
+    source_lines[i] is the 1-based source line that produced output line
+    i + 1, or 0 for lines with no source (blank lines, table headers).
+    """
+
+    text: str
+    source_lines: tuple[int, ...]
+    source_hash: str
+
+    def source_line(self, line: int) -> int:
+        """
+        Map an output line back to its source line
+
+        Args:
+            line: 1-based output line (e.g., from a Gherkin parser error)
+
+        Returns:
+            int: Source line of the nearest preceding mapped output line (1 if none)
+        """
+        for index in range(min(line, len(self.source_lines)) - 1, -1, -1):
+            if self.source_lines[index]:
+                return self.source_lines[index]
+        return 1
+
+
+class SpecCompileError(ValueError):
+    """Spec could not be compiled, with the 1-based source line at fault"""
+
+    def __init__(self, message: str, line: int = 1):
+        super().__init__(message)
+        self.line = line
+
+
+class _Emitter:
+    """Collect output lines together with their source lines"""
+
+    def __init__(self):
+        self.lines: list[str] = []
+        self.source_lines: list[int] = []
+
+    def emit(self, text: str, source_line: int = 0) -> None:
+        self.lines.append(text)
+        self.source_lines.append(source_line)
+
+    def result(self, source: str) -> CompiledText:
+        return CompiledText(
+            text="\n".join(self.lines) + "\n",
+            source_lines=tuple(self.source_lines),
+            source_hash=spec_hash(source).hex(),
+        )
+
+
+def _line(node: Node) -> int:
+    """1-based source line of a YAML node"""
+    return node.start_mark.line + 1
+
+
+def _get(node: Optional[Node], key: str) -> Optional[Node]:
+    """Value node for a key of a mapping node, or None"""
+    if not isinstance(node, MappingNode):
+        return None
+    for key_node, value_node in node.value:
+        if key_node.value == key:
+            return value_node
+    return None
+
+
+def _scalar(node: Optional[Node], default: str = "") -> str:
+    """Text of a scalar node"""
+    if node is None:
+        return default
+    if not isinstance(node, ScalarNode):
+        raise SpecCompileError("Expected text", _line(node))
+    return node.value.strip()
+
+
+def _items(node: Optional[Node]) -> list[Node]:
+    """Item nodes of a sequence node (a lone scalar counts as one item)"""
+    if node is None:
+        return []
+    if isinstance(node, SequenceNode):
+        return node.value
+    if isinstance(node, ScalarNode) and node.value:
+        return [node]
+    if isinstance(node, ScalarNode):
+        return []
+    raise SpecCompileError("Expected a list", _line(node))
+
+
+def _emit_tags(out: _Emitter, node: Optional[Node], indent: str) -> None:
+    """Emit a tag line from a list of tag names"""
+    tags = [_scalar(tag) for tag in _items(node)]
+    if tags:
+        names = (tag if tag.startswith("@") else f"@{tag}" for tag in tags)
+        out.emit(indent + " ".join(names), _line(node))
+
+
+def _emit_steps(out: _Emitter, node: Node, indent: str) -> None:
+    """Emit Given/When/Then groups, continuing each group with And"""
+    for group, keyword in STEP_GROUPS:
+        for index, step in enumerate(_items(_get(node, group))):
+            out.emit(f"{indent}{keyword if index == 0 else 'And'} {_scalar(step)}", _line(step))
+
+
+def _table_cell(value: str) -> str:
+    """Escape a Gherkin table cell"""
+    return value.replace("\\", "\\\\").replace("|", "\\|").replace("\n", "\\n")
+
+
+def _emit_examples(out: _Emitter, node: Optional[Node], indent: str) -> None:
+    """Emit an Examples table from a list of row mappings"""
+    rows = _items(node)
+    if not rows:
+        return
+
+    header: list[str] = []
+    for row in rows:
+        if not isinstance(row, MappingNode):
+            raise SpecCompileError("Examples rows must be mappings", _line(row))
+        for key_node, _ in row.value:
+            if key_node.value not in header:
+                header.append(key_node.value)
+
+    cells = [[_table_cell(column) for column in header]]
+    for row in rows:
+        cells.append([_table_cell(_scalar(_get(row, column))) for column in header])
+
+    widths = [max(len(row[index]) for row in cells) for index in range(len(header))]
+
+    out.emit("")
+    out.emit(f"{indent}Examples:", _line(node))
+    for row_node, row in zip([node, *rows], cells, strict=True):
+        padded = " | ".join(cell.ljust(width) for cell, width in zip(row, widths, strict=True))
+        out.emit(f"{indent}  | {padded} |", _line(row_node))
+
+
+@lru_cache(maxsize=256)
+@timed("gherkin_parse")
+def compile_spec(spec_yaml: str) -> CompiledText:
+    """
+    Compile spec YAML (feature.title, scenarios[].given/when/then) to .feature text
+
+    Works on the composed YAML node tree so every emitted line keeps the
+    line of the YAML value it came from. Keys other than `feature` (such as
+    `analysis`) are ignored. Memoized per spec text.
+
+    Args:
+        spec_yaml: Spec YAML document text
+
+    Returns:
+        CompiledText: Gherkin text with a line map back to the YAML
+
+    Raises:
+        SpecCompileError: If the YAML is invalid or has no feature section
+    """
+    try:
+        root = yaml.compose(spec_yaml, Loader=SpecLoader)
+    except yaml.YAMLError as e:
+        mark = getattr(e, "problem_mark", None)
+        raise SpecCompileError(f"Invalid YAML: {e}", mark.line + 1 if mark else 1) from e
+
+    feature = _get(root, "feature")
+    if not isinstance(feature, MappingNode):
+        raise SpecCompileError("Spec has no 'feature' section", _line(root) if root else 1)
+
+    out = _Emitter()
+    _emit_tags(out, _get(feature, "tags"), "")
+
+    title = _get(feature, "title")
+    out.emit(f"Feature: {_scalar(title, 'Untitled')}", _line(title or feature))
+
+    description = _get(feature, "description")
+    if description is not None:
+        for offset, text in enumerate(_scalar(description).splitlines()):
+            out.emit(f"  {text}".rstrip(), _line(description) + offset)
+
+    background = _get(feature, "background")
+    if background is not None:
+        out.emit("")
+        out.emit("  Background:", _line(background))
+        _emit_steps(out, background, "    ")
+
+    for scenario in _items(_get(feature, "scenarios")):
+        if not isinstance(scenario, MappingNode):
+            raise SpecCompileError("Scenarios must be mappings", _line(scenario))
+
+        examples = _get(scenario, "examples")
+        keyword = "Scenario Outline" if _items(examples) else "Scenario"
+        name = _get(scenario, "scenario")
+
+        out.emit("")
+        _emit_tags(out, _get(scenario, "tags"), "  ")
+        out.emit(f"  {keyword}: {_scalar(name, 'Untitled')}", _line(name or scenario))
+        _emit_steps(out, scenario, "    ")
+        _emit_examples(out, examples, "    ")
+
+    return out.result(spec_yaml)
+
+
+def _quote(value: str) -> str:
+    """YAML double-quoted scalar (JSON strings are valid YAML)"""
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _step_groups(steps: list[dict]) -> Iterator[tuple[str, list[dict]]]:
+    """Group parsed steps into given/when/then, attaching And/But to the previous group"""
+    groups: dict[str, list[dict]] = {group: [] for group, _ in STEP_GROUPS}
+    current = "given"
+
+    for step in steps:
+        keyword_type = step.get("keywordType")
+        if keyword_type in _KEYWORD_TYPE_GROUPS:
+            current = _KEYWORD_TYPE_GROUPS[keyword_type]
+        elif keyword_type is None:
+            current = {"Given": "given", "When": "when", "Then": "then"}.get(
+                step["keyword"].strip(), current
+            )
+        groups[current].append(step)
+
+    for group, _ in STEP_GROUPS:
+        if groups[group]:
+            yield group, groups[group]
+
+
+def _emit_yaml_steps(out: _Emitter, steps: list[dict], indent: str) -> None:
+    """Emit given/when/then step lists"""
+    for group, group_steps in _step_groups(steps):
+        out.emit(f"{indent}{group}:")
+        for step in group_steps:
+            out.emit(f"{indent}  - {_quote(step['text'])}", step["location"]["line"])
+
+
+def _emit_yaml_scenario(out: _Emitter, scenario: dict, indent: str) -> None:
+    """Emit one scenarios[] entry"""
+    out.emit(f"{indent}- scenario: {_quote(scenario['name'])}", scenario["location"]["line"])
+    inner = indent + "  "
+
+    if scenario.get("tags"):
+        out.emit(f"{inner}tags:")
+        for tag in scenario["tags"]:
+            out.emit(f"{inner}  - {_quote(tag['name'])}", tag["location"]["line"])
+
+    _emit_yaml_steps(out, scenario.get("steps", []), inner)
+
+    rows = []
+    for examples in scenario.get("examples", []):
+        if not examples.get("tableHeader"):
+            continue
+        header = [cell["value"] for cell in examples["tableHeader"]["cells"]]
+        for row in examples.get("tableBody", []):
+            values = (cell["value"] for cell in row["cells"])
+            rows.append((row, dict(zip(header, values, strict=True))))
+
+    if rows:
+        out.emit(f"{inner}examples:")
+        for row, values in rows:
+            line = row["location"]["line"]
+            pairs = ", ".join(f"{_quote(key)}: {_quote(value)}" for key, value in values.items())
+            out.emit(f"{inner}  - {{{pairs}}}", line)
+
+
+@lru_cache(maxsize=256)
+@timed("gherkin_parse")
+def decompile_feature(content: str) -> CompiledText:
+    """
+    Convert .feature text back to spec YAML
+
+    Rule children are flattened into the feature's scenarios, all Examples
+    tables become `examples` rows, and doc strings and data tables (which
+    the spec schema has no place for) are dropped. Memoized per content.
+
+    Args:
+        content: Gherkin feature file content
+
+    Returns:
+        CompiledText: Spec YAML with a line map back to the .feature text
+
+    Raises:
+        SpecCompileError: If the Gherkin does not parse or has no Feature
+    """
+    try:
+        document = Parser().parse(content)
+    except (CompositeParserException, ParserException) as e:
+        errors = getattr(e, "errors", None) or [e]
+        location = getattr(errors[0], "location", None) or {}
+        raise SpecCompileError(str(errors[0]), location.get("line") or 1) from e
+
+    feature = document.get("feature")
+    if not feature:
+        raise SpecCompileError("No Feature found")
+
+    out = _Emitter()
+    out.emit("feature:")
+    out.emit(f"  title: {_quote(feature['name'])}", feature["location"]["line"])
+
+    description = (feature.get("description") or "").strip()
+    if description:
+        text = "\n".join(line.strip() for line in description.splitlines())
+        out.emit(f"  description: {_quote(text)}", feature["location"]["line"] + 1)
+
+    if feature.get("tags"):
+        out.emit("  tags:")
+        for tag in feature["tags"]:
+            out.emit(f"    - {_quote(tag['name'])}", tag["location"]["line"])
+
+    children = []
+    for child in feature.get("children", []):
+        if "rule" in child:
+            children.extend(child["rule"].get("children", []))
+        else:
+            children.append(child)
+
+    background = next((child["background"] for child in children if "background" in child), None)
+    if background:
+        out.emit("  background:", background["location"]["line"])
+        _emit_yaml_steps(out, background.get("steps", []), "    ")
+
+    out.emit("  scenarios:")
+    for child in children:
+        if "scenario" in child:
+            _emit_yaml_scenario(out, child["scenario"], "    ")
+
+    return out.result(content)
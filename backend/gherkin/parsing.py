@@ -3,49 +3,183 @@ Gherkin Parsing
 Pure functions for parsing Gherkin into structured data for preview
 """
 
-from typing import Optional
-from dataclasses import dataclass
+import sys
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import accumulate
+from typing import NamedTuple, Optional
+from dataclasses import dataclass, replace
 from gherkin.parser import Parser
+from backend.instrumentation import timed
 
+# Preview models are slotted and immutable: large specs and caches hold many of
+# them, and per-instance dicts and nested row lists dominated their footprint.
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
+class Table:
+    """Data table or Examples table, with all cells in one flat row-major tuple"""
+
+    width: int
+    cells: tuple[str, ...]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[str]]) -> "Table":
+        """
+        Build a table from rows of cells
+
+        Args:
+            rows: Rows of equal length (Gherkin rejects ragged tables)
+
+        Returns:
+            Table
+        """
+        rows = list(rows)
+        width = len(rows[0]) if rows else 0
+        return cls(width=width, cells=tuple(cell for row in rows for cell in row))
+
+    def __len__(self) -> int:
+        return len(self.cells) // self.width if self.width else 0
+
+    def __getitem__(self, index: int) -> tuple[str, ...]:
+        row = range(len(self))[index]
+        return self.cells[row * self.width : (row + 1) * self.width]
+
+    def __iter__(self) -> Iterator[tuple[str, ...]]:
+        for start in range(0, len(self.cells), self.width or 1):
+            yield self.cells[start : start + self.width]
+
+    def to_lists(self) -> list[list[str]]:
+        """Rows as nested lists (e.g., for JSON)"""
+        return [list(row) for row in self]
+
+
+@dataclass(frozen=True, slots=True)
 class GherkinStep:
     """Gherkin step"""
 
     keyword: str
     text: str
     doc_string: Optional[str] = None
-    data_table: Optional[list[list[str]]] = None
+    data_table: Optional[Table] = None
+    line: Optional[int] = None
+    column: Optional[int] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class GherkinExamples:
+    """Examples block of a scenario outline"""
+
+    keyword: str
+    name: str
+    tags: tuple[str, ...]
+    table: Optional[Table]  # Header row first; None for a block without a table
+
+    @property
+    def row_count(self) -> int:
+        """Data rows, excluding the header"""
+        return max(len(self.table) - 1, 0) if self.table else 0
+
+
+@dataclass(frozen=True, slots=True)
 class GherkinScenario:
-    """Gherkin scenario or scenario outline"""
+    """Gherkin scenario, scenario outline or background"""
 
     keyword: str
     name: str
     description: Optional[str]
-    steps: list[GherkinStep]
-    examples: Optional[list[list[str]]] = None
+    steps: tuple[GherkinStep, ...]
+    examples: tuple[GherkinExamples, ...] = ()
+    tags: tuple[str, ...] = ()
+    line: Optional[int] = None
+
+    @property
+    def rows(self) -> "ExpandedRows":
+        """The concrete scenarios this one runs as (one per Examples row for outlines)"""
+        return ExpandedRows(self)
+
+
+class ExpandedRows(Sequence):
+    """
+    Lazy view of an outline's Examples rows as concrete scenarios
+
+    Each row is built with its <placeholders> filled in only when accessed,
+    so huge Examples tables cost nothing until read. A scenario without
+    Examples is its own single row.
+    """
+
+    __slots__ = ("scenario", "_ends")
+
+    def __init__(self, scenario: GherkinScenario):
+        self.scenario = scenario
+        # Running row totals, to find the Examples block holding a given row
+        self._ends = list(accumulate(examples.row_count for examples in scenario.examples))
+
+    def __len__(self) -> int:
+        if not self.scenario.examples:
+            return 1
+        return self._ends[-1]
+
+    def __getitem__(self, index: int) -> GherkinScenario:
+        index = range(len(self))[index]
+        if not self.scenario.examples:
+            return self.scenario
 
+        block = bisect_right(self._ends, index)
+        examples = self.scenario.examples[block]
+        row = index - (self._ends[block - 1] if block else 0)
+        return _expand_row(self.scenario, examples, examples.table[row + 1])
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
+class GherkinRule:
+    """Gherkin rule grouping scenarios under their own background"""
+
+    keyword: str
+    name: str
+    description: Optional[str]
+    tags: tuple[str, ...]
+    background: Optional[GherkinScenario]
+    scenarios: tuple[GherkinScenario, ...]
+
+
+@dataclass(frozen=True, slots=True)
 class GherkinFeature:
     """Gherkin feature"""
 
     name: str
     description: Optional[str]
-    tags: list[str]
+    tags: tuple[str, ...]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedFeature:
-    """Parsed Gherkin feature with all elements"""
+    """
+    Parsed Gherkin feature with all elements
+
+    scenario_count and step_count match the pickle compiler: outlines count
+    once per Examples row, and background steps count in every scenario.
+    """
 
     feature: GherkinFeature
-    scenarios: list[GherkinScenario]
+    scenarios: tuple[GherkinScenario, ...]
+    background: Optional[GherkinScenario] = None
+    rules: tuple[GherkinRule, ...] = ()
+    scenario_count: int = 0
+    step_count: int = 0
+
+
+class _Children(NamedTuple):
+    """Converted children of a feature or rule"""
+
+    background: Optional[GherkinScenario]
+    scenarios: tuple[GherkinScenario, ...]
+    rules: tuple[GherkinRule, ...]
+    scenario_count: int
+    step_count: int
 
 
+@timed("gherkin_parse")
 def parse_gherkin(content: str) -> Optional[ParsedFeature]:
     """
     Parse Gherkin content into structured data for preview
@@ -65,78 +199,253 @@ def parse_gherkin(content: str) -> Optional[ParsedFeature]:
         if not feature_node:
             return None
 
-        # Parse feature
         feature = GherkinFeature(
             name=feature_node.get("name", ""),
-            description=feature_node.get("description", "").strip() or None,
-            tags=[tag["name"] for tag in feature_node.get("tags", [])],
+            description=_description(feature_node),
+            tags=_tags(feature_node),
+        )
+        children = _parse_children(feature_node.get("children", []), background_steps=0)
+
+        return ParsedFeature(
+            feature=feature,
+            scenarios=children.scenarios,
+            background=children.background,
+            rules=children.rules,
+            scenario_count=children.scenario_count,
+            step_count=children.step_count,
         )
-
-        # Parse scenarios
-        scenarios = []
-        for child in feature_node.get("children", []):
-            if "scenario" in child:
-                scenario_node = child["scenario"]
-                scenarios.append(_parse_scenario(scenario_node))
-
-        return ParsedFeature(feature=feature, scenarios=scenarios)
 
     except Exception:
         return None
 
 
+def _parse_children(children: list[dict], *, background_steps: int) -> _Children:
+    """
+    Convert the children of a feature or rule in a single pass
+
+    Counts are accumulated during the same walk instead of compiling pickles.
+
+    Args:
+        children: Feature or rule children ({"background"}, {"scenario"} or {"rule"})
+        background_steps: Steps inherited from enclosing backgrounds
+
+    Returns:
+        _Children
+    """
+    background = None
+    scenarios = []
+    rules = []
+    scenario_count = 0
+    step_count = 0
+
+    for child in children:
+        if "background" in child:
+            background = _parse_scenario(child["background"])
+            background_steps += len(background.steps)
+
+        elif "rule" in child:
+            rule_node = child["rule"]
+            rule_children = _parse_children(
+                rule_node.get("children", []), background_steps=background_steps
+            )
+            rules.append(
+                GherkinRule(
+                    keyword=sys.intern(rule_node["keyword"]),
+                    name=rule_node["name"],
+                    description=_description(rule_node),
+                    tags=_tags(rule_node),
+                    background=rule_children.background,
+                    scenarios=rule_children.scenarios,
+                )
+            )
+            scenario_count += rule_children.scenario_count
+            step_count += rule_children.step_count
+
+        elif "scenario" in child:
+            scenarios.append(_parse_scenario(child["scenario"]))
+            pickles, steps = _pickle_counts(child["scenario"], background_steps)
+            scenario_count += pickles
+            step_count += steps
+
+    return _Children(background, tuple(scenarios), tuple(rules), scenario_count, step_count)
+
+
 def _parse_scenario(scenario_node: dict) -> GherkinScenario:
     """
-    Parse scenario node into GherkinScenario
+    Parse scenario or background node into GherkinScenario
 
     Args:
-        scenario_node: Scenario dict from parser
+        scenario_node: Scenario or background dict from parser
 
     Returns:
         GherkinScenario
     """
-    # Parse steps
-    steps = []
-    for step_node in scenario_node.get("steps", []):
-        step = GherkinStep(
-            keyword=step_node["keyword"],
-            text=step_node["text"],
+    steps = tuple(_parse_step(step_node) for step_node in scenario_node.get("steps", []))
+
+    # Every Examples block, each with its own tags and table
+    examples = tuple(
+        GherkinExamples(
+            keyword=sys.intern(examples_node["keyword"]),
+            name=examples_node.get("name", ""),
+            tags=_tags(examples_node),
+            table=_examples_table(examples_node),
         )
+        for examples_node in scenario_node.get("examples", [])
+    )
 
-        # Parse doc string
-        if "docString" in step_node:
-            step.doc_string = step_node["docString"]["content"]
+    return GherkinScenario(
+        keyword=sys.intern(scenario_node["keyword"]),
+        name=scenario_node["name"],
+        description=_description(scenario_node),
+        steps=steps,
+        examples=examples,
+        tags=_tags(scenario_node),
+        line=scenario_node["location"]["line"],
+    )
 
-        # Parse data table
-        if "dataTable" in step_node:
-            rows = []
-            for row in step_node["dataTable"]["rows"]:
-                cells = [cell["value"] for cell in row["cells"]]
-                rows.append(cells)
-            step.data_table = rows
 
-        steps.append(step)
+def _parse_step(step_node: dict) -> GherkinStep:
+    """
+    Parse step node into GherkinStep
 
-    # Parse examples (for scenario outlines)
-    examples = None
-    if scenario_node.get("examples"):
-        examples_node = scenario_node["examples"][0]
-        if "tableHeader" in examples_node and "tableBody" in examples_node:
-            examples = []
+    Args:
+        step_node: Step dict from parser
 
-            # Header row
-            header = [cell["value"] for cell in examples_node["tableHeader"]["cells"]]
-            examples.append(header)
+    Returns:
+        GherkinStep
+    """
+    data_table = None
+    if "dataTable" in step_node:
+        data_table = Table.from_rows(
+            [cell["value"] for cell in row["cells"]] for row in step_node["dataTable"]["rows"]
+        )
 
-            # Data rows
-            for row in examples_node["tableBody"]:
-                cells = [cell["value"] for cell in row["cells"]]
-                examples.append(cells)
+    return GherkinStep(
+        keyword=sys.intern(step_node["keyword"]),
+        text=step_node["text"],
+        doc_string=step_node["docString"]["content"] if "docString" in step_node else None,
+        data_table=data_table,
+        line=step_node["location"]["line"],
+        column=step_node["location"]["column"],
+    )
 
-    return GherkinScenario(
-        keyword=scenario_node["keyword"],
-        name=scenario_node["name"],
-        description=scenario_node.get("description", "").strip() or None,
+
+def _examples_table(examples_node: dict) -> Optional[Table]:
+    """Header row, then data rows; None if the block has no table"""
+    if "tableHeader" not in examples_node:
+        return None
+    rows = [examples_node["tableHeader"], *examples_node.get("tableBody", [])]
+    return Table.from_rows([cell["value"] for cell in row["cells"]] for row in rows)
+
+
+def _description(node: dict) -> Optional[str]:
+    return node.get("description", "").strip() or None
+
+
+def _tags(node: dict) -> tuple[str, ...]:
+    return tuple(sys.intern(tag["name"]) for tag in node.get("tags", []))
+
+
+def count_pickles(gherkin_document: dict) -> tuple[int, int]:
+    """
+    Scenarios and steps the pickle compiler would produce, computed from the AST
+
+    For callers that only need the counts; parse_gherkin accumulates the same
+    counts while converting the document.
+
+    Args:
+        gherkin_document: Document from the gherkin-official parser
+
+    Returns:
+        (scenario_count, step_count): See _pickle_counts
+    """
+    feature_node = gherkin_document.get("feature") or {}
+    return _count_children(feature_node.get("children", []), background_steps=0)
+
+
+def _count_children(children: list[dict], *, background_steps: int) -> tuple[int, int]:
+    """Pickle counts for the children of a feature or rule"""
+    scenario_count = 0
+    step_count = 0
+
+    for child in children:
+        if "background" in child:
+            background_steps += len(child["background"].get("steps", []))
+        elif "rule" in child:
+            scenarios, steps = _count_children(
+                child["rule"].get("children", []), background_steps=background_steps
+            )
+            scenario_count += scenarios
+            step_count += steps
+        elif "scenario" in child:
+            scenarios, steps = _pickle_counts(child["scenario"], background_steps)
+            scenario_count += scenarios
+            step_count += steps
+
+    return scenario_count, step_count
+
+
+def _pickle_counts(scenario_node: dict, background_steps: int) -> tuple[int, int]:
+    """
+    Scenarios and steps the pickle compiler produces for one scenario
+
+    Args:
+        scenario_node: Scenario or outline dict from parser
+        background_steps: Steps of the enclosing backgrounds
+
+    Returns:
+        (scenarios, steps): Outlines give one scenario per Examples row; a
+        scenario without steps doesn't inherit background steps
+    """
+    examples = scenario_node.get("examples", [])
+    scenarios = (
+        sum(len(e.get("tableBody", [])) for e in examples if "tableHeader" in e)
+        if examples
+        else 1
+    )
+    own_steps = len(scenario_node.get("steps", []))
+    steps = background_steps + own_steps if own_steps else 0
+    return scenarios, scenarios * steps
+
+
+def _expand_row(
+    scenario: GherkinScenario, examples: GherkinExamples, values: tuple[str, ...]
+) -> GherkinScenario:
+    """
+    Fill an outline's <placeholders> from one Examples row
+
+    Args:
+        scenario: Scenario outline
+        examples: Examples block the row belongs to
+        values: Cells of the row
+
+    Returns:
+        GherkinScenario: Concrete scenario with the row's values and tags
+    """
+    header = examples.table[0]
+
+    def fill(text: str) -> str:
+        for name, value in zip(header, values, strict=True):
+            text = text.replace(f"<{name}>", value)
+        return text
+
+    steps = tuple(
+        replace(
+            step,
+            text=fill(step.text),
+            doc_string=fill(step.doc_string) if step.doc_string is not None else None,
+            data_table=(
+                Table(step.data_table.width, tuple(map(fill, step.data_table.cells)))
+                if step.data_table
+                else None
+            ),
+        )
+        for step in scenario.steps
+    )
+    return replace(
+        scenario,
+        name=fill(scenario.name),
         steps=steps,
-        examples=examples,
+        examples=(),
+        tags=scenario.tags + examples.tags,
     )
@@ -0,0 +1,171 @@
+"""
+Issue Description Sections
+Pure functions for splitting a Linear issue description into its sections
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import Optional
+import yaml
+from backend.gherkin.spec_yaml import load_spec_yaml
+
+METADATA_HEADING = "## Request Metadata"
+ANALYSIS_HEADING = "## AI Analysis"
+SPECIFICATION_HEADING = "## Gherkin Specification"
+
+_SECTION_HEADINGS = {
+    METADATA_HEADING: "metadata",
+    ANALYSIS_HEADING: "analysis",
+    SPECIFICATION_HEADING: "specification",
+}
+
+# "- **Request Type**: feature" -> ("Request Type", "feature")
+_METADATA_LINE = re.compile(r"^\s*-?\s*\*\*(?P<key>[^*]+)\*\*:\s*(?P<value>.*?)\s*$")
+
+
+@dataclass(frozen=True)
+class DescriptionSections:
+    """
+    Sections of an issue description as written by create/regenerate
+
+    Instances are memoized and shared between requests; treat them, and the
+    parsed YAML they return, as read-only.
+    """
+
+    plain_text: str
+    metadata: dict[str, str] = field(default_factory=dict)
+    analysis_text: str = ""
+    spec_yaml: str = ""
+    feature_yaml: str = ""
+    analysis_yaml: str = ""
+
+    @property
+    def request_type(self) -> str:
+        """Request type from the metadata ("feature", "bug", ...), or ""."""
+        match = re.match(r"\w+", self.metadata.get("Request Type", ""))
+        return match.group(0) if match else ""
+
+    @property
+    def priority(self) -> Optional[str]:
+        """Linear priority digit from the metadata, or None"""
+        match = re.match(r"\d+", self.metadata.get("Priority", ""))
+        return match.group(0) if match else None
+
+    @cached_property
+    def spec(self) -> Optional[dict]:
+        """
+        Parsed Gherkin specification YAML
+
+        Raises:
+            yaml.YAMLError: If the specification block is not valid YAML
+        """
+        if not self.spec_yaml:
+            return None
+        document = load_spec_yaml(self.spec_yaml)
+        return document if isinstance(document, dict) else None
+
+    @cached_property
+    def analysis(self) -> Optional[dict]:
+        """Parsed `analysis` mapping from the AI Analysis block, None if absent or invalid"""
+        if not self.analysis_yaml:
+            return None
+        try:
+            document = load_spec_yaml(self.analysis_yaml)
+        except yaml.YAMLError:
+            return None
+        return document.get("analysis") if isinstance(document, dict) else None
+
+
+def top_level_block(yaml_text: str, key: str) -> str:
+    """
+    Slice one top-level mapping entry out of YAML text without parsing it
+
+    Args:
+        yaml_text: YAML document text
+        key: Top-level key (e.g., "feature")
+
+    Returns:
+        Text of the entry from "key:" up to the next top-level key, or "" if absent
+    """
+    lines = yaml_text.splitlines()
+    start = None
+
+    for index, line in enumerate(lines):
+        if start is None:
+            if line.startswith(f"{key}:"):
+                start = index
+        elif line and not line[0].isspace() and not line.startswith(("#", "-")):
+            return "\n".join(lines[start:index]).rstrip() + "\n"
+
+    return "\n".join(lines[start:]).rstrip() + "\n" if start is not None else ""
+
+
+@lru_cache(maxsize=256)
+def parse_description(description: str) -> DescriptionSections:
+    """
+    Split an issue description into plain text, metadata, AI analysis and spec
+
+    Tokenizes the description in one pass over its lines. Only the known
+    section headings start a new section, so headings inside the AI response
+    stay part of the analysis. Memoized per description text.
+
+    Args:
+        description: Linear issue description (markdown)
+
+    Returns:
+        DescriptionSections: Read-only sections of the description
+    """
+    section_lines: dict[str, list[str]] = {
+        "plain": [],
+        "metadata": [],
+        "analysis": [],
+        "specification": [],
+    }
+    yaml_blocks: dict[str, str] = {}
+    first_yaml_block = ""
+
+    section = "plain"
+    fence: Optional[list[str]] = None
+
+    for line in description.splitlines():
+        stripped = line.strip()
+
+        if fence is not None:
+            if stripped.startswith("```"):
+                block = "\n".join(fence).strip()
+                yaml_blocks.setdefault(section, block)
+                first_yaml_block = first_yaml_block or block
+                fence = None
+            else:
+                fence.append(line)
+            section_lines[section].append(line)
+            continue
+
+        if stripped in _SECTION_HEADINGS:
+            section = _SECTION_HEADINGS[stripped]
+            continue
+
+        if stripped.startswith("```yaml"):
+            fence = []
+
+        section_lines[section].append(line)
+
+    metadata = {}
+    for line in section_lines["metadata"]:
+        match = _METADATA_LINE.match(line)
+        if match:
+            metadata[match.group("key").strip()] = match.group("value")
+
+    # Older descriptions may only carry the YAML inside the AI response
+    spec_yaml = yaml_blocks.get("specification") or first_yaml_block
+    analysis_yaml = yaml_blocks.get("analysis", "")
+
+    return DescriptionSections(
+        plain_text="\n".join(section_lines["plain"]).strip(),
+        metadata=metadata,
+        analysis_text="\n".join(section_lines["analysis"]).strip(),
+        spec_yaml=spec_yaml,
+        feature_yaml=top_level_block(spec_yaml, "feature") or spec_yaml,
+        analysis_yaml=top_level_block(analysis_yaml, "analysis"),
+    )
@@ -0,0 +1,84 @@
+"""
+Spec YAML
+Load and dump AI spec YAML with libyaml when available, caching parsed documents
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any
+import yaml
+
+try:
+    from yaml import CSafeDumper as SpecDumper, CSafeLoader as SpecLoader
+
+    LIBYAML = True
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as SpecDumper, SafeLoader as SpecLoader
+
+    LIBYAML = False
+
+# Parsed documents kept per process, keyed by content hash
+SPEC_CACHE_SIZE = 256
+
+_documents: "OrderedDict[bytes, Any]" = OrderedDict()
+
+
+def spec_hash(text: str) -> bytes:
+    """Content hash used as the parsed-document cache key"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def load_spec_yaml(text: str) -> Any:
+    """
+    Parse spec YAML, serving repeated content from the cache
+
+    The returned document is shared between callers; do not mutate it.
+
+    Args:
+        text: YAML document text
+
+    Returns:
+        Parsed document
+
+    Raises:
+        yaml.YAMLError: If the text is not valid YAML
+    """
+    key = spec_hash(text)
+
+    try:
+        _documents.move_to_end(key)
+        return _documents[key]
+    except KeyError:
+        pass
+
+    document = yaml.load(text, Loader=SpecLoader)
+
+    _documents[key] = document
+    if len(_documents) > SPEC_CACHE_SIZE:
+        _documents.popitem(last=False)
+
+    return document
+
+
+def dump_spec_yaml(document: Any) -> str:
+    """
+    Serialize a spec document as block-style YAML, keeping key order
+
+    Args:
+        document: Spec document (e.g., {"feature": {...}})
+
+    Returns:
+        YAML text
+    """
+    return yaml.dump(
+        document,
+        Dumper=SpecDumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+    )
+
+
+def clear_spec_cache() -> None:
+    """Drop all cached parsed documents"""
+    _documents.clear()
@@ -3,10 +3,18 @@ Gherkin Validation
 Pure functions for validating Gherkin syntax using gherkin-official parser
 """
 
+import re
+from collections.abc import Iterator
 from typing import Optional
 from dataclasses import dataclass
 from gherkin.parser import Parser
 from gherkin.pickles.compiler import Compiler
+from backend.gherkin.parsing import count_pickles
+from backend.instrumentation import timed
+
+# Parser error formats: "(12:3): expected ..." and "... line 12"
+_LOCATION_PATTERN = re.compile(r"\((\d+):")
+_LINE_PATTERN = re.compile(r"line (\d+)", re.IGNORECASE)
 
 
 @dataclass
@@ -28,6 +36,7 @@ class ValidationResult:
     step_count: int
 
 
+@timed("gherkin_validate")
 def validate_gherkin(content: str) -> ValidationResult:
     """
     Validate Gherkin syntax and return detailed results
@@ -47,13 +56,13 @@ def validate_gherkin(content: str) -> ValidationResult:
         # Parse Gherkin content
         gherkin_document = parser.parse(content)
 
-        # Compile to pickles (scenarios with examples expanded)
-        compiler = Compiler()
-        pickles = compiler.compile(gherkin_document)
+        if not gherkin_document.get("feature"):
+            raise ValueError("No Feature found (line 1)")
 
-        # Count scenarios and steps
-        scenario_count = len(pickles)
-        step_count = sum(len(pickle.steps) for pickle in pickles)
+        # Count what the pickle compiler would produce without building the
+        # pickles (an outline with thousands of rows is just rows x steps);
+        # the same arithmetic parse_gherkin uses for its counts
+        scenario_count, step_count = count_pickles(gherkin_document)
 
         return ValidationResult(
             is_valid=True,
@@ -83,6 +92,65 @@ def validate_gherkin(content: str) -> ValidationResult:
         )
 
 
+def iter_pickles(content: str) -> Iterator[dict]:
+    """
+    Expand Gherkin into pickles lazily, one scenario or Examples row at a time
+
+    Yields the same pickles as Compiler().compile, without holding them all.
+
+    Args:
+        content: Gherkin feature file content
+
+    Yields:
+        dict: Pickle (expanded scenario with background steps and values filled in)
+
+    Raises:
+        Parser errors if the content is not valid Gherkin
+    """
+    gherkin_document = Parser().parse(content)
+    feature_node = gherkin_document.get("feature")
+    if not feature_node:
+        return
+
+    # One compiler keeps pickle ids identical to a whole-document compile
+    compiler = Compiler()
+    backgrounds = []
+
+    def compile_one(child: dict) -> list[dict]:
+        feature = {**feature_node, "children": [*backgrounds, child]}
+        return compiler.compile({"uri": "spec.feature", "feature": feature})
+
+    for child in feature_node["children"]:
+        if "background" in child:
+            backgrounds.append(child)
+        elif "rule" in child:
+            rule_node = child["rule"]
+            rule_backgrounds = []
+            for rule_child in rule_node["children"]:
+                if "background" in rule_child:
+                    rule_backgrounds.append(rule_child)
+                    continue
+                for scenario_node in _single_row_scenarios(rule_child["scenario"]):
+                    children = [*rule_backgrounds, {"scenario": scenario_node}]
+                    yield from compile_one({"rule": {**rule_node, "children": children}})
+        else:
+            for scenario_node in _single_row_scenarios(child["scenario"]):
+                yield from compile_one({"scenario": scenario_node})
+
+
+def _single_row_scenarios(scenario_node: dict) -> Iterator[dict]:
+    """The scenario, or one copy of an outline per Examples row"""
+    if not scenario_node["examples"]:
+        yield scenario_node
+        return
+
+    for examples_node in scenario_node["examples"]:
+        if "tableHeader" not in examples_node:
+            continue
+        for row in examples_node["tableBody"]:
+            yield {**scenario_node, "examples": [{**examples_node, "tableBody": [row]}]}
+
+
 def _extract_line_number(error_message: str) -> int:
     """
     Extract line number from Gherkin parser error message
@@ -93,14 +161,11 @@ def _extract_line_number(error_message: str) -> int:
     Returns:
         int: Line number (1 if not found)
     """
-    # Gherkin parser errors often include "(line: N)" format
-    import re
-
-    match = re.search(r"\((\d+):", error_message)
+    match = _LOCATION_PATTERN.search(error_message)
     if match:
         return int(match.group(1))
 
-    match = re.search(r"line (\d+)", error_message, re.IGNORECASE)
+    match = _LINE_PATTERN.search(error_message)
     if match:
         return int(match.group(1))
 
@@ -0,0 +1,180 @@
+"""
+Instrumentation
+Latency and payload-size histograms, per-request spans and Prometheus rendering
+
+Spans time outbound calls (Linear, GitHub, Gemini) and Gherkin work. Each
+span feeds a process-wide histogram and, inside a request, the request's
+timings (reported in the Server-Timing header by the instrumentation
+middleware). Stdlib only, so pure modules can be instrumented too.
+"""
+
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from functools import wraps
+from typing import Callable, Iterator, Optional
+
+# Seconds: from cache hits up to slow Gemini video analysis
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Bytes: from small GraphQL bodies up to inline video uploads
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class Histogram:
+    """Prometheus-style cumulative histogram keyed by label values"""
+
+    def __init__(self, name: str, description: str, buckets: tuple[float, ...]):
+        self.name = name
+        self.description = description
+        self.buckets = buckets
+        # labels -> [count per bucket..., sum, count]
+        self.series: dict[tuple[tuple[str, str], ...], list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation"""
+        key = tuple(sorted(labels.items()))
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = [0] * (len(self.buckets) + 2)
+
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[index] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> list[str]:
+        """Prometheus text format lines"""
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        for key, series in self.series.items():
+            labels = ",".join(f'{name}="{value}"' for name, value in key)
+            prefix = f"{labels}," if labels else ""
+            # The sum and total count follow the bucket counts in series
+            for bound, count in zip(self.buckets, series, strict=False):
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {count}')
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {series[-1]}')
+            suffix = f"{{{labels}}}" if labels else ""
+            lines.append(f"{self.name}_sum{suffix} {series[-2]}")
+            lines.append(f"{self.name}_count{suffix} {series[-1]}")
+        return lines
+
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method, route and status",
+    LATENCY_BUCKETS,
+)
+SPAN_DURATION = Histogram(
+    "span_duration_seconds",
+    "Time spent in outbound calls and Gherkin work by span and outcome",
+    LATENCY_BUCKETS,
+)
+PAYLOAD_SIZE = Histogram(
+    "payload_size_bytes",
+    "Outbound call payload sizes by span and direction (sent/received)",
+    SIZE_BUCKETS,
+)
+
+# Span name -> total seconds for the current request (None outside requests)
+_request_timings: ContextVar[Optional[dict[str, float]]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def start_request_timings() -> tuple[dict[str, float], Token]:
+    """Collect span timings for the current request until the token is reset"""
+    timings: dict[str, float] = {}
+    return timings, _request_timings.set(timings)
+
+
+def stop_request_timings(token: Token) -> None:
+    """Stop collecting span timings for the current request"""
+    _request_timings.reset(token)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Time a block as a span
+
+    Args:
+        name: Span name (e.g., "linear", "gherkin_parse")
+    """
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        elapsed = time.perf_counter() - start
+        SPAN_DURATION.observe(elapsed, span=name, outcome=outcome)
+
+        timings = _request_timings.get()
+        if timings is not None:
+            timings[name] = timings.get(name, 0.0) + elapsed
+
+
+def timed(name: str) -> Callable:
+    """
+    Decorator running each call of a sync or async function in a span
+
+    Args:
+        name: Span name
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record_size(name: str, direction: str, size: int) -> None:
+    """
+    Record an outbound call's payload size
+
+    Args:
+        name: Span name the payload belongs to
+        direction: "sent" or "received"
+        size: Payload size in bytes
+    """
+    PAYLOAD_SIZE.observe(size, span=name, direction=direction)
+
+
+def server_timing(timings: dict[str, float], total: float) -> str:
+    """
+    Server-Timing header value
+
+    Args:
+        timings: Span name -> seconds for this request
+        total: Seconds from request start to response start
+
+    Returns:
+        str: e.g. 'linear;dur=41.2, gherkin_parse;dur=0.4, app;dur=47.9'
+    """
+    entries = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in timings.items()]
+    entries.append(f"app;dur={total * 1000:.1f}")
+    return ", ".join(entries)
+
+
+def render_metrics() -> str:
+    """Render request, span and payload histograms in Prometheus text format"""
+    lines = []
+    for histogram in (REQUEST_DURATION, SPAN_DURATION, PAYLOAD_SIZE):
+        lines += histogram.render()
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,41 @@
+"""
+Integration Registry
+Rarely-used integrations, imported on first use to keep them off the boot path
+"""
+
+from functools import lru_cache
+from importlib import import_module
+
+# Integration name -> "module:attribute". These only serve request creation
+# and approval; PyGithub in particular is one of the heaviest imports.
+INTEGRATIONS = {
+    "gemini": "backend.services.gemini_service:GeminiService",
+    "github": "backend.adapters.github:GitHubAdapter",
+}
+
+
+class IntegrationUnavailable(RuntimeError):
+    """Integration's optional dependency is not installed"""
+
+
+@lru_cache(maxsize=None)
+def load_integration(name: str):
+    """
+    Import an integration on first use
+
+    Args:
+        name: Key of INTEGRATIONS (e.g., "gemini")
+
+    Returns:
+        The integration's class
+
+    Raises:
+        KeyError: If no integration is registered under the name
+        IntegrationUnavailable: If its optional dependency is not installed
+    """
+    module_name, _, attribute = INTEGRATIONS[name].partition(":")
+    try:
+        module = import_module(module_name)
+    except ImportError as e:
+        raise IntegrationUnavailable(f"{name} integration unavailable: {e}") from e
+    return getattr(module, attribute)
@@ -1,32 +1,72 @@
 """
 Authentication Middleware
-Validates Linear API tokens on each request
+Loads the server-side session on each request
 """
 
-from fastapi import FastAPI, Request, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI
+from fastapi.responses import RedirectResponse
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Receive, Scope, Send
+from backend.services.sessions import SESSION_COOKIE, load_session, revalidate_session
 
+# Routes that never require a session
+PUBLIC_PATHS = frozenset(
+    {
+        "/",
+        "/health",
+        "/metrics",
+        "/auth/login",
+        "/auth/linear",
+        "/auth/callback",
+        "/auth/logout",
+        "/webhooks/linear",
+    }
+)
+PUBLIC_PREFIXES = ("/static/",)
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    """Validate Linear API token on each request"""
 
-    async def dispatch(self, request: Request, call_next):
-        # Skip auth for public routes
-        public_paths = ["/health", "/", "/auth/login", "/auth/linear", "/auth/callback", "/auth/logout"]
-        if request.url.path in public_paths or request.url.path.startswith("/static"):
-            return await call_next(request)
+def is_public_path(path: str) -> bool:
+    """True if the path is served without authentication"""
+    return path in PUBLIC_PATHS or path.startswith(PUBLIC_PREFIXES)
 
-        # Check for Linear token in cookies
-        linear_token = request.cookies.get("linear_token")
-        if not linear_token:
-            # Redirect to login if no token
-            from fastapi.responses import RedirectResponse
-            return RedirectResponse(url="/auth/login", status_code=303)
 
-        # TODO: Validate token with Linear API
-        # For now, trust the cookie
-        response = await call_next(request)
-        return response
+class AuthMiddleware:
+    """
+    Load the session cookie's session and expose it as request.state.session
+
+    The viewer is also exposed as request.state.viewer. Each request costs
+    one Redis read; Linear is asked who the user is at login and again once
+    per token re-validation interval.
+
+    Pure ASGI, so responses (including SSE streams) pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or is_public_path(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        session_id = HTTPConnection(scope).cookies.get(SESSION_COOKIE)
+        if not session_id:
+            await RedirectResponse(url="/auth/login", status_code=303)(scope, receive, send)
+            return
+
+        session = await load_session(session_id)
+        if session is not None:
+            session = await revalidate_session(session)
+        if session is None:
+            response = RedirectResponse(url="/auth/login?error=expired", status_code=303)
+            response.delete_cookie(SESSION_COOKIE)
+            await response(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+        state["session"] = session
+        state["viewer"] = session.viewer
+        await self.app(scope, receive, send)
 
 
 def setup_auth_middleware(app: FastAPI) -> None:
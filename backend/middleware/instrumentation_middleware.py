@@ -0,0 +1,63 @@
+"""
+Instrumentation Middleware
+Times every request and reports where the time went
+"""
+
+import time
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from backend.instrumentation import (
+    REQUEST_DURATION,
+    server_timing,
+    start_request_timings,
+    stop_request_timings,
+)
+
+
+class InstrumentationMiddleware:
+    """
+    Record request latency by route and add a Server-Timing header
+
+    The header breaks the time to first byte down by span (linear, github,
+    gemini, gherkin_parse, gherkin_validate), so browser dev tools show where
+    a slow page spent its time. Pure ASGI, so streamed responses are untouched.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        timings, token = start_request_timings()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", server_timing(timings, time.perf_counter() - start))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            # Route templates, not raw paths, to keep label cardinality bounded
+            route = getattr(scope.get("route"), "path", "unmatched")
+            REQUEST_DURATION.observe(
+                time.perf_counter() - start,
+                method=scope["method"],
+                route=route,
+                status=str(status),
+            )
+            stop_request_timings(token)
+
+
+def setup_instrumentation_middleware(app: FastAPI) -> None:
+    """Setup instrumentation middleware (add last so it wraps all others)"""
+    app.add_middleware(InstrumentationMiddleware)
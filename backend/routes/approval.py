@@ -3,85 +3,374 @@ Approval Routes
 HTMX endpoints for approve, delegate, route actions
 """
 
-from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse
+import asyncio
+import html
+import logging
+from dataclasses import replace
+from typing import Optional
+from fastapi import APIRouter, BackgroundTasks, Form, Request
+from fastapi.responses import HTMLResponse, RedirectResponse
+from backend.adapters.linear import LinearAdapter
+from backend.config import get_settings
+from backend.facades.issue_tracker import Issue
+from backend.gherkin.compiler import CompiledText, SpecCompileError
+from backend.gherkin.parsing import parse_gherkin
+from backend.gherkin.sections import parse_description
+from backend.gherkin.validation import ValidationError, ValidationResult, validate_gherkin
+from backend.integrations import IntegrationUnavailable, load_integration
+from backend.services.analysis_executor import AnalysisSuperseded, get_analysis_executor
+from backend.services.feature_index import (
+    IndexMatches,
+    get_feature_index,
+    refresh_feature_index,
+)
+from backend.services.feature_list import visible_team_ids
+from backend.services.step_similarity import (
+    KnownStep,
+    SimilarStep,
+    get_step_similarity,
+    learn_steps,
+)
+from backend.services.feature_spec import get_compiled_feature, load_issue
+from backend.services.linear_scheduler import Priority
+from backend.services.sessions import Session, current_session, session_token
+from backend.services.team_directory import get_team_members
+from backend.services.viewer import current_viewer
+from backend.templating import templates
+from backend.workflows.approval_workflow import approve_feature as approve_workflow
+from backend.workflows.delegation_workflow import delegate_feature as delegate_workflow
+from backend.workflows.delegation_workflow import route_feature as route_workflow
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
-@router.post("/{issue_id}/approve")
-async def approve_feature(issue_id: str):
-    """Approve feature and commit to Git"""
-    # TODO: Implement approval workflow
-    return {"status": "approved", "commit_sha": "placeholder"}
+def _issue_ref(issue_id: str) -> Issue:
+    """
+    Minimal Issue for workflows that only need the identifier
+
+    Delegation and routing only address the issue by ID, so skip fetching
+    the full issue from Linear.
+    """
+    return Issue(
+        id=issue_id,
+        title="",
+        status="",
+        assignee_id=None,
+        project_id="",
+        custom_fields={},
+    )
 
 
-@router.post("/{issue_id}/delegate")
-async def delegate_feature(issue_id: str, delegate_to_user_id: str, comment: str):
-    """Delegate feature review to another user"""
-    # TODO: Implement delegation workflow
-    return {"status": "delegated", "assignee": delegate_to_user_id}
+def _viewer_name(request: Request) -> str:
+    """Display name for comments and commits made on the viewer's behalf"""
+    viewer = current_viewer(request)
+    return viewer.name if viewer and viewer.name else "Gherkin Taster"
 
 
-@router.post("/{issue_id}/route")
-async def route_for_input(issue_id: str, route_to_user_id: str, comment: str):
-    """Route feature to another user for input"""
-    # TODO: Implement routing workflow
-    return {"status": "routed", "assignee": route_to_user_id}
+async def _run_workflow(workflow, **kwargs) -> Optional[dict]:
+    """Run a workflow after the response has been sent; returns None if it failed"""
+    try:
+        return await workflow(**kwargs)
+    except Exception:
+        logger.exception("%s failed for %s", workflow.__name__, kwargs["issue"].id)
+        return None
 
 
-@router.get("/{issue_id}/validate", response_class=HTMLResponse)
-async def validate_gherkin(request: Request, issue_id: str):
-    """Validate Gherkin syntax (HTMX partial)"""
-    # TODO: Implement actual Gherkin validation
-    return """
-    <div class="mt-4">
-        <div class="rounded-md bg-green-50 p-4">
-            <div class="flex">
-                <div class="flex-shrink-0">
-                    <svg class="h-5 w-5 text-green-400" viewBox="0 0 20 20" fill="currentColor">
-                        <path fill-rule="evenodd" d="M10 18a8 8 0 100-16 8 8 0 000 16zm3.707-9.293a1 1 0 00-1.414-1.414L9 10.586 7.707 9.293a1 1 0 00-1.414 1.414l2 2a1 1 0 001.414 0l4-4z" clip-rule="evenodd"/>
-                    </svg>
-                </div>
-                <div class="ml-3">
-                    <p class="text-sm font-medium text-green-800">Gherkin syntax is valid</p>
-                </div>
-            </div>
-        </div>
-    </div>
+async def _approve_and_learn(**kwargs) -> None:
+    """Run the approval workflow, then offer the committed steps as suggestions"""
+    if await _run_workflow(approve_workflow, **kwargs) is None:
+        return
+
+    parsed = parse_gherkin(kwargs["feature_content"])
+    if parsed:
+        path = kwargs["feature_file_path"]
+        await asyncio.to_thread(
+            learn_steps, (KnownStep(text, path) for text in _step_texts(parsed))
+        )
+
+
+def _step_texts(parsed) -> list[str]:
+    """Texts of every step in a parsed feature, backgrounds and rules included"""
+    scenarios = [parsed.background, *parsed.scenarios]
+    for rule in parsed.rules:
+        scenarios += [rule.background, *rule.scenarios]
+    return [step.text for scenario in scenarios if scenario for step in scenario.steps]
+
+
+def _feature_file_path(identifier: str) -> str:
+    """Repository path an issue's spec is committed to"""
+    settings = get_settings()
+    return f"{settings.github_features_dir}/{identifier.lower()}.feature"
+
+
+async def _refresh_feature_index(git_provider) -> None:
+    """Refresh the repo feature index after the response has been sent"""
+    settings = get_settings()
+    index = get_feature_index()
+    try:
+        stats = await refresh_feature_index(
+            index,
+            git_provider=git_provider,
+            repo=f"{settings.github_org}/{settings.github_repo}",
+            branch=settings.github_base_branch,
+            concurrency=settings.feature_index_concurrency,
+        )
+    except Exception:
+        logger.exception("Feature index refresh failed")
+        return
+
+    # Steps new to the repo become similarity suggestions
+    if stats and stats.fetched:
+        known = [KnownStep(found[0].text, found[0].path) for found in index.steps.values()]
+        await asyncio.to_thread(learn_steps, known)
+
+
+async def _repo_suggestions(
+    issue: dict, compiled: CompiledText, background_tasks: BackgroundTasks
+) -> tuple[Optional[IndexMatches], list[tuple[str, SimilarStep]]]:
+    """
+    Overlap between a valid spec and the specs already in the repository
+
+    A stale feature index is refreshed in the background; until the first
+    refresh completes there are no matches.
+
+    Returns:
+        (index_matches, similar_steps): Duplicate scenarios and exactly reusable
+        steps (None if the index is empty), and (edited step, closest approved
+        step) pairs for steps without an exact match
+    """
+    index = get_feature_index()
+    if index.is_stale(get_settings().feature_index_ttl):
+        try:
+            background_tasks.add_task(_refresh_feature_index, load_integration("github")())
+        except IntegrationUnavailable as e:
+            logger.debug("Feature index unavailable: %s", e)
+
+    similarity = get_step_similarity()
+    if not index.files and not len(similarity):
+        return None, []
+
+    parsed = await get_analysis_executor().run(parse_gherkin, compiled.text)
+    if parsed is None:
+        return None, []
+
+    index_matches = None
+    exact = set()
+    if index.files:
+        index_matches = index.match(parsed, exclude_path=_feature_file_path(issue["identifier"]))
+        exact = {text for text, _ in index_matches.reusable_steps}
+
+    texts = list(dict.fromkeys(text for text in _step_texts(parsed) if text not in exact))
+    # NumPy releases the GIL for the matrix product
+    results = await asyncio.to_thread(similarity.search, texts, k=1)
+    similar_steps = [(text, found[0]) for text, found in zip(texts, results, strict=True) if found]
+
+    return index_matches, similar_steps[:5]
+
+
+async def _validate_issue_spec(
+    issue_id: str, session: Session, *, job_key: Optional[str] = None
+) -> tuple[Optional[dict], Optional[CompiledText], Optional[ValidationResult]]:
+    """
+    Compile the issue's spec and validate the compiled .feature text
+
+    Error lines are mapped back to lines of the spec YAML shown in the editor.
+    Large specs are validated in the analysis pool.
+
+    Args:
+        issue_id: Issue identifier
+        session: Signed-in user's session (token and visible teams)
+        job_key: Analysis job key; a newer validation with the same key supersedes this one
+
+    Raises:
+        AnalysisSuperseded: If a newer validation with the same job key was started
+
+    Returns:
+        (issue, compiled, validation): issue is None if not found; compiled and
+        validation are None if the issue has no spec yet
     """
+    issue = await load_issue(
+        issue_id, session.linear_token, team_ids=await visible_team_ids(session)
+    )
+    if not issue:
+        return None, None, None
+
+    sections = parse_description(issue.get("description") or "")
+    if not sections.spec_yaml:
+        return issue, None, None
+
+    try:
+        compiled = await get_compiled_feature(issue["identifier"], sections.spec_yaml)
+    except SpecCompileError as e:
+        error = ValidationError(line=e.line, column=0, message=str(e))
+        return issue, None, ValidationResult(False, [error], 0, 0)
+
+    validation = await get_analysis_executor().run(
+        validate_gherkin, compiled.text, job_key=job_key
+    )
+    for error in validation.errors:
+        error.line = compiled.source_line(error.line)
+
+    return issue, compiled, validation
+
+
+@router.post("/{issue_id}/approve", response_class=HTMLResponse)
+async def approve_feature(request: Request, issue_id: str, background_tasks: BackgroundTasks):
+    """Validate the compiled spec, then commit it to Git (optimistic HTMX response)"""
+    session = current_session(request)
+    if not session:
+        return RedirectResponse(url="/auth/login", status_code=303)
+    linear_token = session.linear_token
+
+    issue, compiled, validation = await _validate_issue_spec(issue_id, session)
+    if issue is None:
+        return HTMLResponse("<p class='text-sm text-red-600'>Issue not found</p>", status_code=404)
+
+    # Shown in the syntax feedback panel; HTMX does not swap 4xx responses
+    if compiled is None or not validation.is_valid:
+        return templates.TemplateResponse(
+            "partials/syntax_feedback.html",
+            {"request": request, "validation_result": validation},
+        )
+
+    # PyGithub is an optional dependency, loaded on first approval
+    try:
+        github_adapter = load_integration("github")
+    except IntegrationUnavailable as e:
+        logger.error("Approve unavailable: %s", e)
+        return HTMLResponse(
+            "<p class='text-sm text-red-600'>Git integration unavailable</p>", status_code=503
+        )
+
+    settings = get_settings()
+    background_tasks.add_task(
+        _approve_and_learn,
+        issue=replace(_issue_ref(issue["identifier"]), title=issue["title"]),
+        feature_content=compiled.text,
+        repo=f"{settings.github_org}/{settings.github_repo}",
+        feature_file_path=_feature_file_path(issue["identifier"]),
+        base_branch=settings.github_base_branch,
+        author_name=_viewer_name(request),
+        author_email=settings.git_author_email,
+        issue_tracker=LinearAdapter(linear_token, priority=Priority.BACKGROUND),
+        git_provider=github_adapter(),
+        llm_api_key=settings.llm_api_key,
+    )
+
+    return HTMLResponse(
+        "<p class='text-sm text-green-700'>Feature approved, committing...</p>",
+        headers={"HX-Trigger": "featureApproved"},
+    )
+
+
+@router.post("/{issue_id}/delegate", response_class=HTMLResponse)
+async def delegate_feature(
+    request: Request,
+    issue_id: str,
+    background_tasks: BackgroundTasks,
+    assignee_id: str = Form(...),
+    comment: str = Form(""),
+):
+    """Delegate feature review to another user (optimistic HTMX response)"""
+    linear_token = session_token(request)
+    if not linear_token:
+        return RedirectResponse(url="/auth/login", status_code=303)
+
+    background_tasks.add_task(
+        _run_workflow,
+        delegate_workflow,
+        issue=_issue_ref(issue_id),
+        assignee_id=assignee_id,
+        delegator_name=_viewer_name(request),
+        comment=comment or None,
+        issue_tracker=LinearAdapter(linear_token, priority=Priority.BACKGROUND),
+    )
+
+    return HTMLResponse(
+        "<p class='text-sm text-green-700'>Feature delegated</p>",
+        headers={"HX-Trigger": "featureDelegated"},
+    )
+
+
+@router.post("/{issue_id}/route", response_class=HTMLResponse)
+async def route_for_input(
+    request: Request,
+    issue_id: str,
+    background_tasks: BackgroundTasks,
+    target_status: str = Form(...),
+    reason: str = Form(""),
+):
+    """Route feature to another workflow state for input (optimistic HTMX response)"""
+    linear_token = session_token(request)
+    if not linear_token:
+        return RedirectResponse(url="/auth/login", status_code=303)
+
+    background_tasks.add_task(
+        _run_workflow,
+        route_workflow,
+        issue=_issue_ref(issue_id),
+        target_status=target_status,
+        router_name=_viewer_name(request),
+        reason=reason or None,
+        issue_tracker=LinearAdapter(linear_token, priority=Priority.BACKGROUND),
+    )
+
+    return HTMLResponse(
+        f"<p class='text-sm text-green-700'>Feature routed to {html.escape(target_status)}</p>",
+        headers={"HX-Trigger": "featureRouted"},
+    )
+
+
+@router.get("/{issue_id}/validate", response_class=HTMLResponse)
+async def validate_gherkin_spec(request: Request, issue_id: str, background_tasks: BackgroundTasks):
+    """Validate the issue's compiled spec (HTMX partial)"""
+    session = current_session(request)
+    if not session:
+        return HTMLResponse("<p class='text-red-600'>Not authenticated</p>", status_code=401)
+
+    # Each edit re-validates; only the latest validation per editor matters
+    try:
+        issue, compiled, validation = await _validate_issue_spec(
+            issue_id, session, job_key=f"{session.id}:{issue_id}"
+        )
+    except AnalysisSuperseded:
+        # 204: HTMX leaves the panel alone; the newer request will fill it
+        return HTMLResponse(status_code=204)
+
+    index_matches, similar_steps = None, []
+    if compiled is not None and validation.is_valid:
+        index_matches, similar_steps = await _repo_suggestions(issue, compiled, background_tasks)
+
+    return templates.TemplateResponse(
+        "partials/syntax_feedback.html",
+        {
+            "request": request,
+            "validation_result": validation,
+            "index_matches": index_matches,
+            "similar_steps": similar_steps,
+        },
+    )
 
 
 @router.get("/{issue_id}/delegate-form", response_class=HTMLResponse)
-async def get_delegate_form(request: Request, issue_id: str):
+async def get_delegate_form(request: Request, issue_id: str, team_id: str = ""):
     """Get delegation modal form (HTMX partial)"""
-    # TODO: Fetch actual team members from Linear
-    return """
-    <div class="bg-white rounded-lg shadow-xl p-6 max-w-md w-full">
-        <h3 class="text-lg font-medium text-gray-900 mb-4">Delegate Feature</h3>
-        <form hx-post="/approval/{issue_id}/delegate" hx-swap="none">
-            <div class="mb-4">
-                <label class="block text-sm font-medium text-gray-700 mb-2">
-                    Delegate to:
-                </label>
-                <select name="delegate_to_user_id" class="w-full px-3 py-2 border border-gray-300 rounded-md">
-                    <option value="">Select team member...</option>
-                </select>
-            </div>
-            <div class="mb-4">
-                <label class="block text-sm font-medium text-gray-700 mb-2">
-                    Comment:
-                </label>
-                <textarea name="comment" rows="3" class="w-full px-3 py-2 border border-gray-300 rounded-md"></textarea>
-            </div>
-            <div class="flex justify-end space-x-3">
-                <button type="button" data-close-modal class="px-4 py-2 border border-gray-300 rounded-md text-gray-700 hover:bg-gray-50">
-                    Cancel
-                </button>
-                <button type="submit" class="px-4 py-2 bg-indigo-600 text-white rounded-md hover:bg-indigo-700">
-                    Delegate
-                </button>
-            </div>
-        </form>
-    </div>
-    """
+    session = current_session(request)
+
+    # The member directory is cached per team and shared by every user, so
+    # only list the members of a team this user can see
+    team_members = []
+    if session and team_id and team_id in await visible_team_ids(session):
+        team_members = await get_team_members(
+            team_id, issue_tracker=LinearAdapter(session.linear_token)
+        )
+
+    return templates.TemplateResponse(
+        "partials/delegation_modal.html",
+        {
+            "request": request,
+            "issue_id": issue_id,
+            "team_members": team_members,
+        },
+    )
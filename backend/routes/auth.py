@@ -3,14 +3,24 @@ Authentication Routes
 Linear OAuth flow
 """
 
+import logging
 from fastapi import APIRouter, Request, Response
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 import httpx
 from backend.config import get_settings
+from backend.services.sessions import (
+    LEGACY_COOKIES,
+    SESSION_COOKIE,
+    create_session,
+    delete_session,
+    load_session,
+    set_session_cookie,
+)
+from backend.services.viewer import resolve_viewer
+from backend.templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/templates")
+logger = logging.getLogger(__name__)
 
 
 @router.get("/login", response_class=HTMLResponse)
@@ -30,7 +40,7 @@ async def linear_oauth_redirect():
 
     # Linear OAuth authorization URL
     auth_url = (
-        f"https://linear.app/oauth/authorize"
+        f"{settings.linear_oauth_url}"
         f"?client_id={client_id}"
         f"&redirect_uri={redirect_uri}"
         f"&response_type=code"
@@ -48,7 +58,7 @@ async def linear_oauth_callback(request: Request, code: str):
     # Exchange code for access token
     async with httpx.AsyncClient() as client:
         response = await client.post(
-            "https://api.linear.app/oauth/token",
+            settings.linear_oauth_token_url,
             data={
                 "client_id": settings.linear_oauth_client_id,
                 "client_secret": settings.linear_oauth_client_secret,
@@ -60,54 +70,36 @@ async def linear_oauth_callback(request: Request, code: str):
         )
         token_data = response.json()
 
-    # Log the response for debugging
-    print(f"Token exchange response: {token_data}")
-
     access_token = token_data.get("access_token")
 
     if not access_token:
-        print(f"Token exchange failed: {token_data}")
+        logger.warning("Token exchange failed", extra={"response": token_data})
         return RedirectResponse(url="/auth/login?error=failed")
 
-    # Get user info from Linear
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://api.linear.app/graphql",
-            headers={"Authorization": f"Bearer {access_token}"},
-            json={
-                "query": "{ viewer { id name email } }",
-            },
-        )
-        user_data = response.json()
+    # Get user info from Linear (also validates the token)
+    viewer = await resolve_viewer(access_token)
+    if viewer is None:
+        logger.warning("Token exchange returned a token Linear rejects")
+        return RedirectResponse(url="/auth/login?error=failed")
 
-    viewer = user_data.get("data", {}).get("viewer", {})
+    # Keep the token server-side; the browser only gets an opaque session id
+    session = await create_session(access_token, viewer)
 
-    # Store token in session (Redis)
-    # TODO: Store in Redis with user ID as key
-    # For now, store in cookie (not secure for production)
     response = RedirectResponse(url="/features", status_code=303)
-    response.set_cookie(
-        key="linear_token",
-        value=access_token,
-        httponly=True,
-        max_age=2592000,  # 30 days
-        secure=False,  # Set True in production with HTTPS
-    )
-    response.set_cookie(
-        key="user_id", value=viewer.get("id", ""), httponly=True, max_age=2592000
-    )
-    response.set_cookie(
-        key="user_name", value=viewer.get("name", ""), httponly=True, max_age=2592000
-    )
+    set_session_cookie(response, session)
 
     return response
 
 
 @router.get("/logout")
-async def logout():
+async def logout(request: Request):
     """Logout and clear session"""
+    session_id = request.cookies.get(SESSION_COOKIE)
+    if session_id:
+        await delete_session(session_id)
+
     response = RedirectResponse(url="/auth/login", status_code=303)
-    response.delete_cookie("linear_token")
-    response.delete_cookie("user_id")
-    response.delete_cookie("user_name")
+    response.delete_cookie(SESSION_COOKIE)
+    for cookie in LEGACY_COOKIES:
+        response.delete_cookie(cookie)
     return response
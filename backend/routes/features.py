@@ -3,109 +3,214 @@ Feature Routes
 HTMX endpoints for feature list, view, and edit
 """
 
-from fastapi import APIRouter, Request, Form, File, UploadFile
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
+import asyncio
+import base64
+import logging
+from urllib.parse import urlencode
+import httpx
+from fastapi import APIRouter, BackgroundTasks, Request, Form, File, UploadFile
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 from typing import Optional
+from backend.adapters.linear import remember_issue_id
+from backend.config import get_settings
+from backend.gherkin.compiler import SpecCompileError
+from backend.gherkin.parsing import ParsedFeature, parse_gherkin
+from backend.gherkin.sections import parse_description
+from backend.integrations import load_integration
+from backend.services.analysis_executor import get_analysis_executor
+from backend.services.feature_list import (
+    FeaturePage,
+    fetch_feature_page,
+    visible_team_ids,
+)
+from backend.services.feature_spec import get_compiled_feature, load_issue
+from backend.services.issue_cache import invalidate_assigned_issues, invalidate_issue
+from backend.services.issue_search import (
+    IssueSearchIndex,
+    get_issue_search,
+    index_issues,
+    sync_issue_search,
+)
+from backend.services.linear_file_service import LinearFileService
+from backend.services.linear_scheduler import Priority, get_linear_scheduler
+from backend.services.linear_webhooks import subscribe_issue_events
+from backend.services.sessions import current_session, save_session, session_token
+from backend.services.viewer import current_viewer
+from backend.templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/templates")
+logger = logging.getLogger(__name__)
 
+# Resolved once from the shared, precompiled environment (autoescaped)
+preview_template = templates.get_template("features/preview.html")
 
-@router.get("/", response_class=HTMLResponse)
-async def list_features(request: Request, team: str = None):
-    """List all features assigned to current user"""
-    import httpx
+# Specs with more scenarios than this stream their preview
+PREVIEW_STREAM_SCENARIOS = 50
 
-    # Get user's Linear token
-    linear_token = request.cookies.get("linear_token")
-    if not linear_token:
-        return RedirectResponse(url="/auth/login", status_code=303)
+# Rows returned by feature search
+SEARCH_RESULTS = 25
 
-    # Fetch teams first
-    async with httpx.AsyncClient() as client:
-        teams_response = await client.post(
-            "https://api.linear.app/graphql",
-            headers={"Authorization": f"Bearer {linear_token}"},
-            json={
-                "query": """
-                    query {
-                        teams(first: 50) {
-                            nodes {
-                                id
-                                name
-                                key
-                            }
-                        }
-                    }
-                """
-            },
+
+def _next_page_url(
+    page: FeaturePage, *, team: Optional[str], gherkin: bool, sort: str
+) -> Optional[str]:
+    """URL of the page after this one, keeping the list filters"""
+    if not page.has_next_page:
+        return None
+
+    params = {"after": page.end_cursor, "sort": sort}
+    if team:
+        params["team"] = team
+    if gherkin:
+        params["gherkin"] = "true"
+    return f"/features/page?{urlencode(params)}"
+
+
+def _prefetch_next_page(
+    background_tasks: BackgroundTasks,
+    page: FeaturePage,
+    linear_token: str,
+    user_id: Optional[str],
+    **filters,
+) -> None:
+    """Warm the cache with the page after this one at background priority"""
+    if page.has_next_page and user_id:
+        background_tasks.add_task(
+            fetch_feature_page,
+            linear_token,
+            user_id,
+            after=page.end_cursor,
+            priority=Priority.BACKGROUND,
+            **filters,
         )
-        teams_data = teams_response.json()
 
-    teams = teams_data.get("data", {}).get("teams", {}).get("nodes", [])
 
-    # Fetch issues assigned to current user from Linear
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://api.linear.app/graphql",
-            headers={"Authorization": f"Bearer {linear_token}"},
-            json={
-                "query": """
-                    query {
-                        viewer {
-                            assignedIssues(first: 50) {
-                                nodes {
-                                    id
-                                    identifier
-                                    title
-                                    description
-                                    state {
-                                        name
-                                    }
-                                    priority
-                                    createdAt
-                                    updatedAt
-                                    team {
-                                        id
-                                        name
-                                        key
-                                    }
-                                }
-                            }
-                        }
-                    }
-                """
-            },
+def _sync_search_index(
+    background_tasks: BackgroundTasks, linear_token: str, team_ids: set[str]
+) -> IssueSearchIndex:
+    """Schedule an incremental sync of the user's teams in the search index when due"""
+    index = get_issue_search()
+    if index.is_stale(get_settings().issue_search_sync_interval, team_ids):
+        background_tasks.add_task(
+            sync_issue_search, index, linear_token=linear_token, team_ids=team_ids
         )
-        data = response.json()
+    return index
 
-    issues = data.get("data", {}).get("viewer", {}).get("assignedIssues", {}).get("nodes", [])
 
-    # Filter by team if specified
-    if team:
-        issues = [issue for issue in issues if issue.get("team", {}).get("id") == team]
+@router.get("/", response_class=HTMLResponse)
+async def list_features(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    team: str = None,
+    gherkin: bool = False,
+    sort: str = "updated",
+):
+    """List features assigned to current user, first page only"""
 
-    # Transform Linear issues to features format
-    features = [
-        {
-            "issue_id": issue["identifier"],
-            "title": issue["title"],
-            "status": issue["state"]["name"],
-            "priority": issue["priority"],
-            "updated_at": issue["updatedAt"],
-            "has_gherkin": "```yaml" in (issue.get("description") or "") or "## Gherkin Specification" in (issue.get("description") or ""),
-        }
-        for issue in issues
-    ]
+    session = current_session(request)
+    if not session:
+        return RedirectResponse(url="/auth/login", status_code=303)
+
+    # A bare /features reopens the list the way the user last left it
+    if request.query_params:
+        filters = {"team": team, "gherkin_only": gherkin, "sort": sort}
+    else:
+        filters = {"team": None, "gherkin_only": False, "sort": "updated"}
+        filters.update(session.preferences.get("feature_list", {}))
+
+    save = filters != session.preferences.get("feature_list")
+    session.preferences["feature_list"] = filters
+
+    # Loads or refreshes the session's teams (and saves it) alongside the page
+    team_ids, page = await asyncio.gather(
+        visible_team_ids(session),
+        fetch_feature_page(session.linear_token, session.viewer.id, **filters),
+    )
+
+    if save:
+        await save_session(session)
+
+    _prefetch_next_page(
+        background_tasks, page, session.linear_token, session.viewer.id, **filters
+    )
+    _sync_search_index(background_tasks, session.linear_token, team_ids)
 
     return templates.TemplateResponse(
         "features/list.html",
         {
             "request": request,
-            "features": features,
-            "teams": teams,
-            "selected_team": team,
+            "features": page.features,
+            "next_page_url": _next_page_url(
+                page,
+                team=filters["team"],
+                gherkin=filters["gherkin_only"],
+                sort=filters["sort"],
+            ),
+            "teams": session.teams,
+            "selected_team": filters["team"],
+            "gherkin_only": filters["gherkin_only"],
+            "sort": filters["sort"],
+        },
+    )
+
+
+@router.get("/page", response_class=HTMLResponse)
+async def list_features_page(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    after: str,
+    team: str = None,
+    gherkin: bool = False,
+    sort: str = "updated",
+):
+    """Next page of feature rows for infinite scroll (HTMX partial)"""
+
+    linear_token = session_token(request)
+    if not linear_token:
+        return HTMLResponse("", status_code=401)
+
+    viewer = current_viewer(request)
+    user_id = viewer.id if viewer else None
+    filters = {"team": team, "gherkin_only": gherkin, "sort": sort}
+
+    page = await fetch_feature_page(linear_token, user_id, after=after, **filters)
+    _prefetch_next_page(background_tasks, page, linear_token, user_id, **filters)
+
+    return templates.TemplateResponse(
+        "partials/feature_rows.html",
+        {
+            "request": request,
+            "features": page.features,
+            "next_page_url": _next_page_url(page, team=team, gherkin=gherkin, sort=sort),
+        },
+    )
+
+
+@router.get("/search", response_class=HTMLResponse)
+async def search_features(request: Request, background_tasks: BackgroundTasks, q: str = ""):
+    """Search every indexed issue by title, description, steps and tags (HTMX partial)"""
+
+    session = current_session(request)
+    if not session:
+        return HTMLResponse("", status_code=401)
+
+    # Only show issues of teams the user can see
+    team_ids = await visible_team_ids(session)
+    index = _sync_search_index(background_tasks, session.linear_token, team_ids)
+    query = q.strip()
+    if not query:
+        # Cleared search box: empty the results panel
+        return HTMLResponse("")
+
+    results = index.search(query, team_ids=team_ids, limit=SEARCH_RESULTS)
+
+    return templates.TemplateResponse(
+        "partials/search_results.html",
+        {
+            "request": request,
+            "query": query,
+            "features": [document.to_feature() for document in results],
+            "indexing": not team_ids <= index.synced_through.keys(),
         },
     )
 
@@ -113,52 +218,51 @@ async def list_features(request: Request, team: str = None):
 @router.get("/new", response_class=HTMLResponse)
 async def new_feature_form(request: Request):
     """Show new request form"""
-    import httpx
 
     # Get user's Linear token
-    linear_token = request.cookies.get("linear_token")
+    linear_token = session_token(request)
     if not linear_token:
         return RedirectResponse(url="/auth/login", status_code=303)
 
     # Fetch teams, projects and team members from Linear
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://api.linear.app/graphql",
-            headers={"Authorization": f"Bearer {linear_token}"},
-            json={
-                "query": """
-                    query {
-                        teams(first: 50) {
-                            nodes {
-                                id
-                                name
-                                key
-                            }
+    response = await get_linear_scheduler().post(
+        linear_token,
+        {
+            "query": """
+                query {
+                    teams(first: 50) {
+                        nodes {
+                            id
+                            name
+                            key
                         }
-                        projects(first: 50) {
-                            nodes {
-                                id
-                                name
-                            }
+                    }
+                    projects(first: 50) {
+                        nodes {
+                            id
+                            name
                         }
-                        users(first: 50) {
-                            nodes {
-                                id
-                                name
-                                email
-                            }
+                    }
+                    users(first: 50) {
+                        nodes {
+                            id
+                            name
+                            email
                         }
                     }
-                """
-            },
-        )
-        data = response.json()
+                }
+            """
+        },
+    )
+    data = response.json()
 
     teams = data.get("data", {}).get("teams", {}).get("nodes", [])
     projects = data.get("data", {}).get("projects", {}).get("nodes", [])
     team_members = data.get("data", {}).get("users", {}).get("nodes", [])
 
-    print(f"Loaded: {len(teams)} teams, {len(projects)} projects, {len(team_members)} users")
+    logger.debug(
+        "Loaded %d teams, %d projects, %d users", len(teams), len(projects), len(team_members)
+    )
 
     return templates.TemplateResponse(
         "features/new.html",
@@ -174,142 +278,27 @@ async def new_feature_form(request: Request):
 @router.get("/{issue_id}", response_class=HTMLResponse)
 async def view_feature(request: Request, issue_id: str):
     """View and edit a specific feature"""
-    import httpx
-    import re
 
-    # Get user's Linear token
-    linear_token = request.cookies.get("linear_token")
-    if not linear_token:
+    session = current_session(request)
+    if not session:
         return RedirectResponse(url="/auth/login", status_code=303)
 
-    # Fetch issue from Linear with full metadata
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://api.linear.app/graphql",
-            headers={"Authorization": f"Bearer {linear_token}"},
-            json={
-                "query": """
-                    query Issue($id: String!) {
-                        issue(id: $id) {
-                            id
-                            identifier
-                            title
-                            description
-                            state {
-                                name
-                            }
-                            priority
-                            team {
-                                id
-                                name
-                                key
-                            }
-                            project {
-                                id
-                                name
-                            }
-                            assignee {
-                                id
-                                name
-                                email
-                            }
-                            attachments {
-                                nodes {
-                                    id
-                                    title
-                                    url
-                                    metadata
-                                }
-                            }
-                        }
-                    }
-                """,
-                "variables": {"id": issue_id},
-            },
-        )
-        data = response.json()
-
-    issue = data.get("data", {}).get("issue")
-
+    issue = await load_issue(
+        issue_id, session.linear_token, team_ids=await visible_team_ids(session)
+    )
     if not issue:
         return RedirectResponse(url="/features", status_code=303)
 
-    # Extract content from description
-    description = issue.get("description") or ""
-    gherkin_content = ""
-    request_type = ""
-    priority_text = ""
-    ai_analysis = None
-
-    # Extract Gherkin YAML (feature section only, not analysis)
-    print(f"DEBUG: Extracting Gherkin from description (length: {len(description)})")
-    print(f"DEBUG: Description contains '```yaml': {'```yaml' in description}")
-
-    if "```yaml" in description:
-        import yaml
-        start = description.find("```yaml") + 7
-        end = description.find("```", start)
-        print(f"DEBUG: Gherkin positions - start: {start}, end: {end}")
-        if end > start:
-            full_yaml = description[start:end].strip()
-            # Parse YAML and extract only the feature section
-            try:
-                parsed_yaml = yaml.safe_load(full_yaml)
-                if "feature" in parsed_yaml:
-                    # Re-serialize only the feature section
-                    gherkin_content = yaml.dump({"feature": parsed_yaml["feature"]}, default_flow_style=False, sort_keys=False)
-                    print(f"DEBUG: Extracted feature-only content length: {len(gherkin_content)}")
-                else:
-                    gherkin_content = full_yaml
-                    print(f"DEBUG: No 'feature' key found, using full YAML")
-            except Exception as e:
-                print(f"DEBUG: YAML parse error: {e}, using full content")
-                gherkin_content = full_yaml
-
-    # Extract AI Analysis section
-    if "## AI Analysis" in description:
-        import yaml
-        analysis_start = description.find("## AI Analysis") + len("## AI Analysis")
-        analysis_end = description.find("## Gherkin Specification", analysis_start)
-        if analysis_end == -1:
-            analysis_end = len(description)
-
-        analysis_text = description[analysis_start:analysis_end].strip()
-
-        # Try to parse YAML from analysis
-        if "```yaml" in analysis_text:
-            yaml_start = analysis_text.find("```yaml") + 7
-            yaml_end = analysis_text.find("```", yaml_start)
-            if yaml_end > yaml_start:
-                try:
-                    analysis_yaml = yaml.safe_load(analysis_text[yaml_start:yaml_end])
-                    if "analysis" in analysis_yaml:
-                        ai_analysis = analysis_yaml["analysis"]
-                except:
-                    pass
-
-    # Extract request metadata
-    if "Request Type**:" in description:
-        match = re.search(r"Request Type\*\*:\s*(\w+)", description)
-        if match:
-            request_type = match.group(1)
-
-    if "Priority**:" in description:
-        match = re.search(r"Priority\*\*:\s*(\d+)", description)
-        if match:
-            priority_map = {
-                "0": "Urgent",
-                "1": "High",
-                "2": "Medium",
-                "3": "Low",
-                "4": "None"
-            }
-            priority_text = priority_map.get(match.group(1), "Unknown")
+    sections = parse_description(issue.get("description") or "")
 
-    # Extract plain description (before metadata section)
-    plain_description = description
-    if "## Request Metadata" in description:
-        plain_description = description.split("## Request Metadata")[0].strip()
+    priority_map = {
+        "0": "Urgent",
+        "1": "High",
+        "2": "Medium",
+        "3": "Low",
+        "4": "None"
+    }
+    priority_text = priority_map.get(sections.priority, "Unknown") if sections.priority else ""
 
     # Get attachments from issue
     attachments = issue.get("attachments", {}).get("nodes", [])
@@ -328,8 +317,8 @@ async def view_feature(request: Request, issue_id: str):
         "linear_id": issue["id"],
         "title": issue["title"],
         "status": issue["state"]["name"],
-        "description": plain_description,
-        "request_type": request_type,
+        "description": sections.plain_text,
+        "request_type": sections.request_type,
         "priority_text": priority_text,
         "priority": issue.get("priority", 0),
         "team": issue.get("team"),
@@ -340,12 +329,11 @@ async def view_feature(request: Request, issue_id: str):
         "screen_video_url": screen_video_url,
         "audio_url": audio_url,
         "attachments": attachments,
-        "ai_analysis": ai_analysis,
+        "ai_analysis": sections.analysis,
     }
 
-    final_content = gherkin_content or "# No Gherkin content yet"
-    print(f"DEBUG: Passing feature_content to template (length: {len(final_content)})")
-    print(f"DEBUG: First 100 chars: {final_content[:100]}")
+    # Editor shows only the feature section of the spec, not the analysis
+    final_content = sections.feature_yaml or "# No Gherkin content yet"
 
     return templates.TemplateResponse(
         "features/editor.html",
@@ -372,14 +360,10 @@ async def create_feature(
     screen_video: str = Form(""),
 ):
     """Create new request in Linear and trigger AI analysis"""
-    import httpx
-    from backend.config import get_settings
-    from backend.services.gemini_service import GeminiService
-
     settings = get_settings()
 
     # Get user's Linear token from session
-    linear_token = request.cookies.get("linear_token")
+    linear_token = session_token(request)
     if not linear_token:
         return RedirectResponse(url="/auth/login", status_code=303)
 
@@ -395,13 +379,10 @@ async def create_feature(
     gherkin_content = None
     analysis_summary = None
 
-    print(f"Screen video provided: {bool(screen_video)}")
-    print(f"Gemini API key configured: {bool(settings.gemini_api_key)}")
-
     if screen_video and settings.gemini_api_key:
-        print(f"Starting Gemini analysis for video of length: {len(screen_video)}")
+        logger.debug("Starting Gemini analysis", extra={"video_base64_length": len(screen_video)})
         try:
-            gemini_service = GeminiService()
+            gemini_service = load_integration("gemini")()
             result = await gemini_service.analyze_video_and_generate_gherkin(
                 video_base64=screen_video,
                 title=title,
@@ -410,36 +391,16 @@ async def create_feature(
             )
             gherkin_content = result["gherkin_yaml"]
             analysis_summary = result["raw_response"]
-            print(f"Gemini analysis completed successfully")
-        except Exception as e:
-            print(f"Gemini analysis failed: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Gemini analysis failed")
             # Continue without AI analysis
-    else:
-        if not screen_video:
-            print("No screen video provided")
-        if not settings.gemini_api_key:
-            print("No Gemini API key configured")
-
-    # Use the team ID provided by the user
-    print(f"Using selected team ID: {team_id}")
+    elif screen_video:
+        logger.info("No Gemini API key configured, skipping video analysis")
 
-    # Get current user ID if no assignee specified
+    # Assign to the creator if no assignee specified
     if not assignee_id:
-        async with httpx.AsyncClient() as client:
-            user_response = await client.post(
-                "https://api.linear.app/graphql",
-                headers={"Authorization": f"Bearer {linear_token}"},
-                json={
-                    "query": "{ viewer { id name } }"
-                },
-            )
-            user_data = user_response.json()
-
-        current_user = user_data.get("data", {}).get("viewer", {})
-        assignee_id = current_user.get("id")
-        print(f"No assignee specified, assigning to creator: {current_user.get('name')} ({assignee_id})")
+        viewer = current_viewer(request)
+        assignee_id = viewer.id if viewer else None
 
     # Create Linear issue with Gherkin in description
     # NOTE: Do NOT store base64 video in description - too large for Linear API
@@ -460,62 +421,71 @@ async def create_feature(
     if gherkin_content:
         issue_description += f"## Gherkin Specification\n\n```yaml\n{gherkin_content}\n```"
 
-    async with httpx.AsyncClient() as client:
-        mutation = """
-            mutation IssueCreate($input: IssueCreateInput!) {
-                issueCreate(input: $input) {
-                    success
-                    issue {
+    mutation = """
+        mutation IssueCreate($input: IssueCreateInput!) {
+            issueCreate(input: $input) {
+                success
+                issue {
+                    id
+                    identifier
+                    url
+                    title
+                    description
+                    state {
+                        name
+                    }
+                    priority
+                    updatedAt
+                    team {
                         id
-                        identifier
-                        url
                     }
                 }
             }
-        """
-
-        variables = {
-            "input": {
-                "title": title,
-                "description": issue_description,
-                "priority": priority,
-                "teamId": team_id,
-                "assigneeId": assignee_id,
-                "labelIds": [],  # TODO: Map label names to IDs
-            }
         }
+    """
+
+    variables = {
+        "input": {
+            "title": title,
+            "description": issue_description,
+            "priority": priority,
+            "teamId": team_id,
+            "assigneeId": assignee_id,
+            "labelIds": [],  # TODO: Map label names to IDs
+        }
+    }
 
-        if project_id:
-            variables["input"]["projectId"] = project_id
+    if project_id:
+        variables["input"]["projectId"] = project_id
 
-        response = await client.post(
-            "https://api.linear.app/graphql",
-            headers={"Authorization": f"Bearer {linear_token}"},
-            json={"query": mutation, "variables": variables},
-        )
+    response = await get_linear_scheduler().post(
+        linear_token,
+        {"query": mutation, "variables": variables},
+    )
 
-        result = response.json()
+    result = response.json()
 
     # Check if response is valid
     if result is None:
-        print(f"ERROR: Linear API returned None - likely request too large")
-        print(f"Video size: {len(screen_video) if screen_video else 0} bytes")
+        logger.error(
+            "Linear returned no issueCreate result, likely request too large",
+            extra={"video_base64_length": len(screen_video)},
+        )
         return RedirectResponse(url="/features?error=request_too_large", status_code=303)
 
-    print(f"Linear API response: {result}")
-
     # Check if issue was created successfully
     if result and result.get("data", {}).get("issueCreate", {}).get("success"):
         issue_identifier = result["data"]["issueCreate"]["issue"]["identifier"]
         issue_id = result["data"]["issueCreate"]["issue"]["id"]
-        print(f"Successfully created issue: {issue_identifier}")
+        remember_issue_id(issue_identifier, issue_id)
+        await index_issues([result["data"]["issueCreate"]["issue"]])
+        await invalidate_assigned_issues(assignee_id)
+        logger.info("Created issue %s", issue_identifier)
 
         # Upload video/audio as attachments if provided
-        from backend.services.linear_file_service import LinearFileService
         linear_file_service = LinearFileService(linear_token)
 
         if screen_video:
-            print(f"Uploading screen recording...")
             video_url = await linear_file_service.upload_file(
                 file_data=screen_video,
                 filename=f"{issue_identifier}_screen_recording.webm",
@@ -529,7 +499,6 @@ async def create_feature(
                 )
 
         if audio:
-            print(f"Uploading audio recording...")
             audio_url = await linear_file_service.upload_file(
                 file_data=audio,
                 filename=f"{issue_identifier}_audio_recording.webm",
@@ -544,129 +513,87 @@ async def create_feature(
 
         return RedirectResponse(url=f"/features/{issue_identifier}", status_code=303)
     else:
-        print(f"Failed to create issue: {result}")
-        # Check for errors
-        if result and "errors" in result:
-            print(f"GraphQL errors: {result['errors']}")
+        logger.warning("Failed to create issue", extra={"errors": result.get("errors")})
         return RedirectResponse(url="/features?error=creation_failed", status_code=303)
 
 
-@router.get("/{issue_id}/preview", response_class=HTMLResponse)
-async def preview_gherkin(request: Request, issue_id: str):
-    """Render Gherkin preview (HTMX partial)"""
-    import httpx
-    import yaml
+def _render_preview(parsed_feature: Optional[ParsedFeature] = None, **context):
+    """
+    Render the preview partial from a ParsedFeature
 
-    linear_token = request.cookies.get("linear_token")
-    if not linear_token:
-        return "<p class='text-red-600'>Not authenticated</p>"
+    Large specs are streamed as the template renders instead of being built
+    into one string first.
+    """
+    context["parsed_feature"] = parsed_feature
 
-    # Fetch issue to get Gherkin content
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://api.linear.app/graphql",
-            headers={"Authorization": f"Bearer {linear_token}"},
-            json={
-                "query": """
-                    query Issue($id: String!) {
-                        issue(id: $id) {
-                            description
-                        }
-                    }
-                """,
-                "variables": {"id": issue_id},
-            },
-        )
-        data = response.json()
-
-    issue = data.get("data", {}).get("issue")
-    if not issue:
-        return "<p class='text-red-600'>Issue not found</p>"
-
-    description = issue.get("description") or ""
+    if parsed_feature and parsed_feature.scenario_count > PREVIEW_STREAM_SCENARIOS:
+        return StreamingResponse(preview_template.generate(context), media_type="text/html")
 
-    # Extract Gherkin YAML
-    gherkin_yaml = None
-    if "```yaml" in description:
-        start = description.find("```yaml") + 7
-        end = description.find("```", start)
-        if end > start:
-            try:
-                gherkin_yaml = yaml.safe_load(description[start:end].strip())
-            except:
-                return "<p class='text-red-600'>Invalid YAML in Gherkin</p>"
+    return HTMLResponse(preview_template.render(context))
 
-    if not gherkin_yaml or "feature" not in gherkin_yaml:
-        return "<p class='text-gray-500 text-sm'>No Gherkin specification found</p>"
 
-    # Render Gherkin as formatted HTML
-    feature = gherkin_yaml["feature"]
-    html = f"<div class='space-y-4'>"
-    html += f"<div><span class='font-bold text-lg text-indigo-700'>Feature:</span> <span class='text-gray-900'>{feature.get('title', 'Untitled')}</span></div>"
-
-    if feature.get("description"):
-        html += f"<p class='text-sm text-gray-700 ml-4'>{feature['description']}</p>"
-
-    for scenario in feature.get("scenarios", []):
-        html += f"<div class='mt-4 p-4 bg-gray-50 rounded-lg'>"
-        html += f"<div class='font-semibold text-indigo-600'>Scenario: {scenario.get('scenario', 'Untitled')}</div>"
+@router.get("/{issue_id}/preview", response_class=HTMLResponse)
+async def preview_gherkin(request: Request, issue_id: str):
+    """Render Gherkin preview (HTMX partial)"""
 
-        for given in scenario.get("given", []):
-            html += f"<div class='ml-4 mt-2 text-sm'><span class='font-medium text-green-700'>Given</span> {given}</div>"
+    session = current_session(request)
+    if not session:
+        return _render_preview(error="Not authenticated")
 
-        for when in scenario.get("when", []):
-            html += f"<div class='ml-4 mt-1 text-sm'><span class='font-medium text-blue-700'>When</span> {when}</div>"
+    issue = await load_issue(
+        issue_id, session.linear_token, team_ids=await visible_team_ids(session)
+    )
+    if not issue:
+        return _render_preview(error="Issue not found")
 
-        for then in scenario.get("then", []):
-            html += f"<div class='ml-4 mt-1 text-sm'><span class='font-medium text-purple-700'>Then</span> {then}</div>"
+    sections = parse_description(issue.get("description") or "")
+    if not sections.spec_yaml:
+        return _render_preview(message="No Gherkin specification found")
 
-        html += "</div>"
+    # Preview the same compiled .feature text that validation and commit use
+    try:
+        compiled = await get_compiled_feature(issue["identifier"], sections.spec_yaml)
+    except SpecCompileError as e:
+        return _render_preview(error=f"Invalid Gherkin specification: {e}")
 
-    html += "</div>"
-    return html
+    parsed_feature = await get_analysis_executor().run(parse_gherkin, compiled.text)
+    return _render_preview(parsed_feature, message="No Gherkin specification found")
 
 
 @router.post("/{issue_id}/regenerate")
 async def regenerate_gherkin(request: Request, issue_id: str):
     """Regenerate Gherkin from saved video/audio"""
-    import httpx
-    import re
-    from backend.config import get_settings
-    from backend.services.gemini_service import GeminiService
-
     settings = get_settings()
-    linear_token = request.cookies.get("linear_token")
+    linear_token = session_token(request)
 
     if not linear_token:
         return {"error": "Not authenticated"}
 
     # Fetch issue to get saved video/audio from attachments
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://api.linear.app/graphql",
-            headers={"Authorization": f"Bearer {linear_token}"},
-            json={
-                "query": """
-                    query Issue($id: String!) {
-                        issue(id: $id) {
-                            id
-                            identifier
-                            title
-                            description
-                            attachments {
-                                nodes {
-                                    id
-                                    title
-                                    url
-                                }
+    response = await get_linear_scheduler().post(
+        linear_token,
+        {
+            "query": """
+                query Issue($id: String!) {
+                    issue(id: $id) {
+                        id
+                        identifier
+                        title
+                        description
+                        attachments {
+                            nodes {
+                                id
+                                title
+                                url
                             }
                         }
                     }
-                """,
-                "variables": {"id": issue_id},
-            },
-        )
-        data = response.json()
+                }
+            """,
+            "variables": {"id": issue_id},
+        },
+    )
+    data = response.json()
 
     issue = data.get("data", {}).get("issue")
     if not issue:
@@ -687,17 +614,9 @@ async def regenerate_gherkin(request: Request, issue_id: str):
     if not screen_video_url:
         return {"error": "No screen recording attachment found"}
 
-    # Extract request type
-    request_type = "feature"
-    if "Request Type**:" in description:
-        match = re.search(r"Request Type\*\*:\s*(\w+)", description)
-        if match:
-            request_type = match.group(1)
-
-    # Extract plain description
-    plain_description = description
-    if "## Request Metadata" in description:
-        plain_description = description.split("## Request Metadata")[0].strip()
+    sections = parse_description(description)
+    request_type = sections.request_type or "feature"
+    plain_description = sections.plain_text
 
     # Download video from Linear storage (requires authentication)
     async with httpx.AsyncClient() as client:
@@ -707,20 +626,19 @@ async def regenerate_gherkin(request: Request, issue_id: str):
             follow_redirects=True
         )
         if video_response.status_code != 200:
-            print(f"Failed to download video: {video_response.status_code} - {video_response.text}")
+            logger.warning("Failed to download video: %s", video_response.status_code)
             return {"error": f"Failed to download video from Linear storage: {video_response.status_code}"}
 
         # Convert to base64 for Gemini
-        import base64
         video_base64 = base64.b64encode(video_response.content).decode('utf-8')
-        print(f"Downloaded video: {len(video_response.content)} bytes")
+        logger.debug("Downloaded video (%d bytes)", len(video_response.content))
 
     # Regenerate with Gemini
     if not settings.gemini_api_key:
         return {"error": "Gemini API key not configured"}
 
     try:
-        gemini_service = GeminiService()
+        gemini_service = load_integration("gemini")()
         result = await gemini_service.analyze_video_and_generate_gherkin(
             video_base64=video_base64,
             title=issue["title"],
@@ -736,37 +654,78 @@ async def regenerate_gherkin(request: Request, issue_id: str):
         new_description += f"## Gherkin Specification\n\n```yaml\n{result['gherkin_yaml']}\n```"
 
         # Update Linear issue
-        async with httpx.AsyncClient() as client:
-            update_response = await client.post(
-                "https://api.linear.app/graphql",
-                headers={"Authorization": f"Bearer {linear_token}"},
-                json={
-                    "query": """
-                        mutation IssueUpdate($id: String!, $input: IssueUpdateInput!) {
-                            issueUpdate(id: $id, input: $input) {
-                                success
-                                issue {
+        update_response = await get_linear_scheduler().post(
+            linear_token,
+            {
+                "query": """
+                    mutation IssueUpdate($id: String!, $input: IssueUpdateInput!) {
+                        issueUpdate(id: $id, input: $input) {
+                            success
+                            issue {
+                                id
+                                identifier
+                                title
+                                description
+                                state {
+                                    name
+                                }
+                                priority
+                                updatedAt
+                                team {
                                     id
                                 }
                             }
                         }
-                    """,
-                    "variables": {
-                        "id": issue["id"],
-                        "input": {"description": new_description}
-                    },
+                    }
+                """,
+                "variables": {
+                    "id": issue["id"],
+                    "input": {"description": new_description}
                 },
-            )
+            },
+        )
+
+        # Our own write: drop the cached copy rather than waiting for the webhook
+        await invalidate_issue(issue["identifier"])
+        updated = ((update_response.json().get("data") or {}).get("issueUpdate") or {}).get("issue")
+        if updated:
+            await index_issues([updated])
 
         return {"success": True, "message": "Gherkin regenerated successfully"}
 
     except Exception as e:
-        print(f"Regeneration failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Regeneration failed for %s", issue_id)
         return {"error": f"Regeneration failed: {str(e)}"}
 
 
+@router.get("/{issue_id}/events")
+async def feature_events(request: Request, issue_id: str):
+    """Stream Linear change notifications to an open editor (Server-Sent Events)"""
+    messages = {
+        "Issue": "This issue was updated in Linear.",
+        "Comment": "A comment was added or changed in Linear.",
+        "Attachment": "Attachments changed in Linear.",
+    }
+
+    async def event_stream():
+        async for event in subscribe_issue_events(issue_id):
+            if await request.is_disconnected():
+                break
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+
+            message = messages.get(event.get("type"), "This issue changed in Linear.")
+            banner = (
+                "<div class='rounded-md bg-yellow-50 border border-yellow-200 p-3 "
+                f"text-sm text-yellow-800'>{message} "
+                f"<a href='/features/{issue_id}' class='underline font-medium'>Reload</a></div>"
+            )
+            yield f"event: issueChanged\ndata: {banner}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.post("/{issue_id}/validate")
 async def validate_feature(issue_id: str, content: str):
     """Validate Gherkin syntax (HTMX partial)"""
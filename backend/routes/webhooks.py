@@ -0,0 +1,35 @@
+"""
+Webhook Routes
+Signed Linear webhook receiver for push-based cache invalidation
+"""
+
+import json
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+from backend.config import get_settings
+from backend.services.linear_webhooks import apply_webhook_event, is_fresh, verify_signature
+
+router = APIRouter()
+
+
+@router.post("/linear")
+async def linear_webhook(request: Request):
+    """Receive Linear Issue, Comment, Attachment and WorkflowState events"""
+    settings = get_settings()
+    body = await request.body()
+    signature = request.headers.get("linear-signature", "")
+
+    if not verify_signature(body, signature, settings.linear_webhook_secret):
+        return JSONResponse({"error": "Invalid signature"}, status_code=401)
+
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return JSONResponse({"error": "Invalid JSON"}, status_code=400)
+
+    if not is_fresh(payload):
+        return JSONResponse({"error": "Stale delivery"}, status_code=401)
+
+    identifier = await apply_webhook_event(payload)
+
+    return {"status": "ok", "issue": identifier}
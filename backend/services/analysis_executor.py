@@ -0,0 +1,166 @@
+"""
+Analysis Executor
+Runs CPU-heavy Gherkin analysis off the event loop in a warm process pool
+
+Small specs are analysed inline (a pool round trip costs more than the
+work). Large ones go to worker processes, so a 1,000-scenario outline no
+longer stalls every other request on the worker. Jobs carry an optional
+key (editor session + issue); a newer job with the same key supersedes
+the older one.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Callable, Optional, TypeVar
+from backend.config import get_settings
+from backend.instrumentation import LATENCY_BUCKETS, Histogram
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AnalysisSuperseded(Exception):
+    """A newer job with the same key replaced this one before it finished"""
+
+
+def _run_job(func: Callable[[str], T], content: str) -> tuple[T, float]:
+    """Worker side: run the analysis and measure its CPU time"""
+    start = time.process_time()
+    result = func(content)
+    return result, time.process_time() - start
+
+
+def _warm_up() -> None:
+    """Worker side: import the Gherkin parser before the first real job"""
+    import backend.gherkin.validation  # noqa: F401
+
+
+def _default_pool(max_workers: int) -> Executor:
+    # spawn, not fork: the app process has running threads (log listener,
+    # event loop) whose locks a forked child would inherit mid-use
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+class AnalysisExecutor:
+    """
+    Offload Gherkin analysis to a process pool above a size threshold,
+    cancel superseded jobs and record per-job CPU time
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 2,
+        inline_max_bytes: int = 16384,
+        pool_factory: Callable[[int], Executor] = _default_pool,
+    ):
+        self.max_workers = max_workers
+        self.inline_max_bytes = inline_max_bytes
+        self.pool_factory = pool_factory
+
+        self.cpu_seconds = Histogram(
+            "analysis_cpu_seconds",
+            "CPU time of Gherkin analysis jobs by function and mode (inline/pool)",
+            LATENCY_BUCKETS,
+        )
+        self.superseded_total = 0
+
+        self._pool: Optional[Executor] = None
+        self._jobs: dict[str, asyncio.Future] = {}
+
+    async def start(self) -> None:
+        """Start the pool and wait until every worker has imported the parser"""
+        if self._pool is not None:
+            return
+        self._pool = self.pool_factory(self.max_workers)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(self._pool, _warm_up) for _ in range(self.max_workers))
+        )
+        logger.info("Analysis pool ready with %d workers", self.max_workers)
+
+    def shutdown(self) -> None:
+        """Stop the pool, dropping queued jobs"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def run(
+        self, func: Callable[[str], T], content: str, *, job_key: Optional[str] = None
+    ) -> T:
+        """
+        Run an analysis function on Gherkin content
+
+        Content under inline_max_bytes, or any content before start(), is
+        analysed inline. A superseded job may still finish in its worker, but
+        its result is discarded.
+
+        Args:
+            func: Module-level function taking the content (e.g., validate_gherkin)
+            content: Gherkin feature text
+            job_key: Jobs with the same key supersede each other (e.g., "session:ENG-1")
+
+        Returns:
+            The function's result
+
+        Raises:
+            AnalysisSuperseded: If a newer job with the same key was submitted
+        """
+        if self._pool is None or len(content.encode("utf-8")) < self.inline_max_bytes:
+            start = time.thread_time()
+            result = func(content)
+            self._record(func, "inline", time.thread_time() - start)
+            return result
+
+        previous = self._jobs.get(job_key) if job_key else None
+        if previous is not None and not previous.done():
+            previous.cancel()
+            self.superseded_total += 1
+
+        future = asyncio.get_running_loop().run_in_executor(self._pool, _run_job, func, content)
+        if job_key:
+            self._jobs[job_key] = future
+
+        try:
+            result, cpu_seconds = await future
+        except asyncio.CancelledError:
+            # Cancelled by a newer job rather than by our own caller going away
+            if future.cancelled() and not asyncio.current_task().cancelling():
+                raise AnalysisSuperseded() from None
+            raise
+        finally:
+            if job_key and self._jobs.get(job_key) is future:
+                del self._jobs[job_key]
+
+        self._record(func, "pool", cpu_seconds)
+        return result
+
+    def _record(self, func: Callable, mode: str, cpu_seconds: float) -> None:
+        self.cpu_seconds.observe(cpu_seconds, function=func.__name__, mode=mode)
+
+    def render_metrics(self) -> str:
+        """Render CPU-time histogram and superseded-job count in Prometheus text format"""
+        lines = self.cpu_seconds.render()
+        lines += [
+            "# HELP analysis_superseded_total Analysis jobs replaced by a newer job",
+            "# TYPE analysis_superseded_total counter",
+            f"analysis_superseded_total {self.superseded_total}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+@lru_cache
+def get_analysis_executor() -> AnalysisExecutor:
+    """Get the process-wide analysis executor"""
+    settings = get_settings()
+    return AnalysisExecutor(
+        max_workers=settings.analysis_workers,
+        inline_max_bytes=settings.analysis_inline_max_bytes,
+    )
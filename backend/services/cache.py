@@ -0,0 +1,145 @@
+"""
+Redis Cache Service
+Shared JSON cache on the configured Redis instance
+"""
+
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Optional
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from backend.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache
+def get_redis() -> Redis:
+    """Get cached Redis client for the configured Redis URL"""
+    settings = get_settings()
+    return Redis.from_url(settings.redis_url, decode_responses=True)
+
+
+async def cache_get_json(key: str) -> Optional[Any]:
+    """
+    Read a JSON value from the cache
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Decoded value, or None on a miss or if Redis is unavailable
+    """
+    try:
+        raw = await get_redis().get(key)
+    except RedisError as e:
+        logger.warning("Cache read failed for %s: %s", key, e)
+        return None
+
+    return json.loads(raw) if raw is not None else None
+
+
+async def cache_set_json(key: str, value: Any, ttl: int) -> None:
+    """
+    Write a JSON value to the cache
+
+    Args:
+        key: Cache key
+        value: JSON-serializable value
+        ttl: Expiry in seconds
+    """
+    try:
+        await get_redis().set(key, json.dumps(value), ex=ttl)
+    except RedisError as e:
+        logger.warning("Cache write failed for %s: %s", key, e)
+
+
+async def cache_touch_json(key: str, ttl: int) -> Optional[Any]:
+    """
+    Read a JSON value and push its expiry back, in one round trip (GETEX)
+
+    Args:
+        key: Cache key
+        ttl: New expiry in seconds
+
+    Returns:
+        Decoded value, or None on a miss or if Redis is unavailable
+    """
+    try:
+        raw = await get_redis().getex(key, ex=ttl)
+    except RedisError as e:
+        logger.warning("Cache read failed for %s: %s", key, e)
+        return None
+
+    return json.loads(raw) if raw is not None else None
+
+
+async def cache_hget_json(key: str, field: str) -> Optional[Any]:
+    """
+    Read a JSON value from a field of a cached hash
+
+    Args:
+        key: Hash key
+        field: Field within the hash
+
+    Returns:
+        Decoded value, or None on a miss or if Redis is unavailable
+    """
+    try:
+        raw = await get_redis().hget(key, field)
+    except RedisError as e:
+        logger.warning("Cache read failed for %s[%s]: %s", key, field, e)
+        return None
+
+    return json.loads(raw) if raw is not None else None
+
+
+async def cache_hset_json(key: str, field: str, value: Any, ttl: int) -> None:
+    """
+    Write a JSON value to a field of a cached hash
+
+    Deleting the hash key drops every field at once, which lets related
+    entries (e.g., pages of one list) be invalidated together.
+
+    Args:
+        key: Hash key
+        field: Field within the hash
+        value: JSON-serializable value
+        ttl: Expiry of the whole hash in seconds
+    """
+    try:
+        await get_redis().hset(key, field, json.dumps(value))
+        await get_redis().expire(key, ttl)
+    except RedisError as e:
+        logger.warning("Cache write failed for %s[%s]: %s", key, field, e)
+
+
+async def cache_delete(*keys: str) -> None:
+    """
+    Remove keys from the cache
+
+    Args:
+        keys: Cache keys to delete
+    """
+    if not keys:
+        return
+
+    try:
+        await get_redis().delete(*keys)
+    except RedisError as e:
+        logger.warning("Cache delete failed for %s: %s", keys, e)
+
+
+async def cache_publish(channel: str, message: Any) -> None:
+    """
+    Publish a JSON message to subscribers on a Redis channel
+
+    Args:
+        channel: Pub/sub channel name
+        message: JSON-serializable payload
+    """
+    try:
+        await get_redis().publish(channel, json.dumps(message))
+    except RedisError as e:
+        logger.warning("Cache publish failed for %s: %s", channel, e)
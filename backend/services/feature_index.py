@@ -0,0 +1,285 @@
+"""
+Feature Index Service
+Inverted index of the steps and scenarios already in the target repository
+
+The index is built from one tree listing plus concurrent blob fetches, and
+refreshed by blob SHA: files whose SHA is unchanged are not fetched or
+parsed again. Lookups are dictionary hits, so the editor can flag duplicate
+scenarios and reusable steps on every validation.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional
+from backend.facades.git_provider import GitProvider, TreeEntry
+from backend.gherkin.parsing import GherkinScenario, ParsedFeature, parse_gherkin
+
+logger = logging.getLogger(__name__)
+
+FEATURE_SUFFIX = ".feature"
+
+# Step parameters: quoted strings, <outline placeholders> and numbers
+_PARAMETER = re.compile(r'"[^"]*"|\'[^\']*\'|<[^>]+>|\b\d+(?:\.\d+)?\b')
+_SPACE = re.compile(r"\s+")
+
+
+def normalize_step(text: str) -> str:
+    """
+    Step text with parameters abstracted, for matching across specs
+
+    Quoted strings, outline placeholders and numbers become "{}", case and
+    whitespace are folded: 'I add "pen" to my cart' and 'I add "book" to my
+    cart' normalize alike.
+
+    Args:
+        text: Step text without its keyword
+
+    Returns:
+        str: Normalized step
+    """
+    return _SPACE.sub(" ", _PARAMETER.sub("{}", text)).strip().lower()
+
+
+@dataclass(frozen=True)
+class StepLocation:
+    """Step in a repository feature file"""
+
+    path: str
+    line: int
+    text: str
+
+
+@dataclass(frozen=True)
+class IndexedScenario:
+    """Scenario in a repository feature file, with its normalized steps"""
+
+    path: str
+    line: int
+    name: str
+    steps: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class IndexedFile:
+    """What the index keeps of one feature file"""
+
+    sha: str
+    scenarios: tuple[IndexedScenario, ...]
+    steps: tuple[StepLocation, ...]
+
+
+@dataclass(frozen=True)
+class IndexMatches:
+    """Existing specs overlapping a spec being edited"""
+
+    duplicate_scenarios: list[tuple[str, IndexedScenario]]  # (edited scenario, existing)
+    reusable_steps: list[tuple[str, StepLocation]]  # (edited step, existing)
+
+
+@dataclass(frozen=True)
+class RefreshStats:
+    """Outcome of one index refresh"""
+
+    files: int
+    fetched: int
+    removed: int
+
+
+def _all_scenarios(parsed: ParsedFeature) -> list[GherkinScenario]:
+    """Feature and rule scenarios"""
+    return [*parsed.scenarios, *(s for rule in parsed.rules for s in rule.scenarios)]
+
+
+def _all_backgrounds(parsed: ParsedFeature) -> list[GherkinScenario]:
+    """Feature and rule backgrounds"""
+    backgrounds = [parsed.background, *(rule.background for rule in parsed.rules)]
+    return [background for background in backgrounds if background]
+
+
+def index_file(path: str, sha: str, content: str) -> IndexedFile:
+    """
+    Extract the scenarios and steps of one feature file
+
+    Args:
+        path: Repository path
+        sha: Blob SHA of the content
+        content: Gherkin feature text
+
+    Returns:
+        IndexedFile: Empty if the file is not valid Gherkin
+    """
+    parsed = parse_gherkin(content)
+    if parsed is None:
+        return IndexedFile(sha=sha, scenarios=(), steps=())
+
+    scenarios = tuple(
+        IndexedScenario(
+            path=path,
+            line=scenario.line or 0,
+            name=scenario.name,
+            steps=tuple(normalize_step(step.text) for step in scenario.steps),
+        )
+        for scenario in _all_scenarios(parsed)
+    )
+    steps = tuple(
+        StepLocation(path=path, line=step.line or 0, text=step.text)
+        for scenario in (*_all_backgrounds(parsed), *_all_scenarios(parsed))
+        for step in scenario.steps
+    )
+    return IndexedFile(sha=sha, scenarios=scenarios, steps=steps)
+
+
+@dataclass
+class FeatureIndex:
+    """Feature files of one branch, with steps and scenarios indexed for lookup"""
+
+    files: dict[str, IndexedFile] = field(default_factory=dict)
+    steps: dict[str, list[StepLocation]] = field(default_factory=dict)
+    scenarios: dict[tuple[str, ...], list[IndexedScenario]] = field(default_factory=dict)
+    refreshed_at: Optional[float] = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def put(self, path: str, indexed: IndexedFile) -> None:
+        """Add or replace a file"""
+        self.remove(path)
+        self.files[path] = indexed
+        for step in indexed.steps:
+            self.steps.setdefault(normalize_step(step.text), []).append(step)
+        for scenario in indexed.scenarios:
+            if scenario.steps:
+                self.scenarios.setdefault(scenario.steps, []).append(scenario)
+
+    def remove(self, path: str) -> None:
+        """Drop a file and its postings"""
+        indexed = self.files.pop(path, None)
+        if indexed is None:
+            return
+        for step in indexed.steps:
+            _discard(self.steps, normalize_step(step.text), lambda found: found.path == path)
+        for scenario in indexed.scenarios:
+            _discard(self.scenarios, scenario.steps, lambda found: found.path == path)
+
+    def is_stale(self, ttl: int) -> bool:
+        """Whether the index was never built or is older than ttl seconds"""
+        return self.refreshed_at is None or time.monotonic() - self.refreshed_at > ttl
+
+    def match(
+        self, parsed: ParsedFeature, *, exclude_path: str = "", limit: int = 5
+    ) -> IndexMatches:
+        """
+        Find existing scenarios with the same steps, and existing steps a spec reuses
+
+        Args:
+            parsed: Spec being edited
+            exclude_path: The spec's own file, which always matches itself
+            limit: Most matches returned of each kind
+
+        Returns:
+            IndexMatches
+        """
+        duplicates = []
+        for scenario in _all_scenarios(parsed):
+            key = tuple(normalize_step(step.text) for step in scenario.steps)
+            for existing in self.scenarios.get(key, []):
+                if existing.path != exclude_path:
+                    duplicates.append((scenario.name, existing))
+                    break
+
+        reusable = []
+        seen = set()
+        for scenario in (*_all_backgrounds(parsed), *_all_scenarios(parsed)):
+            for step in scenario.steps:
+                key = normalize_step(step.text)
+                if key in seen:
+                    continue
+                seen.add(key)
+                existing = next(
+                    (found for found in self.steps.get(key, []) if found.path != exclude_path),
+                    None,
+                )
+                if existing:
+                    reusable.append((step.text, existing))
+
+        return IndexMatches(duplicate_scenarios=duplicates[:limit], reusable_steps=reusable[:limit])
+
+
+def _discard(postings: dict, key, belongs) -> None:
+    """Remove a file's entries from one posting list, dropping the list once empty"""
+    remaining = [entry for entry in postings.get(key, []) if not belongs(entry)]
+    if remaining:
+        postings[key] = remaining
+    else:
+        postings.pop(key, None)
+
+
+async def refresh_feature_index(
+    index: FeatureIndex,
+    *,
+    git_provider: GitProvider,
+    repo: str,
+    branch: str,
+    concurrency: int = 8,
+) -> Optional[RefreshStats]:
+    """
+    Bring the index up to date with a branch
+
+    One tree listing finds every .feature file; only files whose blob SHA
+    changed are fetched (concurrently) and re-indexed. Parsing runs in worker
+    threads so a large refresh doesn't stall the event loop.
+
+    Args:
+        index: Index to update in place
+        git_provider: Provider to list and fetch files with
+        repo: Repository (e.g., "org/repo")
+        branch: Branch to index
+        concurrency: Most blob fetches in flight
+
+    Returns:
+        RefreshStats, or None if another refresh is already running
+    """
+    if index.lock.locked():
+        return None
+
+    async with index.lock:
+        tree = await git_provider.list_tree(repo, branch)
+        features = {entry.path: entry for entry in tree if entry.path.endswith(FEATURE_SUFFIX)}
+
+        removed = [path for path in index.files if path not in features]
+        for path in removed:
+            index.remove(path)
+
+        changed = [
+            entry
+            for path, entry in features.items()
+            if path not in index.files or index.files[path].sha != entry.sha
+        ]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(entry: TreeEntry) -> tuple[TreeEntry, IndexedFile]:
+            async with semaphore:
+                content = await git_provider.get_blob(repo, entry.sha)
+            return entry, await asyncio.to_thread(index_file, entry.path, entry.sha, content)
+
+        for entry, indexed in await asyncio.gather(*(fetch(entry) for entry in changed)):
+            index.put(entry.path, indexed)
+
+        index.refreshed_at = time.monotonic()
+
+    stats = RefreshStats(files=len(index.files), fetched=len(changed), removed=len(removed))
+    logger.info(
+        "Feature index refreshed: %d files, %d fetched, %d removed",
+        stats.files,
+        stats.fetched,
+        stats.removed,
+    )
+    return stats
+
+
+@lru_cache
+def get_feature_index() -> FeatureIndex:
+    """Get the process-wide index of the configured repository's feature files"""
+    return FeatureIndex()
@@ -0,0 +1,259 @@
+"""
+Feature List Service
+Cursor-paginated, server-side filtered pages of a user's assigned issues
+"""
+
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+from backend.adapters.linear import remember_issue_id
+from backend.config import get_settings
+from backend.services.issue_cache import cache_assigned_page, get_cached_assigned_page
+from backend.services.issue_search import index_issues
+from backend.services.linear_scheduler import LinearScheduler, Priority, get_linear_scheduler
+from backend.services.sessions import Session, save_session
+
+# Issues fetched per page of the feature list
+PAGE_SIZE = 25
+
+# Linear allows at most 250 nodes per connection page
+TEAMS_PAGE_SIZE = 250
+
+# Sort options exposed in the UI -> Linear PaginationOrderBy values
+SORT_FIELDS = {"updated": "updatedAt", "created": "createdAt"}
+
+GHERKIN_MARKER = "## Gherkin Specification"
+
+ASSIGNED_ISSUES_QUERY = """
+    query AssignedIssues(
+        $first: Int!
+        $after: String
+        $filter: IssueFilter
+        $orderBy: PaginationOrderBy
+    ) {
+        viewer {
+            assignedIssues(first: $first, after: $after, filter: $filter, orderBy: $orderBy) {
+                nodes {
+                    id
+                    identifier
+                    title
+                    description
+                    state {
+                        name
+                    }
+                    priority
+                    createdAt
+                    updatedAt
+                    team {
+                        id
+                        name
+                        key
+                    }
+                }
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
+            }
+        }
+    }
+"""
+
+TEAMS_QUERY = """
+    query Teams($first: Int!, $after: String) {
+        teams(first: $first, after: $after) {
+            nodes {
+                id
+                name
+                key
+            }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+    }
+"""
+
+
+@dataclass
+class FeaturePage:
+    """One page of the feature list"""
+
+    features: list[dict] = field(default_factory=list)
+    end_cursor: Optional[str] = None
+    has_next_page: bool = False
+
+
+def page_cache_field(
+    *,
+    team: Optional[str],
+    gherkin_only: bool,
+    sort: str,
+    after: Optional[str],
+) -> str:
+    """Hash field identifying one page within a user's cached assigned list"""
+    return f"{team or '*'}|{int(gherkin_only)}|{sort}|{after or ''}"
+
+
+def build_issue_filter(*, team: Optional[str], gherkin_only: bool) -> Optional[dict]:
+    """
+    Build a Linear IssueFilter for the list filters
+
+    Args:
+        team: Team ID to restrict to, or None for all teams
+        gherkin_only: Only issues whose description has a Gherkin specification
+
+    Returns:
+        IssueFilter dict, or None when no filter applies
+    """
+    issue_filter = {}
+    if team:
+        issue_filter["team"] = {"id": {"eq": team}}
+    if gherkin_only:
+        issue_filter["description"] = {"contains": GHERKIN_MARKER}
+    return issue_filter or None
+
+
+def to_feature(issue: dict) -> dict:
+    """Transform a Linear issue node to the feature list format"""
+    description = issue.get("description") or ""
+    return {
+        "issue_id": issue["identifier"],
+        "title": issue["title"],
+        "status": issue["state"]["name"],
+        "priority": issue["priority"],
+        "updated_at": issue["updatedAt"],
+        "has_gherkin": "```yaml" in description or GHERKIN_MARKER in description,
+    }
+
+
+async def fetch_feature_page(
+    linear_token: str,
+    user_id: Optional[str],
+    *,
+    team: Optional[str] = None,
+    gherkin_only: bool = False,
+    sort: str = "updated",
+    after: Optional[str] = None,
+    priority: Priority = Priority.INTERACTIVE,
+    scheduler: Optional[LinearScheduler] = None,
+) -> FeaturePage:
+    """
+    Get one page of the user's assigned features, serving from the cache when possible
+
+    Pages are cached in the user's assigned-issues hash, so the Linear webhook
+    invalidation of that key drops every page at once.
+
+    Args:
+        linear_token: Linear OAuth token
+        user_id: Linear user ID used as the cache key (no caching if None)
+        team: Team ID filter
+        gherkin_only: Only issues with a Gherkin specification
+        sort: Key of SORT_FIELDS
+        after: endCursor of the previous page, None for the first page
+        priority: Scheduler priority (BACKGROUND for prefetches)
+        scheduler: Linear scheduler (defaults to the process-wide one)
+
+    Returns:
+        FeaturePage: Features plus the cursor for the next page
+    """
+    sort = sort if sort in SORT_FIELDS else "updated"
+    cache_field = page_cache_field(team=team, gherkin_only=gherkin_only, sort=sort, after=after)
+
+    if user_id:
+        cached = await get_cached_assigned_page(user_id, cache_field)
+        if cached is not None:
+            return FeaturePage(**cached)
+
+    scheduler = scheduler or get_linear_scheduler()
+    response = await scheduler.post(
+        linear_token,
+        {
+            "query": ASSIGNED_ISSUES_QUERY,
+            "variables": {
+                "first": PAGE_SIZE,
+                "after": after,
+                "filter": build_issue_filter(team=team, gherkin_only=gherkin_only),
+                "orderBy": SORT_FIELDS[sort],
+            },
+        },
+        priority=priority,
+    )
+    data = response.json()
+
+    connection = (data.get("data") or {}).get("viewer", {}).get("assignedIssues") or {}
+    issues = connection.get("nodes", [])
+    page_info = connection.get("pageInfo") or {}
+
+    for issue in issues:
+        remember_issue_id(issue["identifier"], issue["id"])
+    await index_issues(issues)
+
+    page = FeaturePage(
+        features=[to_feature(issue) for issue in issues],
+        end_cursor=page_info.get("endCursor"),
+        has_next_page=bool(page_info.get("hasNextPage")),
+    )
+
+    # Don't cache failed queries as an empty page
+    if user_id and "errors" not in data:
+        await cache_assigned_page(user_id, cache_field, asdict(page))
+
+    return page
+
+
+async def fetch_all_teams(
+    linear_token: str,
+    *,
+    scheduler: Optional[LinearScheduler] = None,
+) -> list[dict]:
+    """
+    Get every team visible to the user, following pageInfo cursors
+
+    Args:
+        linear_token: Linear OAuth token
+        scheduler: Linear scheduler (defaults to the process-wide one)
+
+    Returns:
+        list[dict]: Team nodes (id, name, key)
+    """
+    scheduler = scheduler or get_linear_scheduler()
+    teams = []
+    after = None
+
+    while True:
+        response = await scheduler.post(
+            linear_token,
+            {"query": TEAMS_QUERY, "variables": {"first": TEAMS_PAGE_SIZE, "after": after}},
+        )
+        connection = (response.json().get("data") or {}).get("teams") or {}
+        teams.extend(connection.get("nodes", []))
+
+        page_info = connection.get("pageInfo") or {}
+        after = page_info.get("endCursor")
+        if not page_info.get("hasNextPage") or not after:
+            return teams
+
+
+async def visible_team_ids(session: Session) -> set[str]:
+    """
+    IDs of the teams the session's user can see
+
+    The team list is kept in the session and re-fetched once it is older than
+    session_teams_ttl, so losing access to a team takes effect within minutes
+    rather than when the session ends.
+
+    Args:
+        session: Signed-in user's session
+
+    Returns:
+        set[str]: Team IDs
+    """
+    if session.teams is None or time.time() - session.teams_loaded_at > (
+        get_settings().session_teams_ttl
+    ):
+        session.teams = await fetch_all_teams(session.linear_token)
+        session.teams_loaded_at = time.time()
+        await save_session(session)
+    return {team["id"] for team in session.teams}
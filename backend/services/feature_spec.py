@@ -0,0 +1,137 @@
+"""
+Feature Spec Service
+Cached issue payloads and precompiled .feature artifacts for the editor and approval
+"""
+
+from dataclasses import asdict
+from typing import Collection, Optional
+from backend.adapters.linear import remember_issue_id
+from backend.gherkin.compiler import CompiledText, compile_spec
+from backend.gherkin.spec_yaml import spec_hash
+from backend.services.issue_cache import (
+    cache_compiled_feature,
+    cache_issue,
+    get_cached_compiled_feature,
+    get_cached_issue,
+)
+from backend.services.issue_search import index_issues
+from backend.services.linear_scheduler import LinearScheduler, get_linear_scheduler
+
+ISSUE_QUERY = """
+    query Issue($id: String!) {
+        issue(id: $id) {
+            id
+            identifier
+            title
+            description
+            state {
+                name
+            }
+            priority
+            updatedAt
+            team {
+                id
+                name
+                key
+            }
+            project {
+                id
+                name
+            }
+            assignee {
+                id
+                name
+                email
+            }
+            attachments {
+                nodes {
+                    id
+                    title
+                    url
+                    metadata
+                }
+            }
+        }
+    }
+"""
+
+
+async def load_issue(
+    issue_id: str,
+    linear_token: str,
+    *,
+    team_ids: Optional[Collection[str]] = None,
+    scheduler: Optional[LinearScheduler] = None,
+) -> Optional[dict]:
+    """
+    Get a full issue payload, serving from the cache when the caller may see it
+
+    Issue payloads are cached by identifier for every user and kept fresh by
+    Linear webhooks. A cached payload is only served if its team is one of
+    the caller's teams; otherwise Linear is asked with the caller's token,
+    so it decides access.
+
+    Args:
+        issue_id: Issue identifier (e.g., "ENG-123")
+        linear_token: Linear OAuth token
+        team_ids: Teams the caller can see (None: never serve from the cache)
+        scheduler: Linear scheduler (defaults to the process-wide one)
+
+    Returns:
+        Issue node as returned by Linear, or None if not found or not visible
+    """
+    issue = await get_cached_issue(issue_id) if team_ids is not None else None
+    if issue is not None and (issue.get("team") or {}).get("id") not in team_ids:
+        issue = None
+
+    if issue is None:
+        scheduler = scheduler or get_linear_scheduler()
+        response = await scheduler.post(
+            linear_token,
+            {"query": ISSUE_QUERY, "variables": {"id": issue_id}},
+        )
+        issue = (response.json().get("data") or {}).get("issue")
+
+        if issue:
+            await cache_issue(issue)
+            await index_issues([issue])
+
+    if issue:
+        # Prime the identifier -> UUID cache used by approval/delegation mutations
+        remember_issue_id(issue["identifier"], issue["id"])
+
+    return issue
+
+
+async def get_compiled_feature(identifier: str, spec_yaml: str) -> CompiledText:
+    """
+    Get the issue's spec compiled to .feature text
+
+    The artifact is cached next to the issue payload and reused as long as
+    the spec text is unchanged, so validation, preview and commit all work
+    from the same compiled output.
+
+    Args:
+        identifier: Issue identifier
+        spec_yaml: Spec YAML from the issue description
+
+    Returns:
+        CompiledText: .feature text with a line map back to the spec YAML
+
+    Raises:
+        SpecCompileError: If the spec cannot be compiled
+    """
+    source_hash = spec_hash(spec_yaml).hex()
+
+    cached = await get_cached_compiled_feature(identifier, source_hash)
+    if cached is not None:
+        return CompiledText(
+            text=cached["text"],
+            source_lines=tuple(cached["source_lines"]),
+            source_hash=source_hash,
+        )
+
+    compiled = compile_spec(spec_yaml)
+    await cache_compiled_feature(identifier, asdict(compiled))
+
+    return compiled
@@ -1,23 +1,122 @@
 """
 Gemini AI Service
 Handles video analysis and Gherkin generation using Google's Gemini API
+
+Talks to the Gemini REST API directly (like the Linear adapter does), so the
+base URL can point at the local fakes and nothing blocks the event loop.
 """
 
+import asyncio
 import base64
-import tempfile
-import os
-import google.generativeai as genai
+import logging
+from functools import lru_cache
+from typing import Optional
+import httpx
 from backend.config import get_settings
+from backend.instrumentation import record_size, timed
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks while Gemini processes an uploaded file
+FILE_POLL_SECONDS = 2.0
+
+
+@lru_cache
+def get_gemini_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for Gemini (video analysis can take minutes)"""
+    return httpx.AsyncClient(timeout=httpx.Timeout(300.0, connect=10.0))
+
+
+def _extract_yaml(result_text: str) -> str:
+    """YAML from a ```yaml fence in a model response, or the whole response"""
+    if "```yaml" in result_text:
+        yaml_start = result_text.find("```yaml") + 7
+        yaml_end = result_text.find("```", yaml_start)
+        return result_text[yaml_start:yaml_end].strip()
+    return result_text
 
 
 class GeminiService:
     """Service for interacting with Gemini AI"""
 
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         settings = get_settings()
-        genai.configure(api_key=settings.gemini_api_key)
-        self.model = genai.GenerativeModel("models/gemini-2.5-flash")
+        self.api_url = settings.gemini_api_url.rstrip("/")
+        self.model = settings.gemini_model
+        self.headers = {"x-goog-api-key": settings.gemini_api_key}
+        self.http_client = http_client or get_gemini_client()
+
+    async def _upload_file(self, data: bytes, mime_type: str, display_name: str) -> dict:
+        """
+        Upload media with the Files API resumable protocol and wait until it is usable
+
+        Returns:
+            File resource ({"name", "uri", "mimeType", "state", ...})
+        """
+        start = await self.http_client.post(
+            f"{self.api_url}/upload/v1beta/files",
+            headers={
+                **self.headers,
+                "X-Goog-Upload-Protocol": "resumable",
+                "X-Goog-Upload-Command": "start",
+                "X-Goog-Upload-Header-Content-Length": str(len(data)),
+                "X-Goog-Upload-Header-Content-Type": mime_type,
+            },
+            json={"file": {"display_name": display_name}},
+        )
+        start.raise_for_status()
+
+        upload = await self.http_client.post(
+            start.headers["x-goog-upload-url"],
+            headers={
+                **self.headers,
+                "X-Goog-Upload-Command": "upload, finalize",
+                "X-Goog-Upload-Offset": "0",
+            },
+            content=data,
+        )
+        upload.raise_for_status()
+        file = upload.json()["file"]
+
+        while file.get("state") == "PROCESSING":
+            logger.debug("Waiting for %s to be processed", file["name"])
+            await asyncio.sleep(FILE_POLL_SECONDS)
+            response = await self.http_client.get(
+                f"{self.api_url}/v1beta/{file['name']}", headers=self.headers
+            )
+            response.raise_for_status()
+            file = response.json()
+
+        if file.get("state") != "ACTIVE":
+            raise Exception(f"File processing failed: {file.get('state')}")
+
+        return file
 
+    async def _generate(self, parts: list[dict]) -> str:
+        """
+        Run generateContent and return the response text
+
+        Args:
+            parts: Content parts ({"text": ...} or {"file_data": {...}})
+
+        Returns:
+            Concatenated text of the first candidate
+        """
+        response = await self.http_client.post(
+            f"{self.api_url}/v1beta/models/{self.model}:generateContent",
+            headers=self.headers,
+            json={"contents": [{"role": "user", "parts": parts}]},
+        )
+        response.raise_for_status()
+
+        candidates = response.json().get("candidates") or [{}]
+        content_parts = (candidates[0].get("content") or {}).get("parts") or []
+        result_text = "".join(part.get("text", "") for part in content_parts)
+
+        record_size("gemini", "received", len(result_text))
+        return result_text
+
+    @timed("gemini")
     async def analyze_video_and_generate_gherkin(
         self,
         video_base64: str,
@@ -104,50 +203,25 @@ analysis:
 - Write scenarios that are testable
 """
 
-        # Save bytes to temporary file for Gemini upload
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".webm") as tmp_file:
-            tmp_file.write(video_bytes)
-            tmp_file_path = tmp_file.name
-
-        try:
-            # Upload video for analysis
-            video_file = genai.upload_file(path=tmp_file_path)
-
-            # Wait for video to be processed
-            import time
-            while video_file.state.name == "PROCESSING":
-                print("Waiting for video to be processed...")
-                time.sleep(2)
-                video_file = genai.get_file(video_file.name)
-
-            if video_file.state.name != "ACTIVE":
-                raise Exception(f"Video processing failed: {video_file.state.name}")
-
-            print(f"Video ready for analysis: {video_file.name}")
-
-            # Generate content with video
-            response = self.model.generate_content([prompt, video_file])
-
-            # Parse response
-            result_text = response.text
-
-            # Extract YAML content (simple parsing)
-            if "```yaml" in result_text:
-                yaml_start = result_text.find("```yaml") + 7
-                yaml_end = result_text.find("```", yaml_start)
-                yaml_content = result_text[yaml_start:yaml_end].strip()
-            else:
-                yaml_content = result_text
-
-            return {
-                "gherkin_yaml": yaml_content,
-                "raw_response": result_text,
-            }
-        finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_file_path):
-                os.remove(tmp_file_path)
+        # Upload video for analysis
+        record_size("gemini", "sent", len(video_bytes) + len(prompt))
+        video_file = await self._upload_file(video_bytes, "video/webm", title or "recording")
+        logger.info("Video ready for analysis: %s", video_file["name"])
+
+        # Generate content with video
+        result_text = await self._generate(
+            [
+                {"text": prompt},
+                {"file_data": {"mime_type": video_file["mimeType"], "file_uri": video_file["uri"]}},
+            ]
+        )
 
+        return {
+            "gherkin_yaml": _extract_yaml(result_text),
+            "raw_response": result_text,
+        }
+
+    @timed("gemini")
     async def transcribe_audio(self, audio_base64: str) -> str:
         """
         Transcribe audio recording
@@ -171,12 +245,18 @@ Output only the transcribed text without any additional commentary.
 """
 
         # Upload audio for transcription
-        audio_file = genai.upload_file(path=audio_bytes)
+        record_size("gemini", "sent", len(audio_bytes) + len(prompt))
+        audio_file = await self._upload_file(audio_bytes, "audio/webm", "audio recording")
 
         # Generate transcription
-        response = self.model.generate_content([prompt, audio_file])
+        result_text = await self._generate(
+            [
+                {"text": prompt},
+                {"file_data": {"mime_type": audio_file["mimeType"], "file_uri": audio_file["uri"]}},
+            ]
+        )
 
-        return response.text.strip()
+        return result_text.strip()
 
     async def _generate_gherkin_from_text(
         self,
@@ -244,18 +324,10 @@ analysis:
 **Note:** Video was provided but too large to analyze. Generated from text description only.
 """
 
-        response = self.model.generate_content(prompt)
-        result_text = response.text
-
-        # Extract YAML content
-        if "```yaml" in result_text:
-            yaml_start = result_text.find("```yaml") + 7
-            yaml_end = result_text.find("```", yaml_start)
-            yaml_content = result_text[yaml_start:yaml_end].strip()
-        else:
-            yaml_content = result_text
+        record_size("gemini", "sent", len(prompt))
+        result_text = await self._generate([{"text": prompt}])
 
         return {
-            "gherkin_yaml": yaml_content,
+            "gherkin_yaml": _extract_yaml(result_text),
             "raw_response": result_text,
         }
@@ -0,0 +1,125 @@
+"""
+Issue Cache Service
+Redis-cached Linear issue payloads and pages of per-user assigned issue lists
+"""
+
+from typing import Optional
+from backend.config import get_settings
+from backend.services.cache import (
+    cache_delete,
+    cache_get_json,
+    cache_hget_json,
+    cache_hset_json,
+    cache_set_json,
+)
+
+
+def issue_key(identifier: str) -> str:
+    """Cache key for an issue payload, by identifier (e.g., "ENG-123")"""
+    return f"issue:{identifier}"
+
+
+def issue_ref_key(uuid: str) -> str:
+    """Cache key mapping an issue UUID back to its identifier"""
+    return f"issue_ref:{uuid}"
+
+
+def compiled_feature_key(identifier: str) -> str:
+    """Cache key for an issue's spec compiled to .feature text"""
+    return f"compiled_feature:{identifier}"
+
+
+def assigned_issues_key(user_id: str) -> str:
+    """Cache key for a user's assigned issue list"""
+    return f"assigned_issues:{user_id}"
+
+
+async def get_cached_issue(identifier: str) -> Optional[dict]:
+    """
+    Get a cached issue payload
+
+    Args:
+        identifier: Issue identifier
+
+    Returns:
+        Issue node as returned by Linear, or None on a miss
+    """
+    return await cache_get_json(issue_key(identifier))
+
+
+async def cache_issue(issue: dict) -> None:
+    """
+    Cache a full issue payload under its identifier
+
+    Args:
+        issue: Issue node including "id" and "identifier"
+    """
+    settings = get_settings()
+    await cache_set_json(issue_key(issue["identifier"]), issue, settings.issue_cache_ttl)
+    await cache_set_json(issue_ref_key(issue["id"]), issue["identifier"], settings.issue_cache_ttl)
+
+
+async def resolve_identifier(uuid: str) -> Optional[str]:
+    """
+    Map an issue UUID to its identifier using the cache
+
+    Args:
+        uuid: Linear issue UUID
+
+    Returns:
+        Identifier, or None if the issue has never been cached
+    """
+    return await cache_get_json(issue_ref_key(uuid))
+
+
+async def invalidate_issue(identifier: str) -> None:
+    """Drop a cached issue payload and its compiled spec"""
+    await cache_delete(issue_key(identifier), compiled_feature_key(identifier))
+
+
+async def get_cached_compiled_feature(identifier: str, source_hash: str) -> Optional[dict]:
+    """
+    Get an issue's compiled spec if it was compiled from the same spec text
+
+    Args:
+        identifier: Issue identifier
+        source_hash: Hash of the current spec YAML
+
+    Returns:
+        Compiled spec dict (text, source_lines, source_hash), or None on a miss
+    """
+    cached = await cache_get_json(compiled_feature_key(identifier))
+    if cached is None or cached.get("source_hash") != source_hash:
+        return None
+    return cached
+
+
+async def cache_compiled_feature(identifier: str, compiled: dict) -> None:
+    """Cache an issue's compiled spec next to its payload"""
+    settings = get_settings()
+    await cache_set_json(compiled_feature_key(identifier), compiled, settings.issue_cache_ttl)
+
+
+async def get_cached_assigned_page(user_id: str, page_key: str) -> Optional[dict]:
+    """
+    Get one cached page of a user's assigned issue list
+
+    Args:
+        user_id: Linear user ID
+        page_key: Identifies filters, sort order and cursor of the page
+
+    Returns:
+        Page dict, or None on a miss
+    """
+    return await cache_hget_json(assigned_issues_key(user_id), page_key)
+
+
+async def cache_assigned_page(user_id: str, page_key: str, page: dict) -> None:
+    """Cache one page of a user's assigned issue list"""
+    settings = get_settings()
+    await cache_hset_json(assigned_issues_key(user_id), page_key, page, settings.issue_cache_ttl)
+
+
+async def invalidate_assigned_issues(*user_ids: Optional[str]) -> None:
+    """Drop every cached page of the given users' assigned issue lists"""
+    await cache_delete(*(assigned_issues_key(user_id) for user_id in user_ids if user_id))
@@ -0,0 +1,559 @@
+"""
+Issue Search Service
+Inverted index over issue titles, descriptions, Gherkin steps and tags
+
+Every issue the app sees (list pages, opened issues, our own writes, Linear
+webhooks) is tokenized into weighted terms; a periodic incremental sync
+pulls whatever else changed in each team since the newest `updatedAt`
+already indexed for that team.
+A search intersects the posting lists of its terms, smallest first, so a
+query touches only the issues that can match rather than every issue.
+"""
+
+import asyncio
+import heapq
+import json
+import logging
+import os
+import re
+import time
+from bisect import bisect_left
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Optional
+from backend.adapters.linear import remember_issue_id
+from backend.config import get_settings
+from backend.gherkin.compiler import SpecCompileError, compile_spec
+from backend.gherkin.parsing import ParsedFeature, parse_gherkin
+from backend.gherkin.sections import SPECIFICATION_HEADING, parse_description
+from backend.services.linear_scheduler import LinearScheduler, Priority, get_linear_scheduler
+
+logger = logging.getLogger(__name__)
+
+# Issues per sync page (Linear allows at most 250 nodes per connection page)
+SYNC_PAGE_SIZE = 250
+
+# Most vocabulary terms a trailing prefix expands to
+PREFIX_EXPANSIONS = 64
+
+# Term weights by where the term occurs; an issue scores its best weight per term
+TITLE_WEIGHT = 4
+TAG_WEIGHT = 3
+SPEC_WEIGHT = 2
+DESCRIPTION_WEIGHT = 1
+
+_TOKEN = re.compile(r"\w+")
+
+SEARCH_SYNC_QUERY = """
+    query SearchSync(
+        $first: Int!
+        $after: String
+        $filter: IssueFilter
+        $orderBy: PaginationOrderBy
+    ) {
+        issues(first: $first, after: $after, filter: $filter, orderBy: $orderBy) {
+            nodes {
+                id
+                identifier
+                title
+                description
+                state {
+                    name
+                }
+                priority
+                updatedAt
+                team {
+                    id
+                }
+            }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+    }
+"""
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens of a text ("@smoke ENG-12" -> ["smoke", "eng", "12"])"""
+    return _TOKEN.findall(text.lower())
+
+
+@dataclass(frozen=True)
+class SearchDocument:
+    """What the index keeps of one issue: its list row fields and weighted terms"""
+
+    identifier: str
+    title: str
+    status: str
+    priority: int
+    updated_at: str
+    team_id: Optional[str]
+    has_gherkin: bool
+    terms: dict[str, int]
+
+    def to_feature(self) -> dict:
+        """Row in the feature list format"""
+        return {
+            "issue_id": self.identifier,
+            "title": self.title,
+            "status": self.status,
+            "priority": self.priority,
+            "updated_at": self.updated_at,
+            "has_gherkin": self.has_gherkin,
+        }
+
+
+@dataclass(frozen=True)
+class SyncStats:
+    """Outcome of one incremental sync"""
+
+    documents: int
+    updated: int
+    synced_through: Optional[str]  # Newest updatedAt covered for the synced teams
+
+
+def _spec_text(parsed: ParsedFeature) -> tuple[list[str], list[str]]:
+    """(tags, scenario names and step texts) of a parsed spec"""
+    scenarios = [*parsed.scenarios, *(s for rule in parsed.rules for s in rule.scenarios)]
+    backgrounds = [parsed.background, *(rule.background for rule in parsed.rules)]
+
+    tags = [*parsed.feature.tags, *(tag for scenario in scenarios for tag in scenario.tags)]
+    text = [parsed.feature.name]
+    for scenario in (*(b for b in backgrounds if b), *scenarios):
+        text.append(scenario.name)
+        text.extend(step.text for step in scenario.steps)
+    return tags, text
+
+
+def document_terms(title: str, description: str, identifier: str = "") -> dict[str, int]:
+    """
+    Weighted search terms of an issue
+
+    Args:
+        title: Issue title
+        description: Issue description (markdown, possibly with a spec)
+        identifier: Issue identifier, indexed so "ENG-12" finds the issue
+
+    Returns:
+        dict: Term -> weight of its most significant occurrence
+    """
+    sections = parse_description(description)
+
+    weighted = [
+        (DESCRIPTION_WEIGHT, sections.plain_text),
+        (TITLE_WEIGHT, title),
+        (TITLE_WEIGHT, identifier),
+    ]
+    # Index the compiled .feature text, as previewed and committed
+    parsed = None
+    if sections.spec_yaml:
+        try:
+            parsed = parse_gherkin(compile_spec(sections.spec_yaml).text)
+        except SpecCompileError:
+            pass
+    if parsed is not None:
+        tags, text = _spec_text(parsed)
+        weighted += [(SPEC_WEIGHT, line) for line in text]
+        weighted += [(TAG_WEIGHT, tag) for tag in tags]
+
+    terms: dict[str, int] = {}
+    for weight, text in weighted:
+        for term in tokenize(text or ""):
+            if terms.get(term, 0) < weight:
+                terms[term] = weight
+    return terms
+
+
+def build_document(issue: dict) -> SearchDocument:
+    """
+    Index entry for a Linear issue node or webhook payload
+
+    Args:
+        issue: Issue with at least identifier and title
+
+    Returns:
+        SearchDocument
+    """
+    description = issue.get("description") or ""
+    team = issue.get("team") or {}
+    return SearchDocument(
+        identifier=issue["identifier"],
+        title=issue["title"],
+        status=(issue.get("state") or {}).get("name", ""),
+        priority=issue.get("priority") or 0,
+        updated_at=issue.get("updatedAt") or "",
+        team_id=team.get("id") or issue.get("teamId"),
+        has_gherkin="```yaml" in description or SPECIFICATION_HEADING in description,
+        terms=document_terms(issue["title"], description, issue["identifier"]),
+    )
+
+
+@dataclass
+class IssueSearchIndex:
+    """Issues by identifier, with a term -> {identifier: weight} posting index"""
+
+    documents: dict[str, SearchDocument] = field(default_factory=dict)
+    postings: dict[str, dict[str, int]] = field(default_factory=dict)
+    # Per team: newest updatedAt a sync has covered, and when (monotonic) it ran
+    synced_through: dict[str, str] = field(default_factory=dict)
+    synced_at: dict[str, float] = field(default_factory=dict)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    _vocabulary: Optional[list[str]] = None  # Sorted terms, rebuilt lazily for prefixes
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add(self, document: SearchDocument) -> bool:
+        """
+        Add or replace an issue, unless the indexed copy is newer
+
+        Args:
+            document: Issue to index
+
+        Returns:
+            bool: Whether the index changed
+        """
+        existing = self.documents.get(document.identifier)
+        if existing is not None:
+            if document.updated_at and document.updated_at < existing.updated_at:
+                return False
+            self.remove(document.identifier)
+
+        self.documents[document.identifier] = document
+        for term, weight in document.terms.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                self.postings[term] = {document.identifier: weight}
+                self._vocabulary = None
+            else:
+                postings[document.identifier] = weight
+        return True
+
+    def is_current(self, issue: dict) -> bool:
+        """Whether the indexed copy of an issue node is at least as new as the node"""
+        existing = self.documents.get(issue["identifier"])
+        updated_at = issue.get("updatedAt") or ""
+        return existing is not None and bool(updated_at) and updated_at <= existing.updated_at
+
+    def put(self, issue: dict) -> bool:
+        """Index a Linear issue node (see add), skipping the parse if already current"""
+        if self.is_current(issue):
+            return False
+        return self.add(build_document(issue))
+
+    def remove(self, identifier: str) -> None:
+        """Drop an issue and its postings"""
+        document = self.documents.pop(identifier, None)
+        if document is None:
+            return
+        for term in document.terms:
+            postings = self.postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(identifier, None)
+            if not postings:
+                del self.postings[term]
+                self._vocabulary = None
+
+    def is_stale(self, interval: int, team_ids: Iterable[str]) -> bool:
+        """Whether any of the teams was never synced or not within interval seconds"""
+        now = time.monotonic()
+        return any(now - self.synced_at.get(team, -interval - 1) > interval for team in team_ids)
+
+    def _prefixed(self, prefix: str) -> list[str]:
+        """Vocabulary terms starting with prefix, at most PREFIX_EXPANSIONS"""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, prefix)
+        return [
+            term
+            for term in islice(vocabulary, start, start + PREFIX_EXPANSIONS)
+            if term.startswith(prefix)
+        ]
+
+    def _postings_for(self, term: str, *, prefix: bool) -> dict[str, int]:
+        """Postings of a term, merged with every term it prefixes if prefix is set"""
+        if not prefix:
+            return self.postings.get(term, {})
+        merged: dict[str, int] = {}
+        for expansion in self._prefixed(term):
+            for identifier, weight in self.postings[expansion].items():
+                if merged.get(identifier, 0) < weight:
+                    merged[identifier] = weight
+        return merged
+
+    def search(
+        self, query: str, *, team_ids: Optional[set[str]] = None, limit: int = 25
+    ) -> list[SearchDocument]:
+        """
+        Issues containing every term of a query, best matches first
+
+        The last term also matches as a prefix, so results follow typing.
+        Ties are broken by most recently updated.
+
+        Args:
+            query: Search text
+            team_ids: Only issues of these teams (None for no restriction)
+            limit: Most results returned
+
+        Returns:
+            list[SearchDocument]
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        postings = [self._postings_for(term, prefix=False) for term in terms[:-1]]
+        postings.append(self._postings_for(terms[-1], prefix=len(terms[-1]) > 1))
+        postings.sort(key=len)
+        if not postings[0]:
+            return []
+
+        scores = dict(postings[0])
+        for other in postings[1:]:
+            scores = {
+                identifier: score + other[identifier]
+                for identifier, score in scores.items()
+                if identifier in other
+            }
+            if not scores:
+                return []
+
+        documents = self.documents
+        candidates = (documents[identifier] for identifier in scores)
+        if team_ids is not None:
+            candidates = (
+                document
+                for document in candidates
+                if document.team_id is None or document.team_id in team_ids
+            )
+        return heapq.nlargest(
+            limit,
+            candidates,
+            key=lambda document: (scores[document.identifier], document.updated_at),
+        )
+
+    def snapshot(self) -> dict:
+        """Documents and sync position, safe to serialize while the index keeps changing"""
+        return {
+            "synced_through": dict(self.synced_through),
+            "documents": list(self.documents.values()),
+        }
+
+    def save(self, path: Path) -> None:
+        """Persist documents and sync position as JSON (see write_snapshot)"""
+        write_snapshot(path, self.snapshot())
+
+    @classmethod
+    def load(cls, path: Path) -> "IssueSearchIndex":
+        """
+        Load a saved index; the next sync only fetches issues updated since the save
+
+        Args:
+            path: File given to save()
+
+        Returns:
+            IssueSearchIndex: Empty if nothing was saved at path
+        """
+        index = cls()
+        if not path.exists():
+            return index
+
+        saved = json.loads(path.read_text())
+        for document in saved["documents"]:
+            index.add(SearchDocument(**document))
+        index.synced_through = saved["synced_through"]
+        return index
+
+
+def write_snapshot(path: Path, snapshot: dict) -> None:
+    """
+    Write an index snapshot as JSON to a temporary name, then rename it into place
+
+    Args:
+        path: File to write
+        snapshot: IssueSearchIndex.snapshot()
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(path.suffix + ".tmp")
+    temporary.write_text(
+        json.dumps(
+            {
+                "synced_through": snapshot["synced_through"],
+                "documents": [asdict(document) for document in snapshot["documents"]],
+            }
+        )
+    )
+    os.replace(temporary, path)
+
+
+async def index_issues(issues: Iterable[dict]) -> int:
+    """
+    Feed issues the app has read or written into the process-wide index
+
+    Specs are compiled and parsed in a worker thread, as in the sync, so a
+    page of issues with large specs doesn't stall the event loop.
+
+    Args:
+        issues: Linear issue nodes (identifier, title, description, ...)
+
+    Returns:
+        int: Issues whose indexed copy changed
+    """
+    index = get_issue_search()
+    changed = [
+        issue for issue in issues if issue.get("identifier") and not index.is_current(issue)
+    ]
+    if not changed:
+        return 0
+    documents = await asyncio.to_thread(_build_documents, changed)
+    return sum(index.add(document) for document in documents)
+
+
+async def sync_issue_search(
+    index: IssueSearchIndex,
+    *,
+    linear_token: str,
+    team_ids: Iterable[str],
+    scheduler: Optional[LinearScheduler] = None,
+    page_size: int = SYNC_PAGE_SIZE,
+) -> Optional[SyncStats]:
+    """
+    Pull issues of the given teams updated since their last sync into the index
+
+    The index is shared by every user, but each sync runs with one user's
+    token, so the position is kept per team: teams never synced are walked in
+    full, the others filter on updatedAt, which costs one request when little
+    changed. Runs at background priority so it never delays interactive calls.
+
+    Args:
+        index: Index to update in place
+        linear_token: Linear OAuth token of a user who can see the teams
+        team_ids: Teams to sync (the token's visible teams)
+        scheduler: Linear scheduler (defaults to the process-wide one)
+        page_size: Issues per request
+
+    Returns:
+        SyncStats, or None if another sync is running or Linear returned errors
+    """
+    if index.lock.locked():
+        return None
+
+    scheduler = scheduler or get_linear_scheduler()
+    async with index.lock:
+        team_ids = set(team_ids)
+        known = sorted(team for team in team_ids if team in index.synced_through)
+        unsynced = sorted(team_ids - set(known))
+
+        windows = []
+        if unsynced:
+            windows.append({"team": {"id": {"in": unsynced}}})
+        if known:
+            since = min(index.synced_through[team] for team in known)
+            windows.append({"team": {"id": {"in": known}}, "updatedAt": {"gt": since}})
+
+        newest = max((index.synced_through[team] for team in known), default="")
+        updated = 0
+        for issue_filter in windows:
+            pulled = await _pull_issues(
+                index,
+                linear_token=linear_token,
+                issue_filter=issue_filter,
+                scheduler=scheduler,
+                page_size=page_size,
+            )
+            if pulled is None:
+                # Keep the old positions so the next sync retries the same window
+                return None
+            updated += pulled[0]
+            newest = max(newest, pulled[1])
+
+        # Everything in these teams up to the newest issue seen is now indexed
+        now = time.monotonic()
+        for team in team_ids:
+            if newest:
+                index.synced_through[team] = max(newest, index.synced_through.get(team, ""))
+            index.synced_at[team] = now
+
+    stats = SyncStats(documents=len(index), updated=updated, synced_through=newest or None)
+    logger.info("Issue search synced: %d issues, %d updated", stats.documents, stats.updated)
+
+    path = _index_path()
+    if path and updated:
+        await asyncio.to_thread(write_snapshot, path, index.snapshot())
+    return stats
+
+
+async def _pull_issues(
+    index: IssueSearchIndex,
+    *,
+    linear_token: str,
+    issue_filter: dict,
+    scheduler: LinearScheduler,
+    page_size: int,
+) -> Optional[tuple[int, str]]:
+    """
+    Index every issue matching a filter, following pageInfo cursors
+
+    Returns:
+        (issues updated, newest updatedAt seen), or None if Linear returned errors
+    """
+    updated = 0
+    newest = ""
+    after = None
+
+    while True:
+        response = await scheduler.post(
+            linear_token,
+            {
+                "query": SEARCH_SYNC_QUERY,
+                "variables": {
+                    "first": page_size,
+                    "after": after,
+                    "filter": issue_filter,
+                    "orderBy": "updatedAt",
+                },
+            },
+            priority=Priority.BACKGROUND,
+        )
+        data = response.json()
+        if "errors" in data:
+            logger.warning("Issue search sync failed: %s", data["errors"])
+            return None
+
+        connection = (data.get("data") or {}).get("issues") or {}
+        nodes = connection.get("nodes", [])
+        for issue in nodes:
+            remember_issue_id(issue["identifier"], issue["id"])
+            newest = max(newest, issue.get("updatedAt") or "")
+
+        # Parsing specs is CPU work; a full page would stall the event loop
+        changed = [issue for issue in nodes if not index.is_current(issue)]
+        documents = await asyncio.to_thread(_build_documents, changed)
+        updated += sum(index.add(document) for document in documents)
+
+        page_info = connection.get("pageInfo") or {}
+        after = page_info.get("endCursor")
+        if not page_info.get("hasNextPage") or not after:
+            return updated, newest
+
+
+def _build_documents(issues: list[dict]) -> list[SearchDocument]:
+    return [build_document(issue) for issue in issues]
+
+
+def _index_path() -> Optional[Path]:
+    settings = get_settings()
+    return Path(settings.issue_search_path) if settings.issue_search_path else None
+
+
+@lru_cache
+def get_issue_search() -> IssueSearchIndex:
+    """Get the process-wide issue search index, loaded from disk if persisted"""
+    path = _index_path()
+    return IssueSearchIndex.load(path) if path else IssueSearchIndex()
@@ -5,15 +5,20 @@ Handles uploading files to Linear's private cloud storage
 
 import httpx
 import base64
+import logging
 from typing import Optional
+from backend.services.linear_scheduler import Priority, get_linear_scheduler
+
+logger = logging.getLogger(__name__)
 
 
 class LinearFileService:
     """Service for uploading files to Linear"""
 
-    def __init__(self, linear_token: str):
+    def __init__(self, linear_token: str, priority: Priority = Priority.INTERACTIVE):
         self.linear_token = linear_token
-        self.api_url = "https://api.linear.app/graphql"
+        self.scheduler = get_linear_scheduler()
+        self.priority = priority
 
     async def upload_file(
         self,
@@ -41,36 +46,35 @@ class LinearFileService:
         file_size = len(file_bytes)
 
         # Step 1: Request upload URL from Linear
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.api_url,
-                headers={"Authorization": f"Bearer {self.linear_token}"},
-                json={
-                    "query": """
-                        mutation FileUpload($contentType: String!, $filename: String!, $size: Int!) {
-                            fileUpload(contentType: $contentType, filename: $filename, size: $size) {
-                                uploadFile {
-                                    uploadUrl
-                                    assetUrl
-                                    headers {
-                                        key
-                                        value
-                                    }
+        response = await self.scheduler.post(
+            self.linear_token,
+            {
+                "query": """
+                    mutation FileUpload($contentType: String!, $filename: String!, $size: Int!) {
+                        fileUpload(contentType: $contentType, filename: $filename, size: $size) {
+                            uploadFile {
+                                uploadUrl
+                                assetUrl
+                                headers {
+                                    key
+                                    value
                                 }
                             }
                         }
-                    """,
-                    "variables": {
-                        "contentType": content_type,
-                        "filename": filename,
-                        "size": file_size,
-                    },
+                    }
+                """,
+                "variables": {
+                    "contentType": content_type,
+                    "filename": filename,
+                    "size": file_size,
                 },
-            )
-            result = response.json()
+            },
+            priority=self.priority,
+        )
+        result = response.json()
 
         if not result or "errors" in result:
-            print(f"Failed to get upload URL: {result}")
+            logger.warning("Failed to get upload URL", extra={"response": result})
             return None
 
         upload_data = result["data"]["fileUpload"]["uploadFile"]
@@ -96,10 +100,12 @@ class LinearFileService:
             )
 
         if upload_response.status_code not in [200, 204]:
-            print(f"Failed to upload file: {upload_response.status_code} {upload_response.text}")
+            logger.warning(
+                "Failed to upload file: %s %s", upload_response.status_code, upload_response.text
+            )
             return None
 
-        print(f"Successfully uploaded file: {filename} ({file_size} bytes) -> {asset_url}")
+        logger.info("Uploaded file %s (%d bytes)", filename, file_size)
         return asset_url
 
     async def attach_to_issue(
@@ -119,40 +125,39 @@ class LinearFileService:
         Returns:
             True if successful, False otherwise
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.api_url,
-                headers={"Authorization": f"Bearer {self.linear_token}"},
-                json={
-                    "query": """
-                        mutation AttachmentCreate($issueId: String!, $url: String!, $title: String!) {
-                            attachmentCreate(input: {
-                                issueId: $issueId
-                                url: $url
-                                title: $title
-                            }) {
-                                success
-                                attachment {
-                                    id
-                                    url
-                                }
+        response = await self.scheduler.post(
+            self.linear_token,
+            {
+                "query": """
+                    mutation AttachmentCreate($issueId: String!, $url: String!, $title: String!) {
+                        attachmentCreate(input: {
+                            issueId: $issueId
+                            url: $url
+                            title: $title
+                        }) {
+                            success
+                            attachment {
+                                id
+                                url
                             }
                         }
-                    """,
-                    "variables": {
-                        "issueId": issue_id,
-                        "url": asset_url,
-                        "title": title,
-                    },
+                    }
+                """,
+                "variables": {
+                    "issueId": issue_id,
+                    "url": asset_url,
+                    "title": title,
                 },
-            )
-            result = response.json()
+            },
+            priority=self.priority,
+        )
+        result = response.json()
 
         if not result or "errors" in result:
-            print(f"Failed to attach file: {result}")
+            logger.warning("Failed to attach file", extra={"response": result})
             return False
 
         success = result["data"]["attachmentCreate"]["success"]
         if success:
-            print(f"Successfully attached file to issue {issue_id}")
+            logger.info("Attached file to issue %s", issue_id)
         return success
@@ -0,0 +1,302 @@
+"""
+Linear Request Scheduler
+Central, rate-limit-aware gateway for every Linear GraphQL call
+"""
+
+import asyncio
+import hashlib
+import heapq
+import itertools
+import random
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from typing import Optional
+import httpx
+from backend.config import get_settings
+from backend.instrumentation import record_size, timed
+
+LINEAR_API_URL = "https://api.linear.app/graphql"
+
+# Linear rate-limit response headers -> RateLimitBudget fields
+_BUDGET_HEADERS = {
+    "x-ratelimit-requests-limit": "requests_limit",
+    "x-ratelimit-requests-remaining": "requests_remaining",
+    "x-ratelimit-requests-reset": "requests_reset_ms",
+    "x-ratelimit-complexity-limit": "complexity_limit",
+    "x-ratelimit-complexity-remaining": "complexity_remaining",
+    "x-ratelimit-complexity-reset": "complexity_reset_ms",
+}
+
+
+class Priority(IntEnum):
+    """Scheduling priority, lower runs first"""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+@dataclass
+class RateLimitBudget:
+    """Last known Linear rate-limit budget for one API token"""
+
+    requests_limit: Optional[int] = None
+    requests_remaining: Optional[int] = None
+    requests_reset_ms: Optional[int] = None
+    complexity_limit: Optional[int] = None
+    complexity_remaining: Optional[int] = None
+    complexity_reset_ms: Optional[int] = None
+    last_complexity: Optional[int] = None
+
+
+def token_label(token: str) -> str:
+    """Short, non-reversible label for a token in metrics and logs"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:12]
+
+
+def _is_rate_limited(response: httpx.Response) -> bool:
+    """True for HTTP 429 or a GraphQL RATELIMITED error"""
+    if response.status_code == 429:
+        return True
+    if response.status_code != 400:
+        return False
+
+    try:
+        errors = response.json().get("errors") or []
+    except ValueError:
+        return False
+
+    return any((error.get("extensions") or {}).get("code") == "RATELIMITED" for error in errors)
+
+
+def _is_mutation(payload: dict) -> bool:
+    """True if the GraphQL document is a mutation"""
+    return payload.get("query", "").lstrip().startswith("mutation")
+
+
+def _not_sent(error: httpx.TransportError) -> bool:
+    """True if the request never reached Linear, so resending cannot duplicate it"""
+    return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+
+
+class LinearScheduler:
+    """
+    Queue Linear requests by priority, track rate-limit budget per token and
+    retry rate-limited or failed requests with jittered exponential backoff
+    """
+
+    def __init__(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        *,
+        api_url: str = LINEAR_API_URL,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 8.0,
+        background_reserve: float = 0.2,
+        max_interactive_wait: float = 5.0,
+    ):
+        self.http_client = http_client or httpx.AsyncClient(timeout=30.0)
+        self.api_url = api_url
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.background_reserve = background_reserve
+        self.max_interactive_wait = max_interactive_wait
+
+        self.budgets: dict[str, RateLimitBudget] = {}
+        self.requests_total: dict[Priority, int] = dict.fromkeys(Priority, 0)
+        self.retries_total = 0
+
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for a free slot"""
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    @timed("linear")
+    async def post(
+        self,
+        token: str,
+        payload: dict,
+        *,
+        priority: Priority = Priority.INTERACTIVE,
+        idempotent: Optional[bool] = None,
+    ) -> httpx.Response:
+        """
+        Send a GraphQL payload to Linear through the scheduler
+
+        Rate-limited responses and connection failures are always retried.
+        Server errors and timeouts are only retried for idempotent requests:
+        Linear may already have applied a mutation that failed that way.
+
+        Args:
+            token: Linear API or OAuth token
+            payload: GraphQL body ({"query": ..., "variables": ...})
+            priority: INTERACTIVE for page loads, BACKGROUND for deferred jobs
+            idempotent: Safe to resend; defaults to True for queries, False for mutations
+
+        Returns:
+            httpx.Response: Final response after any retries
+        """
+        label = token_label(token)
+        headers = {"Authorization": f"Bearer {token}"}
+        if idempotent is None:
+            idempotent = not _is_mutation(payload)
+
+        self.requests_total[priority] += 1
+
+        for attempt in range(self.max_retries + 1):
+            # Waits happen without a slot, so one token's exhausted budget
+            # never holds up requests for other tokens
+            await self._wait_for_budget(label, priority)
+
+            await self._acquire(priority)
+            try:
+                response = await self.http_client.post(self.api_url, headers=headers, json=payload)
+            except httpx.TransportError as e:
+                if attempt == self.max_retries or not (idempotent or _not_sent(e)):
+                    raise
+                self.retries_total += 1
+                response = None
+            finally:
+                self._release()
+
+            if response is not None:
+                self._record_budget(label, response)
+                record_size("linear", "sent", len(response.request.content))
+                record_size("linear", "received", len(response.content))
+
+                retryable = _is_rate_limited(response) or (
+                    idempotent and response.status_code >= 500
+                )
+                if not retryable or attempt == self.max_retries:
+                    return response
+                self.retries_total += 1
+
+            await asyncio.sleep(self._backoff(attempt, response))
+
+        return response
+
+    async def _acquire(self, priority: Priority) -> None:
+        """Wait for a concurrency slot, interactive requests first"""
+        if self._active < self.max_concurrency and not self.queue_depth:
+            self._active += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot was handed over just before cancellation; pass it on
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand the slot to the highest-priority waiter, or free it"""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        self._active -= 1
+
+    async def _wait_for_budget(self, label: str, priority: Priority) -> None:
+        """
+        Hold requests back when the token's budget is running out
+
+        Background work stops at the reserve so interactive reads keep some
+        headroom; interactive reads only wait (briefly) once the budget is gone.
+        """
+        budget = self.budgets.get(label)
+        if budget is None:
+            return
+
+        now_ms = time.time() * 1000
+        reserve = self.background_reserve if priority == Priority.BACKGROUND else 0.0
+        delay = 0.0
+
+        for remaining, limit, reset_ms in (
+            (budget.requests_remaining, budget.requests_limit, budget.requests_reset_ms),
+            (budget.complexity_remaining, budget.complexity_limit, budget.complexity_reset_ms),
+        ):
+            if remaining is None or limit is None or reset_ms is None or reset_ms <= now_ms:
+                continue
+            if remaining <= limit * reserve:
+                delay = max(delay, (reset_ms - now_ms) / 1000)
+
+        if priority == Priority.INTERACTIVE and delay > self.max_interactive_wait:
+            # Let the request through; a 429 is retried with backoff
+            return
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _record_budget(self, label: str, response: httpx.Response) -> None:
+        """Update the token's budget from Linear's rate-limit headers"""
+        budget = self.budgets.setdefault(label, RateLimitBudget())
+
+        for header, field in _BUDGET_HEADERS.items():
+            value = response.headers.get(header)
+            if value is not None and value.isdigit():
+                setattr(budget, field, int(value))
+
+        complexity = response.headers.get("x-complexity")
+        if complexity is not None and complexity.isdigit():
+            budget.last_complexity = int(complexity)
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Delay before the next attempt: Retry-After if given, else full jitter"""
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after is not None and retry_after.isdigit():
+                return min(float(retry_after), self.backoff_cap)
+
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2**attempt))
+
+    def render_metrics(self) -> str:
+        """Render budget, queue and retry metrics in Prometheus text format"""
+        lines = [
+            "# HELP linear_requests_total Linear requests sent through the scheduler",
+            "# TYPE linear_requests_total counter",
+        ]
+        for priority, count in self.requests_total.items():
+            lines.append(f'linear_requests_total{{priority="{priority.name.lower()}"}} {count}')
+
+        lines += [
+            "# HELP linear_retries_total Linear requests retried after 429/5xx/transport errors",
+            "# TYPE linear_retries_total counter",
+            f"linear_retries_total {self.retries_total}",
+            "# HELP linear_queue_depth Linear requests waiting for a scheduler slot",
+            "# TYPE linear_queue_depth gauge",
+            f"linear_queue_depth {self.queue_depth}",
+        ]
+
+        for field in ("requests_remaining", "complexity_remaining", "last_complexity"):
+            metric = f"linear_rate_limit_{field}"
+            lines += [
+                f"# HELP {metric} Last reported Linear {field.replace('_', ' ')} per token",
+                f"# TYPE {metric} gauge",
+            ]
+            for label, budget in self.budgets.items():
+                value = getattr(budget, field)
+                if value is not None:
+                    lines.append(f'{metric}{{token="{label}"}} {value}')
+
+        return "\n".join(lines) + "\n"
+
+
+@lru_cache
+def get_linear_scheduler() -> LinearScheduler:
+    """Get the process-wide Linear scheduler"""
+    return LinearScheduler(api_url=get_settings().linear_api_url)
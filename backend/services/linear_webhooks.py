@@ -0,0 +1,214 @@
+"""
+Linear Webhook Service
+Verifies Linear webhook deliveries and applies them to the Redis caches
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import time
+from typing import AsyncIterator, Optional
+from redis.exceptions import RedisError
+from backend.adapters.linear import (
+    forget_workflow_states,
+    remember_issue_id,
+    remember_issue_team,
+)
+from backend.services.cache import cache_publish, get_redis
+from backend.services.issue_cache import (
+    cache_issue,
+    get_cached_issue,
+    invalidate_assigned_issues,
+    invalidate_issue,
+    resolve_identifier,
+)
+from backend.services.issue_search import get_issue_search, index_issues
+
+logger = logging.getLogger(__name__)
+
+# Deliveries older than this are rejected as possible replays
+WEBHOOK_TOLERANCE_SECONDS = 60
+
+# Seconds between keepalive ticks on an idle subscription
+SUBSCRIPTION_KEEPALIVE_SECONDS = 15.0
+
+# Issue fields that can be patched into a cached payload from webhook data
+_PATCHABLE_ISSUE_FIELDS = ("title", "description", "priority", "state", "assignee", "project")
+
+
+def issue_channel(identifier: str) -> str:
+    """Pub/sub channel for change notifications on one issue"""
+    return f"issue_events:{identifier}"
+
+
+def verify_signature(body: bytes, signature: str, secret: str) -> bool:
+    """
+    Verify the Linear-Signature header against the raw request body
+
+    Args:
+        body: Raw request body
+        signature: Hex HMAC-SHA256 from the Linear-Signature header
+        secret: Webhook signing secret
+
+    Returns:
+        bool: True if the signature matches
+    """
+    if not secret or not signature:
+        return False
+
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+def is_fresh(payload: dict, now_ms: Optional[int] = None) -> bool:
+    """
+    Check the delivery timestamp is within the replay tolerance
+
+    Args:
+        payload: Decoded webhook payload
+        now_ms: Current time in milliseconds (defaults to wall clock)
+
+    Returns:
+        bool: True if webhookTimestamp is recent enough
+    """
+    timestamp = payload.get("webhookTimestamp")
+    if not isinstance(timestamp, (int, float)):
+        return False
+
+    now_ms = now_ms if now_ms is not None else int(time.time() * 1000)
+    return abs(now_ms - timestamp) <= WEBHOOK_TOLERANCE_SECONDS * 1000
+
+
+async def apply_webhook_event(payload: dict) -> Optional[str]:
+    """
+    Update or invalidate caches for a Linear webhook event and notify editors
+
+    Args:
+        payload: Decoded webhook payload ({action, type, data, updatedFrom, ...})
+
+    Returns:
+        Identifier of the affected issue, or None if no issue was affected
+    """
+    event_type = payload.get("type")
+    action = payload.get("action")
+    data = payload.get("data") or {}
+
+    if event_type == "Issue":
+        identifier = await _apply_issue_event(action, data, payload.get("updatedFrom") or {})
+    elif event_type in ("Comment", "Attachment"):
+        identifier = await _issue_identifier_for(data)
+        # Attachments are part of the cached issue payload; comments are not
+        if identifier and event_type == "Attachment":
+            await invalidate_issue(identifier)
+    elif event_type == "WorkflowState":
+        forget_workflow_states()
+        identifier = None
+    else:
+        identifier = None
+
+    if identifier:
+        await cache_publish(
+            issue_channel(identifier),
+            {"type": event_type, "action": action, "identifier": identifier},
+        )
+
+    return identifier
+
+
+async def _apply_issue_event(action: str, data: dict, updated_from: dict) -> Optional[str]:
+    """
+    Apply an Issue create/update/remove event
+
+    Args:
+        action: "create", "update" or "remove"
+        data: Issue data from the webhook
+        updated_from: Previous values of changed fields (updates only)
+
+    Returns:
+        Issue identifier, or None if the payload has none
+    """
+    identifier = data.get("identifier")
+    if not identifier:
+        return None
+
+    # Linear renumbers an issue that moves to another team; drop the old number
+    previous = await resolve_identifier(data["id"]) if data.get("id") else None
+    if previous and previous != identifier:
+        await invalidate_issue(previous)
+        get_issue_search().remove(previous)
+
+    remember_issue_id(identifier, data.get("id", ""))
+    remember_issue_team(data.get("id", ""), data.get("teamId", ""))
+
+    # Assigned lists change on create/remove and when the assignee moves
+    await invalidate_assigned_issues(data.get("assigneeId"), updated_from.get("assigneeId"))
+
+    if action == "remove":
+        await invalidate_issue(identifier)
+        get_issue_search().remove(identifier)
+        return identifier
+
+    # Issue payloads carry title, description and updatedAt, enough to re-index
+    if "title" in data:
+        await index_issues([data])
+
+    cached = await get_cached_issue(identifier)
+    cached_team = ((cached or {}).get("team") or {}).get("id")
+    if cached is not None and (
+        "teamId" in updated_from or data.get("teamId", cached_team) != cached_team
+    ):
+        # Cache hits are only served to users who can see the cached team, so
+        # a moved issue is fetched again rather than patched under its old team
+        await invalidate_issue(identifier)
+    elif cached is not None:
+        for field in _PATCHABLE_ISSUE_FIELDS:
+            if field in data:
+                cached[field] = data[field]
+        await cache_issue(cached)
+
+    return identifier
+
+
+async def _issue_identifier_for(data: dict) -> Optional[str]:
+    """
+    Find the parent issue identifier for Comment/Attachment data
+
+    Args:
+        data: Comment or Attachment data from the webhook
+
+    Returns:
+        Issue identifier, or None if the issue is not known to the cache
+    """
+    issue = data.get("issue") or {}
+    if issue.get("identifier"):
+        return issue["identifier"]
+
+    issue_id = data.get("issueId") or issue.get("id")
+    return await resolve_identifier(issue_id) if issue_id else None
+
+
+async def subscribe_issue_events(identifier: str) -> AsyncIterator[Optional[dict]]:
+    """
+    Yield change notifications published for one issue
+
+    Yields None every SUBSCRIPTION_KEEPALIVE_SECONDS while idle so callers can
+    send keepalives and notice disconnects. Ends quietly if Redis is unavailable.
+
+    Args:
+        identifier: Issue identifier to watch
+    """
+    pubsub = get_redis().pubsub()
+
+    try:
+        await pubsub.subscribe(issue_channel(identifier))
+        while True:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True,
+                timeout=SUBSCRIPTION_KEEPALIVE_SECONDS,
+            )
+            yield json.loads(message["data"]) if message else None
+    except RedisError as e:
+        logger.warning("Issue event subscription failed for %s: %s", identifier, e)
+    finally:
+        await pubsub.aclose()
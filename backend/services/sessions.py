@@ -0,0 +1,169 @@
+"""
+Session Service
+Server-side sessions in Redis, keyed by an opaque id stored in a cookie
+"""
+
+import hashlib
+import logging
+import secrets
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+import httpx
+from fastapi import Request, Response
+from backend.config import get_settings
+from backend.services.cache import cache_delete, cache_set_json, cache_touch_json
+from backend.services.viewer import Viewer, resolve_viewer
+
+logger = logging.getLogger(__name__)
+
+SESSION_COOKIE = "session_id"
+
+# The cookie outlives idle sessions; Redis expiry decides when a session ends
+SESSION_COOKIE_MAX_AGE = 2592000  # 30 days
+
+# Cookies set before server-side sessions, cleared on logout
+LEGACY_COOKIES = ("linear_token", "user_id", "user_name")
+
+
+@dataclass
+class Session:
+    """Everything a request needs about the signed-in user"""
+
+    id: str
+    linear_token: str
+    viewer: Viewer
+    teams: Optional[list[dict]] = None
+    teams_loaded_at: float = 0.0  # Wall clock; the team list is re-fetched after session_teams_ttl
+    validated_at: float = 0.0  # Wall clock of the last check that Linear accepts the token
+    preferences: dict = field(default_factory=dict)
+
+
+def session_key(session_id: str) -> str:
+    """Cache key for a session, by id hash (never the raw cookie value)"""
+    return f"session:{hashlib.sha256(session_id.encode('utf-8')).hexdigest()}"
+
+
+async def save_session(session: Session) -> None:
+    """
+    Write a session to Redis, resetting its expiry
+
+    Args:
+        session: Session to store
+    """
+    settings = get_settings()
+    data = asdict(session)
+    del data["id"]
+    await cache_set_json(session_key(session.id), data, settings.session_ttl)
+
+
+async def create_session(linear_token: str, viewer: Viewer) -> Session:
+    """
+    Start a session for a validated token
+
+    Args:
+        linear_token: Linear OAuth token
+        viewer: User the token belongs to
+
+    Returns:
+        Session: New session with a fresh opaque id
+    """
+    session = Session(
+        id=secrets.token_urlsafe(32),
+        linear_token=linear_token,
+        viewer=viewer,
+        validated_at=time.time(),
+    )
+    await save_session(session)
+    return session
+
+
+async def load_session(session_id: str) -> Optional[Session]:
+    """
+    Get a session, sliding its expiry forward
+
+    A single GETEX both reads the session and restarts its idle timeout.
+
+    Args:
+        session_id: Opaque id from the session cookie
+
+    Returns:
+        Session, or None if it expired, was deleted, or never existed
+    """
+    settings = get_settings()
+    data = await cache_touch_json(session_key(session_id), settings.session_ttl)
+    if data is None:
+        return None
+
+    return Session(
+        id=session_id,
+        linear_token=data["linear_token"],
+        viewer=Viewer(**data["viewer"]),
+        teams=data.get("teams"),
+        teams_loaded_at=data.get("teams_loaded_at") or 0.0,
+        validated_at=data.get("validated_at") or 0.0,
+        preferences=data.get("preferences") or {},
+    )
+
+
+async def revalidate_session(session: Session) -> Optional[Session]:
+    """
+    Check that Linear still accepts the session's token, once per interval
+
+    Between checks a request costs only the session read. A token Linear
+    rejects (revoked, or the user was removed) ends the session; if Linear
+    can't be reached the session is kept and checked again on the next request.
+
+    Args:
+        session: Session loaded for this request
+
+    Returns:
+        Session (with its viewer refreshed), or None if the session was ended
+    """
+    settings = get_settings()
+    if time.time() - session.validated_at < settings.token_revalidation_interval:
+        return session
+
+    try:
+        viewer = await resolve_viewer(session.linear_token)
+    except httpx.HTTPError:
+        logger.warning("Could not re-validate a session token", exc_info=True)
+        return session
+
+    if viewer is None:
+        await delete_session(session.id)
+        return None
+
+    session.viewer = viewer
+    session.validated_at = time.time()
+    await save_session(session)
+    return session
+
+
+async def delete_session(session_id: str) -> None:
+    """End a session (e.g., on logout)"""
+    await cache_delete(session_key(session_id))
+
+
+def set_session_cookie(response: Response, session: Session) -> None:
+    """Point the browser at a session"""
+    settings = get_settings()
+    response.set_cookie(
+        key=SESSION_COOKIE,
+        value=session.id,
+        httponly=True,
+        samesite="lax",
+        max_age=SESSION_COOKIE_MAX_AGE,
+        secure=settings.environment != "development",
+    )
+
+
+def current_session(request: Request) -> Optional[Session]:
+    """Session loaded by the auth middleware, or None on public routes"""
+    return getattr(request.state, "session", None)
+
+
+def session_token(request: Request) -> Optional[str]:
+    """Linear token of the current session, or None on public routes"""
+    session = current_session(request)
+    return session.linear_token if session else None
@@ -0,0 +1,357 @@
+"""
+Step Similarity Service
+"Similar step already exists" suggestions from hashed character n-gram vectors
+
+Each approved step is normalized (see feature_index.normalize_step), split
+into character trigrams and hashed into a fixed-size, L2-normalized vector,
+so cosine similarity is a dot product. With NumPy installed the vectors are
+rows of one float32 matrix and a batch of queries is a single matrix
+product followed by a partial sort; the matrix persists as a .npy file that
+workers memory-map at startup. Without NumPy the same vectors are kept
+sparse and scanned in pure Python.
+"""
+
+import fcntl
+import heapq
+import json
+import logging
+import os
+import tempfile
+import threading
+import zlib
+from collections import Counter
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from importlib import import_module
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Optional, Sequence
+from backend.config import get_settings
+from backend.services.feature_index import normalize_step
+
+logger = logging.getLogger(__name__)
+
+DIMENSIONS = 512
+NGRAM = 3
+
+
+@dataclass(frozen=True)
+class KnownStep:
+    """Approved step the index can suggest"""
+
+    text: str
+    path: str
+
+
+@dataclass(frozen=True)
+class SimilarStep:
+    """Suggestion for an edited step"""
+
+    text: str
+    path: str
+    score: float
+
+
+def _load_numpy():
+    """NumPy if installed (optional: `similarity` extra), else None"""
+    try:
+        return import_module("numpy")
+    except ImportError:
+        return None
+
+
+def hashed_ngrams(text: str, dimensions: int = DIMENSIONS) -> dict[int, float]:
+    """
+    L2-normalized hashed character n-gram vector of a step, as {bucket: weight}
+
+    Args:
+        text: Step text
+        dimensions: Hash buckets
+
+    Returns:
+        dict: Non-zero buckets (empty for empty text)
+    """
+    padded = f" {normalize_step(text)} "
+    counts = Counter(
+        zlib.crc32(padded[i : i + NGRAM].encode("utf-8")) % dimensions
+        for i in range(len(padded) - NGRAM + 1)
+    )
+    norm = sum(count * count for count in counts.values()) ** 0.5
+    return {bucket: count / norm for bucket, count in counts.items()} if norm else {}
+
+
+class StepSimilarityIndex:
+    """
+    Approved steps with n-gram vectors, searchable by cosine similarity
+
+    Steps are deduplicated by normalized text; adding is incremental. Adds
+    and saves run in worker threads and are serialized by a lock; searches
+    read a snapshot and don't take it.
+    """
+
+    def __init__(self, *, dimensions: int = DIMENSIONS, use_numpy: bool = True):
+        self.dimensions = dimensions
+        self.np = _load_numpy() if use_numpy else None
+        self.steps: list[KnownStep] = []
+        self._keys: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        # NumPy: rows [0, len(steps)) of a matrix with spare capacity.
+        # Pure Python: one sparse vector per step.
+        self._matrix = self.np.zeros((0, dimensions), dtype=self.np.float32) if self.np else None
+        self._vectors: list[dict[int, float]] = []
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def add(self, steps: Iterable[KnownStep]) -> int:
+        """
+        Add approved steps, skipping ones already known
+
+        Args:
+            steps: Steps to add
+
+        Returns:
+            int: Steps added
+        """
+        steps = list(steps)
+        with self._lock:
+            new = []
+            for step in steps:
+                key = normalize_step(step.text)
+                if key and key not in self._keys:
+                    self._keys[key] = len(self.steps) + len(new)
+                    new.append(step)
+            if not new:
+                return 0
+
+            vectors = [hashed_ngrams(step.text, self.dimensions) for step in new]
+            if self.np is not None:
+                self._append_rows(vectors)
+            else:
+                self._vectors.extend(vectors)
+            self.steps.extend(new)
+            return len(new)
+
+    def _append_rows(self, vectors: list[dict[int, float]]) -> None:
+        """Write vectors after the last row, doubling capacity when full"""
+        np = self.np
+        start = len(self.steps)
+        end = start + len(vectors)
+        if end > self._matrix.shape[0] or not self._matrix.flags.writeable:
+            # A loaded matrix is a read-only memory map; growing copies it
+            capacity = max(end, 2 * self._matrix.shape[0], 1024)
+            grown = np.zeros((capacity, self.dimensions), dtype=np.float32)
+            grown[:start] = self._matrix[:start]
+            self._matrix = grown
+
+        rows = self._matrix[start:end]
+        for row, vector in zip(rows, vectors, strict=True):
+            row[list(vector)] = list(vector.values())
+
+    def search(
+        self, texts: Sequence[str], *, k: int = 3, min_score: float = 0.6
+    ) -> list[list[SimilarStep]]:
+        """
+        Most similar known steps for each text, excluding exact (normalized) matches
+
+        Args:
+            texts: Step texts to find suggestions for
+            k: Most suggestions per text
+            min_score: Lowest cosine similarity returned
+
+        Returns:
+            list: Per text, suggestions by descending score
+        """
+        # Snapshot: adds may run concurrently with a search in a thread
+        steps = self.steps[:]
+        count = len(steps)
+        if not texts or not count:
+            return [[] for _ in texts]
+
+        queries = [hashed_ngrams(text, self.dimensions) for text in texts]
+        if self.np is not None:
+            ranked = self._rank_numpy(queries, self._matrix[:count], k + 1)
+        else:
+            vectors = self._vectors[:count]
+            ranked = [
+                heapq.nlargest(
+                    k + 1, ((_dot(query, vector), row) for row, vector in enumerate(vectors))
+                )
+                for query in queries
+            ]
+
+        results = []
+        for text, candidates in zip(texts, ranked, strict=True):
+            own = self._keys.get(normalize_step(text))
+            results.append(
+                [
+                    SimilarStep(text=steps[row].text, path=steps[row].path, score=round(score, 3))
+                    for score, row in candidates
+                    if row != own and score >= min_score
+                ][:k]
+            )
+        return results
+
+    def _rank_numpy(self, queries: list[dict[int, float]], matrix, k: int) -> list[list]:
+        """Top-k (score, row) per query from one batched matrix product"""
+        np = self.np
+        batch = np.zeros((len(queries), self.dimensions), dtype=np.float32)
+        for row, query in zip(batch, queries, strict=True):
+            row[list(query)] = list(query.values())
+
+        scores = batch @ matrix.T
+        k = min(k, scores.shape[1])
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        ranked = []
+        for query_scores, rows in zip(scores, top, strict=True):
+            rows = rows[np.argsort(-query_scores[rows])]
+            ranked.append([(float(query_scores[row]), int(row)) for row in rows])
+        return ranked
+
+    def save(self, path: Path) -> None:
+        """
+        Persist steps (JSON) and, with NumPy, the vector matrix (.npy)
+
+        Both files are written to a unique temporary file in the same
+        directory and renamed into place, the matrix first so a reader never
+        pairs the new step list with a matrix missing its rows (load()
+        recomputes vectors when the shapes disagree). Concurrent writers must
+        be serialized by the caller; see learn_steps().
+
+        Args:
+            path: Base path; writes path.json and path.npy
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            keys = sorted(self._keys, key=self._keys.get)
+            if self.np is not None:
+                matrix = self._matrix[: len(self.steps)]
+                _replace_atomically(
+                    path.with_suffix(".npy"), lambda file: self.np.save(file, matrix)
+                )
+            document = json.dumps(
+                {
+                    "dimensions": self.dimensions,
+                    "steps": [asdict(step) for step in self.steps],
+                    "keys": keys,
+                }
+            ).encode()
+            _replace_atomically(path.with_suffix(".json"), lambda file: file.write(document))
+
+    def merge_saved(self, path: Path) -> int:
+        """
+        Add the steps another process saved to path
+
+        Args:
+            path: Base path the index is persisted under
+
+        Returns:
+            int: Steps added
+        """
+        meta = path.with_suffix(".json")
+        if not meta.exists():
+            return 0
+        try:
+            document = json.loads(meta.read_text())
+        except ValueError:
+            logger.warning("Ignoring unreadable step similarity index at %s", meta)
+            return 0
+        return self.add(KnownStep(**step) for step in document.get("steps", []))
+
+    @classmethod
+    def load(cls, path: Path, *, use_numpy: bool = True) -> "StepSimilarityIndex":
+        """
+        Load a saved index, memory-mapping the vector matrix when possible
+
+        Vectors are recomputed from the step texts if the matrix is missing,
+        stale or NumPy is not installed.
+
+        Args:
+            path: Base path given to save()
+            use_numpy: Use NumPy if installed
+
+        Returns:
+            StepSimilarityIndex: Empty if nothing was saved at path
+        """
+        meta = path.with_suffix(".json")
+        if not meta.exists():
+            return cls(use_numpy=use_numpy)
+
+        saved = json.loads(meta.read_text())
+        index = cls(dimensions=saved["dimensions"], use_numpy=use_numpy)
+        steps = [KnownStep(**step) for step in saved["steps"]]
+
+        matrix_path = path.with_suffix(".npy")
+        if index.np is not None and matrix_path.exists():
+            matrix = index.np.load(matrix_path, mmap_mode="r")
+            if matrix.shape == (len(steps), index.dimensions):
+                index._matrix = matrix
+                index.steps = steps
+                index._keys = {key: row for row, key in enumerate(saved["keys"])}
+                return index
+            logger.warning("Ignoring stale step vectors at %s", matrix_path)
+
+        index.add(steps)
+        return index
+
+
+def _dot(a: dict[int, float], b: dict[int, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(bucket, 0.0) for bucket, weight in a.items())
+
+
+def _index_path() -> Optional[Path]:
+    settings = get_settings()
+    return Path(settings.step_similarity_path) if settings.step_similarity_path else None
+
+
+@lru_cache
+def get_step_similarity() -> StepSimilarityIndex:
+    """Get the process-wide step similarity index, loaded from disk if persisted"""
+    path = _index_path()
+    return StepSimilarityIndex.load(path) if path else StepSimilarityIndex()
+
+
+def learn_steps(steps: Iterable[KnownStep]) -> int:
+    """
+    Add approved steps to the process-wide index and persist it if configured
+
+    Every worker saves to the same files, so the save holds an exclusive lock
+    on path.lock and first merges whatever other workers saved; otherwise the
+    last writer would drop their steps. Other workers pick up the new steps
+    on their own next save or restart.
+
+    Args:
+        steps: Approved steps
+
+    Returns:
+        int: Steps added
+    """
+    index = get_step_similarity()
+    path = _index_path()
+    if not path:
+        return index.add(steps)
+
+    steps = list(steps)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_suffix(".lock"), "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        index.merge_saved(path)
+        added = index.add(steps)
+        if added:
+            index.save(path)
+    return added
+
+
+def _replace_atomically(target: Path, write: Callable[[BinaryIO], object]) -> None:
+    with tempfile.NamedTemporaryFile(
+        dir=target.parent, prefix=f".{target.name}.", delete=False
+    ) as file:
+        try:
+            write(file)
+        except BaseException:
+            file.close()
+            os.unlink(file.name)
+            raise
+    os.replace(file.name, target)
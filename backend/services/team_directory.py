@@ -0,0 +1,44 @@
+"""
+Team Directory Service
+Cached team member lists for delegation forms
+"""
+
+from backend.config import get_settings
+from backend.facades.issue_tracker import IssueTrackerProvider, User
+from backend.services.cache import cache_get_json, cache_set_json
+
+
+def team_directory_key(team_id: str) -> str:
+    """Cache key for a team's member list"""
+    return f"team_directory:{team_id}"
+
+
+async def get_team_members(
+    team_id: str,
+    *,
+    issue_tracker: IssueTrackerProvider,
+) -> list[User]:
+    """
+    Get team members, serving from the cache when possible
+
+    Args:
+        team_id: Issue tracker team ID
+        issue_tracker: Provider used to load members on a cache miss
+
+    Returns:
+        list[User]: Team members sorted by name
+    """
+    cached = await cache_get_json(team_directory_key(team_id))
+    if cached is not None:
+        return [User(**member) for member in cached]
+
+    members = sorted(await issue_tracker.get_users(team_id), key=lambda user: user.name.lower())
+
+    settings = get_settings()
+    await cache_set_json(
+        team_directory_key(team_id),
+        [{"id": user.id, "email": user.email, "name": user.name} for user in members],
+        settings.team_directory_ttl,
+    )
+
+    return members
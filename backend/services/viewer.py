@@ -0,0 +1,60 @@
+"""
+Viewer Service
+Validates Linear tokens and resolves the user they belong to
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+from fastapi import Request
+from backend.services.linear_scheduler import LinearScheduler, get_linear_scheduler
+
+VIEWER_QUERY = "{ viewer { id name email } }"
+
+
+@dataclass(frozen=True)
+class Viewer:
+    """Linear user a token belongs to"""
+
+    id: str
+    name: str
+    email: str = ""
+
+
+async def resolve_viewer(
+    linear_token: str,
+    *,
+    scheduler: Optional[LinearScheduler] = None,
+) -> Optional[Viewer]:
+    """
+    Validate a Linear token and get its viewer
+
+    Called at login and, through the session, once per token re-validation
+    interval, so it always asks Linear.
+
+    Args:
+        linear_token: Linear OAuth or API token
+        scheduler: Linear scheduler (defaults to the process-wide one)
+
+    Returns:
+        Viewer, or None if Linear rejected the token
+
+    Raises:
+        httpx.HTTPError: If Linear could not be reached
+    """
+    scheduler = scheduler or get_linear_scheduler()
+    response = await scheduler.post(linear_token, {"query": VIEWER_QUERY})
+
+    if response.status_code in (400, 401, 403):
+        return None
+    response.raise_for_status()
+
+    node = (response.json().get("data") or {}).get("viewer")
+    if not node:
+        return None
+
+    return Viewer(id=node["id"], name=node.get("name") or "", email=node.get("email") or "")
+
+
+def current_viewer(request: Request) -> Optional[Viewer]:
+    """Viewer resolved by the auth middleware, or None on public routes"""
+    return getattr(request.state, "viewer", None)
@@ -0,0 +1,156 @@
+"""
+Structured Logging
+JSON log lines written off the request path, with secret redaction and debug sampling
+
+Loggers under `backend` hand records to a queue; a listener thread formats
+them as JSON and writes them to stdout, so a slow or blocked stdout never
+stalls the event loop.
+"""
+
+import json
+import logging
+import queue
+import random
+import re
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Optional
+from backend.config import Settings
+
+REDACTED = "[REDACTED]"
+
+# Keys whose values are never logged, wherever they appear in structured fields
+SECRET_KEYS = frozenset(
+    {
+        "access_token",
+        "api_key",
+        "authorization",
+        "client_secret",
+        "cookie",
+        "linear_token",
+        "password",
+        "refresh_token",
+        "secret",
+        "session_id",
+        "token",
+    }
+)
+
+# Secrets recognizable by shape inside free text
+SECRET_PATTERN = re.compile(
+    r"(?i)bearer\s+[\w.~+/-]+=*"
+    r"|\blin_(?:api|oauth)_\w+"
+    r"|\b(?:ghp|gho|ghs|ghu)_\w+|\bgithub_pat_\w+"
+    r"|\bAIza[\w-]{35}"
+)
+
+# LogRecord attributes; anything else on a record came from `extra=`
+_RECORD_FIELDS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message",
+    "asctime",
+}
+
+_listener: Optional[QueueListener] = None
+
+
+def redact(value: Any) -> Any:
+    """
+    Strip secrets from a value about to be logged
+
+    Args:
+        value: String, or dict/list of values (e.g., a GraphQL response)
+
+    Returns:
+        Copy with secret-keyed values and token-shaped strings replaced
+    """
+    if isinstance(value, str):
+        return SECRET_PATTERN.sub(REDACTED, value)
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if str(key).lower() in SECRET_KEYS else redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [redact(item) for item in value]
+    return value
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, logger, message, extra fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": redact(record.getMessage()),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS:
+                entry[key] = REDACTED if key.lower() in SECRET_KEYS else redact(value)
+        if record.exc_info:
+            entry["exc"] = redact(self.formatException(record.exc_info))
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class DebugSampler(logging.Filter):
+    """Keep every INFO+ record but only a share of DEBUG records"""
+
+    def __init__(self, rate: float, sample: Callable[[], float] = random.random):
+        super().__init__()
+        self.rate = rate
+        self.sample = sample
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or self.sample() < self.rate
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queue records unformatted so JSON encoding and redaction run on the listener"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Freeze the message now, since args may change after the call returns
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def configure_logging(settings: Settings) -> None:
+    """
+    Route the `backend` loggers through the JSON queue handler
+
+    Safe to call more than once; later calls only update level and sampling.
+
+    Args:
+        settings: Application settings (log_level, log_debug_sample_rate)
+    """
+    global _listener
+
+    logger = logging.getLogger("backend")
+    logger.setLevel(settings.log_level.upper())
+    logger.propagate = False
+
+    if _listener is None:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(JsonFormatter())
+
+        handler = _DeferredQueueHandler(log_queue)
+        logger.handlers = [handler]
+
+        _listener = QueueListener(log_queue, output)
+        _listener.start()
+
+    handler = logger.handlers[0]
+    handler.filters = [DebugSampler(settings.log_debug_sample_rate)]
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread"""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        logging.getLogger("backend").handlers = []
@@ -0,0 +1,47 @@
+"""
+Template Environment
+Single Jinja2 environment shared by every router, with a bytecode cache
+"""
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from fastapi.templating import Jinja2Templates
+from backend.config import get_settings
+
+TEMPLATE_DIR = "app/templates"
+
+
+def build_environment() -> Environment:
+    """
+    Build the Jinja2 environment from settings
+
+    Compiled templates are cached as bytecode on disk, so worker restarts
+    load them instead of recompiling. Templates are only re-checked for
+    changes in development.
+
+    Returns:
+        Environment: Autoescaping environment for app/templates
+    """
+    settings = get_settings()
+
+    return Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=True,
+        auto_reload=settings.environment == "development",
+        bytecode_cache=FileSystemBytecodeCache(settings.template_cache_dir or None),
+    )
+
+
+templates = Jinja2Templates(env=build_environment())
+
+
+def precompile_templates() -> int:
+    """
+    Compile every HTML template into the shared environment's cache
+
+    Returns:
+        int: Number of templates compiled
+    """
+    names = templates.env.list_templates(extensions=["html"])
+    for name in names:
+        templates.env.get_template(name)
+    return len(names)
@@ -6,6 +6,7 @@ Pure functions for Gherkin feature approval process
 from typing import Optional
 from backend.facades.issue_tracker import IssueTrackerProvider, Issue
 from backend.facades.git_provider import GitProvider
+from backend.gherkin.validation import validate_gherkin
 
 
 async def approve_feature(
@@ -43,7 +44,16 @@ async def approve_feature(
             "issue_updated": bool,
             "branch_name": str
         }
+
+    Raises:
+        ValueError: If feature_content is not valid Gherkin (nothing is committed)
     """
+    # Never commit a spec that does not parse
+    validation = validate_gherkin(feature_content)
+    if not validation.is_valid:
+        error = validation.errors[0]
+        raise ValueError(f"Invalid Gherkin at line {error.line}: {error.message}")
+
     # Generate branch name from issue ID
     branch_name = f"feature/{issue.id.lower()}-gherkin-approval"
 
@@ -32,20 +32,15 @@ async def delegate_feature(
             "comment_id": str
         }
     """
-    # Update issue assignee
-    try:
-        await issue_tracker.update_issue(issue.id, assignee_id=assignee_id)
-        issue_updated = True
-    except Exception:
-        issue_updated = False
-
     # Build delegation comment
     comment_body = f"🔄 Feature delegated by {delegator_name}"
     if comment:
         comment_body += f"\n\n**Reason:** {comment}"
 
-    # Add comment to issue
-    created_comment = await issue_tracker.add_comment(issue.id, comment_body)
+    # Reassign and comment in a single round trip
+    issue_updated, created_comment = await issue_tracker.update_issue_with_comment(
+        issue.id, comment_body, assignee_id=assignee_id
+    )
 
     return {
         "issue_updated": issue_updated,
@@ -79,20 +74,15 @@ async def route_feature(
             "comment_id": str
         }
     """
-    # Update issue status
-    try:
-        await issue_tracker.update_issue(issue.id, status=target_status)
-        issue_updated = True
-    except Exception:
-        issue_updated = False
-
     # Build routing comment
     comment_body = f"↪️ Feature routed to **{target_status}** by {router_name}"
     if reason:
         comment_body += f"\n\n**Reason:** {reason}"
 
-    # Add comment to issue
-    created_comment = await issue_tracker.add_comment(issue.id, comment_body)
+    # Change status and comment in a single round trip
+    issue_updated, created_comment = await issue_tracker.update_issue_with_comment(
+        issue.id, comment_body, status=target_status
+    )
 
     return {
         "issue_updated": issue_updated,
@@ -0,0 +1,342 @@
+"""
+Gherkin Scaling Benchmark
+Time and peak memory of parsing and validation across generated features of growing size
+
+Features are generated from 5 to 2,000 scenarios in several shapes (plain
+steps, doc strings and data tables, outlines with large Examples tables,
+non-English dialects). For each function and shape the benchmark reports
+per-size time, peak memory and the memory the result keeps alive, plus the
+scaling exponent between sizes (1.0 = linear); exponents above
+NONLINEAR_EXPONENT are flagged.
+
+Usage:
+    python -m benchmarks.gherkin_scaling [--sizes 5,20,100] [--variants plain,outline]
+        [--repeat N] [--csv PATH] [--write-corpus DIR]
+"""
+
+import argparse
+import csv
+import math
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from itertools import pairwise
+from pathlib import Path
+from typing import Callable, Optional
+from gherkin.dialect import Dialect
+from backend.gherkin.parsing import parse_gherkin
+from backend.gherkin.validation import validate_business_rules, validate_gherkin
+
+SCENARIO_COUNTS = (5, 20, 100, 500, 2000)
+
+FUNCTIONS: dict[str, Callable[[str], object]] = {
+    "parse_gherkin": parse_gherkin,
+    "validate_gherkin": validate_gherkin,
+    "validate_business_rules": validate_business_rules,
+}
+
+# Growth exponent between two sizes above which a curve counts as nonlinear
+NONLINEAR_EXPONENT = 1.25
+
+
+@dataclass(frozen=True)
+class CorpusShape:
+    """How a generated feature is built"""
+
+    language: str = "en"
+    doc_strings: bool = False
+    data_tables: bool = False
+    outline_rows: int = 0
+
+
+PLAIN = CorpusShape()
+
+VARIANTS = {
+    "plain": PLAIN,
+    "rich": CorpusShape(doc_strings=True, data_tables=True),
+    "outline": CorpusShape(outline_rows=50),
+    "i18n-fr": CorpusShape(language="fr", doc_strings=True, data_tables=True, outline_rows=10),
+    "i18n-ja": CorpusShape(language="ja", doc_strings=True, data_tables=True, outline_rows=10),
+}
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """One function on one generated feature"""
+
+    function: str
+    variant: str
+    scenarios: int
+    bytes: int
+    ms: float
+    peak_kib: float
+    retained_kib: float
+
+
+def _keyword(keywords: list[str], last: bool = False) -> str:
+    """
+    A dialect keyword other than the "* " step bullet
+
+    Step keywords keep their trailing space where the dialect has one
+    (Japanese step keywords join the text directly).
+    """
+    words = [word for word in keywords if word.strip() != "*"]
+    return words[-1] if last else words[0]
+
+
+def build_feature(scenario_count: int, shape: CorpusShape = PLAIN) -> str:
+    """
+    Feature file shaped like compiled AI specs, with the given number of scenarios
+
+    Every third scenario carries a doc string and every third (offset) a data
+    table when enabled; every fourth is an outline with `outline_rows` rows.
+
+    Args:
+        scenario_count: Scenarios (plain and outline) in the feature
+        shape: Dialect and optional Gherkin elements
+
+    Returns:
+        str: Gherkin feature text
+    """
+    dialect = Dialect.for_name(shape.language)
+    given = _keyword(dialect.given_keywords)
+    when = _keyword(dialect.when_keywords)
+    then = _keyword(dialect.then_keywords)
+    and_ = _keyword(dialect.and_keywords, last=True)
+
+    lines = [] if shape.language == "en" else [f"# language: {shape.language}"]
+    lines += [
+        "@checkout @generated",
+        f"{_keyword(dialect.feature_keywords)}: Checkout with saved payment methods",
+        "  Returning customers can pay with a stored card without re-entering it,",
+        "  so repeat purchases take one click.",
+        "",
+        f"  {_keyword(dialect.background_keywords)}:",
+        f"    {given}I am signed in as a returning customer",
+        f"    {and_}I have a saved Visa card ending in 4242",
+    ]
+
+    for index in range(scenario_count):
+        outline = shape.outline_rows and index % 4 == 3
+        if outline:
+            keyword = dialect.scenario_outline_keywords[0]
+        else:
+            keyword = _keyword(dialect.scenario_keywords, last=True)
+        quantity = "<quantity>" if outline else str(index % 9 + 1)
+
+        lines += [
+            "",
+            f"  @scenario-{index + 1}",
+            f"  {keyword}: Customer completes checkout path {index + 1}",
+            f"    {given}my cart contains {quantity} items worth more than $50",
+        ]
+        if shape.data_tables and index % 3 == 1:
+            lines.append("      | item      | price | quantity |")
+            lines += [f"      | product-{row} | {row * 7}.99 | {row} |" for row in range(1, 6)]
+        lines += [
+            f"    {when}I open the checkout page",
+            f"    {and_}I confirm the order with the saved card",
+            f"    {then}I see the order confirmation page",
+        ]
+        if shape.doc_strings and index % 3 == 0:
+            lines += [
+                '      """',
+                "      Thank you for your order.",
+                f"      Order reference: ORD-{index + 1:06d}",
+                "      A receipt was sent to your email address.",
+                '      """',
+            ]
+        lines.append(f"    {and_}I receive a confirmation email within one minute")
+
+        if outline:
+            lines += ["", f"    {_keyword(dialect.examples_keywords)}:", "      | quantity |"]
+            lines += [f"      | {row + 1:<8} |" for row in range(shape.outline_rows)]
+
+    return "\n".join(lines) + "\n"
+
+
+def best_time_ms(func: Callable[[str], object], content: str, repeat: int) -> float:
+    """Best per-call time in milliseconds, with enough calls per run to be measurable"""
+    number = max(1, min(200, 2000 // content.count("\n")))
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(content)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1000
+
+
+def peak_memory_kib(func: Callable[[str], object], content: str) -> float:
+    """Peak memory allocated during one call, in KiB"""
+    tracemalloc.start()
+    try:
+        func(content)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def retained_memory_kib(func: Callable[[str], object], content: str) -> float:
+    """Memory still held by the result of one call, in KiB"""
+    tracemalloc.start()
+    try:
+        result = func(content)  # noqa: F841 - kept alive while measuring
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current / 1024
+
+
+def measure(
+    function: str, variant: str, scenario_count: int, *, repeat: int = 3
+) -> Measurement:
+    """
+    Time and peak memory of one function on one generated feature
+
+    Args:
+        function: Key of FUNCTIONS
+        variant: Key of VARIANTS
+        scenario_count: Scenarios in the generated feature
+        repeat: Timing repetitions (best is kept)
+
+    Returns:
+        Measurement
+    """
+    content = build_feature(scenario_count, VARIANTS[variant])
+    func = FUNCTIONS[function]
+    return Measurement(
+        function=function,
+        variant=variant,
+        scenarios=scenario_count,
+        bytes=len(content.encode("utf-8")),
+        ms=best_time_ms(func, content, repeat),
+        peak_kib=peak_memory_kib(func, content),
+        retained_kib=retained_memory_kib(func, content),
+    )
+
+
+def scaling_exponents(points: list[tuple[int, float]]) -> list[Optional[float]]:
+    """
+    Growth exponent between consecutive sizes: log(v2 / v1) / log(n2 / n1)
+
+    Args:
+        points: (size, value) pairs in increasing size order
+
+    Returns:
+        list: One exponent per consecutive pair (1.0 = linear, 2.0 = quadratic),
+        None where a value is zero
+    """
+    return [
+        math.log(value / previous_value) / math.log(size / previous_size)
+        if previous_value > 0 and value > 0
+        else None
+        for (previous_size, previous_value), (size, value) in pairwise(points)
+    ]
+
+
+def fitted_exponent(points: list[tuple[int, float]]) -> Optional[float]:
+    """
+    Least-squares slope of log(value) over log(size) across the whole curve
+
+    Less sensitive to one noisy size than the pairwise exponents, so this is
+    what decides whether a curve is nonlinear.
+
+    Args:
+        points: (size, value) pairs
+
+    Returns:
+        float, or None with fewer than two positive points
+    """
+    logs = [(math.log(size), math.log(value)) for size, value in points if value > 0]
+    if len(logs) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in logs) / len(logs)
+    mean_y = sum(y for _, y in logs) / len(logs)
+    spread = sum((x - mean_x) ** 2 for x, _ in logs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in logs) / spread
+
+
+def print_curve(function: str, variant: str, measurements: list[Measurement]) -> bool:
+    """Print one scaling curve; returns True if time or memory grows nonlinearly"""
+    time_points = [(m.scenarios, m.ms) for m in measurements]
+    memory_points = [(m.scenarios, m.peak_kib) for m in measurements]
+    times = [None] + scaling_exponents(time_points)
+    memory = [None] + scaling_exponents(memory_points)
+
+    def exponent(value: Optional[float]) -> str:
+        return "" if value is None else f"{value:.2f}"
+
+    print(f"\n{function} / {variant}")
+    print(
+        f"{'scenarios':>9} {'KiB':>8} {'ms':>10} {'us/scen':>8} {'peak KiB':>10} "
+        f"{'kept KiB':>10} {'time exp':>9} {'mem exp':>8}"
+    )
+    for m, time_exp, memory_exp in zip(measurements, times, memory, strict=True):
+        print(
+            f"{m.scenarios:>9} {m.bytes / 1024:>8.1f} {m.ms:>10.3f} "
+            f"{m.ms * 1000 / m.scenarios:>8.1f} {m.peak_kib:>10.1f} {m.retained_kib:>10.1f} "
+            f"{exponent(time_exp):>9} {exponent(memory_exp):>8}"
+        )
+
+    fitted = {"time": fitted_exponent(time_points), "memory": fitted_exponent(memory_points)}
+    print(
+        f"  fitted: time n^{exponent(fitted['time']) or '-'}, "
+        f"memory n^{exponent(fitted['memory']) or '-'}"
+    )
+
+    nonlinear = [name for name, value in fitted.items() if (value or 0) > NONLINEAR_EXPONENT]
+    if nonlinear:
+        print(f"  ^ {' and '.join(nonlinear)} grow faster than n^{NONLINEAR_EXPONENT}")
+    return bool(nonlinear)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, SCENARIO_COUNTS)))
+    parser.add_argument("--variants", default=",".join(VARIANTS))
+    parser.add_argument("--functions", default=",".join(FUNCTIONS))
+    parser.add_argument("--repeat", type=int, default=3, help="timing repetitions per case")
+    parser.add_argument("--csv", type=Path, help="write all measurements here")
+    parser.add_argument("--write-corpus", type=Path, help="write the generated features here")
+    args = parser.parse_args()
+
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    variants = args.variants.split(",")
+    functions = args.functions.split(",")
+
+    if args.write_corpus:
+        args.write_corpus.mkdir(parents=True, exist_ok=True)
+        for variant in variants:
+            for size in sizes:
+                path = args.write_corpus / f"{variant}-{size}.feature"
+                path.write_text(build_feature(size, VARIANTS[variant]), encoding="utf-8")
+        print(f"Corpus written to {args.write_corpus}")
+
+    results = []
+    nonlinear = []
+    for function in functions:
+        for variant in variants:
+            curve = [measure(function, variant, size, repeat=args.repeat) for size in sizes]
+            results += curve
+            if print_curve(function, variant, curve):
+                nonlinear.append(f"{function} / {variant}")
+
+    if args.csv:
+        with args.csv.open("w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=list(asdict(results[0])))
+            writer.writeheader()
+            writer.writerows(asdict(result) for result in results)
+        print(f"\nMeasurements written to {args.csv}")
+
+    if nonlinear:
+        print(f"\nNonlinear: {', '.join(nonlinear)}")
+        sys.exit(1)
+    print("\nAll curves within linear bounds")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Import-time Audit
+Report per-module import cost of the app (python -X importtime) and check lazy integrations
+
+Usage:
+    python -m benchmarks.import_time [--module backend.app] [--top N] [--repeat N]
+"""
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass
+from backend.integrations import INTEGRATIONS
+
+# Third-party packages that must stay off the boot path (loaded via backend.integrations)
+LAZY_PACKAGES = ("github",)
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """One line of -X importtime output"""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """
+    Parse `python -X importtime` stderr
+
+    Args:
+        output: stderr of the interpreter run
+
+    Returns:
+        list[ImportTiming]: One entry per imported module, in import-completion order
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        module = name.lstrip(" ")
+        timings.append(
+            ImportTiming(
+                module=module.rstrip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(name) - len(module) - 1) // 2,
+            )
+        )
+    return timings
+
+
+def measure_imports(module: str) -> list[ImportTiming]:
+    """
+    Import a module in a fresh interpreter with -X importtime
+
+    Args:
+        module: Dotted module name (e.g., "backend.app")
+
+    Returns:
+        list[ImportTiming]: Per-module timings
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def eager_lazy_packages(timings: list[ImportTiming]) -> list[str]:
+    """Lazy-only packages that were imported anyway"""
+    loaded = {timing.module for timing in timings}
+    return [
+        package
+        for package in LAZY_PACKAGES
+        if package in loaded or any(name.startswith(f"{package}.") for name in loaded)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="backend.app", help="module to import")
+    parser.add_argument("--top", type=int, default=20, help="modules to list")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters to time")
+    args = parser.parse_args()
+
+    runs = [measure_imports(args.module) for _ in range(args.repeat)]
+    totals = [next(t.cumulative_us for t in run if t.module == args.module) for run in runs]
+    best = runs[totals.index(min(totals))]
+
+    print(f"import {args.module}: best {min(totals) / 1000:.1f} ms of {args.repeat} runs")
+    print(f"{'self ms':>8} {'cumulative ms':>14}  module")
+    for timing in sorted(best, key=lambda t: t.cumulative_us, reverse=True)[: args.top]:
+        self_ms, cumulative_ms = timing.self_us / 1000, timing.cumulative_us / 1000
+        print(f"{self_ms:>8.1f} {cumulative_ms:>14.1f}  {timing.module}")
+
+    print(f"\nLazy integrations: {', '.join(sorted(INTEGRATIONS))}")
+    eager = eager_lazy_packages(best)
+    if eager:
+        print(f"Imported at boot but registered as lazy: {', '.join(eager)}")
+        sys.exit(1)
+    print("None imported at boot")
+
+
+if __name__ == "__main__":
+    main()
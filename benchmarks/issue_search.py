@@ -0,0 +1,104 @@
+"""
+Issue Search Benchmark
+Query latency of the issue search index by workspace size
+
+Generates synthetic issues (half with a Gherkin spec, like the fake Linear
+workspace), indexes them, then times typical searches: a common term, a
+rare term, several terms, and a trailing prefix as typed into the search
+box. Search must stay well under 50 ms at tens of thousands of issues.
+
+Usage:
+    python -m benchmarks.issue_search [--sizes 1000,10000,50000]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+from backend.services.issue_search import IssueSearchIndex, build_document
+from fakes.linear import spec_description
+
+SIZES = (1000, 10000, 50000)
+
+AREAS = ["checkout", "login", "invoice", "search", "dashboard", "export", "profile", "cart"]
+ACTIONS = ["fails", "is slow", "needs filters", "should remember", "times out", "redesign"]
+
+QUERIES = {
+    "common term": "checkout",
+    "rare term": "zzqx",
+    "three terms": "checkout confirmation audit",
+    "prefix": "dashb",
+}
+
+
+def generate_issues(count: int, seed: int = 3) -> list[dict]:
+    """Synthetic issue nodes; every other one carries a spec with a rare word"""
+    rng = random.Random(seed)
+    issues = []
+    for number in range(1, count + 1):
+        title = f"{rng.choice(AREAS).title()} {rng.choice(ACTIONS)} {number}"
+        description = spec_description(title, rng.randint(2, 6)) if number % 2 else title
+        if number % 997 == 0:
+            description += "\n\nMentions zzqx."
+        issues.append(
+            {
+                "id": f"uuid-{number}",
+                "identifier": f"ENG-{number}",
+                "title": title,
+                "description": description,
+                "state": {"name": "Todo"},
+                "priority": 2,
+                "updatedAt": f"2025-01-01T00:00:{number % 60:02d}.{number:06d}Z",
+                "team": {"id": "team-eng"},
+            }
+        )
+    return issues
+
+
+def time_ms(func, repeat: int = 20) -> float:
+    """Best wall time of func() in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)))
+    args = parser.parse_args()
+
+    # Tokenize once at the largest size; smaller indexes reuse a prefix
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    issues = generate_issues(sizes[-1])
+    start = time.perf_counter()
+    documents = [build_document(issue) for issue in issues]
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"tokenized {len(documents)} issues: {elapsed_ms / len(documents):.2f} ms/issue\n")
+
+    header = "".join(f"{name:>14}" for name in QUERIES)
+    print(f"{'issues':>8} {'load ms':>10}{header}")
+    for size in sizes:
+        index = IssueSearchIndex()
+        for document in documents[:size]:
+            index.add(document)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "issue-search.json"
+            index.save(path)
+            load_ms = time_ms(partial(IssueSearchIndex.load, path), 1)
+
+        index.search("warm")  # Build the prefix vocabulary outside the timings
+        timings = "".join(
+            f"{time_ms(partial(index.search, query, team_ids={'team-eng'})):>14.2f}"
+            for query in QUERIES.values()
+        )
+        print(f"{size:>8} {load_ms:>10.1f}{timings}")
+
+
+if __name__ == "__main__":
+    main()
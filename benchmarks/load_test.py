@@ -0,0 +1,672 @@
+"""
+Load Test
+Drive user journeys against the app backed by the local fakes and check latency budgets
+
+Virtual users log in through the fake Linear OAuth flow, list features, open
+the editor, type (each edit saved to Linear, then debounced validate +
+preview), then approve or delegate.
+The app and the fakes each run in their own thread with uvicorn, so the
+event-loop lag sampled in the app's loop is the app's alone. Requires Redis
+at REDIS_URL (sessions and caches).
+
+Usage:
+    python -m benchmarks.load_test [--users N] [--duration S] [--latency-ms MS]
+        [--baseline PATH] [--update-baseline] [--tolerance 0.25]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import hmac
+import itertools
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+import httpx
+import uvicorn
+from fakes.faults import Faults
+from fakes.server import SERVICES, create_app as create_fakes_app
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "load_test.json"
+
+# Latency regressions smaller than this are noise, whatever the relative change
+SLACK_MS = 5.0
+
+# Signs the Issue webhooks delivered to the app for the load test's edits
+WEBHOOK_SECRET = "load-test-webhook-secret"
+
+_FEATURE_LINK = re.compile(r'href="/features/([A-Z]+-\d+)"')
+_ASSIGNEE_OPTION = re.compile(r'<option value="([^"]+)"')
+
+# Step of the fake specs that edits rewrite (see fakes.linear.spec_description)
+_EDITED_STEP = re.compile(r"I see a confirmation(?: \(revision \d+\))?")
+
+ISSUE_DESCRIPTION_QUERY = """
+    query Issue($id: String!) {
+        issue(id: $id) { description }
+    }
+"""
+
+ISSUE_UPDATE_MUTATION = """
+    mutation EditSpec($id: String!, $input: IssueUpdateInput!) {
+        issueUpdate(id: $id, input: $input) {
+            success
+            issue { id identifier title description updatedAt team { id } }
+        }
+    }
+"""
+
+
+@dataclass(frozen=True)
+class Sample:
+    """One timed request"""
+
+    endpoint: str
+    seconds: float
+    status: int
+
+
+@dataclass
+class EndpointStats:
+    """Latency and error summary for one endpoint (milliseconds)"""
+
+    count: int
+    errors: int
+    throughput: float
+    p50: float
+    p95: float
+    p99: float
+
+
+@dataclass
+class LoadReport:
+    """Result of one load run"""
+
+    users: int
+    elapsed: float
+    journeys: int
+    endpoints: dict[str, EndpointStats]
+    loop_lag_p99: float
+    loop_lag_max: float
+
+    def to_json(self) -> dict:
+        return {
+            "users": self.users,
+            "elapsed": round(self.elapsed, 3),
+            "journeys": self.journeys,
+            "loop_lag_p99": round(self.loop_lag_p99, 3),
+            "loop_lag_max": round(self.loop_lag_max, 3),
+            "endpoints": {name: asdict(stats) for name, stats in self.endpoints.items()},
+        }
+
+
+def percentile(values: list[float], q: float) -> float:
+    """
+    Percentile by linear interpolation between closest ranks
+
+    Args:
+        values: Observations (any order)
+        q: Percentile in 0..100
+
+    Returns:
+        float: The percentile, or 0.0 for no observations
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(samples: list[Sample], elapsed: float) -> dict[str, EndpointStats]:
+    """
+    Per-endpoint throughput, error count and latency percentiles
+
+    Args:
+        samples: Timed requests of the run
+        elapsed: Run duration in seconds
+
+    Returns:
+        dict: Endpoint -> EndpointStats, sorted by endpoint
+    """
+    by_endpoint: dict[str, list[Sample]] = {}
+    for sample in samples:
+        by_endpoint.setdefault(sample.endpoint, []).append(sample)
+
+    stats = {}
+    for endpoint in sorted(by_endpoint):
+        endpoint_samples = by_endpoint[endpoint]
+        latencies = [sample.seconds * 1000 for sample in endpoint_samples]
+        stats[endpoint] = EndpointStats(
+            count=len(endpoint_samples),
+            errors=sum(1 for sample in endpoint_samples if sample.status >= 400),
+            throughput=len(endpoint_samples) / elapsed if elapsed else 0.0,
+            p50=percentile(latencies, 50),
+            p95=percentile(latencies, 95),
+            p99=percentile(latencies, 99),
+        )
+    return stats
+
+
+def compare_to_baseline(report: dict, baseline: dict, *, tolerance: float = 0.25) -> list[str]:
+    """
+    Regressions of a report against a stored baseline
+
+    Latency (p95, p99, loop lag) may grow by `tolerance` plus SLACK_MS, error
+    rates by one percentage point; endpoints in the baseline must be exercised.
+
+    Args:
+        report: LoadReport.to_json() of this run
+        baseline: LoadReport.to_json() of the reference run
+        tolerance: Allowed relative slowdown (0.25 = 25%)
+
+    Returns:
+        list[str]: One message per regression, empty if within budget
+    """
+
+    def exceeds(current: float, reference: float) -> bool:
+        return current > reference * (1 + tolerance) + SLACK_MS
+
+    regressions = []
+    for endpoint, reference in baseline["endpoints"].items():
+        current = report["endpoints"].get(endpoint)
+        if current is None:
+            regressions.append(f"{endpoint}: not exercised")
+            continue
+
+        for key in ("p95", "p99"):
+            if exceeds(current[key], reference[key]):
+                regressions.append(
+                    f"{endpoint}: {key} {current[key]:.1f} ms > baseline {reference[key]:.1f} ms"
+                )
+
+        error_rate = current["errors"] / current["count"]
+        reference_rate = reference["errors"] / reference["count"]
+        if error_rate > reference_rate + 0.01:
+            regressions.append(
+                f"{endpoint}: error rate {error_rate:.1%} > baseline {reference_rate:.1%}"
+            )
+
+    if exceeds(report["loop_lag_p99"], baseline["loop_lag_p99"]):
+        regressions.append(
+            f"event loop lag p99 {report['loop_lag_p99']:.1f} ms > "
+            f"baseline {baseline['loop_lag_p99']:.1f} ms"
+        )
+    return regressions
+
+
+class LoopLagMonitor:
+    """Sample event-loop lag: how late a periodic sleep wakes up"""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.lags: list[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(0.0, loop.time() - start - self.interval) * 1000)
+
+    def start(self) -> None:
+        """Start sampling on the running loop"""
+        self._task = asyncio.get_running_loop().create_task(self._sample())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+
+class Recorder:
+    """Time requests of all virtual users, labelled by endpoint"""
+
+    def __init__(self):
+        self.samples: list[Sample] = []
+
+    async def request(
+        self, client: httpx.AsyncClient, method: str, url: str, endpoint: str, **kwargs
+    ) -> httpx.Response:
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.samples.append(Sample(endpoint, time.perf_counter() - start, 599))
+            raise
+        self.samples.append(Sample(endpoint, time.perf_counter() - start, response.status_code))
+        return response
+
+
+@dataclass
+class SpecEditor:
+    """
+    Save edits of a spec to the fake Linear and tell the app, as Linear would
+
+    Each edit rewrites one step of the issue's spec with a new revision
+    number, then delivers a signed Issue webhook to the app, which patches
+    its cached issue. The validate and preview that follow compile new spec
+    text instead of hitting the compiled-feature cache.
+    """
+
+    linear: httpx.AsyncClient  # Based at the fake Linear API (serving /graphql)
+    token: str = "load-test-editor"
+    secret: str = WEBHOOK_SECRET
+    revisions: itertools.count = field(default_factory=lambda: itertools.count(1))
+
+    async def _graphql(self, query: str, variables: dict) -> dict:
+        response = await self.linear.post(
+            "/graphql",
+            json={"query": query, "variables": variables},
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+        response.raise_for_status()
+        return response.json()["data"]
+
+    async def edit(self, client: httpx.AsyncClient, recorder: Recorder, issue_id: str) -> bool:
+        """
+        Change the issue's spec text and deliver the update webhook to the app
+
+        Args:
+            client: The virtual user's app client
+            recorder: Recorder for the webhook delivery
+            issue_id: Issue identifier
+
+        Returns:
+            bool: False if the issue has no spec step to edit
+        """
+        issue = (await self._graphql(ISSUE_DESCRIPTION_QUERY, {"id": issue_id}))["issue"]
+        description = (issue or {}).get("description") or ""
+        edited, count = _EDITED_STEP.subn(
+            f"I see a confirmation (revision {next(self.revisions)})", description
+        )
+        if not count:
+            return False
+
+        result = await self._graphql(
+            ISSUE_UPDATE_MUTATION, {"id": issue_id, "input": {"description": edited}}
+        )
+        updated = result["issueUpdate"]["issue"]
+        body = json.dumps(
+            {
+                "type": "Issue",
+                "action": "update",
+                "data": {
+                    "id": updated["id"],
+                    "identifier": updated["identifier"],
+                    "title": updated["title"],
+                    "description": updated["description"],
+                    "updatedAt": updated["updatedAt"],
+                    "teamId": updated["team"]["id"],
+                },
+                "updatedFrom": {"description": description},
+                "webhookTimestamp": int(time.time() * 1000),
+            }
+        ).encode("utf-8")
+        signature = hmac.new(self.secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+        await recorder.request(
+            client,
+            "POST",
+            "/webhooks/linear",
+            "POST /webhooks/linear",
+            content=body,
+            headers={"Content-Type": "application/json", "Linear-Signature": signature},
+        )
+        return True
+
+
+@dataclass
+class JourneySettings:
+    """Pacing of a virtual user, and where its edits are saved"""
+
+    edits: int = 5
+    debounce: float = 0.5
+    think: float = 1.0
+    rng: random.Random = field(default_factory=random.Random)
+    editor: Optional[SpecEditor] = None
+
+    async def pause(self, seconds: float) -> None:
+        """Sleep around `seconds` (exponentially distributed, like real users)"""
+        if seconds > 0:
+            await asyncio.sleep(self.rng.expovariate(1 / seconds))
+
+
+async def login(client: httpx.AsyncClient, recorder: Recorder) -> None:
+    """
+    Log in through the OAuth redirect chain
+
+    The app redirects to the fake Linear authorize URL, which redirects back
+    to the app's fixed callback URL; only its path is requested, so the app
+    can listen on any port.
+    """
+    response = await recorder.request(client, "GET", "/auth/linear", "GET /auth/linear")
+    authorize = await client.get(response.headers["location"])
+    callback = urlsplit(authorize.headers["location"])
+    await recorder.request(
+        client, "GET", f"{callback.path}?{callback.query}", "GET /auth/callback"
+    )
+
+
+async def open_list(client: httpx.AsyncClient, recorder: Recorder) -> list[str]:
+    """Open the feature list; returns the issue identifiers on the first page"""
+    response = await recorder.request(client, "GET", "/features/", "GET /features/")
+    return _FEATURE_LINK.findall(response.text)
+
+
+async def open_editor(
+    client: httpx.AsyncClient, recorder: Recorder, issue_id: str
+) -> httpx.Response:
+    """Open the editor, with the partials HTMX loads alongside it"""
+    editor = await recorder.request(
+        client, "GET", f"/features/{issue_id}", "GET /features/{issue_id}"
+    )
+    await asyncio.gather(
+        recorder.request(
+            client, "GET", f"/approval/{issue_id}/validate", "GET /approval/{issue_id}/validate"
+        ),
+        recorder.request(
+            client, "GET", f"/features/{issue_id}/preview", "GET /features/{issue_id}/preview"
+        ),
+    )
+    return editor
+
+
+async def type_in_editor(
+    client: httpx.AsyncClient, recorder: Recorder, issue_id: str, settings: JourneySettings
+) -> None:
+    """Edit bursts, each saved and followed by the debounced validate + preview refresh"""
+    for _ in range(settings.edits):
+        if settings.editor is not None:
+            await settings.editor.edit(client, recorder, issue_id)
+        await settings.pause(settings.debounce)
+        await asyncio.gather(
+            recorder.request(
+                client,
+                "GET",
+                f"/approval/{issue_id}/validate",
+                "GET /approval/{issue_id}/validate",
+            ),
+            recorder.request(
+                client, "GET", f"/features/{issue_id}/preview", "GET /features/{issue_id}/preview"
+            ),
+        )
+
+
+async def review_journey(
+    client: httpx.AsyncClient, recorder: Recorder, settings: JourneySettings
+) -> bool:
+    """List, open a feature, type, approve; False if there was nothing to review"""
+    issue_ids = await open_list(client, recorder)
+    if not issue_ids:
+        return False
+    issue_id = settings.rng.choice(issue_ids)
+
+    await settings.pause(settings.think)
+    await open_editor(client, recorder, issue_id)
+    await type_in_editor(client, recorder, issue_id, settings)
+    await recorder.request(
+        client, "POST", f"/approval/{issue_id}/approve", "POST /approval/{issue_id}/approve"
+    )
+    return True
+
+
+async def delegate_journey(
+    client: httpx.AsyncClient, recorder: Recorder, settings: JourneySettings
+) -> bool:
+    """List, open a feature, pick a teammate, delegate; False if there was nothing to delegate"""
+    issue_ids = await open_list(client, recorder)
+    if not issue_ids:
+        return False
+    issue_id = settings.rng.choice(issue_ids)
+
+    await settings.pause(settings.think)
+    await open_editor(client, recorder, issue_id)
+    form = await recorder.request(
+        client,
+        "GET",
+        f"/approval/{issue_id}/delegate-form?team_id=team-eng",
+        "GET /approval/{issue_id}/delegate-form",
+    )
+    assignees = _ASSIGNEE_OPTION.findall(form.text) or ["user-2"]
+
+    await settings.pause(settings.think)
+    await recorder.request(
+        client,
+        "POST",
+        f"/approval/{issue_id}/delegate",
+        "POST /approval/{issue_id}/delegate",
+        data={"assignee_id": settings.rng.choice(assignees), "comment": "Please review"},
+    )
+    return True
+
+
+# Journey -> share of journeys
+JOURNEYS: dict[str, tuple[Callable, float]] = {
+    "review": (review_journey, 0.7),
+    "delegate": (delegate_journey, 0.3),
+}
+
+
+async def virtual_user(
+    client: httpx.AsyncClient, recorder: Recorder, settings: JourneySettings, deadline: float
+) -> int:
+    """Log in, then run weighted journeys until the deadline; returns journeys completed"""
+    journeys, weights = zip(*JOURNEYS.values(), strict=True)
+    completed = 0
+
+    async with client:
+        await login(client, recorder)
+        while time.monotonic() < deadline:
+            journey = settings.rng.choices(journeys, weights)[0]
+            try:
+                if await journey(client, recorder, settings):
+                    completed += 1
+                    continue
+            except httpx.HTTPError:
+                pass  # Already recorded as a failed sample
+            # Back off like a user retrying, rather than spinning on failures
+            await settings.pause(settings.think)
+    return completed
+
+
+async def run_load(
+    client_factory: Callable[[], httpx.AsyncClient],
+    *,
+    users: int,
+    duration: float,
+    monitor: LoopLagMonitor,
+    seed: int = 0,
+    settings: Optional[Callable[[random.Random], JourneySettings]] = None,
+) -> LoadReport:
+    """
+    Run virtual users against the app and summarize the run
+
+    Args:
+        client_factory: New client (own cookie jar) for the app, per user
+        users: Concurrent virtual users
+        duration: Seconds to keep starting journeys
+        monitor: Lag monitor running in the app's event loop
+        seed: Seed for journey choice and pacing
+        settings: JourneySettings factory, given each user's RNG
+
+    Returns:
+        LoadReport
+    """
+    settings = settings or (lambda rng: JourneySettings(rng=rng))
+    recorder = Recorder()
+    start = time.monotonic()
+
+    completed = await asyncio.gather(
+        *(
+            virtual_user(
+                client_factory(),
+                recorder,
+                settings(random.Random(seed + index)),
+                start + duration,
+            )
+            for index in range(users)
+        )
+    )
+    elapsed = time.monotonic() - start
+
+    return LoadReport(
+        users=users,
+        elapsed=elapsed,
+        journeys=sum(completed),
+        endpoints=summarize(recorder.samples, elapsed),
+        loop_lag_p99=percentile(monitor.lags, 99),
+        loop_lag_max=max(monitor.lags, default=0.0),
+    )
+
+
+class ServerThread:
+    """Serve an ASGI app with uvicorn on a background thread with its own event loop"""
+
+    def __init__(self, app, *, port: int, monitor: Optional[LoopLagMonitor] = None):
+        config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+        self.server = uvicorn.Server(config)
+        self.monitor = monitor
+        self.thread = threading.Thread(target=lambda: asyncio.run(self._serve()), daemon=True)
+
+    async def _serve(self) -> None:
+        if self.monitor is not None:
+            self.monitor.start()
+        try:
+            await self.server.serve()
+        finally:
+            if self.monitor is not None:
+                self.monitor.stop()
+
+    def __enter__(self) -> "ServerThread":
+        self.thread.start()
+        deadline = time.monotonic() + 10
+        while not self.server.started:
+            if time.monotonic() > deadline or not self.thread.is_alive():
+                raise RuntimeError(f"Server on port {self.server.config.port} did not start")
+            time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.server.should_exit = True
+        self.thread.join()
+
+
+def print_report(report: LoadReport) -> None:
+    print(
+        f"{report.users} users, {report.journeys} journeys in {report.elapsed:.1f} s; "
+        f"event loop lag p99 {report.loop_lag_p99:.1f} ms, max {report.loop_lag_max:.1f} ms"
+    )
+    print(f"{'endpoint':<42} {'count':>6} {'err':>5} {'req/s':>7} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for endpoint, stats in report.endpoints.items():
+        print(
+            f"{endpoint:<42} {stats.count:>6} {stats.errors:>5} {stats.throughput:>7.1f} "
+            f"{stats.p50:>8.1f} {stats.p95:>8.1f} {stats.p99:>8.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=20, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds to run")
+    parser.add_argument("--edits", type=int, default=5, help="edit bursts per review")
+    parser.add_argument("--think", type=float, default=1.0, help="mean think time in seconds")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="fake API latency")
+    parser.add_argument("--jitter-ms", type=float, default=25.0, help="fake API jitter")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fake API error rate")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--app-port", type=int, default=8030)
+    parser.add_argument("--fakes-port", type=int, default=8100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="store this run")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown")
+    parser.add_argument("--json", type=Path, help="also write the report here")
+    args = parser.parse_args()
+
+    fakes_url = f"http://127.0.0.1:{args.fakes_port}"
+    os.environ.update(
+        {
+            "ENVIRONMENT": "development",
+            "LINEAR_API_URL": f"{fakes_url}/linear/graphql",
+            "LINEAR_OAUTH_URL": f"{fakes_url}/linear/oauth/authorize",
+            "LINEAR_OAUTH_TOKEN_URL": f"{fakes_url}/linear/oauth/token",
+            "GITHUB_API_URL": f"{fakes_url}/github",
+            "GEMINI_API_URL": f"{fakes_url}/gemini",
+            "LINEAR_WEBHOOK_SECRET": WEBHOOK_SECRET,
+        }
+    )
+    # Imported after the environment points the settings at the fakes
+    from backend.app import app
+
+    faults = {
+        service: Faults(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            seed=args.seed + index,
+        )
+        for index, service in enumerate(SERVICES)
+    }
+    fakes = create_fakes_app(fakes_url, faults=faults, seed=args.seed)
+    monitor = LoopLagMonitor()
+    app_url = f"http://127.0.0.1:{args.app_port}"
+
+    async def load() -> LoadReport:
+        linear = httpx.AsyncClient(base_url=f"{fakes_url}/linear", timeout=30.0)
+        async with linear:
+            editor = SpecEditor(linear)
+            return await run_load(
+                lambda: httpx.AsyncClient(base_url=app_url, timeout=30.0),
+                users=args.users,
+                duration=args.duration,
+                monitor=monitor,
+                seed=args.seed,
+                settings=lambda rng: JourneySettings(
+                    edits=args.edits, think=args.think, rng=rng, editor=editor
+                ),
+            )
+
+    with ServerThread(fakes, port=args.fakes_port), ServerThread(
+        app, port=args.app_port, monitor=monitor
+    ):
+        report = asyncio.run(load())
+
+    print_report(report)
+    result = report.to_json()
+    if args.json:
+        args.json.write_text(json.dumps(result, indent=2) + "\n")
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(result, indent=2) + "\n")
+        print(f"\nBaseline written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"\nNo baseline at {args.baseline}; record one with --update-baseline")
+        return
+
+    regressions = compare_to_baseline(
+        result, json.loads(args.baseline.read_text()), tolerance=args.tolerance
+    )
+    if regressions:
+        print("\nRegressions against baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print(f"\nWithin {args.tolerance:.0%} of baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Spec YAML Micro-benchmark
+Compare pure-Python and libyaml loading of AI spec YAML, and the parsed-document cache
+
+Usage:
+    python -m benchmarks.spec_yaml [--repeat N]
+"""
+
+import argparse
+import timeit
+from functools import partial
+import yaml
+from backend.gherkin import spec_yaml
+from backend.gherkin.spec_yaml import SpecLoader, clear_spec_cache, dump_spec_yaml, load_spec_yaml
+
+# Scenario counts covering typical Gemini output (a few KB) up to large specs
+SPEC_SIZES = (5, 20, 60, 200)
+
+
+def build_spec(scenario_count: int) -> str:
+    """Spec YAML shaped like Gemini output, with the given number of scenarios"""
+    scenarios = [
+        {
+            "scenario": f"User completes checkout step {index} with a saved card",
+            "given": [
+                "I am signed in as a returning customer",
+                f"my cart contains {index + 1} items worth more than $50",
+            ],
+            "when": [
+                "I open the checkout page",
+                "I choose the saved Visa card ending in 4242",
+                "I confirm the order",
+            ],
+            "then": [
+                "I see the order confirmation page",
+                "I receive a confirmation email within one minute",
+            ],
+        }
+        for index in range(scenario_count)
+    ]
+    document = {
+        "feature": {
+            "title": "Checkout with saved payment methods",
+            "description": "Returning customers can pay with a stored card without re-entering it",
+            "scenarios": scenarios,
+        },
+        "analysis": {
+            "summary": "The recording shows a returning customer paying with a stored card",
+            "user_journey": "Cart -> checkout -> choose saved card -> confirm -> confirmation",
+            "edge_cases": ["Expired saved card", "Card removed in another session"],
+            "technical_notes": ["Cards are tokenized by the payment provider"],
+        },
+    }
+    return dump_spec_yaml(document)
+
+
+def best_of(statement, repeat: int, number: int) -> float:
+    """Best per-call time in milliseconds"""
+    return min(timeit.repeat(statement, repeat=repeat, number=number)) / number * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions per case")
+    args = parser.parse_args()
+
+    print(f"libyaml available: {spec_yaml.LIBYAML}")
+    print(
+        f"{'scenarios':>9} {'bytes':>8} {'SafeLoader ms':>14} {'CSafeLoader ms':>15} "
+        f"{'speedup':>8} {'cached ms':>10}"
+    )
+
+    for scenario_count in SPEC_SIZES:
+        text = build_spec(scenario_count)
+        number = max(1, 200 // scenario_count)
+
+        pure = best_of(partial(yaml.load, text, Loader=yaml.SafeLoader), args.repeat, number)
+        fast = best_of(partial(yaml.load, text, Loader=SpecLoader), args.repeat, number)
+
+        clear_spec_cache()
+        load_spec_yaml(text)
+        cached = best_of(partial(load_spec_yaml, text), args.repeat, 1000)
+
+        print(
+            f"{scenario_count:>9} {len(text):>8} {pure:>14.3f} {fast:>15.3f} "
+            f"{pure / fast:>7.1f}x {cached:>10.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
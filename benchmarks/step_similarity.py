@@ -0,0 +1,85 @@
+"""
+Step Similarity Benchmark
+Search latency of the step similarity index by backend and index size
+
+Generates synthetic approved steps, then times one editor validation's
+worth of queries (a batch of 20 steps) against 1,000 to 50,000 known
+steps, plus cold load time of a saved index.
+
+Usage:
+    python -m benchmarks.step_similarity [--sizes 1000,10000] [--queries 20]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+from backend.services.step_similarity import KnownStep, StepSimilarityIndex
+
+SIZES = (1000, 10000, 50000)
+
+SUBJECTS = ["I", "the customer", "an admin", "the reviewer", "a guest", "the system"]
+VERBS = ["open", "submit", "approve", "delete", "search for", "export", "see", "filter"]
+OBJECTS = ["the order", "a report", "the invoice", "my cart", "the feature list", "a comment"]
+DETAILS = ["", "with a saved card", "for last month", "from the dashboard", "as CSV", "twice"]
+
+
+def generate_steps(count: int, seed: int = 7) -> list[KnownStep]:
+    """Synthetic step texts, distinct after normalization (a random word, not a number)"""
+    rng = random.Random(seed)
+    return [
+        KnownStep(
+            f"{rng.choice(SUBJECTS)} {rng.choice(VERBS)} {rng.choice(OBJECTS)} "
+            f"{rng.choice(DETAILS)} in {''.join(rng.choices('abcdefghijklmnop', k=6))}",
+            f"features/generated-{index % 500}.feature",
+        )
+        for index in range(count)
+    ]
+
+
+def time_ms(func, repeat: int = 5) -> float:
+    """Best wall time of func() in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)))
+    parser.add_argument("--queries", type=int, default=20, help="steps per search batch")
+    args = parser.parse_args()
+
+    queries = [step.text for step in generate_steps(args.queries, seed=11)]
+    backends = [("python", False)]
+    if StepSimilarityIndex().np is not None:
+        backends.append(("numpy", True))
+    else:
+        print("numpy not installed; timing the pure-Python backend only")
+
+    print(f"{'backend':>8} {'steps':>8} {'add ms':>10} {'search ms':>10} {'load ms':>10}")
+    for size in sorted(int(size) for size in args.sizes.split(",")):
+        steps = generate_steps(size)
+        for name, use_numpy in backends:
+            index = StepSimilarityIndex(use_numpy=use_numpy)
+            start = time.perf_counter()
+            index.add(steps)
+            add_ms = (time.perf_counter() - start) * 1000
+
+            search_ms = time_ms(partial(index.search, queries, k=3))
+
+            with tempfile.TemporaryDirectory() as directory:
+                path = Path(directory) / "steps"
+                index.save(path)
+                load_ms = time_ms(partial(StepSimilarityIndex.load, path, use_numpy=use_numpy), 1)
+
+            print(f"{name:>8} {size:>8} {add_ms:>10.1f} {search_ms:>10.2f} {load_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
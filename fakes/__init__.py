@@ -0,0 +1 @@
+"""Local fakes of the Linear, GitHub and Gemini APIs (run with python -m fakes)"""
@@ -0,0 +1,47 @@
+"""
+Run the fake services: python -m fakes --port 8100 --latency-ms 50 --rate-limit-rate 0.05
+"""
+
+import argparse
+import uvicorn
+from fakes.faults import Faults
+from fakes.server import SERVICES, create_app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local fake Linear, GitHub and Gemini APIs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of 5xx responses")
+    parser.add_argument(
+        "--rate-limit-rate", type=float, default=0.0, help="Share of rate-limited responses"
+    )
+    parser.add_argument("--processing-seconds", type=float, default=0.0)
+    parser.add_argument("--issues", type=int, default=200, help="Issues in the Linear workspace")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    faults = {
+        service: Faults(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            seed=args.seed + index,
+        )
+        for index, service in enumerate(SERVICES)
+    }
+    app = create_app(
+        f"http://{args.host}:{args.port}",
+        faults=faults,
+        seed=args.seed,
+        issue_count=args.issues,
+        processing_seconds=args.processing_seconds,
+    )
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
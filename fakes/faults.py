@@ -0,0 +1,65 @@
+"""
+Fault Injection
+Configurable latency, error and rate-limit injection shared by the fake APIs
+"""
+
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class Faults:
+    """
+    Faults injected into every request a fake API serves
+
+    latency_ms is added to each response, plus up to jitter_ms of random
+    extra. error_rate and rate_limit_rate are probabilities (0..1) of
+    answering with a server error or the API's rate-limit response.
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    seed: Optional[int] = None
+    rng: random.Random = field(default_factory=random.Random, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.seed is not None:
+            self.rng.seed(self.seed)
+
+    def update(self, **changes) -> None:
+        """Change fault settings at runtime (e.g., from the /_faults endpoint)"""
+        for name, value in changes.items():
+            if name not in ("latency_ms", "jitter_ms", "error_rate", "rate_limit_rate"):
+                raise ValueError(f"Unknown fault setting: {name}")
+            setattr(self, name, float(value))
+
+    def settings(self) -> dict:
+        """Current fault settings"""
+        return {
+            "latency_ms": self.latency_ms,
+            "jitter_ms": self.jitter_ms,
+            "error_rate": self.error_rate,
+            "rate_limit_rate": self.rate_limit_rate,
+        }
+
+    async def inject(self) -> Optional[str]:
+        """
+        Delay the current request and pick a fault for it
+
+        Returns:
+            "error", "rate_limit", or None to serve the request normally
+        """
+        delay = self.latency_ms + self.rng.uniform(0, self.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        roll = self.rng.random()
+        if roll < self.error_rate:
+            return "error"
+        if roll < self.error_rate + self.rate_limit_rate:
+            return "rate_limit"
+        return None
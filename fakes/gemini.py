@@ -0,0 +1,178 @@
+"""
+Fake Gemini API
+Files API resumable uploads and generateContent with canned Gherkin responses
+"""
+
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+import yaml
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+from fakes.faults import Faults
+
+_TITLE = re.compile(r"^- Title:\s*(.*)$", re.MULTILINE)
+
+
+@dataclass
+class GeminiStore:
+    """Uploaded files and pending resumable upload sessions"""
+
+    files: dict[str, dict] = field(default_factory=dict)
+    uploads: dict[str, dict] = field(default_factory=dict)
+
+
+def canned_response(prompt: str) -> str:
+    """
+    Model output for a prompt: a transcript, or a YAML Gherkin spec for the prompt's title
+
+    Args:
+        prompt: Text parts of the request, joined
+    """
+    if prompt.lstrip().startswith("Transcribe"):
+        return "Please add a way to export the feature list as a spreadsheet."
+
+    match = _TITLE.search(prompt)
+    title = (match.group(1).strip() if match else "") or "Generated feature"
+    document = {
+        "feature": {
+            "title": title,
+            "description": f"Generated specification for {title.lower()}",
+            "scenarios": [
+                {
+                    "scenario": f"{title} succeeds",
+                    "given": ["I am signed in"],
+                    "when": [f"I use {title.lower()}"],
+                    "then": ["I see the expected result"],
+                },
+                {
+                    "scenario": f"{title} fails gracefully",
+                    "given": ["I am signed in", "the service is unavailable"],
+                    "when": [f"I use {title.lower()}"],
+                    "then": ["I see an error message"],
+                },
+            ],
+        },
+        "analysis": {
+            "summary": f"Request for {title.lower()}",
+            "edge_cases": ["Empty input", "Slow network"],
+        },
+    }
+    return f"```yaml\n{yaml.safe_dump(document, sort_keys=False)}```"
+
+
+def _error(message: str, status_code: int, status: str) -> JSONResponse:
+    return JSONResponse(
+        {"error": {"code": status_code, "message": message, "status": status}},
+        status_code=status_code,
+    )
+
+
+def create_gemini_app(
+    store: Optional[GeminiStore] = None,
+    *,
+    faults: Optional[Faults] = None,
+    public_url: str = "http://localhost:8100/gemini",
+    processing_seconds: float = 0.0,
+) -> FastAPI:
+    """
+    Build the fake Gemini API
+
+    Args:
+        store: Uploaded file data
+        faults: Fault injection settings
+        public_url: URL this app is reachable at (for upload session and file URIs)
+        processing_seconds: How long uploaded files stay in the PROCESSING state
+
+    Returns:
+        FastAPI app serving /upload/v1beta/files, /v1beta/files and generateContent
+    """
+    app = FastAPI(title="Fake Gemini API")
+    app.state.store = store or GeminiStore()
+    app.state.faults = faults or Faults()
+
+    @app.middleware("http")
+    async def inject_faults(request: Request, call_next):
+        if not (request.headers.get("x-goog-api-key") or request.query_params.get("key")):
+            return _error("Method doesn't allow unregistered callers", 403, "PERMISSION_DENIED")
+
+        fault = await app.state.faults.inject()
+        if fault == "error":
+            return _error("An internal error has occurred", 500, "INTERNAL")
+        if fault == "rate_limit":
+            return _error("Resource has been exhausted", 429, "RESOURCE_EXHAUSTED")
+        return await call_next(request)
+
+    def file_json(file_id: str) -> dict:
+        file = app.state.store.files[file_id]
+        ready = time.monotonic() - file["uploaded"] >= processing_seconds
+        return {
+            "name": f"files/{file_id}",
+            "displayName": file["display_name"],
+            "mimeType": file["mime_type"],
+            "sizeBytes": str(len(file["content"])),
+            "uri": f"{public_url}/v1beta/files/{file_id}",
+            "state": "ACTIVE" if ready else "PROCESSING",
+        }
+
+    @app.post("/upload/v1beta/files")
+    async def upload(request: Request, upload_id: Optional[str] = None):
+        command = request.headers.get("x-goog-upload-command", "")
+
+        if command == "start":
+            body = await request.json()
+            upload_id = uuid.uuid4().hex
+            app.state.store.uploads[upload_id] = {
+                "display_name": (body.get("file") or {}).get("display_name", ""),
+                "mime_type": request.headers.get(
+                    "x-goog-upload-header-content-type", "application/octet-stream"
+                ),
+            }
+            return Response(
+                headers={
+                    "X-Goog-Upload-Status": "active",
+                    "X-Goog-Upload-URL": f"{public_url}/upload/v1beta/files?upload_id={upload_id}",
+                }
+            )
+
+        pending = app.state.store.uploads.pop(upload_id or "", None)
+        if pending is None or "finalize" not in command:
+            return _error("Unknown upload session", 400, "INVALID_ARGUMENT")
+
+        file_id = uuid.uuid4().hex[:12]
+        app.state.store.files[file_id] = {
+            **pending,
+            "content": await request.body(),
+            "uploaded": time.monotonic(),
+        }
+        return JSONResponse({"file": file_json(file_id)}, headers={"X-Goog-Upload-Status": "final"})
+
+    @app.get("/v1beta/files/{file_id}")
+    async def get_file(file_id: str):
+        if file_id not in app.state.store.files:
+            return _error(f"File files/{file_id} not found", 404, "NOT_FOUND")
+        return file_json(file_id)
+
+    @app.post("/v1beta/models/{model}:generateContent")
+    async def generate_content(model: str, request: Request):
+        body = await request.json()
+        parts = [part for content in body.get("contents", []) for part in content["parts"]]
+        prompt = "\n".join(part["text"] for part in parts if "text" in part)
+        text = canned_response(prompt)
+        return {
+            "candidates": [
+                {
+                    "content": {"role": "model", "parts": [{"text": text}]},
+                    "finishReason": "STOP",
+                }
+            ],
+            "modelVersion": model,
+            "usageMetadata": {
+                "promptTokenCount": len(prompt) // 4,
+                "candidatesTokenCount": len(text) // 4,
+            },
+        }
+
+    return app
@@ -0,0 +1,243 @@
+"""
+Fake GitHub API
+REST subset used by the GitHub adapter: repositories, contents, git refs, trees and blobs
+"""
+
+import base64
+import hashlib
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from fakes.faults import Faults
+
+RATE_LIMIT = 5000
+
+
+def _sha(content: bytes) -> str:
+    """Git blob SHA, so updates must send the SHA GitHub would have returned"""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+@dataclass
+class GitHubStore:
+    """In-memory repositories: repo -> branch -> path -> file bytes"""
+
+    files: dict[str, dict[str, dict[str, bytes]]] = field(default_factory=dict)
+    heads: dict[str, dict[str, str]] = field(default_factory=dict)
+
+    def repository(self, repo: str) -> dict[str, dict[str, bytes]]:
+        """Branches of a repository, created with an empty main branch on first use"""
+        if repo not in self.files:
+            self.files[repo] = {"main": {}}
+            self.heads[repo] = {"main": hashlib.sha1(repo.encode()).hexdigest()}
+        return self.files[repo]
+
+    def commit(self, repo: str, branch: str, path: str, content: bytes, message: str) -> str:
+        """Write a file and advance the branch head"""
+        self.repository(repo).setdefault(branch, {})[path] = content
+        head = hashlib.sha1(
+            f"{self.heads[repo].get(branch)}:{path}:{message}".encode() + content
+        ).hexdigest()
+        self.heads[repo][branch] = head
+        return head
+
+
+def _error(message: str, status_code: int, headers: Optional[dict] = None) -> JSONResponse:
+    return JSONResponse({"message": message}, status_code=status_code, headers=headers)
+
+
+def create_github_app(
+    store: Optional[GitHubStore] = None,
+    *,
+    faults: Optional[Faults] = None,
+    public_url: str = "http://localhost:8100/github",
+) -> FastAPI:
+    """
+    Build the fake GitHub API
+
+    Any repository name exists on first access, with an empty main branch.
+
+    Args:
+        store: Repository data
+        faults: Fault injection settings
+        public_url: URL this app is reachable at (for resource URLs)
+
+    Returns:
+        FastAPI app serving /repos/...
+    """
+    app = FastAPI(title="Fake GitHub API")
+    app.state.store = store or GitHubStore()
+    app.state.faults = faults or Faults()
+
+    @app.middleware("http")
+    async def inject_faults(request: Request, call_next):
+        if not request.headers.get("authorization"):
+            return _error("Requires authentication", 401)
+
+        fault = await app.state.faults.inject()
+        if fault == "error":
+            return _error("Server Error", 502)
+        if fault == "rate_limit":
+            return _error(
+                "API rate limit exceeded",
+                403,
+                {
+                    "X-RateLimit-Limit": str(RATE_LIMIT),
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": str(int(time.time()) + 60),
+                },
+            )
+
+        response = await call_next(request)
+        response.headers["X-RateLimit-Limit"] = str(RATE_LIMIT)
+        response.headers["X-RateLimit-Remaining"] = str(RATE_LIMIT - 1)
+        return response
+
+    def repository_json(repo: str) -> dict:
+        app.state.store.repository(repo)
+        return {
+            "id": int(hashlib.sha1(repo.encode()).hexdigest()[:8], 16),
+            "name": repo.split("/")[1],
+            "full_name": repo,
+            "url": f"{public_url}/repos/{repo}",
+            "default_branch": "main",
+        }
+
+    def content_json(repo: str, path: str, content: bytes) -> dict:
+        return {
+            "type": "file",
+            "name": path.rsplit("/", 1)[-1],
+            "path": path,
+            "sha": _sha(content),
+            "size": len(content),
+            "encoding": "base64",
+            "content": base64.b64encode(content).decode("ascii"),
+            "url": f"{public_url}/repos/{repo}/contents/{path}",
+        }
+
+    @app.get("/repos/{owner}/{name}")
+    async def get_repository(owner: str, name: str):
+        return repository_json(f"{owner}/{name}")
+
+    @app.get("/repos/{owner}/{name}/contents/{path:path}")
+    async def get_contents(owner: str, name: str, path: str, ref: str = "main"):
+        repo = f"{owner}/{name}"
+        content = app.state.store.repository(repo).get(ref, {}).get(path)
+        if content is None:
+            return _error("Not Found", 404)
+        return content_json(repo, path, content)
+
+    @app.put("/repos/{owner}/{name}/contents/{path:path}")
+    async def put_contents(owner: str, name: str, path: str, request: Request):
+        repo = f"{owner}/{name}"
+        body = await request.json()
+        branch = body.get("branch", "main")
+        existing = app.state.store.repository(repo).get(branch, {}).get(path)
+
+        # GitHub rejects updates without the current blob SHA, and creates with one
+        if existing is not None and body.get("sha") != _sha(existing):
+            return _error(f"{path} does not match {body.get('sha')}", 409)
+        if existing is None and body.get("sha"):
+            return _error("sha wasn't supplied for a new file", 422)
+
+        content = base64.b64decode(body["content"])
+        commit_sha = app.state.store.commit(repo, branch, path, content, body.get("message", ""))
+        return JSONResponse(
+            {
+                "content": content_json(repo, path, content),
+                "commit": {
+                    "sha": commit_sha,
+                    "message": body.get("message", ""),
+                    "author": body.get("author"),
+                    "url": f"{public_url}/repos/{repo}/git/commits/{commit_sha}",
+                },
+            },
+            status_code=200 if existing is not None else 201,
+        )
+
+    @app.get("/repos/{owner}/{name}/git/ref/{ref:path}")
+    @app.get("/repos/{owner}/{name}/git/refs/{ref:path}")
+    async def get_ref(owner: str, name: str, ref: str):
+        repo = f"{owner}/{name}"
+        app.state.store.repository(repo)
+        branch = ref.removeprefix("heads/")
+        sha = app.state.store.heads[repo].get(branch)
+        if sha is None:
+            return _error("Not Found", 404)
+        return {
+            "ref": f"refs/heads/{branch}",
+            "url": f"{public_url}/repos/{repo}/git/refs/heads/{branch}",
+            "object": {"type": "commit", "sha": sha},
+        }
+
+    @app.get("/repos/{owner}/{name}/git/trees/{ref:path}")
+    async def get_tree(owner: str, name: str, ref: str):
+        # Accepts a branch name or head SHA; always lists blobs recursively
+        repo = f"{owner}/{name}"
+        branches = app.state.store.repository(repo)
+        heads = app.state.store.heads[repo]
+        branch = ref if ref in branches else next((b for b, h in heads.items() if h == ref), None)
+        if branch is None:
+            return _error("Not Found", 404)
+        return {
+            "sha": heads[branch],
+            "url": f"{public_url}/repos/{repo}/git/trees/{heads[branch]}",
+            "truncated": False,
+            "tree": [
+                {
+                    "path": path,
+                    "mode": "100644",
+                    "type": "blob",
+                    "sha": _sha(content),
+                    "size": len(content),
+                    "url": f"{public_url}/repos/{repo}/git/blobs/{_sha(content)}",
+                }
+                for path, content in sorted(branches[branch].items())
+            ],
+        }
+
+    @app.get("/repos/{owner}/{name}/git/blobs/{sha}")
+    async def get_blob(owner: str, name: str, sha: str):
+        repo = f"{owner}/{name}"
+        for files in app.state.store.repository(repo).values():
+            for content in files.values():
+                if _sha(content) == sha:
+                    return {
+                        "sha": sha,
+                        "size": len(content),
+                        "encoding": "base64",
+                        "content": base64.b64encode(content).decode("ascii"),
+                        "url": f"{public_url}/repos/{repo}/git/blobs/{sha}",
+                    }
+        return _error("Not Found", 404)
+
+    @app.post("/repos/{owner}/{name}/git/refs")
+    async def create_ref(owner: str, name: str, request: Request):
+        repo = f"{owner}/{name}"
+        body = await request.json()
+        branches = app.state.store.repository(repo)
+        branch = body["ref"].removeprefix("refs/heads/")
+        if branch in branches:
+            return _error("Reference already exists", 422)
+
+        source = next(
+            (head for head, sha in app.state.store.heads[repo].items() if sha == body["sha"]),
+            None,
+        )
+        if source is None:
+            return _error("Object does not exist", 422)
+
+        branches[branch] = dict(branches[source])
+        app.state.store.heads[repo][branch] = body["sha"]
+        return JSONResponse(
+            {
+                "ref": body["ref"],
+                "url": f"{public_url}/repos/{repo}/git/{body['ref']}",
+                "object": {"type": "commit", "sha": body["sha"]},
+            },
+            status_code=201,
+        )
+
+    return app
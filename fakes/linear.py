@@ -0,0 +1,516 @@
+"""
+Fake Linear API
+GraphQL subset used by the app, file uploads/asset downloads and the OAuth flow
+
+Queries are not fully parsed: the root fields of the operation are found and
+each is answered by a resolver returning a superset of the fields the app
+selects, which is all a client reading JSON can tell apart.
+"""
+
+import itertools
+import random
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+import yaml
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, RedirectResponse, Response
+from fakes.faults import Faults
+
+GHERKIN_MARKER = "## Gherkin Specification"
+
+# Linear's per-token request budget (the real API allows 1,500 requests/hour)
+REQUESTS_LIMIT = 1500
+COMPLEXITY_LIMIT = 250000
+
+_FIELD = re.compile(r"\s*(\w+)\s*(?:\(([^)]*)\))?")
+_ARGUMENT = re.compile(r"(\w+)\s*:\s*(\$\w+|\"[^\"]*\"|[\w.-]+)")
+
+STATE_NAMES = ("Backlog", "Todo", "In Progress", "In Review", "Approved", "Done")
+
+
+def root_fields(query: str, variables: dict) -> list[tuple[str, dict]]:
+    """
+    Root fields of a GraphQL operation with their resolved arguments
+
+    Args:
+        query: GraphQL document (one operation, arguments as $variables or literals)
+        variables: Operation variables
+
+    Returns:
+        list of (field name, arguments)
+    """
+    fields = []
+    depth = 0
+    index = query.index("{")
+
+    while index < len(query):
+        char = query[index]
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+        elif depth == 1 and not char.isspace():
+            match = _FIELD.match(query, index)
+            if match and match.group(1):
+                fields.append((match.group(1), _arguments(match.group(2) or "", variables)))
+                index = match.end()
+                continue
+        index += 1
+
+    return fields
+
+
+def _arguments(text: str, variables: dict) -> dict:
+    """Resolve `name: $var` and literal arguments"""
+    arguments = {}
+    for name, value in _ARGUMENT.findall(text):
+        if value.startswith("$"):
+            arguments[name] = variables.get(value[1:])
+        elif value.startswith('"'):
+            arguments[name] = value[1:-1]
+        elif value.isdigit():
+            arguments[name] = int(value)
+        else:
+            arguments[name] = value
+    return arguments
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+def spec_description(title: str, scenario_count: int) -> str:
+    """Issue description in the app's create_feature format, with a Gherkin spec"""
+    spec = {
+        "feature": {
+            "title": title,
+            "description": f"Business-facing description of {title.lower()}",
+            "scenarios": [
+                {
+                    "scenario": f"{title} path {index + 1}",
+                    "given": ["I am signed in as a returning customer"],
+                    "when": [f"I complete step {index + 1} of {title.lower()}"],
+                    "then": ["I see a confirmation", "an audit entry is recorded"],
+                }
+                for index in range(scenario_count)
+            ],
+        }
+    }
+    analysis = {
+        "analysis": {
+            "summary": f"The recording shows {title.lower()}",
+            "edge_cases": ["Session expires midway", "Network drops during submit"],
+        }
+    }
+    return (
+        f"Requested from a screen recording.\n\n"
+        f"## Request Metadata\n\n- **Request Type**: feature\n- **Priority**: 2\n\n"
+        f"## AI Analysis\n\n## Overview\n\n```yaml\n{yaml.safe_dump(analysis)}```\n\n"
+        f"{GHERKIN_MARKER}\n\n```yaml\n{yaml.safe_dump(spec, sort_keys=False)}```"
+    )
+
+
+@dataclass
+class LinearStore:
+    """In-memory Linear workspace"""
+
+    viewer: dict
+    users: list[dict]
+    teams: list[dict]
+    projects: list[dict]
+    states: list[dict]
+    issues: dict[str, dict] = field(default_factory=dict)
+    assets: dict[str, bytes] = field(default_factory=dict)
+    numbers: Callable[[], int] = field(default_factory=lambda: itertools.count(1).__next__)
+
+    @classmethod
+    def seeded(cls, *, issue_count: int = 200, seed: int = 0) -> "LinearStore":
+        """
+        Workspace with three teams and issues assigned to the viewer
+
+        Every other issue carries a Gherkin specification, so both list filters
+        and the editor have realistic data.
+        """
+        rng = random.Random(seed)
+        users = [
+            {"id": f"user-{index}", "name": f"Dev {index}", "email": f"dev{index}@example.com"}
+            for index in range(1, 6)
+        ]
+        teams = [
+            {"id": f"team-{key.lower()}", "name": name, "key": key}
+            for key, name in (("ENG", "Engineering"), ("DES", "Design"), ("OPS", "Operations"))
+        ]
+        store = cls(
+            viewer=users[0],
+            users=users,
+            teams=teams,
+            projects=[
+                {"id": "project-1", "name": "Checkout"},
+                {"id": "project-2", "name": "Login"},
+            ],
+            states=[
+                {"id": f"state-{index}", "name": name} for index, name in enumerate(STATE_NAMES)
+            ],
+        )
+
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for index in range(issue_count):
+            title = f"Feature request {index + 1}"
+            created = start + timedelta(hours=index)
+            store.add_issue(
+                title=title,
+                description=(
+                    spec_description(title, rng.randint(2, 12)) if index % 2 == 0 else title
+                ),
+                team=teams[index % len(teams)],
+                assignee=users[0] if index % 5 else users[1 + index % 4],
+                priority=rng.randint(0, 4),
+                created=created,
+                updated=created + timedelta(minutes=rng.randint(0, 10000)),
+            )
+        return store
+
+    def add_issue(
+        self,
+        *,
+        title: str,
+        description: str,
+        team: dict,
+        assignee: Optional[dict],
+        priority: int = 0,
+        project: Optional[dict] = None,
+        created: Optional[datetime] = None,
+        updated: Optional[datetime] = None,
+    ) -> dict:
+        """Create an issue in the Todo state"""
+        now = datetime.now(timezone.utc)
+        identifier = f"{team['key']}-{self.numbers()}"
+        issue = {
+            "id": str(uuid.uuid4()),
+            "identifier": identifier,
+            "title": title,
+            "description": description,
+            "priority": priority,
+            "state": {"name": "Todo"},
+            "team": team,
+            "project": project,
+            "assignee": assignee,
+            "createdAt": _timestamp(created or now),
+            "updatedAt": _timestamp(updated or created or now),
+            "url": f"https://linear.app/fake/issue/{identifier}",
+            "attachments": {"nodes": []},
+            "comments": [],
+        }
+        self.issues[issue["id"]] = issue
+        return issue
+
+    def find_issue(self, issue_id: str) -> Optional[dict]:
+        """Issue by UUID or identifier"""
+        if issue_id in self.issues:
+            return self.issues[issue_id]
+        return next(
+            (issue for issue in self.issues.values() if issue["identifier"] == issue_id), None
+        )
+
+    def find(self, nodes: list[dict], node_id: Optional[str]) -> Optional[dict]:
+        return next((node for node in nodes if node["id"] == node_id), None)
+
+
+def _page(nodes: list[dict], first: Optional[int], after: Optional[str]) -> dict:
+    """Relay-style connection over a list, with the list index as cursor"""
+    start = int(after) + 1 if after else 0
+    end = start + (first or 50)
+    page = nodes[start:end]
+    return {
+        "nodes": page,
+        "pageInfo": {
+            "hasNextPage": end < len(nodes),
+            "endCursor": str(start + len(page) - 1) if page else after,
+        },
+    }
+
+
+def _matches(issue: dict, issue_filter: Optional[dict]) -> bool:
+    """Apply the IssueFilter subset the app sends (team id, description contains, updatedAt gt)"""
+    if not issue_filter:
+        return True
+    team_id = (issue_filter.get("team") or {}).get("id") or {}
+    if team_id.get("eq") and issue["team"]["id"] != team_id["eq"]:
+        return False
+    if team_id.get("in") is not None and issue["team"]["id"] not in team_id["in"]:
+        return False
+    updated_after = (issue_filter.get("updatedAt") or {}).get("gt")
+    if updated_after and issue["updatedAt"] <= updated_after:
+        return False
+    contains = (issue_filter.get("description") or {}).get("contains")
+    if contains and contains not in (issue["description"] or ""):
+        return False
+    return True
+
+
+class LinearResolvers:
+    """Root field resolvers over a LinearStore"""
+
+    def __init__(self, store: LinearStore, public_url: str):
+        self.store = store
+        self.public_url = public_url
+
+    def resolve(self, name: str, arguments: dict):
+        resolver = getattr(self, f"field_{name}", None)
+        if resolver is None:
+            raise KeyError(name)
+        return resolver(**arguments)
+
+    # Queries
+
+    def field_viewer(self, **_):
+        viewer = self.store.viewer
+        return {**viewer, "assignedIssues": _AssignedIssues(self.store, viewer["id"])}
+
+    def field_teams(self, first=50, after=None, **_):
+        return _page(self.store.teams, first, after)
+
+    def field_projects(self, first=50, after=None, **_):
+        return _page(self.store.projects, first, after)
+
+    def field_users(self, first=50, after=None, **_):
+        return _page(self.store.users, first, after)
+
+    def field_workflowStates(self, first=50, after=None, **_):
+        return _page(self.store.states, first, after)
+
+    def field_team(self, id=None, **_):
+        team = self.store.find(self.store.teams, id)
+        return team and {**team, "members": {"nodes": self.store.users}}
+
+    def field_issue(self, id=None, **_):
+        issue = self.store.find_issue(id)
+        return issue and {key: value for key, value in issue.items() if key != "comments"}
+
+    def field_issues(self, first=50, after=None, filter=None, orderBy=None, **_):
+        sort_key = orderBy if orderBy in ("createdAt", "updatedAt") else "createdAt"
+        issues = sorted(
+            (issue for issue in self.store.issues.values() if _matches(issue, filter)),
+            key=lambda issue: issue[sort_key],
+            reverse=True,
+        )
+        return _page([self.field_issue(issue["id"]) for issue in issues], first, after)
+
+    # Mutations
+
+    def field_issueCreate(self, input=None, **_):
+        input = input or {}
+        issue = self.store.add_issue(
+            title=input.get("title", ""),
+            description=input.get("description", ""),
+            team=self.store.find(self.store.teams, input.get("teamId")) or self.store.teams[0],
+            assignee=self.store.find(self.store.users, input.get("assigneeId")),
+            priority=input.get("priority", 0),
+            project=self.store.find(self.store.projects, input.get("projectId")),
+        )
+        return {"success": True, "issue": self.field_issue(issue["id"])}
+
+    def field_issueUpdate(self, id=None, input=None, **_):
+        issue = self.store.find_issue(id)
+        if issue is None:
+            return {"success": False}
+
+        input = input or {}
+        for key in ("title", "description", "priority"):
+            if key in input:
+                issue[key] = input[key]
+        if "stateId" in input:
+            state = self.store.find(self.store.states, input["stateId"])
+            issue["state"] = {"name": state["name"]} if state else issue["state"]
+        if "assigneeId" in input:
+            issue["assignee"] = self.store.find(self.store.users, input["assigneeId"])
+        issue["updatedAt"] = _timestamp(datetime.now(timezone.utc))
+        return {"success": True, "issue": self.field_issue(issue["id"])}
+
+    def field_commentCreate(self, input=None, **_):
+        input = input or {}
+        issue = self.store.find_issue(input.get("issueId"))
+        if issue is None:
+            return {"success": False, "comment": None}
+
+        comment = {
+            "id": str(uuid.uuid4()),
+            "body": input.get("body", ""),
+            "createdAt": _timestamp(datetime.now(timezone.utc)),
+            "user": {"id": self.store.viewer["id"]},
+        }
+        issue["comments"].append(comment)
+        return {"success": True, "comment": comment}
+
+    def field_fileUpload(self, contentType=None, filename=None, size=None, **_):
+        asset_id = uuid.uuid4().hex
+        return {
+            "success": True,
+            "uploadFile": {
+                "uploadUrl": f"{self.public_url}/uploads/{asset_id}",
+                "assetUrl": f"{self.public_url}/assets/{asset_id}",
+                "contentType": contentType,
+                "filename": filename,
+                "size": size,
+                "headers": [{"key": "x-fake-upload", "value": asset_id}],
+            },
+        }
+
+    def field_attachmentCreate(self, issueId=None, url=None, title=None, **_):
+        issue = self.store.find_issue(issueId)
+        if issue is None:
+            return {"success": False, "attachment": None}
+
+        attachment = {"id": str(uuid.uuid4()), "title": title, "url": url, "metadata": {}}
+        issue["attachments"]["nodes"].append(attachment)
+        return {"success": True, "attachment": attachment}
+
+
+class _AssignedIssues:
+    """viewer.assignedIssues, resolved lazily with its own arguments"""
+
+    def __init__(self, store: LinearStore, user_id: str):
+        self.store = store
+        self.user_id = user_id
+
+    def resolve(self, first=None, after=None, filter=None, orderBy=None) -> dict:
+        sort_key = orderBy if orderBy in ("createdAt", "updatedAt") else "updatedAt"
+        issues = sorted(
+            (
+                issue
+                for issue in self.store.issues.values()
+                if (issue["assignee"] or {}).get("id") == self.user_id
+                and _matches(issue, filter)
+            ),
+            key=lambda issue: issue[sort_key],
+            reverse=True,
+        )
+        return _page(issues, first, after)
+
+
+def _nested_arguments(query: str, field_name: str, variables: dict) -> dict:
+    """Arguments of a nested field (e.g., viewer.assignedIssues)"""
+    match = re.search(rf"{field_name}\s*\(([^)]*)\)", query)
+    return _arguments(match.group(1), variables) if match else {}
+
+
+def _graphql_error(
+    message: str, code: str, status_code: int, headers: Optional[dict] = None
+) -> JSONResponse:
+    return JSONResponse(
+        {"errors": [{"message": message, "extensions": {"code": code}}]},
+        status_code=status_code,
+        headers=headers,
+    )
+
+
+def create_linear_app(
+    store: Optional[LinearStore] = None,
+    *,
+    faults: Optional[Faults] = None,
+    public_url: str = "http://localhost:8100/linear",
+) -> FastAPI:
+    """
+    Build the fake Linear API
+
+    Args:
+        store: Workspace data (defaults to a seeded workspace)
+        faults: Fault injection settings
+        public_url: URL this app is reachable at (for upload and asset URLs)
+
+    Returns:
+        FastAPI app serving /graphql, /uploads, /assets and /oauth
+    """
+    app = FastAPI(title="Fake Linear API")
+    app.state.store = store or LinearStore.seeded()
+    app.state.faults = faults or Faults()
+    resolvers = LinearResolvers(app.state.store, public_url)
+    budgets: dict[str, list[float]] = {}
+
+    def rate_limit_headers(token: str) -> dict:
+        now = time.time()
+        remaining, reset = budgets.get(token, [REQUESTS_LIMIT, now + 3600])
+        if now >= reset:
+            remaining, reset = REQUESTS_LIMIT, now + 3600
+        budgets[token] = [max(remaining - 1, 0), reset]
+        return {
+            "X-RateLimit-Requests-Limit": str(REQUESTS_LIMIT),
+            "X-RateLimit-Requests-Remaining": str(int(budgets[token][0])),
+            "X-RateLimit-Requests-Reset": str(int(reset * 1000)),
+            "X-RateLimit-Complexity-Limit": str(COMPLEXITY_LIMIT),
+            "X-RateLimit-Complexity-Remaining": str(COMPLEXITY_LIMIT),
+        }
+
+    @app.post("/graphql")
+    async def graphql(request: Request):
+        token = request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+        if not token or token.startswith("revoked"):
+            return _graphql_error("Authentication required", "AUTHENTICATION_ERROR", 401)
+
+        fault = await app.state.faults.inject()
+        headers = rate_limit_headers(token)
+        if fault == "error":
+            return JSONResponse({"errors": [{"message": "Internal error"}]}, status_code=500)
+        if fault == "rate_limit":
+            headers["X-RateLimit-Requests-Remaining"] = "0"
+            return _graphql_error("Rate limit exceeded", "RATELIMITED", 400, headers)
+
+        body = await request.json()
+        query = body.get("query", "")
+        variables = body.get("variables") or {}
+
+        data, errors = {}, []
+        for name, arguments in root_fields(query, variables):
+            try:
+                value = resolvers.resolve(name, arguments)
+            except KeyError:
+                errors.append({"message": f"Cannot query field '{name}' on fake Linear"})
+                continue
+            if isinstance(value, dict) and isinstance(value.get("assignedIssues"), _AssignedIssues):
+                value = {
+                    **value,
+                    "assignedIssues": value["assignedIssues"].resolve(
+                        **_nested_arguments(query, "assignedIssues", variables)
+                    ),
+                }
+            data[name] = value
+
+        payload = {"data": data}
+        if errors:
+            payload["errors"] = errors
+        status_code = 400 if errors and not data else 200
+        return JSONResponse(payload, status_code=status_code, headers=headers)
+
+    @app.put("/uploads/{asset_id}")
+    async def upload(asset_id: str, request: Request):
+        app.state.store.assets[asset_id] = await request.body()
+        return Response(status_code=200)
+
+    @app.get("/assets/{asset_id}")
+    async def asset(asset_id: str, request: Request):
+        if not request.headers.get("authorization"):
+            return Response(status_code=401)
+        content = app.state.store.assets.get(asset_id)
+        if content is None:
+            return Response(status_code=404)
+        return Response(content, media_type="application/octet-stream")
+
+    @app.get("/oauth/authorize")
+    async def authorize(redirect_uri: str, state: str = ""):
+        suffix = f"&state={state}" if state else ""
+        return RedirectResponse(f"{redirect_uri}?code=fake-code-{uuid.uuid4().hex}{suffix}")
+
+    @app.post("/oauth/token")
+    async def token():
+        return {
+            "access_token": f"fake-token-{uuid.uuid4().hex}",
+            "token_type": "Bearer",
+            "expires_in": 315705599,
+            "scope": "read write",
+        }
+
+    return app
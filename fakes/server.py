@@ -0,0 +1,80 @@
+"""
+Fake Services Server
+Linear, GitHub and Gemini fakes on one port, with runtime fault controls
+
+Mounted at /linear, /github and /gemini; point the app at them with the
+*_API_URL / LINEAR_OAUTH_* settings (see .env.example).
+"""
+
+from typing import Optional
+from fastapi import FastAPI, HTTPException
+from fakes.faults import Faults
+from fakes.gemini import create_gemini_app
+from fakes.github import create_github_app
+from fakes.linear import LinearStore, create_linear_app
+
+SERVICES = ("linear", "github", "gemini")
+
+
+def create_app(
+    public_url: str = "http://localhost:8100",
+    *,
+    faults: Optional[dict[str, Faults]] = None,
+    seed: int = 0,
+    issue_count: int = 200,
+    processing_seconds: float = 0.0,
+) -> FastAPI:
+    """
+    Build the combined fake services app
+
+    Args:
+        public_url: URL the server is reachable at
+        faults: Service name -> fault settings (defaults to no faults)
+        seed: Seed for generated Linear data
+        issue_count: Issues in the generated Linear workspace
+        processing_seconds: How long Gemini keeps uploads in PROCESSING
+
+    Returns:
+        FastAPI app with /linear, /github, /gemini and /_faults/{service}
+    """
+    faults = {service: (faults or {}).get(service) or Faults() for service in SERVICES}
+
+    app = FastAPI(title="Fake Services")
+    app.state.faults = faults
+    app.mount(
+        "/linear",
+        create_linear_app(
+            LinearStore.seeded(issue_count=issue_count, seed=seed),
+            faults=faults["linear"],
+            public_url=f"{public_url}/linear",
+        ),
+    )
+    app.mount(
+        "/github", create_github_app(faults=faults["github"], public_url=f"{public_url}/github")
+    )
+    app.mount(
+        "/gemini",
+        create_gemini_app(
+            faults=faults["gemini"],
+            public_url=f"{public_url}/gemini",
+            processing_seconds=processing_seconds,
+        ),
+    )
+
+    @app.get("/_faults/{service}")
+    async def get_faults(service: str):
+        if service not in faults:
+            raise HTTPException(status_code=404, detail=f"Unknown service: {service}")
+        return faults[service].settings()
+
+    @app.put("/_faults/{service}")
+    async def set_faults(service: str, changes: dict):
+        if service not in faults:
+            raise HTTPException(status_code=404, detail=f"Unknown service: {service}")
+        try:
+            faults[service].update(**changes)
+        except (TypeError, ValueError) as e:
+            raise HTTPException(status_code=422, detail=str(e)) from e
+        return faults[service].settings()
+
+    return app
@@ -3,11 +3,12 @@ Pytest Configuration and Fixtures
 Shared test fixtures for Gherkin Taster
 """
 
+import hashlib
 import pytest
 from fastapi.testclient import TestClient
 from backend.app import app
 from backend.facades.issue_tracker import Issue, User, Comment
-from backend.facades.git_provider import GitProvider
+from backend.facades.git_provider import GitProvider, TreeEntry
 from backend.facades.issue_tracker import IssueTrackerProvider
 
 
@@ -78,6 +79,12 @@ def mock_issue_tracker():
             self.comments.append(comment)
             return comment
 
+        async def update_issue_with_comment(
+            self, issue_id: str, content: str, **kwargs
+        ) -> tuple[bool, Comment]:
+            await self.update_issue(issue_id, **kwargs)
+            return True, await self.add_comment(issue_id, content)
+
         async def get_users(self, team_id: str) -> list[User]:
             return [
                 User(id="user-1", email="dev1@buckler.ai", name="Dev One"),
@@ -87,6 +94,12 @@ def mock_issue_tracker():
     return MockIssueTracker()
 
 
+def _blob_sha(content: str) -> str:
+    """Git blob SHA of file content"""
+    data = content.encode("utf-8")
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
 @pytest.fixture
 def mock_git_provider():
     """Mock git provider"""
@@ -96,6 +109,7 @@ def mock_git_provider():
             self.files = {}
             self.commits = []
             self.branches = []
+            self.blob_fetches = []
 
         async def get_file(self, repo: str, path: str, branch: str) -> str:
             key = f"{repo}:{branch}:{path}"
@@ -134,9 +148,65 @@ def mock_git_provider():
                 {"repo": repo, "name": branch_name, "from": from_branch}
             )
 
+        async def list_tree(self, repo: str, branch: str) -> list[TreeEntry]:
+            prefix = f"{repo}:{branch}:"
+            return [
+                TreeEntry(path=key.removeprefix(prefix), sha=_blob_sha(content))
+                for key, content in self.files.items()
+                if key.startswith(prefix)
+            ]
+
+        async def get_blob(self, repo: str, sha: str) -> str:
+            self.blob_fetches.append(sha)
+            return next(content for content in self.files.values() if _blob_sha(content) == sha)
+
     return MockGitProvider()
 
 
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """In-memory stand-in for the shared Redis client"""
+
+    class FakeRedis:
+        def __init__(self):
+            self.store = {}
+            self.ttls = {}
+            self.published = []
+
+        async def get(self, key):
+            return self.store.get(key)
+
+        async def set(self, key, value, ex=None):
+            self.store[key] = value
+            self.ttls[key] = ex
+
+        async def getex(self, key, ex=None):
+            if key in self.store:
+                self.ttls[key] = ex
+            return self.store.get(key)
+
+        async def hget(self, key, field):
+            return self.store.get(key, {}).get(field)
+
+        async def hset(self, key, field, value):
+            self.store.setdefault(key, {})[field] = value
+
+        async def expire(self, key, ttl):
+            self.ttls[key] = ttl
+
+        async def delete(self, *keys):
+            for key in keys:
+                self.store.pop(key, None)
+                self.ttls.pop(key, None)
+
+        async def publish(self, channel, message):
+            self.published.append((channel, message))
+
+    redis = FakeRedis()
+    monkeypatch.setattr("backend.services.cache.get_redis", lambda: redis)
+    return redis
+
+
 @pytest.fixture
 def sample_gherkin_valid():
     """Valid Gherkin feature file"""
@@ -168,3 +238,39 @@ def sample_gherkin_invalid():
   InvalidKeyword: This is not valid Gherkin
     Given this will cause a parse error
 """
+
+
+@pytest.fixture
+def sample_spec_yaml():
+    """Spec YAML in the shape Gemini returns (feature plus analysis)"""
+    return """feature:
+  title: "User Login"
+  description: "Registered users can sign in"
+  scenarios:
+    - scenario: "Successful login"
+      given:
+        - "I am on the login page"
+      when:
+        - "I enter valid credentials"
+      then:
+        - "I see the dashboard"
+
+analysis:
+  summary: "User signs in"
+  edge_cases: ["Wrong password"]
+"""
+
+
+@pytest.fixture
+def sample_issue_description(sample_spec_yaml):
+    """Issue description as written by create_feature"""
+    return (
+        "Users need to sign in.\n\n"
+        "## Request Metadata\n\n"
+        "- **Request Type**: feature\n"
+        "- **Priority**: 2\n"
+        "\n## AI Analysis\n\n"
+        "## Overview\n\n"
+        f"```yaml\n{sample_spec_yaml}```\n\n"
+        f"## Gherkin Specification\n\n```yaml\n{sample_spec_yaml}\n```"
+    )
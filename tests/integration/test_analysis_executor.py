@@ -0,0 +1,98 @@
+"""
+Integration Tests: Analysis Executor
+Tests for inline/pool dispatch, superseding and metrics of the Gherkin analysis pool
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from backend.gherkin.validation import validate_gherkin
+from backend.services.analysis_executor import AnalysisExecutor, AnalysisSuperseded
+from benchmarks.gherkin_scaling import build_feature
+
+BLOCK = threading.Event()
+
+
+def _blocking_length(content: str) -> int:
+    """Analysis stand-in that waits until the test releases it"""
+    BLOCK.wait(timeout=5)
+    return len(content)
+
+
+def _thread_pool(max_workers: int) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
+@pytest.fixture
+async def thread_executor():
+    """Executor whose 'pool' is threads, with every spec large enough to offload"""
+    executor = AnalysisExecutor(max_workers=1, inline_max_bytes=0, pool_factory=_thread_pool)
+    await executor.start()
+    BLOCK.clear()
+    yield executor
+    BLOCK.set()
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_small_specs_run_inline():
+    """Test content under the threshold is analysed without a pool"""
+    executor = AnalysisExecutor(inline_max_bytes=1 << 20, pool_factory=_thread_pool)
+    content = build_feature(3)
+
+    result = await executor.run(validate_gherkin, content)
+
+    assert result.is_valid
+    assert 'analysis_cpu_seconds_count{function="validate_gherkin",mode="inline"} 1' in (
+        executor.render_metrics()
+    )
+
+
+@pytest.mark.asyncio
+async def test_newer_job_supersedes_older(thread_executor):
+    """Test a second job with the same key cancels the queued first one"""
+    # The only worker is busy, so the keyed job waits in the queue
+    busy = asyncio.create_task(thread_executor.run(_blocking_length, "busy"))
+    await asyncio.sleep(0.05)
+    older = asyncio.create_task(thread_executor.run(len, "old", job_key="s1:ENG-1"))
+    await asyncio.sleep(0.05)
+    newer = asyncio.create_task(thread_executor.run(len, "newer", job_key="s1:ENG-1"))
+    await asyncio.sleep(0.05)
+    BLOCK.set()
+
+    with pytest.raises(AnalysisSuperseded):
+        await older
+    assert await newer == 5
+    assert await busy == 4
+    assert thread_executor.superseded_total == 1
+    assert "analysis_superseded_total 1" in thread_executor.render_metrics()
+
+
+@pytest.mark.asyncio
+async def test_different_keys_do_not_supersede(thread_executor):
+    """Test jobs for different editors both complete"""
+    BLOCK.set()
+
+    results = await asyncio.gather(
+        thread_executor.run(len, "one", job_key="s1:ENG-1"),
+        thread_executor.run(len, "three", job_key="s2:ENG-1"),
+    )
+
+    assert results == [3, 5]
+    assert thread_executor.superseded_total == 0
+
+
+@pytest.mark.asyncio
+async def test_process_pool_matches_inline_validation():
+    """Test a large spec validated in a worker process gives the inline result"""
+    executor = AnalysisExecutor(max_workers=1, inline_max_bytes=1024)
+    await executor.start()
+    try:
+        content = build_feature(40)
+        result = await executor.run(validate_gherkin, content, job_key="s1:ENG-1")
+    finally:
+        executor.shutdown()
+
+    assert result == validate_gherkin(content)
+    assert 'mode="pool"' in executor.render_metrics()
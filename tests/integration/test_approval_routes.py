@@ -0,0 +1,130 @@
+"""
+Integration Tests: Approval Routes
+Tests for the delegation and routing endpoints in backend/routes/approval.py
+"""
+
+import time
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from backend.facades.issue_tracker import User
+from backend.middleware.auth_middleware import setup_auth_middleware
+from backend.routes import approval
+from backend.services.sessions import SESSION_COOKIE, create_session, save_session
+from backend.services.viewer import Viewer
+
+
+@pytest.fixture
+def workflow_calls(monkeypatch):
+    """Record the workflows the routes schedule instead of calling Linear"""
+    calls = []
+
+    def recorder(name):
+        async def workflow(**kwargs):
+            calls.append((name, kwargs))
+            return {"success": True}
+
+        workflow.__name__ = name
+        return workflow
+
+    monkeypatch.setattr(approval, "delegate_workflow", recorder("delegate_feature"))
+    monkeypatch.setattr(approval, "route_workflow", recorder("route_feature"))
+    return calls
+
+
+@pytest.fixture
+async def client(fake_redis):
+    """App with the auth middleware and the approval router, signed in to team-eng"""
+    app = FastAPI()
+    setup_auth_middleware(app)
+    app.include_router(approval.router, prefix="/approval")
+
+    session = await create_session("token", Viewer(id="user-1", name="Dev One"))
+    session.teams = [{"id": "team-eng", "name": "Engineering"}]
+    session.teams_loaded_at = time.time()
+    await save_session(session)
+    test_client = TestClient(app)
+    test_client.cookies.set(SESSION_COOKIE, session.id)
+    return test_client
+
+
+def test_delegate_responds_optimistically_and_runs_workflow(client, workflow_calls):
+    """Test delegation answers at once and runs the workflow as a background task"""
+    response = client.post(
+        "/approval/ENG-1/delegate", data={"assignee_id": "user-2", "comment": "Please review"}
+    )
+
+    assert response.status_code == 200
+    assert "Feature delegated" in response.text
+    assert response.headers["HX-Trigger"] == "featureDelegated"
+
+    [(name, kwargs)] = workflow_calls
+    assert name == "delegate_feature"
+    assert kwargs["issue"].id == "ENG-1"
+    assert kwargs["assignee_id"] == "user-2"
+    assert kwargs["delegator_name"] == "Dev One"
+    assert kwargs["comment"] == "Please review"
+
+
+def test_route_escapes_target_status_and_runs_workflow(client, workflow_calls):
+    """Test the routed status is HTML-escaped and the workflow gets it unchanged"""
+    target = "<img src=x onerror=alert(1)>"
+
+    response = client.post("/approval/ENG-1/route", data={"target_status": target})
+
+    assert response.status_code == 200
+    assert "<img" not in response.text
+    assert "&lt;img src=x onerror=alert(1)&gt;" in response.text
+    assert response.headers["HX-Trigger"] == "featureRouted"
+
+    [(name, kwargs)] = workflow_calls
+    assert name == "route_feature"
+    assert kwargs["target_status"] == target
+    assert kwargs["router_name"] == "Dev One"
+    assert kwargs["reason"] is None
+
+
+def test_delegate_form_lists_team_members(client, monkeypatch):
+    """Test the delegation modal renders the team's members for the issue"""
+    requested = []
+
+    async def get_team_members(team_id, *, issue_tracker):
+        requested.append(team_id)
+        return [User(id="user-2", email="ada@example.com", name="Ada <Lovelace>")]
+
+    monkeypatch.setattr(approval, "get_team_members", get_team_members)
+
+    response = client.get("/approval/ENG-1/delegate-form", params={"team_id": "team-eng"})
+
+    assert response.status_code == 200
+    assert requested == ["team-eng"]
+    assert 'hx-post="/approval/ENG-1/delegate"' in response.text
+    assert '<option value="user-2">Ada &lt;Lovelace&gt; (ada@example.com)</option>' in response.text
+
+
+def test_delegate_form_without_team_has_no_members(client, monkeypatch):
+    """Test no members are looked up when the issue's team is unknown"""
+
+    async def get_team_members(team_id, *, issue_tracker):
+        raise AssertionError("members looked up without a team")
+
+    monkeypatch.setattr(approval, "get_team_members", get_team_members)
+
+    response = client.get("/approval/ENG-1/delegate-form")
+
+    assert response.status_code == 200
+    assert "<option value=\"\">Select team member...</option>" in response.text
+
+
+def test_delegate_form_hides_members_of_teams_the_user_cannot_see(client, monkeypatch):
+    """Test another team's cached member directory is not served"""
+
+    async def get_team_members(team_id, *, issue_tracker):
+        raise AssertionError("members looked up for a team the user cannot see")
+
+    monkeypatch.setattr(approval, "get_team_members", get_team_members)
+
+    response = client.get("/approval/ENG-1/delegate-form", params={"team_id": "team-private"})
+
+    assert response.status_code == 200
+    assert response.text.count("<option") == 1  # Only the placeholder
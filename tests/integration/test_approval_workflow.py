@@ -100,3 +100,25 @@ async def test_approve_feature_generates_commit_message(
     message = result["commit_message"]
     assert "feat:" in message.lower() or "feature" in message.lower()
     assert "User Login" in message or mock_issue.title in message
+
+
+@pytest.mark.asyncio
+async def test_approve_feature_rejects_invalid_gherkin(
+    mock_issue, mock_issue_tracker, mock_git_provider, sample_gherkin_invalid
+):
+    """Test invalid Gherkin is never committed"""
+    with pytest.raises(ValueError):
+        await approve_feature(
+            issue=mock_issue,
+            feature_content=sample_gherkin_invalid,
+            repo="buckler/test-repo",
+            feature_file_path="features/user_login.feature",
+            base_branch="main",
+            author_name="Test User",
+            author_email="test@buckler.ai",
+            issue_tracker=mock_issue_tracker,
+            git_provider=mock_git_provider,
+        )
+
+    assert mock_git_provider.branches == []
+    assert mock_git_provider.commits == []
@@ -0,0 +1,113 @@
+"""
+Integration Tests: Auth Middleware
+Tests for backend/middleware/auth_middleware.py
+"""
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from backend.middleware.auth_middleware import is_public_path, setup_auth_middleware
+from backend.services import sessions
+from backend.services.sessions import (
+    SESSION_COOKIE,
+    create_session,
+    current_session,
+    save_session,
+)
+from backend.services.viewer import Viewer, current_viewer
+
+
+@pytest.fixture
+def client(fake_redis):
+    """App with only the auth middleware and a few probe routes"""
+    app = FastAPI()
+    setup_auth_middleware(app)
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.get("/whoami")
+    async def whoami(request: Request):
+        viewer = current_viewer(request)
+        token = current_session(request).linear_token
+        return {"id": viewer.id, "name": viewer.name, "token": token}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            yield "a"
+            yield "b"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    return TestClient(app)
+
+
+@pytest.fixture
+async def session(fake_redis):
+    """Stored session for a signed-in user"""
+    return await create_session("token", Viewer(id="user-1", name="Dev One"))
+
+
+def test_public_paths():
+    """Test the precomputed public route matcher"""
+    assert is_public_path("/health")
+    assert is_public_path("/static/css/app.css")
+    assert not is_public_path("/features")
+    assert not is_public_path("/staticfiles")
+
+
+def test_public_route_needs_no_session(client):
+    """Test public routes skip authentication"""
+    assert client.get("/health").status_code == 200
+
+
+def test_missing_session_redirects_to_login(client):
+    """Test protected routes redirect without a session cookie"""
+    response = client.get("/whoami", follow_redirects=False)
+
+    assert response.status_code == 303
+    assert response.headers["location"] == "/auth/login"
+
+
+def test_session_exposes_viewer_and_token(client, session):
+    """Test the session is loaded into request state"""
+    client.cookies.set(SESSION_COOKIE, session.id)
+
+    assert client.get("/whoami").json() == {"id": "user-1", "name": "Dev One", "token": "token"}
+
+
+def test_unknown_session_clears_cookie(client):
+    """Test an expired or forged session id sends the user back to login"""
+    client.cookies.set(SESSION_COOKIE, "expired")
+
+    response = client.get("/whoami", follow_redirects=False)
+
+    assert response.status_code == 303
+    assert response.headers["location"] == "/auth/login?error=expired"
+    assert f"{SESSION_COOKIE}=" in response.headers["set-cookie"]
+
+
+async def test_revoked_token_ends_session_at_revalidation(client, session, monkeypatch):
+    """Test a session whose token Linear now rejects is sent back to login"""
+
+    async def rejected(linear_token):
+        return None
+
+    monkeypatch.setattr(sessions, "resolve_viewer", rejected)
+    session.validated_at = 0.0
+    await save_session(session)
+    client.cookies.set(SESSION_COOKIE, session.id)
+
+    response = client.get("/whoami", follow_redirects=False)
+
+    assert response.headers["location"] == "/auth/login?error=expired"
+
+
+def test_streaming_responses_pass_through(client, session):
+    """Test streamed responses are not buffered or wrapped"""
+    client.cookies.set(SESSION_COOKIE, session.id)
+
+    assert client.get("/stream").text == "ab"
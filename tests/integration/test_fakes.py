@@ -0,0 +1,163 @@
+"""
+Integration Tests: Fake Services
+Tests for fakes/ driven through the app's real Linear, Gemini and GitHub clients
+"""
+
+import base64
+import httpx
+import pytest
+from backend.config import Settings
+from backend.services.feature_list import fetch_feature_page
+from backend.services.feature_spec import load_issue
+from backend.services.gemini_service import GeminiService
+from backend.services.linear_scheduler import LinearScheduler
+from backend.services.viewer import resolve_viewer
+from fakes.faults import Faults
+from fakes.linear import root_fields
+from fakes.server import create_app
+
+
+@pytest.fixture
+def fakes_app():
+    return create_app("http://fakes", issue_count=40)
+
+
+@pytest.fixture
+def fakes_client(fakes_app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=fakes_app), base_url="http://fakes")
+
+
+@pytest.fixture
+def scheduler(fakes_client):
+    return LinearScheduler(
+        fakes_client, api_url="http://fakes/linear/graphql", max_retries=0, backoff_base=0
+    )
+
+
+def test_root_fields_resolve_variables_and_literals():
+    """Test the query scanner finds root fields and their arguments"""
+    query = """
+        query Page($first: Int!) {
+            teams(first: $first) { nodes { id } }
+            issue(id: "ENG-1") { id }
+        }
+    """
+
+    assert root_fields(query, {"first": 5}) == [("teams", {"first": 5}), ("issue", {"id": "ENG-1"})]
+
+
+@pytest.mark.asyncio
+async def test_linear_fake_serves_viewer_pages_and_issues(fake_redis, scheduler):
+    """Test the app's Linear services run unchanged against the fake"""
+    viewer = await resolve_viewer("token-1", scheduler=scheduler)
+    first = await fetch_feature_page("token-1", viewer.id, gherkin_only=True, scheduler=scheduler)
+    second = await fetch_feature_page(
+        "token-1", viewer.id, gherkin_only=True, after=first.end_cursor, scheduler=scheduler
+    )
+    issue = await load_issue(first.features[0]["issue_id"], "token-1", scheduler=scheduler)
+
+    assert viewer.id == "user-1"
+    assert all(feature["has_gherkin"] for feature in first.features + second.features)
+    first_ids = {feature["issue_id"] for feature in first.features}
+    assert first_ids.isdisjoint(feature["issue_id"] for feature in second.features)
+    assert "## Gherkin Specification" in issue["description"]
+
+
+@pytest.mark.asyncio
+async def test_linear_fake_rejects_revoked_tokens(fake_redis, scheduler):
+    """Test a revoked token resolves to no viewer"""
+    assert await resolve_viewer("revoked-token", scheduler=scheduler) is None
+
+
+@pytest.mark.asyncio
+async def test_linear_fake_injects_rate_limits_and_errors(fakes_client):
+    """Test fault settings change responses at runtime"""
+    payload = {"query": "{ viewer { id } }"}
+    headers = {"Authorization": "Bearer token-1"}
+
+    await fakes_client.put("/_faults/linear", json={"rate_limit_rate": 1})
+    limited = await fakes_client.post("/linear/graphql", json=payload, headers=headers)
+
+    await fakes_client.put("/_faults/linear", json={"rate_limit_rate": 0, "error_rate": 1})
+    failed = await fakes_client.post("/linear/graphql", json=payload, headers=headers)
+
+    assert limited.status_code == 400
+    assert limited.json()["errors"][0]["extensions"]["code"] == "RATELIMITED"
+    assert limited.headers["x-ratelimit-requests-remaining"] == "0"
+    assert failed.status_code == 500
+
+
+@pytest.mark.asyncio
+async def test_fault_settings_reject_unknown_names(fakes_client):
+    """Test the fault endpoint validates settings"""
+    response = await fakes_client.put("/_faults/linear", json={"latency": 5})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_gemini_fake_uploads_and_generates(monkeypatch, fakes_client):
+    """Test video analysis runs the upload, poll and generate round trip"""
+    monkeypatch.setattr(
+        "backend.services.gemini_service.get_settings",
+        lambda: Settings(gemini_api_url="http://fakes/gemini", gemini_api_key="key"),
+    )
+    service = GeminiService(http_client=fakes_client)
+    video = base64.b64encode(b"webm-bytes").decode("ascii")
+
+    result = await service.analyze_video_and_generate_gherkin(
+        f"data:video/webm;base64,{video}", "Export list", "", "feature"
+    )
+
+    assert "title: Export list" in result["gherkin_yaml"]
+
+
+@pytest.mark.asyncio
+async def test_github_fake_round_trips_contents(fakes_client):
+    """Test a created file can be read back and updated with its SHA"""
+    headers = {"Authorization": "token gh-token"}
+    url = "/github/repos/acme/specs/contents/features/login.feature"
+    body = {"message": "Add", "content": base64.b64encode(b"Feature: Login").decode("ascii")}
+
+    created = await fakes_client.put(url, json=body, headers=headers)
+    fetched = await fakes_client.get(url, params={"ref": "main"}, headers=headers)
+    stale = await fakes_client.put(url, json=body, headers=headers)
+    updated = await fakes_client.put(
+        url, json={**body, "sha": fetched.json()["sha"]}, headers=headers
+    )
+
+    assert created.status_code == 201
+    assert base64.b64decode(fetched.json()["content"]) == b"Feature: Login"
+    assert stale.status_code == 409
+    assert updated.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_github_fake_lists_tree_and_serves_blobs(fakes_client):
+    """Test a branch tree lists file blob SHAs that resolve to their content"""
+    headers = {"Authorization": "token gh-token"}
+    body = {"message": "Add", "content": base64.b64encode(b"Feature: Cart").decode("ascii")}
+    await fakes_client.put(
+        "/github/repos/acme/specs/contents/features/cart.feature", json=body, headers=headers
+    )
+
+    tree = await fakes_client.get("/github/repos/acme/specs/git/trees/main", headers=headers)
+    entry = tree.json()["tree"][0]
+    blob = await fakes_client.get(
+        f"/github/repos/acme/specs/git/blobs/{entry['sha']}", headers=headers
+    )
+
+    assert entry["path"] == "features/cart.feature"
+    assert base64.b64decode(blob.json()["content"]) == b"Feature: Cart"
+
+
+@pytest.mark.asyncio
+async def test_github_fake_rate_limits_with_403():
+    """Test GitHub-style rate limiting"""
+    app = create_app("http://fakes", faults={"github": Faults(rate_limit_rate=1)})
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://fakes")
+
+    response = await client.get("/github/repos/acme/specs", headers={"Authorization": "token t"})
+
+    assert response.status_code == 403
+    assert response.headers["x-ratelimit-remaining"] == "0"
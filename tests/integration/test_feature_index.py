@@ -0,0 +1,137 @@
+"""
+Integration Tests: Feature Index
+Tests for backend/services/feature_index.py
+"""
+
+import threading
+import pytest
+from backend.gherkin.parsing import parse_gherkin
+from backend.services import feature_index
+from backend.services.feature_index import (
+    FeatureIndex,
+    normalize_step,
+    refresh_feature_index,
+)
+
+REPO = "acme/specs"
+
+CHECKOUT = """Feature: Checkout
+  Background:
+    Given I am signed in as "alice"
+
+  Scenario: Pay with saved card
+    Given my cart contains 3 items
+    When I pay with my saved card
+    Then I see the order confirmation
+"""
+
+SEARCH = """Feature: Search
+  Scenario: Search by name
+    Given I am on the search page
+    When I search for "boots"
+    Then I see 10 results
+"""
+
+
+def _add(git_provider, path: str, content: str) -> None:
+    git_provider.files[f"{REPO}:main:{path}"] = content
+
+
+async def _refresh(index, git_provider):
+    return await refresh_feature_index(index, git_provider=git_provider, repo=REPO, branch="main")
+
+
+def test_normalize_step_abstracts_parameters():
+    """Test quoted strings, numbers and placeholders match any value"""
+    assert normalize_step('I add "pen"  to my Cart 3 times') == "i add {} to my cart {} times"
+    assert normalize_step("I add <item> to my cart <n> times") == "i add {} to my cart {} times"
+
+
+@pytest.mark.asyncio
+async def test_refresh_indexes_feature_files_only(mock_git_provider):
+    """Test the first refresh fetches every .feature file and nothing else"""
+    _add(mock_git_provider, "features/checkout.feature", CHECKOUT)
+    _add(mock_git_provider, "features/search.feature", SEARCH)
+    _add(mock_git_provider, "README.md", "# Specs")
+    index = FeatureIndex()
+
+    stats = await _refresh(index, mock_git_provider)
+
+    assert (stats.files, stats.fetched, stats.removed) == (2, 2, 0)
+    assert [location.path for location in index.steps["i am signed in as {}"]] == [
+        "features/checkout.feature"
+    ]
+    assert not index.is_stale(ttl=60)
+
+
+@pytest.mark.asyncio
+async def test_refresh_skips_unchanged_blobs(mock_git_provider):
+    """Test only changed files are fetched again and deleted files are dropped"""
+    _add(mock_git_provider, "features/checkout.feature", CHECKOUT)
+    _add(mock_git_provider, "features/search.feature", SEARCH)
+    index = FeatureIndex()
+    await _refresh(index, mock_git_provider)
+
+    _add(mock_git_provider, "features/search.feature", SEARCH.replace("10 results", "results"))
+    del mock_git_provider.files[f"{REPO}:main:features/checkout.feature"]
+    stats = await _refresh(index, mock_git_provider)
+
+    assert (stats.files, stats.fetched, stats.removed) == (1, 1, 1)
+    assert len(mock_git_provider.blob_fetches) == 3
+    assert "i am signed in as {}" not in index.steps
+    assert "i see results" in index.steps
+
+
+@pytest.mark.asyncio
+async def test_refresh_parses_off_the_event_loop(mock_git_provider, monkeypatch):
+    """Test feature files are parsed in worker threads, not on the event loop"""
+    _add(mock_git_provider, "features/checkout.feature", CHECKOUT)
+    _add(mock_git_provider, "features/search.feature", SEARCH)
+    threads = []
+
+    def recording_parse(content):
+        threads.append(threading.get_ident())
+        return parse_gherkin(content)
+
+    monkeypatch.setattr(feature_index, "parse_gherkin", recording_parse)
+    await _refresh(FeatureIndex(), mock_git_provider)
+
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
+
+
+@pytest.mark.asyncio
+async def test_match_flags_duplicate_scenarios_and_reusable_steps(mock_git_provider):
+    """Test a spec's scenarios and steps are matched against other files"""
+    _add(mock_git_provider, "features/checkout.feature", CHECKOUT)
+    _add(mock_git_provider, "features/eng-7.feature", SEARCH)
+    index = FeatureIndex()
+    await _refresh(index, mock_git_provider)
+
+    spec = parse_gherkin(
+        """Feature: Reorder
+  Scenario: Reorder last cart
+    Given my cart contains 5 items
+    When I pay with my saved card
+    Then I see the order confirmation
+
+  Scenario: Search again
+    Given I am on the search page
+    Then I see the reorder button
+"""
+    )
+    matches = index.match(spec, exclude_path="features/eng-7.feature")
+
+    [(name, existing)] = matches.duplicate_scenarios
+    assert name == "Reorder last cart"
+    assert (existing.path, existing.name, existing.line) == (
+        "features/checkout.feature",
+        "Pay with saved card",
+        5,
+    )
+    # "I am on the search page" only exists in the spec's own file
+    assert [text for text, _ in matches.reusable_steps] == [
+        "my cart contains 5 items",
+        "I pay with my saved card",
+        "I see the order confirmation",
+    ]
@@ -0,0 +1,161 @@
+"""
+Integration Tests: Feature List
+Tests for backend/services/feature_list.py
+"""
+
+import httpx
+import pytest
+from backend.config import get_settings
+from backend.services import feature_list
+from backend.services.feature_list import (
+    GHERKIN_MARKER,
+    PAGE_SIZE,
+    fetch_all_teams,
+    fetch_feature_page,
+    visible_team_ids,
+)
+from backend.services.issue_cache import assigned_issues_key, invalidate_assigned_issues
+from backend.services.sessions import create_session, load_session
+from backend.services.viewer import Viewer
+
+
+class RecordingScheduler:
+    """Scheduler stand-in returning canned responses and recording payloads"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.payloads = []
+
+    async def post(self, token, payload, *, priority=None):
+        self.payloads.append(payload)
+        return httpx.Response(200, json=self.responses.pop(0))
+
+
+def issue_node(number: int) -> dict:
+    return {
+        "id": f"uuid-{number}",
+        "identifier": f"ENG-{number}",
+        "title": f"Feature {number}",
+        "description": GHERKIN_MARKER if number % 2 else "",
+        "state": {"name": "Todo"},
+        "priority": 2,
+        "createdAt": "2025-01-01T00:00:00Z",
+        "updatedAt": "2025-01-02T00:00:00Z",
+        "team": {"id": "team-1", "name": "Engineering", "key": "ENG"},
+    }
+
+
+def assigned_page(numbers, end_cursor=None) -> dict:
+    return {
+        "data": {
+            "viewer": {
+                "assignedIssues": {
+                    "nodes": [issue_node(number) for number in numbers],
+                    "pageInfo": {"hasNextPage": end_cursor is not None, "endCursor": end_cursor},
+                }
+            }
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_fetch_feature_page_sends_cursor_and_filters(fake_redis):
+    """Test filters, sort order and cursor are sent to Linear"""
+    scheduler = RecordingScheduler(assigned_page([1, 3], end_cursor="cursor-2"))
+
+    page = await fetch_feature_page(
+        "token",
+        "user-1",
+        team="team-1",
+        gherkin_only=True,
+        sort="created",
+        after="cursor-1",
+        scheduler=scheduler,
+    )
+
+    variables = scheduler.payloads[0]["variables"]
+    assert variables["first"] == PAGE_SIZE
+    assert variables["after"] == "cursor-1"
+    assert variables["orderBy"] == "createdAt"
+    assert variables["filter"] == {
+        "team": {"id": {"eq": "team-1"}},
+        "description": {"contains": GHERKIN_MARKER},
+    }
+    assert [feature["issue_id"] for feature in page.features] == ["ENG-1", "ENG-3"]
+    assert page.has_next_page and page.end_cursor == "cursor-2"
+
+
+@pytest.mark.asyncio
+async def test_fetch_feature_page_cached_until_invalidated(fake_redis):
+    """Test pages are served from the cache until a webhook drops the user's list"""
+    scheduler = RecordingScheduler(assigned_page([1, 2]), assigned_page([1, 2, 3]))
+
+    await fetch_feature_page("token", "user-1", scheduler=scheduler)
+    cached = await fetch_feature_page("token", "user-1", scheduler=scheduler)
+
+    assert len(scheduler.payloads) == 1
+    assert [feature["has_gherkin"] for feature in cached.features] == [True, False]
+
+    await invalidate_assigned_issues("user-1")
+    assert assigned_issues_key("user-1") not in fake_redis.store
+
+    refreshed = await fetch_feature_page("token", "user-1", scheduler=scheduler)
+    assert len(refreshed.features) == 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_feature_page_does_not_cache_errors(fake_redis):
+    """Test a failed query is not cached as an empty page"""
+    scheduler = RecordingScheduler({"errors": [{"message": "boom"}]})
+
+    page = await fetch_feature_page("token", "user-1", scheduler=scheduler)
+
+    assert page.features == []
+    assert assigned_issues_key("user-1") not in fake_redis.store
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_teams_follows_cursors():
+    """Test every teams page is loaded"""
+    scheduler = RecordingScheduler(
+        {
+            "data": {
+                "teams": {
+                    "nodes": [{"id": "team-1", "name": "A", "key": "A"}],
+                    "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+                }
+            }
+        },
+        {
+            "data": {
+                "teams": {
+                    "nodes": [{"id": "team-2", "name": "B", "key": "B"}],
+                    "pageInfo": {"hasNextPage": False, "endCursor": "c2"},
+                }
+            }
+        },
+    )
+
+    teams = await fetch_all_teams("token", scheduler=scheduler)
+
+    assert [team["id"] for team in teams] == ["team-1", "team-2"]
+    assert scheduler.payloads[1]["variables"]["after"] == "c1"
+
+
+@pytest.mark.asyncio
+async def test_visible_team_ids_refetched_after_ttl(fake_redis, monkeypatch):
+    """Test the session's team list is reused within its TTL and re-fetched after it"""
+    team_lists = [[{"id": "team-1"}, {"id": "team-private"}], [{"id": "team-1"}]]
+
+    async def fetch_teams(linear_token):
+        return team_lists.pop(0)
+
+    monkeypatch.setattr(feature_list, "fetch_all_teams", fetch_teams)
+    session = await create_session("token", Viewer(id="user-1", name="Dev One"))
+
+    assert await visible_team_ids(session) == {"team-1", "team-private"}
+    assert await visible_team_ids(session) == {"team-1", "team-private"}
+
+    session.teams_loaded_at -= get_settings().session_teams_ttl + 1
+    assert await visible_team_ids(session) == {"team-1"}
+    assert (await load_session(session.id)).teams == [{"id": "team-1"}]
@@ -0,0 +1,86 @@
+"""
+Integration Tests: Feature Spec
+Tests for backend/services/feature_spec.py
+"""
+
+import httpx
+import pytest
+from backend.gherkin.compiler import SpecCompileError
+from backend.services.feature_spec import get_compiled_feature, load_issue
+from backend.services.issue_cache import cache_issue, compiled_feature_key, invalidate_issue
+
+
+@pytest.mark.asyncio
+async def test_get_compiled_feature_cached_with_issue(fake_redis, sample_spec_yaml):
+    """Test the compiled artifact is stored next to the issue and reused"""
+    compiled = await get_compiled_feature("ENG-1", sample_spec_yaml)
+    assert compiled_feature_key("ENG-1") in fake_redis.store
+
+    cached = await get_compiled_feature("ENG-1", sample_spec_yaml)
+    assert cached == compiled
+
+
+@pytest.mark.asyncio
+async def test_get_compiled_feature_recompiles_changed_spec(fake_redis, sample_spec_yaml):
+    """Test a changed spec is not served from a stale artifact"""
+    await get_compiled_feature("ENG-1", sample_spec_yaml)
+
+    changed = sample_spec_yaml.replace("User Login", "User Sign In")
+    compiled = await get_compiled_feature("ENG-1", changed)
+
+    assert compiled.text.startswith("Feature: User Sign In")
+
+
+@pytest.mark.asyncio
+async def test_invalidate_issue_drops_compiled_feature(fake_redis, sample_spec_yaml):
+    """Test issue invalidation also drops its compiled artifact"""
+    await get_compiled_feature("ENG-1", sample_spec_yaml)
+    await invalidate_issue("ENG-1")
+
+    assert compiled_feature_key("ENG-1") not in fake_redis.store
+
+
+@pytest.mark.asyncio
+async def test_get_compiled_feature_rejects_invalid_spec(fake_redis):
+    """Test compile errors are raised and nothing is cached"""
+    with pytest.raises(SpecCompileError):
+        await get_compiled_feature("ENG-1", "analysis:\n  summary: x\n")
+
+    assert compiled_feature_key("ENG-1") not in fake_redis.store
+
+
+class IssueScheduler:
+    """Scheduler stand-in answering the issue query as Linear would for one token"""
+
+    def __init__(self, issue):
+        self.issue = issue
+        self.calls = 0
+
+    async def post(self, token, payload, *, priority=None):
+        self.calls += 1
+        return httpx.Response(200, json={"data": {"issue": self.issue}})
+
+
+CACHED_ISSUE = {
+    "id": "uuid-1",
+    "identifier": "ENG-1",
+    "title": "Private roadmap",
+    "description": "Secret plans",
+    "team": {"id": "team-private"},
+}
+
+
+@pytest.mark.asyncio
+async def test_load_issue_serves_cache_only_to_its_team(fake_redis):
+    """Test a cached issue is only served to users who can see its team"""
+    await cache_issue(CACHED_ISSUE)
+
+    member = IssueScheduler(CACHED_ISSUE)
+    assert await load_issue("ENG-1", "t", team_ids={"team-private"}, scheduler=member)
+    assert member.calls == 0
+
+    # Linear refuses the outsider's token; the cached copy must not leak
+    outsider = IssueScheduler(None)
+    assert await load_issue("ENG-1", "t", team_ids={"team-eng"}, scheduler=outsider) is None
+    assert await load_issue("ENG-1", "t", scheduler=outsider) is None
+    assert outsider.calls == 2
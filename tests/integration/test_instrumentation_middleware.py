@@ -0,0 +1,45 @@
+"""
+Integration Tests: Instrumentation Middleware
+Tests for backend/middleware/instrumentation_middleware.py
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from backend.instrumentation import render_metrics, span
+from backend.middleware.instrumentation_middleware import setup_instrumentation_middleware
+
+
+@pytest.fixture
+def client():
+    """App with only the instrumentation middleware and a probe route"""
+    app = FastAPI()
+    setup_instrumentation_middleware(app)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str):
+        with span("linear"):
+            pass
+        return {"id": item_id}
+
+    return TestClient(app)
+
+
+def test_server_timing_header_lists_spans(client):
+    """Test the response reports span and total time"""
+    response = client.get("/items/1")
+
+    timing = response.headers["server-timing"]
+    assert timing.startswith("linear;dur=")
+    assert "app;dur=" in timing
+
+
+def test_request_latency_recorded_by_route_template(client):
+    """Test request latency is labelled by route, not raw path"""
+    client.get("/items/42")
+
+    metrics = render_metrics()
+
+    assert 'route="/items/{item_id}"' in metrics
+    assert "/items/42" not in metrics
+    assert 'span_duration_seconds_count{outcome="ok",span="linear"}' in metrics
@@ -0,0 +1,260 @@
+"""
+Integration Tests: Issue Search
+Tests for backend/services/issue_search.py
+"""
+
+import threading
+import httpx
+import pytest
+from backend.services import issue_search
+from backend.services.issue_search import (
+    IssueSearchIndex,
+    build_document,
+    get_issue_search,
+    index_issues,
+    sync_issue_search,
+)
+from backend.services.linear_scheduler import LinearScheduler
+from backend.services.linear_webhooks import apply_webhook_event
+from backend.templating import templates
+from fakes.server import create_app
+
+SPEC_DESCRIPTION = """Customers want to reuse a card at checkout.
+
+## Request Metadata
+
+- **Request Type**: feature
+
+## Gherkin Specification
+
+```yaml
+feature:
+  title: Saved cards
+  tags: ["@payments"]
+  background:
+    given: ["I have a stored wallet"]
+  scenarios:
+    - scenario: Pay with a saved card
+      tags: ["@smoke"]
+      given: ["I am signed in"]
+      when: ["I pay with my saved visa"]
+      then: ["the order is confirmed"]
+```
+"""
+
+
+def issue(number: int, title: str, description: str = "", **fields) -> dict:
+    return {
+        "id": f"uuid-{number}",
+        "identifier": f"ENG-{number}",
+        "title": title,
+        "description": description,
+        "state": {"name": "Todo"},
+        "priority": 2,
+        "updatedAt": f"2025-01-{number:02d}T00:00:00.000Z",
+        "team": {"id": "team-eng"},
+        **fields,
+    }
+
+
+@pytest.fixture
+def index():
+    search_index = IssueSearchIndex()
+    search_index.put(issue(1, "Saved cards at checkout", SPEC_DESCRIPTION))
+    search_index.put(issue(2, "Checkout is slow", "Pages time out when paying"))
+    search_index.put(issue(3, "Export invoices", "Finance needs a CSV of every order"))
+    return search_index
+
+
+@pytest.fixture
+def process_index():
+    """Fresh process-wide index, fed by webhooks and our own reads and writes"""
+    get_issue_search.cache_clear()
+    yield get_issue_search()
+    get_issue_search.cache_clear()
+
+
+def identifiers(documents) -> list[str]:
+    return [document.identifier for document in documents]
+
+
+def test_document_indexes_title_description_steps_and_tags():
+    """Test spec steps, background, scenario names and tags are searchable, metadata is not"""
+    document = build_document(issue(1, "Saved cards", SPEC_DESCRIPTION))
+
+    assert document.has_gherkin
+    assert document.terms["saved"] == 4  # title outranks the step it also appears in
+    assert document.terms["visa"] == 2
+    assert document.terms["payments"] == 3
+    assert document.terms["smoke"] == 3
+    assert document.terms["wallet"] == 2
+    assert document.terms["reuse"] == 1
+    assert document.terms["eng"] == 4
+    assert "request" not in document.terms
+
+
+def test_search_requires_every_term_and_ranks_title_matches_first(index):
+    """Test terms are intersected and weighted by where they occur"""
+    assert identifiers(index.search("checkout")) == ["ENG-2", "ENG-1"]
+    assert identifiers(index.search("checkout visa")) == ["ENG-1"]
+    assert identifiers(index.search("order")) == ["ENG-1", "ENG-3"]
+    assert index.search("checkout invoices") == []
+    assert index.search("  ") == []
+
+
+def test_last_term_matches_as_prefix(index):
+    """Test results follow typing: the trailing term is a prefix"""
+    assert identifiers(index.search("export inv")) == ["ENG-3"]
+    assert identifiers(index.search("@smo")) == ["ENG-1"]
+    assert index.search("inv export") == []
+
+
+def test_search_restricted_to_visible_teams(index):
+    """Test issues of teams the user cannot see are left out"""
+    index.put(issue(4, "Checkout for partners", team={"id": "team-private"}))
+
+    assert "ENG-4" in identifiers(index.search("checkout"))
+    assert "ENG-4" not in identifiers(index.search("checkout", team_ids={"team-eng"}))
+
+
+def test_put_replaces_postings_and_ignores_older_copies(index):
+    """Test re-indexing drops old terms and out-of-order copies are skipped"""
+    assert index.put(issue(3, "Export credit notes", updatedAt="2025-02-01T00:00:00.000Z"))
+    assert not index.put(issue(3, "Export invoices"))
+
+    assert index.search("invoices") == []
+    assert identifiers(index.search("credit")) == ["ENG-3"]
+
+    index.remove("ENG-3")
+    assert index.search("credit") == []
+    assert "credit" not in index.postings
+
+
+def test_save_and_load_round_trip(index, tmp_path):
+    """Test a saved index answers the same queries and resumes its sync position"""
+    index.synced_through = {"team-eng": "2025-01-03T00:00:00.000Z"}
+    path = tmp_path / "issue-search.json"
+    index.save(path)
+
+    loaded = IssueSearchIndex.load(path)
+
+    assert identifiers(loaded.search("checkout")) == ["ENG-2", "ENG-1"]
+    assert loaded.synced_through == {"team-eng": "2025-01-03T00:00:00.000Z"}
+    assert len(IssueSearchIndex.load(tmp_path / "missing.json")) == 0
+
+
+@pytest.mark.asyncio
+async def test_sync_walks_every_issue_then_only_changes(fake_redis):
+    """Test a team's first sync pages through all its issues and the next filters on updatedAt"""
+    fakes_app = create_app("http://fakes", issue_count=30)
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=fakes_app), base_url="http://fakes"
+    )
+    scheduler = LinearScheduler(
+        client, api_url="http://fakes/linear/graphql", max_retries=0, backoff_base=0
+    )
+    index = IssueSearchIndex()
+
+    all_teams = {"team-eng", "team-des", "team-ops"}
+
+    first = await sync_issue_search(
+        index, linear_token="token", team_ids=all_teams, scheduler=scheduler, page_size=8
+    )
+
+    assert first.documents == 30
+    assert first.updated == 30
+    assert not index.is_stale(60, all_teams)
+    assert len(index.search("feature request")) == 25
+
+    await scheduler.post(
+        "token",
+        {
+            "query": "mutation Rename($id: String!, $input: IssueUpdateInput!) "
+            "{ issueUpdate(id: $id, input: $input) { success } }",
+            "variables": {"id": "ENG-1", "input": {"title": "Refund approvals"}},
+        },
+    )
+
+    second = await sync_issue_search(
+        index, linear_token="token", team_ids=all_teams, scheduler=scheduler, page_size=8
+    )
+
+    assert second.updated == 1
+    assert second.synced_through > first.synced_through
+    assert identifiers(index.search("refund")) == ["ENG-1"]
+
+
+@pytest.mark.asyncio
+async def test_webhooks_update_and_remove_indexed_issues(fake_redis, process_index):
+    """Test Issue webhooks re-index changed issues and drop removed ones"""
+    data = issue(5, "Bulk archive", "Archive many issues at once")
+
+    await apply_webhook_event({"type": "Issue", "action": "create", "data": data})
+    assert identifiers(process_index.search("archive")) == ["ENG-5"]
+
+    await apply_webhook_event({"type": "Issue", "action": "remove", "data": data})
+    assert process_index.search("archive") == []
+
+
+@pytest.mark.asyncio
+async def test_index_issues_parses_off_the_event_loop(process_index, monkeypatch):
+    """Test issues read by the app are tokenized in a worker thread, current ones skipped"""
+    threads = []
+
+    def recording_build(issue):
+        threads.append(threading.get_ident())
+        return build_document(issue)
+
+    monkeypatch.setattr(issue_search, "build_document", recording_build)
+
+    assert await index_issues([issue(1, "Saved cards", SPEC_DESCRIPTION), issue(2, "Slow")]) == 2
+    assert await index_issues([issue(1, "Saved cards", SPEC_DESCRIPTION)]) == 0
+
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
+    assert identifiers(process_index.search("visa")) == ["ENG-1"]
+
+
+def test_results_partial_escapes_query(index):
+    """Test the HTMX results partial escapes the query and links each issue"""
+    template = templates.get_template("partials/search_results.html")
+
+    body = template.render(
+        query="<b>checkout</b>",
+        features=[document.to_feature() for document in index.search("checkout")],
+        indexing=False,
+    )
+
+    assert "&lt;b&gt;checkout&lt;/b&gt;" in body
+    assert 'href="/features/ENG-2"' in body
+    assert "No features match" not in body
+
+
+@pytest.mark.asyncio
+async def test_sync_position_is_kept_per_team(fake_redis):
+    """Test teams synced later by another user still get their older issues indexed"""
+    fakes_app = create_app("http://fakes", issue_count=30)
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=fakes_app), base_url="http://fakes"
+    )
+    scheduler = LinearScheduler(
+        client, api_url="http://fakes/linear/graphql", max_retries=0, backoff_base=0
+    )
+    index = IssueSearchIndex()
+
+    first = await sync_issue_search(
+        index, linear_token="eng-token", team_ids={"team-eng"}, scheduler=scheduler
+    )
+
+    assert first.updated == 10
+    assert set(index.synced_through) == {"team-eng"}
+    assert index.is_stale(60, {"team-eng", "team-des"})
+
+    second = await sync_issue_search(
+        index, linear_token="design-token", team_ids={"team-eng", "team-des"}, scheduler=scheduler
+    )
+
+    assert second.updated == 10
+    assert second.documents == 20
+    assert sum(identifier.startswith("DES-") for identifier in index.documents) == 10
+    assert not index.is_stale(60, {"team-eng", "team-des"})
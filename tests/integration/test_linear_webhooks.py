@@ -0,0 +1,169 @@
+"""
+Integration Tests: Linear Webhooks
+Tests for backend/services/linear_webhooks.py
+"""
+
+import hashlib
+import hmac
+import json
+import pytest
+from backend.adapters import linear
+from backend.services.issue_cache import (
+    assigned_issues_key,
+    cache_assigned_page,
+    cache_issue,
+    get_cached_issue,
+    issue_key,
+)
+from backend.services.linear_webhooks import (
+    apply_webhook_event,
+    is_fresh,
+    issue_channel,
+    verify_signature,
+)
+
+
+@pytest.fixture
+def cached_issue():
+    """Issue payload as cached by view_feature"""
+    return {
+        "id": "uuid-123",
+        "identifier": "TEST-123",
+        "title": "Old title",
+        "description": "Old description",
+        "state": {"name": "Todo"},
+        "priority": 3,
+    }
+
+
+def test_verify_signature():
+    """Test HMAC signature verification against the raw body"""
+    body = b'{"type": "Issue"}'
+    signature = hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+
+    assert verify_signature(body, signature, "secret") is True
+    assert verify_signature(body, signature, "other") is False
+    assert verify_signature(body, "", "secret") is False
+
+
+def test_is_fresh_rejects_old_deliveries():
+    """Test replay protection on webhookTimestamp"""
+    assert is_fresh({"webhookTimestamp": 1_000_000}, now_ms=1_030_000) is True
+    assert is_fresh({"webhookTimestamp": 1_000_000}, now_ms=1_100_000) is False
+    assert is_fresh({}, now_ms=1_000_000) is False
+
+
+@pytest.mark.asyncio
+async def test_issue_update_patches_cache(fake_redis, cached_issue):
+    """Test issue updates are written into the cached payload"""
+    await cache_issue(cached_issue)
+
+    identifier = await apply_webhook_event(
+        {
+            "type": "Issue",
+            "action": "update",
+            "data": {
+                "id": "uuid-123",
+                "identifier": "TEST-123",
+                "title": "New title",
+                "description": "New description",
+            },
+        }
+    )
+
+    cached = await get_cached_issue("TEST-123")
+    assert identifier == "TEST-123"
+    assert cached["title"] == "New title"
+    assert cached["description"] == "New description"
+    assert cached["state"] == {"name": "Todo"}
+
+
+@pytest.mark.asyncio
+async def test_team_move_invalidates_instead_of_patching(fake_redis, cached_issue):
+    """Test an issue moved to another team is dropped, not patched under its old team"""
+    await cache_issue({**cached_issue, "team": {"id": "team-a"}})
+
+    await apply_webhook_event(
+        {
+            "type": "Issue",
+            "action": "update",
+            "data": {
+                "id": "uuid-123",
+                "identifier": "TEST-123",
+                "description": "Private plans",
+                "teamId": "team-b",
+            },
+        }
+    )
+
+    assert await get_cached_issue("TEST-123") is None
+
+
+@pytest.mark.asyncio
+async def test_renumbered_issue_drops_its_old_identifier(fake_redis, cached_issue, monkeypatch):
+    """Test the payload cached under the pre-move identifier is dropped"""
+    monkeypatch.setattr(linear, "_issue_teams", {"uuid-123": "team-a"})
+    await cache_issue({**cached_issue, "team": {"id": "team-a"}})
+
+    identifier = await apply_webhook_event(
+        {
+            "type": "Issue",
+            "action": "update",
+            "data": {"id": "uuid-123", "identifier": "OPS-7", "teamId": "team-b"},
+            "updatedFrom": {"teamId": "team-a"},
+        }
+    )
+
+    assert identifier == "OPS-7"
+    assert issue_key("TEST-123") not in fake_redis.store
+    assert await get_cached_issue("OPS-7") is None
+    # Status changes now resolve against the new team's workflow states
+    assert linear._issue_teams["uuid-123"] == "team-b"
+
+
+@pytest.mark.asyncio
+async def test_issue_reassignment_invalidates_both_lists(fake_redis):
+    """Test assignee changes drop the old and new assignee's lists"""
+    await cache_assigned_page("user-old", "first", {"features": []})
+    await cache_assigned_page("user-new", "first", {"features": []})
+
+    await apply_webhook_event(
+        {
+            "type": "Issue",
+            "action": "update",
+            "data": {"id": "uuid-123", "identifier": "TEST-123", "assigneeId": "user-new"},
+            "updatedFrom": {"assigneeId": "user-old"},
+        }
+    )
+
+    assert assigned_issues_key("user-old") not in fake_redis.store
+    assert assigned_issues_key("user-new") not in fake_redis.store
+
+
+@pytest.mark.asyncio
+async def test_attachment_invalidates_issue_by_uuid(fake_redis, cached_issue):
+    """Test attachment events resolve the issue UUID and drop its payload"""
+    await cache_issue(cached_issue)
+
+    identifier = await apply_webhook_event(
+        {"type": "Attachment", "action": "create", "data": {"issueId": "uuid-123"}}
+    )
+
+    assert identifier == "TEST-123"
+    assert issue_key("TEST-123") not in fake_redis.store
+
+
+@pytest.mark.asyncio
+async def test_comment_notifies_editor_sessions(fake_redis):
+    """Test comment events are published on the issue channel"""
+    await apply_webhook_event(
+        {
+            "type": "Comment",
+            "action": "create",
+            "data": {"issue": {"id": "uuid-123", "identifier": "TEST-123"}},
+        }
+    )
+
+    channel, message = fake_redis.published[0]
+    assert channel == issue_channel("TEST-123")
+    assert json.loads(message)["type"] == "Comment"
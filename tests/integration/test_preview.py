@@ -0,0 +1,99 @@
+"""
+Integration Tests: Gherkin Preview
+Tests for the preview renderer in backend/routes/features.py
+"""
+
+from fastapi.responses import StreamingResponse
+from backend.gherkin.compiler import compile_spec
+from backend.gherkin.parsing import parse_gherkin
+from backend.routes.features import PREVIEW_STREAM_SCENARIOS, _render_preview
+
+
+def parse_spec_yaml(spec_yaml: str):
+    """Preview model of a spec, built from its compiled .feature text like the route does"""
+    return parse_gherkin(compile_spec(spec_yaml).text)
+
+
+def test_preview_escapes_user_text():
+    """Test spec text is HTML-escaped"""
+    spec_yaml = """feature:
+  title: "<script>x</script>"
+  scenarios:
+    - scenario: a & b
+      given: ["a"]
+"""
+    response = _render_preview(parse_spec_yaml(spec_yaml))
+
+    body = response.body.decode()
+    assert "&lt;script&gt;" in body
+    assert "<script>" not in body
+    assert "a &amp; b" in body
+
+
+def test_preview_from_parsed_gherkin(sample_gherkin_valid):
+    """Test the preview renders a ParsedFeature from .feature text"""
+    response = _render_preview(parse_gherkin(sample_gherkin_valid))
+
+    assert "User Login" in response.body.decode()
+
+
+def test_spec_preview_shows_background_and_scenario_tags():
+    """Test spec background steps and scenario tags survive compilation into the preview"""
+    spec_yaml = """feature:
+  title: Saved cards
+  background:
+    given: ["I am signed in"]
+  scenarios:
+    - scenario: Pay with a saved card
+      tags: ["smoke"]
+      when: ["I pay with my saved visa"]
+      then: ["the order is confirmed"]
+"""
+    body = _render_preview(parse_spec_yaml(spec_yaml)).body.decode()
+
+    assert "I am signed in" in body
+    assert "@smoke" in body
+
+
+def test_preview_renders_rules_and_every_examples_block():
+    """Test rule scenarios and all Examples blocks of an outline are shown"""
+    content = """Feature: Refunds
+  Rule: Large refunds need approval
+    Background:
+      Given I am a manager
+
+    Scenario Outline: Refund <amount>
+      When I refund <amount>
+
+      Examples: Small
+        | amount |
+        | 5      |
+
+      Examples: Large
+        | amount |
+        | 5000   |
+"""
+    body = _render_preview(parse_gherkin(content)).body.decode()
+
+    assert "Large refunds need approval" in body
+    assert "I am a manager" in body
+    assert "Small" in body and "5000" in body
+
+
+def test_preview_streams_large_specs():
+    """Test large specs are streamed instead of rendered into one string"""
+    scenarios = "".join(
+        f"    - scenario: S{index}\n      given: [a]\n"
+        for index in range(PREVIEW_STREAM_SCENARIOS + 1)
+    )
+    spec_yaml = f"feature:\n  title: Big\n  scenarios:\n{scenarios}"
+    response = _render_preview(parse_spec_yaml(spec_yaml))
+
+    assert isinstance(response, StreamingResponse)
+
+
+def test_preview_message_without_spec():
+    """Test the empty state message is shown when there is no spec"""
+    response = _render_preview(None, message="No Gherkin specification found")
+
+    assert "No Gherkin specification found" in response.body.decode()
@@ -0,0 +1,133 @@
+"""
+Integration Tests: Sessions
+Tests for backend/services/sessions.py
+"""
+
+import httpx
+import pytest
+from backend.config import get_settings
+from backend.services import sessions
+from backend.services.sessions import (
+    SESSION_COOKIE,
+    create_session,
+    delete_session,
+    load_session,
+    revalidate_session,
+    save_session,
+    session_key,
+)
+from backend.services.viewer import Viewer
+
+
+@pytest.mark.asyncio
+async def test_session_round_trip(fake_redis):
+    """Test a stored session loads back with its token, viewer, teams and preferences"""
+    session = await create_session("token", Viewer(id="user-1", name="Dev One"))
+    session.teams = [{"id": "team-1", "name": "Engineering"}]
+    session.preferences["feature_list"] = {"team": "team-1"}
+    await save_session(session)
+
+    loaded = await load_session(session.id)
+
+    assert loaded == session
+
+
+@pytest.mark.asyncio
+async def test_session_stored_by_id_hash(fake_redis):
+    """Test neither the session id nor the token appears in the Redis key"""
+    session = await create_session("token", Viewer(id="user-1", name="Dev One"))
+
+    key = session_key(session.id)
+
+    assert key in fake_redis.store
+    assert session.id not in key
+    assert len(session.id) >= 32
+
+
+@pytest.mark.asyncio
+async def test_load_session_slides_expiry(fake_redis):
+    """Test reading a session restarts its idle timeout"""
+    session = await create_session("token", Viewer(id="user-1", name="Dev One"))
+    fake_redis.ttls[session_key(session.id)] = 5
+
+    await load_session(session.id)
+
+    assert fake_redis.ttls[session_key(session.id)] == get_settings().session_ttl
+
+
+@pytest.mark.asyncio
+async def test_deleted_session_is_gone(fake_redis):
+    """Test logout ends the session"""
+    session = await create_session("token", Viewer(id="user-1", name="Dev One"))
+
+    await delete_session(session.id)
+
+    assert await load_session(session.id) is None
+
+
+@pytest.fixture
+def linear_viewer(monkeypatch):
+    """Stand-in for Linear's viewer query; set .result to a Viewer, None or an exception"""
+
+    class LinearViewer:
+        result = Viewer(id="user-1", name="Dev One (renamed)")
+        calls = 0
+
+        async def __call__(self, linear_token):
+            self.calls += 1
+            if isinstance(self.result, Exception):
+                raise self.result
+            return self.result
+
+    stub = LinearViewer()
+    monkeypatch.setattr(sessions, "resolve_viewer", stub)
+    return stub
+
+
+@pytest.mark.asyncio
+async def test_token_revalidated_once_per_interval(fake_redis, linear_viewer):
+    """Test Linear is only asked again once the re-validation interval has passed"""
+    session = await create_session("token", Viewer(id="user-1", name="Dev One"))
+
+    assert await revalidate_session(session) is session
+    assert linear_viewer.calls == 0
+
+    session.validated_at -= get_settings().token_revalidation_interval + 1
+    revalidated = await revalidate_session(session)
+
+    assert linear_viewer.calls == 1
+    assert revalidated.viewer.name == "Dev One (renamed)"
+    assert (await load_session(session.id)).validated_at == revalidated.validated_at
+
+
+@pytest.mark.asyncio
+async def test_rejected_token_ends_session(fake_redis, linear_viewer):
+    """Test a token Linear no longer accepts ends the session"""
+    session = await create_session("token", Viewer(id="user-1", name="Dev One"))
+    session.validated_at = 0.0
+    linear_viewer.result = None
+
+    assert await revalidate_session(session) is None
+    assert await load_session(session.id) is None
+
+
+@pytest.mark.asyncio
+async def test_unreachable_linear_keeps_session(fake_redis, linear_viewer):
+    """Test a Linear outage doesn't sign users out"""
+    session = await create_session("token", Viewer(id="user-1", name="Dev One"))
+    session.validated_at = 0.0
+    linear_viewer.result = httpx.ConnectError("down")
+
+    assert await revalidate_session(session) is session
+    assert await load_session(session.id) is not None
+
+
+@pytest.mark.asyncio
+async def test_root_redirects_by_session(client, fake_redis):
+    """Test / sends signed-in users to their features and everyone else to login"""
+    session = await create_session("token", Viewer(id="user-1", name="Dev One"))
+
+    assert client.get("/", follow_redirects=False).headers["location"] == "/auth/login"
+
+    client.cookies.set(SESSION_COOKIE, session.id)
+    assert client.get("/", follow_redirects=False).headers["location"] == "/features"
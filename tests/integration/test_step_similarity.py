@@ -0,0 +1,141 @@
+"""
+Integration Tests: Step Similarity
+Tests for backend/services/step_similarity.py
+"""
+
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+import pytest
+from backend.services.feature_index import normalize_step
+from backend.services import step_similarity
+from backend.services.step_similarity import (
+    KnownStep,
+    StepSimilarityIndex,
+    hashed_ngrams,
+)
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+BACKENDS = [
+    pytest.param(False, id="python"),
+    pytest.param(
+        True, id="numpy", marks=pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+    ),
+]
+
+APPROVED = [
+    KnownStep("I am signed in as a returning customer", "features/checkout.feature"),
+    KnownStep("my cart contains 3 items", "features/checkout.feature"),
+    KnownStep("I pay with my saved card", "features/checkout.feature"),
+    KnownStep("I search for \"boots\"", "features/search.feature"),
+]
+
+
+def test_hashed_ngrams_are_unit_vectors():
+    """Test vectors are L2-normalized and parameters don't change them"""
+    vector = hashed_ngrams('I search for "boots"')
+
+    assert sum(weight * weight for weight in vector.values()) == pytest.approx(1.0)
+    assert vector == hashed_ngrams('I search for "sandals"')
+    assert hashed_ngrams("") == {}
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_search_suggests_closest_step(use_numpy):
+    """Test a reworded step finds the approved step it resembles"""
+    index = StepSimilarityIndex(use_numpy=use_numpy)
+    index.add(APPROVED)
+
+    [suggestions, unrelated] = index.search(
+        ["I am logged in as a returning customer", "the weather is sunny"], k=2
+    )
+
+    assert suggestions[0].text == "I am signed in as a returning customer"
+    assert suggestions[0].score > 0.6
+    assert unrelated == []
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_search_excludes_exact_matches(use_numpy):
+    """Test a step is not suggested as similar to itself"""
+    index = StepSimilarityIndex(use_numpy=use_numpy)
+    index.add(APPROVED)
+
+    [suggestions] = index.search(["my cart contains 7 items"], min_score=0.0)
+
+    assert "my cart contains 3 items" not in [found.text for found in suggestions]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_add_is_incremental_and_deduplicated(use_numpy):
+    """Test adding skips known steps and grows past the initial capacity"""
+    index = StepSimilarityIndex(use_numpy=use_numpy)
+
+    assert index.add(APPROVED) == 4
+    assert index.add([KnownStep("my cart contains 10 items", "features/other.feature")]) == 0
+    assert index.add(KnownStep(f"step number {i} of many", "f.feature") for i in range(2000)) == 1
+    assert index.add(KnownStep(f"generated step {word}", "f.feature") for word in "abcdefgh") == 8
+    assert len(index) == 13
+
+    [suggestions] = index.search(["generated step h"], min_score=0.0)
+    assert suggestions[0].text.startswith("generated step")
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_concurrent_adds_keep_rows_consistent(tmp_path, use_numpy):
+    """Test adds and saves from several threads neither lose nor misnumber steps"""
+    index = StepSimilarityIndex(use_numpy=use_numpy)
+    words = ["".join(letters) for letters in product("abcdefghij", repeat=3)][:200]
+    batches = [
+        [KnownStep(f"batch {batch} step {word}", "f.feature") for word in words]
+        for batch in "klmnopqr"
+    ]
+
+    def learn(batch):
+        added = index.add(batch)
+        index.save(tmp_path / "steps")
+        return added
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        added = sum(pool.map(learn, batches))
+
+    assert added == len(index) == 1600
+    assert all(normalize_step(index.steps[row].text) == key for key, row in index._keys.items())
+    assert len(StepSimilarityIndex.load(tmp_path / "steps", use_numpy=use_numpy)) == 1600
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_save_and_load_round_trip(tmp_path, use_numpy):
+    """Test a saved index loads with the same steps and answers the same"""
+    index = StepSimilarityIndex(use_numpy=use_numpy)
+    index.add(APPROVED)
+    index.save(tmp_path / "steps")
+
+    loaded = StepSimilarityIndex.load(tmp_path / "steps", use_numpy=use_numpy)
+    loaded.add([KnownStep("I open the checkout page", "features/checkout.feature")])
+
+    query = ["I pay with the saved card"]
+    assert loaded.steps[:4] == index.steps
+    assert loaded.search(query) == index.search(query)
+    assert len(loaded) == 5
+
+
+def test_workers_saving_to_one_path_keep_each_others_steps(tmp_path, monkeypatch):
+    """Test each worker merges what the others saved before overwriting the files"""
+    workers = [StepSimilarityIndex(use_numpy=False), StepSimilarityIndex(use_numpy=False)]
+    monkeypatch.setattr(step_similarity, "_index_path", lambda: tmp_path / "steps")
+
+    batches = [APPROVED[:1], APPROVED[1:2], APPROVED[2:]]
+    for worker, steps in zip(workers + workers[:1], batches, strict=True):
+        monkeypatch.setattr(step_similarity, "get_step_similarity", lambda worker=worker: worker)
+        assert step_similarity.learn_steps(steps) == len(steps)
+
+    saved = StepSimilarityIndex.load(tmp_path / "steps", use_numpy=False)
+    assert sorted(step.text for step in saved.steps) == sorted(step.text for step in APPROVED)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["steps.json", "steps.lock"]
+
+
+def test_load_missing_index_is_empty(tmp_path):
+    """Test loading where nothing was saved gives an empty index"""
+    assert len(StepSimilarityIndex.load(tmp_path / "missing")) == 0
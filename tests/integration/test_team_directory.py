@@ -0,0 +1,31 @@
+"""
+Integration Tests: Team Directory
+Tests for backend/services/team_directory.py
+"""
+
+import pytest
+from backend.services.team_directory import get_team_members, team_directory_key
+
+
+@pytest.mark.asyncio
+async def test_get_team_members_populates_cache(fake_redis, mock_issue_tracker):
+    """Test first lookup loads members from the tracker and caches them"""
+    members = await get_team_members("team-1", issue_tracker=mock_issue_tracker)
+
+    assert [user.name for user in members] == ["Dev One", "Dev Two"]
+    assert team_directory_key("team-1") in fake_redis.store
+
+
+@pytest.mark.asyncio
+async def test_get_team_members_served_from_cache(fake_redis, mock_issue_tracker):
+    """Test cached directory is used without calling the tracker"""
+    await get_team_members("team-1", issue_tracker=mock_issue_tracker)
+
+    async def fail_get_users(team_id):
+        raise AssertionError("tracker should not be called on a cache hit")
+
+    mock_issue_tracker.get_users = fail_get_users
+    members = await get_team_members("team-1", issue_tracker=mock_issue_tracker)
+
+    assert len(members) == 2
+    assert members[0].email == "dev1@buckler.ai"
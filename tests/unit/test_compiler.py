@@ -0,0 +1,104 @@
+"""
+Unit Tests: Spec Compiler
+Tests for backend/gherkin/compiler.py
+"""
+
+import pytest
+from backend.gherkin.compiler import SpecCompileError, compile_spec, decompile_feature
+from backend.gherkin.parsing import parse_gherkin
+from backend.gherkin.validation import validate_gherkin
+
+
+def test_compile_spec_produces_valid_gherkin(sample_spec_yaml):
+    """Test compiled spec is valid Gherkin and ignores the analysis section"""
+    compiled = compile_spec(sample_spec_yaml)
+
+    assert compiled.text.startswith("Feature: User Login\n")
+    assert "analysis" not in compiled.text
+    result = validate_gherkin(compiled.text)
+    assert result.is_valid is True
+    assert result.scenario_count == 1
+    assert result.step_count == 3
+
+
+def test_compile_spec_maps_lines_to_yaml(sample_spec_yaml):
+    """Test every step line maps back to the YAML line it came from"""
+    compiled = compile_spec(sample_spec_yaml)
+    yaml_lines = sample_spec_yaml.splitlines()
+
+    for number, line in enumerate(compiled.text.splitlines(), 1):
+        if line.strip().startswith(("Given ", "When ", "Then ")):
+            step_text = line.strip().split(" ", 1)[1]
+            assert step_text in yaml_lines[compiled.source_line(number) - 1]
+
+
+def test_compile_spec_outline_with_examples():
+    """Test scenarios with examples compile to outlines with a table"""
+    spec = """feature:
+  title: Search
+  scenarios:
+    - scenario: Find products
+      given: ["I search for <term>"]
+      then: ["I see <count> results"]
+      examples:
+        - {term: shoes, count: 3}
+        - {term: "a|b", count: 0}
+"""
+    compiled = compile_spec(spec)
+
+    assert "Scenario Outline: Find products" in compiled.text
+    assert "| a\\|b  | 0     |" in compiled.text
+    assert validate_gherkin(compiled.text).scenario_count == 2
+
+
+def test_compile_spec_reports_yaml_error_line():
+    """Test invalid YAML raises with the offending line"""
+    with pytest.raises(SpecCompileError) as error:
+        compile_spec("feature:\n  title: x\n  scenarios: [unclosed\n")
+
+    assert error.value.line >= 3
+
+
+def test_compile_spec_requires_feature():
+    """Test a spec without a feature section is rejected"""
+    with pytest.raises(SpecCompileError):
+        compile_spec("analysis:\n  summary: x\n")
+
+
+def test_decompile_round_trip(sample_spec_yaml):
+    """Test .feature -> YAML -> .feature reproduces the compiled text"""
+    compiled = compile_spec(sample_spec_yaml)
+    spec = decompile_feature(compiled.text)
+
+    assert compile_spec(spec.text).text == compiled.text
+
+
+def test_decompile_flattens_rules_and_backgrounds():
+    """Test rules, backgrounds and And steps are mapped to the spec schema"""
+    content = """Feature: Accounts
+
+  Background:
+    Given the service is up
+
+  Rule: Sign in
+    Scenario: Valid user
+      Given a user
+      And a password
+      When they sign in
+      Then they see the dashboard
+"""
+    spec = decompile_feature(content)
+    feature = parse_gherkin(compile_spec(spec.text).text)
+
+    assert "background:" in spec.text
+    assert [scenario.name for scenario in feature.scenarios] == ["Valid user"]
+    assert [step.text for step in feature.scenarios[0].steps][:2] == ["a user", "a password"]
+    assert spec.source_line(spec.text.splitlines().index('        - "a password"') + 1) == 9
+
+
+def test_decompile_reports_parse_error_line():
+    """Test invalid Gherkin raises with the parser's line"""
+    with pytest.raises(SpecCompileError) as error:
+        decompile_feature("Feature: Broken\n\n  Scenario: x\n    Given a\n  Nonsense here\n")
+
+    assert error.value.line == 5
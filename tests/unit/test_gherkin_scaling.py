@@ -0,0 +1,62 @@
+"""
+Unit Tests: Gherkin Scaling Benchmark
+Tests for benchmarks/gherkin_scaling.py
+"""
+
+import pytest
+from backend.gherkin.parsing import parse_gherkin
+from backend.gherkin.validation import validate_gherkin
+from benchmarks.gherkin_scaling import (
+    VARIANTS,
+    build_feature,
+    fitted_exponent,
+    measure,
+    scaling_exponents,
+)
+
+
+@pytest.mark.parametrize("variant", sorted(VARIANTS))
+def test_generated_features_are_valid(variant):
+    """Test every corpus shape is valid Gherkin with the requested scenarios"""
+    shape = VARIANTS[variant]
+    result = validate_gherkin(build_feature(8, shape))
+
+    # Scenarios 4 and 8 are outlines, each expanding to one pickle per Examples row
+    outlines = 2 if shape.outline_rows else 0
+    assert result.is_valid
+    assert result.scenario_count == 8 - outlines + outlines * shape.outline_rows
+
+
+def test_generated_features_include_tables_and_doc_strings():
+    """Test the rich shape exercises doc strings, data tables and Examples"""
+    parsed = parse_gherkin(build_feature(4, VARIANTS["i18n-fr"]))
+
+    steps = [step for scenario in parsed.scenarios for step in scenario.steps]
+    assert any(step.doc_string for step in steps)
+    assert any(step.data_table for step in steps)
+    assert parsed.scenarios[3].examples[0].table[0] == ("quantity",)
+
+
+def test_scaling_exponents():
+    """Test pairwise exponents, with None where a value is zero"""
+    assert scaling_exponents([(10, 1.0), (20, 2.0), (40, 8.0), (80, 0.0)]) == [
+        pytest.approx(1.0),
+        pytest.approx(2.0),
+        None,
+    ]
+
+
+def test_fitted_exponent():
+    """Test the least-squares slope recovers a power law"""
+    assert fitted_exponent([(n, 3 * n**2) for n in (5, 20, 100, 500)]) == pytest.approx(2.0)
+    assert fitted_exponent([(5, 0.0), (20, 1.0)]) is None
+
+
+def test_measure_reports_time_and_memory():
+    """Test a measurement has positive time and peak memory"""
+    result = measure("validate_gherkin", "plain", 5, repeat=1)
+
+    assert result.scenarios == 5
+    assert result.ms > 0
+    assert result.peak_kib > 0
+    assert result.retained_kib >= 0
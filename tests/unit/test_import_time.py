@@ -0,0 +1,36 @@
+"""
+Unit Tests: Import-time Audit
+Tests for benchmarks/import_time.py
+"""
+
+from benchmarks.import_time import (
+    ImportTiming,
+    eager_lazy_packages,
+    measure_imports,
+    parse_importtime,
+)
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      1500 |       1620 | backend.app
+"""
+
+
+def test_parse_importtime():
+    """Test -X importtime lines become timings with nesting depth"""
+    assert parse_importtime(SAMPLE) == [
+        ImportTiming(module="_io", self_us=120, cumulative_us=120, depth=1),
+        ImportTiming(module="backend.app", self_us=1500, cumulative_us=1620, depth=0),
+    ]
+
+
+def test_eager_lazy_packages_matches_submodules():
+    """Test a lazy package counts as loaded when any submodule is"""
+    timings = [ImportTiming(module="github.Repository", self_us=1, cumulative_us=1, depth=0)]
+
+    assert eager_lazy_packages(timings) == ["github"]
+
+
+def test_app_boot_skips_lazy_integrations():
+    """Test importing the app does not load PyGithub"""
+    assert eager_lazy_packages(measure_imports("backend.app")) == []
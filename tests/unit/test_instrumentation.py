@@ -0,0 +1,82 @@
+"""
+Unit Tests: Instrumentation
+Tests for backend/instrumentation.py
+"""
+
+import pytest
+from backend.instrumentation import (
+    Histogram,
+    server_timing,
+    span,
+    start_request_timings,
+    stop_request_timings,
+    timed,
+)
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Test observations land in every bucket at or above their value"""
+    histogram = Histogram("demo_seconds", "Demo", (0.1, 1.0))
+    histogram.observe(0.05, route="/a")
+    histogram.observe(0.5, route="/a")
+
+    lines = histogram.render()
+
+    assert 'demo_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{route="/a",le="1.0"} 2' in lines
+    assert 'demo_seconds_bucket{route="/a",le="+Inf"} 2' in lines
+    assert 'demo_seconds_count{route="/a"} 2' in lines
+    assert "# TYPE demo_seconds histogram" in lines
+
+
+def test_spans_accumulate_per_request():
+    """Test repeated spans add up in the request's timings"""
+    timings, token = start_request_timings()
+    try:
+        with span("linear"):
+            pass
+        with span("linear"):
+            pass
+    finally:
+        stop_request_timings(token)
+
+    with span("linear"):
+        pass
+
+    assert list(timings) == ["linear"]
+    assert timings["linear"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_timed_wraps_async_functions():
+    """Test the decorator awaits coroutines inside the span"""
+
+    @timed("gemini")
+    async def call():
+        return "done"
+
+    timings, token = start_request_timings()
+    try:
+        assert await call() == "done"
+    finally:
+        stop_request_timings(token)
+
+    assert "gemini" in timings
+
+
+def test_span_records_errors():
+    """Test a failing block still records its time"""
+    timings, token = start_request_timings()
+    try:
+        with pytest.raises(ValueError):
+            with span("gherkin_parse"):
+                raise ValueError("bad")
+    finally:
+        stop_request_timings(token)
+
+    assert "gherkin_parse" in timings
+
+
+def test_server_timing_header():
+    """Test spans and total are rendered in milliseconds"""
+    assert server_timing({"linear": 0.0412}, 0.0479) == "linear;dur=41.2, app;dur=47.9"
@@ -0,0 +1,37 @@
+"""
+Unit Tests: Integration Registry
+Tests for backend/integrations.py
+"""
+
+import pytest
+from backend import integrations
+from backend.integrations import IntegrationUnavailable, load_integration
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Registry with test-only entries"""
+    monkeypatch.setitem(integrations.INTEGRATIONS, "json", "json:JSONDecoder")
+    monkeypatch.setitem(integrations.INTEGRATIONS, "missing", "not_installed_sdk:Client")
+    load_integration.cache_clear()
+    yield
+    load_integration.cache_clear()
+
+
+def test_load_integration_imports_on_first_use(registry):
+    """Test the registered attribute is imported and returned"""
+    import json
+
+    assert load_integration("json") is json.JSONDecoder
+
+
+def test_load_integration_missing_dependency(registry):
+    """Test a missing optional dependency is reported as unavailable"""
+    with pytest.raises(IntegrationUnavailable, match="missing integration unavailable"):
+        load_integration("missing")
+
+
+def test_load_integration_unknown_name(registry):
+    """Test unregistered names are rejected"""
+    with pytest.raises(KeyError):
+        load_integration("nope")
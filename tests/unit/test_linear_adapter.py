@@ -0,0 +1,167 @@
+"""
+Unit Tests: Linear Adapter
+Tests for backend/adapters/linear.py
+"""
+
+import json
+import httpx
+import pytest
+from backend.adapters import linear
+from backend.adapters.linear import (
+    LinearAdapter,
+    LinearAPIError,
+    remember_issue_id,
+    remember_issue_team,
+)
+from backend.services.linear_scheduler import LinearScheduler
+
+
+@pytest.fixture
+def linear_requests():
+    """Record GraphQL documents sent to Linear and reply from canned data"""
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        sent.append(body)
+        query = body["query"]
+
+        if "issueUpdate" in query:
+            return httpx.Response(200, json={"data": {"issueUpdate": {"success": True}}})
+        if "commentCreate" in query:
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "commentCreate": {
+                            "success": True,
+                            "comment": {
+                                "id": "comment-1",
+                                "body": body["variables"]["input"]["body"],
+                                "createdAt": "2025-01-01T00:00:00Z",
+                                "user": {"id": "user-123"},
+                            },
+                        }
+                    }
+                },
+            )
+        if "workflowStates" in query:
+            # Every team has its own "Approved" state
+            team_id = body["variables"]["teamId"]
+            states = [{"id": f"{team_id}-approved", "name": "Approved"}]
+            return httpx.Response(200, json={"data": {"workflowStates": {"nodes": states}}})
+        issue = {"id": "uuid-looked-up", "identifier": "TEST-999", "team": {"id": "team-1"}}
+        return httpx.Response(200, json={"data": {"issue": issue}})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return sent, LinearAdapter("token", scheduler=LinearScheduler(client))
+
+
+@pytest.fixture(autouse=True)
+def clear_linear_caches():
+    """Isolate the module-level identifier and state caches between tests"""
+    linear._issue_uuids.clear()
+    linear._issue_teams.clear()
+    linear._workflow_state_ids.clear()
+    yield
+    linear._issue_uuids.clear()
+    linear._issue_teams.clear()
+    linear._workflow_state_ids.clear()
+
+
+@pytest.mark.asyncio
+async def test_update_issue_uses_cached_uuid(linear_requests):
+    """Test assignee update sends one issueUpdate when UUID is cached"""
+    sent, adapter = linear_requests
+    remember_issue_id("TEST-123", "uuid-123")
+
+    await adapter.update_issue("TEST-123", assignee_id="user-new")
+
+    assert len(sent) == 1
+    assert sent[0]["variables"] == {"id": "uuid-123", "input": {"assigneeId": "user-new"}}
+
+
+@pytest.mark.asyncio
+async def test_add_comment_sends_single_mutation(linear_requests):
+    """Test comment creation sends one commentCreate when UUID is cached"""
+    sent, adapter = linear_requests
+    remember_issue_id("TEST-123", "uuid-123")
+
+    comment = await adapter.add_comment("TEST-123", "Looks good")
+
+    assert len(sent) == 1
+    assert sent[0]["variables"]["input"] == {"issueId": "uuid-123", "body": "Looks good"}
+    assert comment.issue_id == "TEST-123"
+    assert comment.content == "Looks good"
+
+
+@pytest.mark.asyncio
+async def test_uuid_resolved_once_then_cached(linear_requests):
+    """Test identifier lookup happens only on the first mutation"""
+    sent, adapter = linear_requests
+
+    await adapter.add_comment("TEST-999", "First")
+    await adapter.add_comment("TEST-999", "Second")
+
+    assert len(sent) == 3
+    assert sent[2]["variables"]["input"]["issueId"] == "uuid-looked-up"
+
+
+@pytest.mark.asyncio
+async def test_workflow_states_loaded_once(linear_requests):
+    """Test status updates resolve a team's workflow states only once per process"""
+    sent, adapter = linear_requests
+    remember_issue_id("TEST-123", "uuid-123")
+    remember_issue_team("uuid-123", "team-1")
+
+    await adapter.update_issue("TEST-123", status="Approved")
+    await adapter.update_issue("TEST-123", status="Approved")
+
+    state_queries = [body for body in sent if "workflowStates" in body["query"]]
+    assert len(state_queries) == 1
+    assert sent[-1]["variables"]["input"] == {"stateId": "team-1-approved"}
+
+
+@pytest.mark.asyncio
+async def test_workflow_states_resolved_in_the_issues_team(linear_requests):
+    """Test the same state name resolves to each issue's own team's state"""
+    sent, adapter = linear_requests
+    remember_issue_id("ENG-1", "uuid-eng")
+    remember_issue_team("uuid-eng", "team-eng")
+    remember_issue_id("DES-1", "uuid-des")
+    remember_issue_team("uuid-des", "team-des")
+
+    await adapter.update_issue("ENG-1", status="Approved")
+    await adapter.update_issue("DES-1", status="Approved")
+
+    updates = [body["variables"] for body in sent if "issueUpdate" in body["query"]]
+    assert updates == [
+        {"id": "uuid-eng", "input": {"stateId": "team-eng-approved"}},
+        {"id": "uuid-des", "input": {"stateId": "team-des-approved"}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_issue_team_looked_up_when_unknown(linear_requests):
+    """Test a status update finds the issue's team before resolving the state"""
+    sent, adapter = linear_requests
+
+    await adapter.update_issue("TEST-999", status="Approved")
+
+    assert sent[-1]["variables"] == {
+        "id": "uuid-looked-up",
+        "input": {"stateId": "team-1-approved"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_unknown_status_sends_no_routing_comment(linear_requests):
+    """Test a status the issue's team doesn't have fails before anything is posted"""
+    sent, adapter = linear_requests
+    remember_issue_id("TEST-123", "uuid-123")
+    remember_issue_team("uuid-123", "team-1")
+
+    with pytest.raises(LinearAPIError):
+        await adapter.update_issue_with_comment("TEST-123", "Routed", status="Shipped")
+
+    assert not [body for body in sent if "commentCreate" in body["query"]]
@@ -0,0 +1,180 @@
+"""
+Unit Tests: Linear Request Scheduler
+Tests for backend/services/linear_scheduler.py
+"""
+
+import asyncio
+import json
+import time
+import httpx
+import pytest
+from backend.services.linear_scheduler import (
+    LinearScheduler,
+    Priority,
+    RateLimitBudget,
+    token_label,
+)
+
+
+def make_scheduler(handler, **kwargs) -> LinearScheduler:
+    """Scheduler backed by a mock transport with no real backoff delay"""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return LinearScheduler(client, backoff_base=0.0, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_records_rate_limit_budget():
+    """Test budget headers are tracked per token"""
+
+    def handler(request):
+        return httpx.Response(
+            200,
+            json={"data": {}},
+            headers={
+                "X-RateLimit-Requests-Limit": "1500",
+                "X-RateLimit-Requests-Remaining": "1499",
+                "X-RateLimit-Complexity-Remaining": "249000",
+                "X-Complexity": "12",
+            },
+        )
+
+    scheduler = make_scheduler(handler)
+    await scheduler.post("secret-token", {"query": "{ viewer { id } }"})
+
+    budget = scheduler.budgets[token_label("secret-token")]
+    assert budget.requests_limit == 1500
+    assert budget.requests_remaining == 1499
+    assert budget.complexity_remaining == 249000
+    assert budget.last_complexity == 12
+
+
+@pytest.mark.asyncio
+async def test_retries_rate_limited_and_server_errors():
+    """Test 429, RATELIMITED and 5xx responses are retried"""
+    responses = [
+        httpx.Response(429),
+        httpx.Response(400, json={"errors": [{"extensions": {"code": "RATELIMITED"}}]}),
+        httpx.Response(502),
+        httpx.Response(200, json={"data": {"ok": True}}),
+    ]
+
+    scheduler = make_scheduler(lambda request: responses.pop(0))
+    response = await scheduler.post("token", {"query": "{ ok }"})
+
+    assert response.status_code == 200
+    assert scheduler.retries_total == 3
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries():
+    """Test the last failed response is returned once retries are exhausted"""
+    scheduler = make_scheduler(lambda request: httpx.Response(503), max_retries=2)
+    response = await scheduler.post("token", {"query": "{ ok }"})
+
+    assert response.status_code == 503
+    assert scheduler.retries_total == 2
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_jump_the_queue():
+    """Test waiting interactive requests run before waiting background requests"""
+    order = []
+    release = asyncio.Event()
+
+    async def handler(request):
+        order.append(request.read().decode())
+        if len(order) == 1:
+            await release.wait()
+        return httpx.Response(200, json={"data": {}})
+
+    scheduler = make_scheduler(handler, max_concurrency=1)
+
+    first = asyncio.create_task(scheduler.post("token", {"query": "first"}))
+    await asyncio.sleep(0)
+    background = asyncio.create_task(
+        scheduler.post("token", {"query": "background"}, priority=Priority.BACKGROUND)
+    )
+    interactive = asyncio.create_task(scheduler.post("token", {"query": "interactive"}))
+    await asyncio.sleep(0)
+
+    assert scheduler.queue_depth == 2
+    release.set()
+    await asyncio.gather(first, background, interactive)
+
+    assert [json.loads(body)["query"] for body in order] == ["first", "interactive", "background"]
+
+
+@pytest.mark.asyncio
+async def test_metrics_never_expose_token():
+    """Test Prometheus output labels budgets by token hash"""
+    scheduler = make_scheduler(
+        lambda request: httpx.Response(
+            200, json={"data": {}}, headers={"X-RateLimit-Requests-Remaining": "10"}
+        )
+    )
+    await scheduler.post("secret-token", {"query": "{ ok }"})
+
+    metrics = scheduler.render_metrics()
+    assert "secret-token" not in metrics
+    label = token_label("secret-token")
+    assert f'linear_rate_limit_requests_remaining{{token="{label}"}} 10' in metrics
+    assert 'linear_requests_total{priority="interactive"} 1' in metrics
+
+
+@pytest.mark.asyncio
+async def test_mutations_only_retried_when_not_applied():
+    """Test a failed mutation is resent only after a rate limit or a failed connect"""
+    mutation = {"query": "mutation { issueCreate(input: {}) { success } }"}
+
+    scheduler = make_scheduler(lambda request: httpx.Response(502))
+    assert (await scheduler.post("token", mutation)).status_code == 502
+    assert scheduler.retries_total == 0
+
+    responses = [httpx.Response(429), httpx.Response(200, json={"data": {}})]
+    scheduler = make_scheduler(lambda request: responses.pop(0))
+    assert (await scheduler.post("token", mutation)).status_code == 200
+    assert scheduler.retries_total == 1
+
+    def read_timeout(request):
+        raise httpx.ReadTimeout("no response", request=request)
+
+    scheduler = make_scheduler(read_timeout)
+    with pytest.raises(httpx.ReadTimeout):
+        await scheduler.post("token", mutation)
+    assert scheduler.retries_total == 0
+
+    attempts = []
+
+    def connect_then_succeed(request):
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"data": {}})
+
+    scheduler = make_scheduler(connect_then_succeed)
+    assert (await scheduler.post("token", mutation)).status_code == 200
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_budget_wait_does_not_hold_a_slot():
+    """Test a token waiting for its reset does not block another token's requests"""
+    scheduler = make_scheduler(
+        lambda request: httpx.Response(200, json={"data": {}}), max_concurrency=1
+    )
+    budget = scheduler.budgets.setdefault(token_label("exhausted"), RateLimitBudget())
+    budget.requests_limit = 100
+    budget.requests_remaining = 0
+    budget.requests_reset_ms = time.time() * 1000 + 1000
+
+    waiting = asyncio.create_task(
+        scheduler.post("exhausted", {"query": "{ a }"}, priority=Priority.BACKGROUND)
+    )
+    await asyncio.sleep(0.05)
+
+    start = time.perf_counter()
+    await scheduler.post("healthy", {"query": "{ b }"})
+
+    assert time.perf_counter() - start < 0.5
+    assert not waiting.done()
+    waiting.cancel()
@@ -0,0 +1,138 @@
+"""
+Unit Tests: Load Test
+Tests for benchmarks/load_test.py
+"""
+
+import asyncio
+import json
+import time
+import httpx
+import pytest
+from backend.services.linear_webhooks import is_fresh, verify_signature
+from benchmarks.load_test import (
+    WEBHOOK_SECRET,
+    LoopLagMonitor,
+    Recorder,
+    Sample,
+    SpecEditor,
+    compare_to_baseline,
+    login,
+    percentile,
+    summarize,
+)
+from fakes.server import create_app
+
+
+def report(p95: float, errors: int = 0, loop_lag_p99: float = 1.0) -> dict:
+    return {
+        "loop_lag_p99": loop_lag_p99,
+        "endpoints": {"GET /features/": {"count": 100, "errors": errors, "p95": p95, "p99": p95}},
+    }
+
+
+def test_percentile_interpolates():
+    """Test percentiles interpolate between closest ranks"""
+    assert percentile([4, 1, 3, 2], 50) == 2.5
+    assert percentile([1, 2, 3, 4], 100) == 4
+    assert percentile([], 99) == 0.0
+
+
+def test_summarize_groups_by_endpoint():
+    """Test per-endpoint counts, errors, throughput and latency in ms"""
+    samples = [
+        Sample("GET /features/", 0.010, 200),
+        Sample("GET /features/", 0.030, 500),
+        Sample("GET /auth/linear", 0.002, 307),
+    ]
+
+    stats = summarize(samples, elapsed=2.0)
+
+    assert list(stats) == ["GET /auth/linear", "GET /features/"]
+    assert stats["GET /features/"].count == 2
+    assert stats["GET /features/"].errors == 1
+    assert stats["GET /features/"].throughput == 1.0
+    assert stats["GET /features/"].p50 == pytest.approx(20.0)
+
+
+def test_compare_to_baseline_flags_regressions():
+    """Test latency, error-rate and loop-lag regressions beyond tolerance and slack"""
+    baseline = report(p95=100.0)
+
+    assert compare_to_baseline(report(p95=120.0), baseline) == []
+    assert len(compare_to_baseline(report(p95=200.0), baseline)) == 2
+    assert compare_to_baseline(report(p95=100.0, errors=5), baseline) == [
+        "GET /features/: error rate 5.0% > baseline 0.0%"
+    ]
+    assert compare_to_baseline(report(p95=100.0, loop_lag_p99=50.0), baseline) == [
+        "event loop lag p99 50.0 ms > baseline 1.0 ms"
+    ]
+    assert compare_to_baseline({"loop_lag_p99": 1.0, "endpoints": {}}, baseline) == [
+        "GET /features/: not exercised"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_monitor_sees_blocking_calls():
+    """Test a blocking call shows up as event-loop lag"""
+    monitor = LoopLagMonitor(interval=0.005)
+    monitor.start()
+    await asyncio.sleep(0.01)
+    time.sleep(0.05)
+    await asyncio.sleep(0.01)
+    monitor.stop()
+
+    assert max(monitor.lags) >= 40
+
+
+@pytest.mark.asyncio
+async def test_login_follows_oauth_redirects_to_app_callback():
+    """Test login requests only the callback path on the app, whatever its redirect host"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/auth/linear":
+            return httpx.Response(307, headers={"location": "http://fakes/oauth/authorize"})
+        if request.url.path == "/oauth/authorize":
+            location = "http://localhost:8030/auth/callback?code=abc"
+            return httpx.Response(307, headers={"location": location})
+        return httpx.Response(303, headers={"set-cookie": "session_id=s1; Path=/"})
+
+    recorder = Recorder()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://app")
+
+    await login(client, recorder)
+
+    assert [sample.endpoint for sample in recorder.samples] == [
+        "GET /auth/linear",
+        "GET /auth/callback",
+    ]
+    assert client.cookies["session_id"] == "s1"
+
+
+@pytest.mark.asyncio
+async def test_spec_editor_changes_the_spec_on_every_edit():
+    """Test each edit saves new spec text to Linear and delivers a signed webhook"""
+    fakes = create_app("http://fakes", issue_count=2)
+    linear = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=fakes), base_url="http://fakes/linear"
+    )
+    deliveries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        signature = request.headers["linear-signature"]
+        assert verify_signature(request.content, signature, WEBHOOK_SECRET)
+        deliveries.append(json.loads(request.content))
+        return httpx.Response(200, json={"status": "ok"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://app")
+    editor = SpecEditor(linear)
+    recorder = Recorder()
+
+    assert await editor.edit(client, recorder, "ENG-1")
+    assert await editor.edit(client, recorder, "ENG-1")
+    assert not await editor.edit(client, recorder, "DES-2")  # No spec to edit
+
+    first, second = (delivery["data"]["description"] for delivery in deliveries)
+    assert "(revision 1)" in first and "(revision 2)" in second
+    assert deliveries[1]["updatedFrom"]["description"] == first
+    assert all(is_fresh(delivery) for delivery in deliveries)
+    assert [sample.endpoint for sample in recorder.samples] == ["POST /webhooks/linear"] * 2
@@ -4,7 +4,8 @@ Tests for backend/gherkin/parsing.py
 """
 
 import pytest
-from backend.gherkin.parsing import parse_gherkin, ParsedFeature
+from backend.gherkin.parsing import parse_gherkin, ParsedFeature, Table
+from backend.gherkin.validation import validate_gherkin
 
 
 def test_parse_gherkin_valid(sample_gherkin_valid):
@@ -100,7 +101,7 @@ def test_parse_gherkin_with_scenario_outline():
     assert result is not None
     assert len(result.scenarios) == 1
     assert result.scenarios[0].examples is not None
-    assert len(result.scenarios[0].examples) == 3  # Header + 2 rows
+    assert len(result.scenarios[0].examples[0].table) == 3  # Header + 2 rows
 
 
 def test_parse_gherkin_invalid():
@@ -116,3 +117,108 @@ def test_parse_gherkin_empty():
     result = parse_gherkin("")
 
     assert result is None
+
+
+def test_table_rows_from_flat_cells():
+    """Test a table indexes and iterates rows over its flat cell tuple"""
+    table = Table.from_rows([["a", "b"], ["1", "2"], ["3", "4"]])
+
+    assert table.cells == ("a", "b", "1", "2", "3", "4")
+    assert len(table) == 3
+    assert table[0] == ("a", "b")
+    assert table[-1] == ("3", "4")
+    assert list(table) == [("a", "b"), ("1", "2"), ("3", "4")]
+    assert not Table.from_rows([])
+
+
+def test_parsed_feature_is_slotted_and_immutable():
+    """Test parsed models carry no per-instance dict and reject mutation"""
+    content = """Feature: Cart
+  Scenario: Add
+    Given a cart
+      | item | qty |
+      | pen  | 2   |
+"""
+    result = parse_gherkin(content)
+    step = result.scenarios[0].steps[0]
+
+    assert not hasattr(step, "__dict__")
+    assert step.data_table[1] == ("pen", "2")
+    with pytest.raises(AttributeError):
+        step.text = "changed"
+
+
+RULES_FEATURE = """@billing
+Feature: Invoices
+  Background:
+    Given I am signed in
+
+  Scenario: List invoices
+    When I open invoices
+    Then I see my invoices
+
+  Rule: Refunds need approval
+    Background:
+      Given I am a manager
+
+    @refund
+    Scenario Outline: Refund <amount>
+      When I refund <amount>
+      Then the refund is <status>
+
+      @small
+      Examples: Small
+        | amount | status   |
+        | 5      | approved |
+        | 10     | approved |
+
+      @large
+      Examples: Large
+        | amount | status  |
+        | 5000   | pending |
+"""
+
+
+def test_parse_gherkin_rules_backgrounds_and_all_examples():
+    """Test rules, backgrounds and every Examples block are converted"""
+    result = parse_gherkin(RULES_FEATURE)
+
+    assert result.background.steps[0].text == "I am signed in"
+    assert [scenario.name for scenario in result.scenarios] == ["List invoices"]
+
+    rule = result.rules[0]
+    assert rule.name == "Refunds need approval"
+    assert rule.background.steps[0].text == "I am a manager"
+
+    outline = rule.scenarios[0]
+    assert outline.tags == ("@refund",)
+    assert [examples.name for examples in outline.examples] == ["Small", "Large"]
+    assert [examples.tags for examples in outline.examples] == [("@small",), ("@large",)]
+    assert outline.examples[1].table[1] == ("5000", "pending")
+    assert (outline.steps[0].line, outline.steps[0].column) == (16, 7)
+
+
+def test_parse_gherkin_counts_match_compiled_pickles():
+    """Test single-pass counts equal the pickle compiler's"""
+    result = parse_gherkin(RULES_FEATURE)
+    validation = validate_gherkin(RULES_FEATURE)
+
+    assert (result.scenario_count, result.step_count) == (4, 15)
+    assert (result.scenario_count, result.step_count) == (
+        validation.scenario_count,
+        validation.step_count,
+    )
+
+
+def test_outline_rows_expand_lazily_across_examples():
+    """Test outline rows are indexed across Examples blocks with values filled in"""
+    outline = parse_gherkin(RULES_FEATURE).rules[0].scenarios[0]
+    rows = outline.rows
+
+    assert len(rows) == 3
+    assert rows[2].name == "Refund 5000"
+    assert [step.text for step in rows[2].steps] == ["I refund 5000", "the refund is pending"]
+    assert rows[2].tags == ("@refund", "@large")
+    assert [row.name for row in rows] == ["Refund 5", "Refund 10", "Refund 5000"]
+    with pytest.raises(IndexError):
+        rows[3]
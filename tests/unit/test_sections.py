@@ -0,0 +1,60 @@
+"""
+Unit Tests: Issue Description Sections
+Tests for backend/gherkin/sections.py
+"""
+
+from backend.gherkin.sections import parse_description, top_level_block
+
+
+def test_parse_description_sections(sample_issue_description):
+    """Test plain text, metadata, analysis and spec are split apart"""
+    sections = parse_description(sample_issue_description)
+
+    assert sections.plain_text == "Users need to sign in."
+    assert sections.request_type == "feature"
+    assert sections.priority == "2"
+    assert sections.analysis_text.startswith("## Overview")
+    assert sections.spec["feature"]["title"] == "User Login"
+    assert sections.analysis["summary"] == "User signs in"
+
+
+def test_feature_yaml_excludes_analysis(sample_issue_description):
+    """Test the editor content is only the feature section, in its original text"""
+    sections = parse_description(sample_issue_description)
+
+    assert sections.feature_yaml.startswith("feature:\n")
+    assert 'title: "User Login"' in sections.feature_yaml
+    assert "analysis:" not in sections.feature_yaml
+
+
+def test_parse_description_is_memoized(sample_issue_description):
+    """Test the same description text is parsed once"""
+    first = parse_description(sample_issue_description)
+    second = parse_description("".join(list(sample_issue_description)))
+
+    assert first is second
+
+
+def test_parse_description_plain_text_only():
+    """Test descriptions without sections have no metadata or spec"""
+    sections = parse_description("Just a bug report")
+
+    assert sections.plain_text == "Just a bug report"
+    assert sections.request_type == ""
+    assert sections.priority is None
+    assert sections.spec is None
+    assert sections.analysis is None
+
+
+def test_parse_description_falls_back_to_analysis_yaml(sample_spec_yaml):
+    """Test older descriptions with YAML only in the AI response still have a spec"""
+    description = f"Text\n\n## AI Analysis\n\n```yaml\n{sample_spec_yaml}```\n"
+    sections = parse_description(description)
+
+    assert sections.spec["feature"]["title"] == "User Login"
+    assert sections.analysis["edge_cases"] == ["Wrong password"]
+
+
+def test_top_level_block_missing_key():
+    """Test slicing a key that is not present"""
+    assert top_level_block("analysis:\n  summary: x\n", "feature") == ""
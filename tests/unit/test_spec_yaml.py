@@ -0,0 +1,37 @@
+"""
+Unit Tests: Spec YAML
+Tests for backend/gherkin/spec_yaml.py
+"""
+
+import pytest
+import yaml
+from backend.gherkin.spec_yaml import clear_spec_cache, dump_spec_yaml, load_spec_yaml
+
+
+def test_load_spec_yaml_matches_safe_load(sample_spec_yaml):
+    """Test the accelerated loader parses the same document as yaml.safe_load"""
+    assert load_spec_yaml(sample_spec_yaml) == yaml.safe_load(sample_spec_yaml)
+
+
+def test_load_spec_yaml_caches_by_content(sample_spec_yaml):
+    """Test identical content returns the cached document"""
+    clear_spec_cache()
+    first = load_spec_yaml(sample_spec_yaml)
+    second = load_spec_yaml("".join(list(sample_spec_yaml)))
+
+    assert first is second
+
+
+def test_load_spec_yaml_rejects_unsafe_tags():
+    """Test the loader stays safe (no arbitrary Python objects)"""
+    with pytest.raises(yaml.YAMLError):
+        load_spec_yaml("!!python/object/apply:os.system ['true']")
+
+
+def test_dump_spec_yaml_round_trip_keeps_order(sample_spec_yaml):
+    """Test dumping keeps key order and round-trips"""
+    document = load_spec_yaml(sample_spec_yaml)
+    text = dump_spec_yaml(document)
+
+    assert text.index("feature:") < text.index("analysis:")
+    assert load_spec_yaml(text) == document
@@ -0,0 +1,74 @@
+"""
+Unit Tests: Structured Logging
+Tests for backend/structured_logging.py
+"""
+
+import json
+import logging
+from backend.config import Settings
+from backend.structured_logging import (
+    REDACTED,
+    DebugSampler,
+    JsonFormatter,
+    configure_logging,
+    redact,
+    shutdown_logging,
+)
+
+
+def make_record(level=logging.INFO, msg="hello", args=None, **extra):
+    record = logging.LogRecord("backend.test", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_redact_secret_keys_and_token_shapes():
+    """Test secrets are removed by key anywhere in a structure and by shape in text"""
+    value = {
+        "access_token": "lin_oauth_abc",
+        "data": [{"Authorization": "Bearer xyz", "note": "key lin_api_123 leaked"}],
+    }
+
+    assert redact(value) == {
+        "access_token": REDACTED,
+        "data": [{"Authorization": REDACTED, "note": f"key {REDACTED} leaked"}],
+    }
+
+
+def test_json_formatter_includes_redacted_extra_fields():
+    """Test each record becomes one JSON object with its extra fields"""
+    record = make_record(msg="Token exchange failed for %s", args=("ENG",), response={"token": "t"})
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "backend.test"
+    assert entry["message"] == "Token exchange failed for ENG"
+    assert entry["response"] == {"token": REDACTED}
+
+
+def test_debug_sampler_keeps_info_and_samples_debug():
+    """Test only DEBUG records are subject to sampling"""
+    sampler = DebugSampler(0.25, sample=lambda: 0.5)
+
+    assert sampler.filter(make_record(logging.INFO))
+    assert not sampler.filter(make_record(logging.DEBUG))
+    assert DebugSampler(0.75, sample=lambda: 0.5).filter(make_record(logging.DEBUG))
+
+
+def test_configure_logging_writes_json_lines(capsys):
+    """Test backend loggers write JSON through the queue listener"""
+    configure_logging(Settings(log_level="DEBUG", log_debug_sample_rate=0.0))
+    try:
+        logger = logging.getLogger("backend.demo")
+        logger.debug("dropped by sampling")
+        logger.info("Created issue %s", "ENG-1", extra={"authorization": "Bearer abc"})
+    finally:
+        shutdown_logging()
+
+    lines = capsys.readouterr().out.strip().splitlines()
+
+    assert len(lines) == 1
+    entry = json.loads(lines[0])
+    assert entry["message"] == "Created issue ENG-1"
+    assert entry["authorization"] == REDACTED
@@ -0,0 +1,34 @@
+"""
+Unit Tests: Template Environment
+Tests for backend/templating.py
+"""
+
+from pathlib import Path
+from backend.config import Settings
+from backend.routes import approval, auth, features, navigation
+from backend.templating import TEMPLATE_DIR, build_environment, precompile_templates, templates
+
+
+def test_routers_share_one_environment():
+    """Test every router renders through the same environment"""
+    for module in (approval, auth, features, navigation):
+        assert module.templates.env is templates.env
+
+
+def test_precompile_templates_compiles_all_html():
+    """Test every template is compiled ahead of the first request"""
+    count = precompile_templates()
+
+    assert count == len(list(Path(TEMPLATE_DIR).rglob("*.html")))
+
+
+def test_auto_reload_only_in_development(monkeypatch, tmp_path):
+    """Test production environments never stat templates for changes"""
+    settings = Settings(environment="production", template_cache_dir=str(tmp_path))
+    monkeypatch.setattr("backend.templating.get_settings", lambda: settings)
+
+    environment = build_environment()
+    environment.get_template("features/preview.html")
+
+    assert environment.auto_reload is False
+    assert list(tmp_path.iterdir())
@@ -4,11 +4,16 @@ Tests for backend/gherkin/validation.py
 """
 
 import pytest
+from gherkin.parser import Parser
+from gherkin.pickles.compiler import Compiler
 from backend.gherkin.validation import (
+    count_pickles,
+    iter_pickles,
     validate_gherkin,
     validate_business_rules,
     ValidationResult,
 )
+from benchmarks.gherkin_scaling import VARIANTS, build_feature
 
 
 def test_validate_gherkin_valid(sample_gherkin_valid):
@@ -101,3 +106,62 @@ def test_validate_business_rules_valid():
     violations = validate_business_rules(content)
 
     assert len(violations) == 0
+
+
+OUTLINES_WITH_RULE = """Feature: Refunds
+  Background:
+    Given I am signed in
+
+  Scenario: Empty
+
+  Rule: Approval
+    Background:
+      Given I am a manager
+
+    Scenario Outline: Refund <amount>
+      When I refund <amount>
+      Then it is <status>
+
+      Examples: Small
+        | amount | status   |
+        | 5      | approved |
+
+      Examples: Large
+        | amount | status  |
+        | 5000   | pending |
+        | 9000   | pending |
+
+      Examples: Untabled
+"""
+
+
+def _compiled(content: str) -> list[dict]:
+    return Compiler().compile({**Parser().parse(content), "uri": "spec.feature"})
+
+
+@pytest.mark.parametrize(
+    "content",
+    [OUTLINES_WITH_RULE] + [build_feature(12, shape) for shape in VARIANTS.values()],
+)
+def test_count_pickles_matches_compiler(content):
+    """Test arithmetic counts equal the counts of fully compiled pickles"""
+    pickles = _compiled(content)
+
+    assert count_pickles(Parser().parse(content)) == (
+        len(pickles),
+        sum(len(pickle["steps"]) for pickle in pickles),
+    )
+
+
+def test_count_pickles_outline_rows_times_steps():
+    """Test outline rows multiply steps, backgrounds included, empty scenarios excluded"""
+    # Empty: 1 scenario, no steps; outline: 3 rows x (2 backgrounds + 2 steps)
+    assert count_pickles(Parser().parse(OUTLINES_WITH_RULE)) == (4, 12)
+
+
+def test_iter_pickles_matches_compiler():
+    """Test lazy expansion yields exactly the compiler's pickles"""
+    pickles = iter_pickles(OUTLINES_WITH_RULE)
+
+    assert next(pickles)["name"] == "Empty"
+    assert [next(pickles)] + list(pickles) == _compiled(OUTLINES_WITH_RULE)[1:]